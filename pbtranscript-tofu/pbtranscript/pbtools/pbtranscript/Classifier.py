@@ -12,6 +12,8 @@ from pbtools.pbtranscript.PBTranscriptException import PBTranscriptException
 from pbtools.pbtranscript.io.DOMIO import DOMReader
 from pbtools.pbtranscript.io.ReadAnnotation import ReadAnnotation
 from pbtools.pbtranscript.io.Summary import ClassifySummary
+from pbtools.pbtranscript.io.SeqIndex import count_records
+from pbtools.pbtranscript.PrimerScanner import PrimerScanner
 from pbtools.pbtranscript.Utils import revcmp, realpath, \
     generateChunkedFN, cat_files, real_upath, ln
 
@@ -25,6 +27,13 @@ FRONTENDDOMFN = "hmmer.front_end.dom"
 FLCHIMERADOMFN = "hmmer.fl.chimera.dom"
 NFLCHIMERADOMFN = "hmmer.nfl.chimera.dom"
 CLASSIFYSUMMARY = "classify_summary.txt"
+PRIMERSEARCHDIFFFN = "primer_search.phmmer_diff.txt"
+
+# How to find primers in front/back windows of reads:
+#   builtin  --- in-process local alignment (PrimerScanner)
+#   phmmer   --- phmmer
+#   validate --- phmmer, and report reads on which builtin disagrees
+PRIMER_SEARCH_MODES = ("builtin", "phmmer", "validate")
 
 
 # ChimeraDetectionOptions:
@@ -96,7 +105,8 @@ class Classifier(object):
                  cpus=1, change_read_id=True,
                  opts=ChimeraDetectionOptions(50, 10, 100, 50, 100, False),
                  out_nfl_fn=None, out_flnc_fn=None,
-                 ignore_polyA=False, keep_primer=False, reuse_dom=False):
+                 ignore_polyA=False, keep_primer=False, reuse_dom=False,
+                 primer_search="builtin"):
         self.reads_fn = realpath(reads_fn)
         self.out_dir = realpath(out_dir)
         self.cpus = cpus
@@ -105,6 +115,11 @@ class Classifier(object):
         self.ignore_polyA = ignore_polyA
         self.keep_primer = keep_primer # if True, primers are not removed (useful for targeted)
         self.reuse_dom = reuse_dom
+        if primer_search not in PRIMER_SEARCH_MODES:
+            raise ClassifierException(
+                "Unknown primer search mode {m}, must be one of {ms}.".
+                format(m=primer_search, ms=", ".join(PRIMER_SEARCH_MODES)))
+        self.primer_search = primer_search
 
         # The input primer file: primers.fa
         self.primer_fn = primer_fn if primer_fn is not None else \
@@ -144,10 +159,16 @@ class Classifier(object):
         #     hmmer.fl.chimera.dom and hmmer.nfl.chimera.dom
         self.out_trimmed_fl_dom_fn = op.join(self.out_dir, FLCHIMERADOMFN)
         self.out_trimmed_nfl_dom_fn = op.join(self.out_dir, NFLCHIMERADOMFN)
+        # Reads on which builtin primer search and phmmer disagree
+        self.primer_search_diff_fn = op.join(self.out_dir, PRIMERSEARCHDIFFFN)
 
         self.chunked_front_back_reads_fns = None
         self.chunked_front_back_dom_fns = None
 
+        # With builtin primer search, primer hits in the middle of trimmed
+        # reads are found while trimming: read id --> list of DOMRecord
+        self.interior_hits = {}
+
         #self.chunked_trimmed_reads_fns = None
         #self.chunked_trimmed_reads_dom_fns = None
 
@@ -304,13 +325,12 @@ class Classifier(object):
     @property
     def numReads(self):
         """Return the number of reads in reads_fn."""
-        cmd = "grep -c '>' {r}".format(r=real_upath(self.reads_fn))
-        output, errCode, errMsg = backticks(cmd)
-        if errCode != 0:
+        try:
+            return count_records(self.reads_fn)
+        except IOError as e:
             raise ClassifierException(
                 "Error reading file {r}:{e}".
-                format(r=self.reads_fn, e=str(errMsg)))
-        return int(output[0])
+                format(r=self.reads_fn, e=str(e)))
 
     def _chunkReads(self, reads_fn, reads_per_chunk, chunked_reads_fns,
                     extract_front_back_only=True, window_size=100):
@@ -567,7 +587,8 @@ class Classifier(object):
                      primer_report_nfl_fn,
                      best_of_front, best_of_back, primer_indices,
                      min_seq_len, min_score, change_read_id,
-                     ignore_polyA, keep_primer):
+                     ignore_polyA, keep_primer, scanner=None,
+                     chimera_scanner=None):
         """Trim bar code from reads in 'reads_fn', annotate each read,
         indicating:
             whether its 5' primer, 3' primer and polyA tail are seen,
@@ -587,8 +608,15 @@ class Classifier(object):
         min_seq_len: minimum length to output a read.
         min_score: minimum score to output a read.
         change_read_id: if True, change read ids to 'movie/zmw/start_end'.
+        scanner: if not None, a PrimerScanner which finds primer hits of
+                 reads while trimming, instead of best_of_front/back.
+        chimera_scanner: if not None, a PrimerScanner of primers for
+                 chimera detection, which records primer hits in the
+                 middle of trimmed fl reads (and nfl reads, if chimera
+                 detection on nfl reads is required) in interior_hits.
         """
         logging.info("Trim bar code away from reads.")
+        detect_chimera_nfl = self.chimera_detection_opts.detect_chimera_nfl
         logging.debug("Writing full-length trimmed reads to {f}".
                       format(f=out_fl_reads_fn))
         logging.debug("Writing non-full-length trimmed reads to {f}".
@@ -600,14 +628,18 @@ class Classifier(object):
                 FastaWriter(out_nfl_reads_fn) as nfl_fawriter, \
                 FastaWriter(out_fl_reads_fn) as fl_fawriter, \
                 open(primer_report_nfl_fn, 'w') as reporter:
-            for read in fareader:
+            if scanner is not None:
+                hits = scanner.scan_reads(fareader, cpus=self.cpus)
+            else:
+                hits = ((read, best_of_front[read.name],
+                         best_of_back[read.name]) for read in fareader)
+            for read, dFront, dBack in hits:
                 self.summary.num_reads += 1  # number of ROI reads
                 pbread = PBRead(read)
                 logging.debug("Pick up best primer combo for {r}".
                               format(r=read.name))
                 primerIndex, strand, fw, rc = self._pickBestPrimerCombo(
-                    best_of_front[read.name], best_of_back[read.name],
-                    primer_indices, min_score)
+                    dFront, dBack, primer_indices, min_score)
                 logging.debug("read={0}\n".format(read.name) +
                               "primer={0} strand={1} fw={2} rc={3}".
                               format(primerIndex, strand, fw, rc))
@@ -629,6 +661,11 @@ class Classifier(object):
                         nfl_fawriter.writeRecord(annotation.toAnnotation(),
                                                  read.sequence)
                         self.summary.num_nfl += 1
+                        if chimera_scanner is not None and detect_chimera_nfl:
+                            # No primer seen in windows, search whole read.
+                            self._findInteriorHits(newName, read.sequence,
+                                                   chimera_scanner,
+                                                   full_search=True)
                     else:
                         self.summary.num_filtered_short_reads += 1
                     continue
@@ -685,6 +722,10 @@ class Classifier(object):
                     reporter.write(annotation.toReportRecord(delimitor=",") + "\n")
 
                 if len(seq) >= min_seq_len:
+                    if chimera_scanner is not None and \
+                       (annotation.isFullLength is True or detect_chimera_nfl):
+                        self._findInteriorHits(newName, seq, chimera_scanner,
+                                               full_search=False)
                     if annotation.isFullLength is True:
                         # Write long full-length reads
                         fl_fawriter.writeRecord(annotation.toAnnotation(), seq)
@@ -696,6 +737,17 @@ class Classifier(object):
                 else:
                     self.summary.num_filtered_short_reads += 1
 
+    def _findInteriorHits(self, read_id, seq, scanner, full_search):
+        """Find primer hits in the middle of a trimmed read seq, which
+        make it a chimera, and save them to interior_hits[read_id]."""
+        hits = scanner.interior_hits(
+            sid=read_id, seq=seq,
+            min_dist_from_end=self.chimera_detection_opts.min_dist_from_end,
+            min_score=self.chimera_detection_opts.min_score,
+            full_search=full_search)
+        if len(hits) > 0:
+            self.interior_hits[read_id] = hits
+
     def _validate_outputs(self, out_dir, out_all_reads_fn):
         """Validate and create output directory."""
         logging.info("Creating output directory {d}.".format(d=out_dir))
@@ -719,12 +771,52 @@ class Classifier(object):
             if op.exists(f):
                 os.remove(f)
 
+    def _validatePrimerSearch(self, reads_fn, best_of_front, best_of_back,
+                              scanner, primer_indices, min_score, out_fn):
+        """Compare primer hits found by phmmer (best_of_front/back) with
+        those found by scanner: for each read, pick up the best primer
+        combo from either and write reads on which primer index, strand,
+        5' end or 3' end differ to out_fn. Return the number of such reads.
+        """
+        logging.info("Validate builtin primer search against phmmer.")
+        num_reads, num_diffs = 0, 0
+        with FastaReader(reads_fn) as reader, open(out_fn, 'w') as writer:
+            writer.write("#read_id\tphmmer\tbuiltin\n")
+            for read, dFront, dBack in scanner.scan_reads(reader,
+                                                          cpus=self.cpus):
+                num_reads += 1
+                picks = []
+                for front, back in ((best_of_front[read.name],
+                                     best_of_back[read.name]),
+                                    (dFront, dBack)):
+                    ind, strand, fw, rc = self._pickBestPrimerCombo(
+                        front, back, primer_indices, min_score)
+                    if fw is None and rc is None:
+                        picks.append("NA")
+                    else:
+                        picks.append("{i}{s}:{f}:{r}".format(i=ind, s=strand,
+                            f=(fw.sEnd if fw is not None else "NA"),
+                            r=(rc.sEnd if rc is not None else "NA")))
+                if picks[0] != picks[1]:
+                    num_diffs += 1
+                    writer.write("{r}\t{p}\t{b}\n".format(r=read.name,
+                                 p=picks[0], b=picks[1]))
+        logging.info("Builtin primer search disagrees with phmmer on " +
+                     "{n} of {m} reads, see {f}.".format(n=num_diffs,
+                     m=num_reads, f=out_fn))
+        return num_diffs
+
     def runPrimerTrimmer(self):
-        """Run PHMMER to identify barcodes and trim them away.
+        """Identify barcodes and trim them away.
         (1) create forward/reverse primers
-        (2) copy input with just the first/last k bases
-        (3) run phmmer
-        (4) parse phmmer DOM output, trim barcodes and output summary
+        (2) if primer_search is 'builtin', find primers with PrimerScanner
+            while trimming, in one pass over reads, which also finds
+            primer hits in the middle of trimmed reads for chimera
+            detection, then skip to (5)
+        (3) copy input with just the first/last k bases, run phmmer
+        (4) parse phmmer DOM output; if primer_search is 'validate',
+            compare it with PrimerScanner hits
+        (5) trim barcodes and output summary
         """
         logging.info("Start to find and trim 3'/5' primers and polyAs.")
         # Sanity check input primers and create forward/reverse primers
@@ -735,15 +827,34 @@ class Classifier(object):
             primer_out_fn=self.primer_front_back_fn,
             revcmp_primers=False)
 
+        window_size = self.chimera_detection_opts.primer_search_window
+        scanner, best_of_front, best_of_back = None, None, None
+        chimera_scanner = None
+        if self.primer_search != "phmmer":
+            scanner = PrimerScanner(primer_fn=self.primer_front_back_fn,
+                                    window_size=window_size)
+        if self.primer_search == "builtin":
+            # Create forward/reverse primers for chimera detection, which
+            # is done while trimming.
+            self._processPrimers(primer_fn=self.primer_fn,
+                                 window_size=window_size,
+                                 primer_out_fn=self.primer_chimera_fn,
+                                 revcmp_primers=True)
+            chimera_scanner = PrimerScanner(primer_fn=self.primer_chimera_fn,
+                                            window_size=window_size)
+
         logging.info("reuse_dom = {0}".format(self.reuse_dom))
-        if op.exists(self.out_front_back_dom_fn) and self.reuse_dom:
+        if self.primer_search == "builtin":
+            logging.info("Find primers with builtin primer search.")
+        elif op.exists(self.out_front_back_dom_fn) and self.reuse_dom:
             logging.warn("Primer detection output already exists. Parsing {0}".
                          format(self.out_front_back_dom_fn))
         else:
             # Split reads in reads_fn into smaller chunks.
-            num_chunks = max(min(self.cpus, self.numReads), 1)
-            reads_per_chunk = int(math.ceil(self.numReads / (float(num_chunks))))
-            num_chunks = int(math.ceil(self.numReads / float(reads_per_chunk)))
+            num_reads = self.numReads
+            num_chunks = max(min(self.cpus, num_reads), 1)
+            reads_per_chunk = int(math.ceil(num_reads / (float(num_chunks))))
+            num_chunks = int(math.ceil(num_reads / float(reads_per_chunk)))
 
             logging.debug("Split reads into {n} chunks".format(n=num_chunks))
             # Divide input reads into smaller chunks and extract only
@@ -757,7 +868,6 @@ class Classifier(object):
 
             # Split reads within 'reads_fn' into 'num_chunks' chunks, and only
             # extract the front and end segment from each read.
-            window_size = self.chimera_detection_opts.primer_search_window
             self._chunkReads(reads_fn=self.reads_fn,
                              reads_per_chunk=reads_per_chunk,
                              chunked_reads_fns=self.chunked_front_back_reads_fns,
@@ -772,9 +882,19 @@ class Classifier(object):
                 primer_fn=self.primer_front_back_fn,
                 pbmatrix_fn=self.pbmatrix_fn)
 
-        # Parse dome file, and return dictionary of front & back.
-        best_of_front, best_of_back = self._getBestFrontBackRecord(
-            self.out_front_back_dom_fn)
+        if self.primer_search != "builtin":
+            # Parse dome file, and return dictionary of front & back.
+            best_of_front, best_of_back = self._getBestFrontBackRecord(
+                self.out_front_back_dom_fn)
+            if self.primer_search == "validate":
+                self._validatePrimerSearch(
+                    reads_fn=self.reads_fn, best_of_front=best_of_front,
+                    best_of_back=best_of_back, scanner=scanner,
+                    primer_indices=primer_indices,
+                    min_score=self.chimera_detection_opts.min_score,
+                    out_fn=self.primer_search_diff_fn)
+                # phmmer hits are used for trimming
+                scanner = None
 
         # Trim bar code away
         self._trimBarCode(reads_fn=self.reads_fn,
@@ -788,7 +908,9 @@ class Classifier(object):
                           min_score=self.chimera_detection_opts.min_score,
                           change_read_id=self.change_read_id,
                           ignore_polyA=self.ignore_polyA,
-                          keep_primer=self.keep_primer)
+                          keep_primer=self.keep_primer,
+                          scanner=scanner,
+                          chimera_scanner=chimera_scanner)
 
         # Clean intemediate files: chunked reads files and chunked dom files.
         self._cleanup(self.chunked_front_back_reads_fns)
@@ -799,7 +921,8 @@ class Classifier(object):
                         primer_report_fn, out_dom, num_reads, job_name):
         """Detect chimeric reads from in_fasta, call phmmer to generate a
         dom file (out_dom), save non-chimeric reads to out_nc_fasta and
-        chimeric reads to out_c_fasta.
+        chimeric reads to out_c_fasta. With builtin primer search, use
+        interior_hits found while trimming instead of calling phmmer.
             in_fasta --- either a fasta of trimmed fl reads, or a fasta of
                          trimmed nfl reads.
             out_nc_fasta --- an output fasta of non-chimeric reads
@@ -811,7 +934,9 @@ class Classifier(object):
         Return:
             (num_nc, num_c, num_nc_bases, num_c_bases)
         """
-        if op.exists(out_dom) and self.reuse_dom:
+        if self.primer_search == "builtin":
+            logging.info("Use primer hits found while trimming.")
+        elif op.exists(out_dom) and self.reuse_dom:
             logging.warn("Chimera detection output already exists. Parse {o}.".
                          format(o=out_dom))
         else:
@@ -836,8 +961,11 @@ class Classifier(object):
                                primer_fn=self.primer_chimera_fn,
                                pbmatrix_fn=self.pbmatrix_fn)
 
-        suspicous_hits = self._getChimeraRecord(out_dom,
-                                                self.chimera_detection_opts)
+        if self.primer_search == "builtin":
+            suspicous_hits = self.interior_hits
+        else:
+            suspicous_hits = self._getChimeraRecord(
+                out_dom, self.chimera_detection_opts)
 
         # Update chimera information
         (num_nc, num_c, num_nc_bases, num_c_bases) = \
@@ -854,11 +982,12 @@ class Classifier(object):
         """Call chimera detection on full-length reads, and non-full-length
         reads if required."""
         # Create forward/reverse primers for chimera detection.
-        self._processPrimers(
-            primer_fn=self.primer_fn,
-            window_size=self.chimera_detection_opts.primer_search_window,
-            primer_out_fn=self.primer_chimera_fn,
-            revcmp_primers=True)
+        if self.primer_search != "builtin":
+            self._processPrimers(
+                primer_fn=self.primer_fn,
+                window_size=self.chimera_detection_opts.primer_search_window,
+                primer_out_fn=self.primer_chimera_fn,
+                revcmp_primers=True)
 
         # Detect chimeras among full-length reads, separate flnc reads and
         # flc reads.
@@ -925,8 +1054,9 @@ class Classifier(object):
         or multiple transcripts with primers seen in the middle of
         a read)
         (1) Create and validate input/output
-        (2) Check phmmer is runnable
-        (3) Find primers using phmmer and trim away primers and polyAs
+        (2) Check phmmer is runnable, unless using builtin primer search
+        (3) Find primers using builtin primer search or phmmer and
+            trim away primers and polyAs
         (4) Detect chimeras from trimmed reads
         """
         # Validate input files and required data files.
@@ -936,7 +1066,8 @@ class Classifier(object):
         self._validate_outputs(self.out_dir, self.out_all_reads_fn)
 
         # Sanity check phmmer can be called successfully.
-        self._checkPhmmer()
+        if self.primer_search != "builtin":
+            self._checkPhmmer()
 
         # Find and trim primers and polyAs.
         self.runPrimerTrimmer()
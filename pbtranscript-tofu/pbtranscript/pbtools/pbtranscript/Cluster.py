@@ -5,14 +5,17 @@ import os.path as op
 import logging
 import cPickle
 import time
+import shutil
 from pbtools.pbtranscript.PBTranscriptException import PBTranscriptException
 from pbtools.pbtranscript.io.FastqSplitter import splitFastq
 from pbtools.pbtranscript.Utils import realpath, ln
 from pbtools.pbtranscript.Polish import Polish
+from pbtools.pbtranscript.StageGraph import Stage, StageGraph
 from pbtools.pbtranscript.ice.ProbModel import ProbFromModel, ProbFromQV, ProbFromFastq
 from pbtools.pbtranscript.ice.IceFiles import IceFiles
 from pbtools.pbtranscript.ice.IceInit import IceInit
 from pbtools.pbtranscript.ice.IceIterative import IceIterative
+from pbtools.pbtranscript.ice.IceJournal import IceJournal
 from pbtools.pbtranscript.ice.IceUtils import ice_fa2fq, ice_fq2fa
 from pbtools.pbtranscript.__init__ import get_version
 
@@ -64,6 +67,8 @@ class Cluster(IceFiles):
         self._logConfigs()      # Log configurations
 
         self.iceinit = None
+        self._seed_d = None     # initial probabilities computed by IceInit
+        self.graph = None       # StageGraph of cluster stages
         self.icec = None
         self.iceq = None
         self.pol = None
@@ -135,7 +140,8 @@ class Cluster(IceFiles):
         else:
             self.add_log("Creating output directory {d}.".format(d=root_dir))
             os.mkdir(root_dir)
-        if op.exists(out_fa):
+        # out_fa of a previous run in root_dir is re-written
+        if op.exists(out_fa) and not op.exists(self.stage_cache_dir):
             raise ClusterException("Consensus FASTA file {f} already exists.".
                                    format(f=out_fa))
         return root_dir, out_fa
@@ -188,119 +194,191 @@ class Cluster(IceFiles):
                 format(f=firstSplitFq, t=time.time()-start_t),
                 level=logging.INFO)
 
-    def run(self):
-        """Call ICE to cluster consensus isoforms."""
-        self.add_log("Start to run cluster.", level=logging.INFO)
-
-        if self.ice_opts.targeted_isoseq:
-            first_split = 1000
-            self.ice_opts.flnc_reads_per_split = 10000
-            self.add_log("targeted_isoseq: further splitting JUST first split to 1000. Changing flnc_reads_per_split=10000.")
-        else:
-            first_split = None
-
+    @property
+    def stage_cache_dir(self):
+        """Return $root_dir/stages, where StageGraph keeps .done files."""
+        return op.join(self.root_dir, "stages")
+
+    def _split_flnc(self, first_split):
+        """
+        Split flnc reads into smaller fastq files, convert the first split
+        to fasta. Return split fastq files followed by the first fasta.
+        """
         # Split flnc_fa into smaller files and save files to _flnc_splitted_fas.
         self.add_log("Splitting {flnc} into ".format(flnc=self.flnc_fa) +
                      "smaller files each containing {n} reads.".format(
                      n=self.ice_opts.flnc_reads_per_split),
                      level=logging.INFO)
 
-        self._flnc_splitted_fqs = splitFastq(
+        splitted_fqs = splitFastq(
             input_fastq=self.flnc_fa,
             reads_per_split=self.ice_opts.flnc_reads_per_split,
             out_dir=self.root_dir,
             out_prefix="input.split",
             first_split=first_split)
 
-
         self.add_log("Splitted files are: " +
-                     "\n".join(self._flnc_splitted_fqs),
+                     "\n".join(splitted_fqs),
                      level=logging.INFO)
 
-        firstSplit_fq = self._flnc_splitted_fqs[0]
+        firstSplit_fq = splitted_fqs[0]
         firstSplit_fa = firstSplit_fq[:firstSplit_fq.rfind('.')] + '.fasta'
         ice_fq2fa(firstSplit_fq, firstSplit_fa)
-
-
-        # -------- commenting out below because we already have FASTQ!
-        #firstSplit = self._flnc_splitted_fas[0]
-        #firstSplit_fq = firstSplit[:firstSplit.rfind('.')] + '.fastq'
-        #self.add_log("Converting first split file {0} + {1} into fastq\n".format(\
-        #        firstSplit, self.ccs_fofn), level=logging.INFO)
-        ## Convert this into FASTQ
-        #ice_fa2fq(firstSplit, self.ccs_fofn, firstSplit_fq)
-        #
-        ## Set up probabbility and quality value model
-        #if self.ice_opts.use_finer_qv:
-        #    self._setProbQV_ccs(self.ccs_fofn, firstSplit)
-        #else:
-        #    self._setProbQV_fq(firstSplitFq=firstSplit_fq)
+        return splitted_fqs + [firstSplit_fa]
+
+    def _load_flnc_splits(self):
+        """Set _flnc_splitted_fqs from outputs of stage split_flnc,
+        return the first split in fasta."""
+        outputs = self.graph.outputs("split_flnc")
+        self._flnc_splitted_fqs = outputs[:-1]
+        return outputs[-1]
+
+    def _init_clusters(self):
+        """Initialize clusters by IceInit, dump them to initPickleFN."""
+        firstSplit_fa = self._load_flnc_splits()
+        firstSplit_fq = self._flnc_splitted_fqs[0]
         self._setProbQV_fq(firstSplitFq=firstSplit_fq)
 
         # Initialize cluster by clique
-        if os.path.exists(self.initPickleFN):
-            self.add_log("Reading existing uc pickle: {0}".format(self.initPickleFN), level=logging.INFO)
+        self.add_log("Finding maximal cliques: initializing IceInit.",
+                     level=logging.INFO)
+        self.iceinit = IceInit(readsFa=firstSplit_fa,
+                               qver_get_func=self._probqv.get_smoothed,
+                               ice_opts=self.ice_opts,
+                               sge_opts=self.sge_opts,
+                               qvmean_get_func=self._probqv.get_mean,
+                               calc_prob_func=self._probqv.calc_prob_from_aln)
+        uc = self.iceinit.uc
+        # Reuse scored all-vs-all hits as initial probabilities,
+        # saving one alignment round in IceIterative.
+        self._seed_d = self.iceinit.seed_d()
+        self.iceinit.edges = None
+
+        # Dump uc to a file
+        self.add_log("Dumping initial clusters to {f}".format(
+                     f=self.initPickleFN), level=logging.INFO)
+        with open(self.initPickleFN, 'w') as f:
+            cPickle.dump(uc, f)
+
+    def _run_ice_iterative(self):
+        """Run IceIterative, resuming from its checkpoint journal."""
+        if IceJournal(self.journal_dir).exists():
+            # Resume IceIterative from the last consistent checkpoint.
+            self.add_log("Resuming IceIterative from checkpoint journal " +
+                         "{d}.".format(d=self.journal_dir), level=logging.INFO)
+            self.icec = IceIterative.from_journal(self.root_dir)
+        else:
+            firstSplit_fa = self._load_flnc_splits()
+            firstSplit_fq = self._flnc_splitted_fqs[0]
+            if self._probqv is None:
+                self._setProbQV_fq(firstSplitFq=firstSplit_fq)
+            self.add_log("Reading initial clusters: {0}".format(
+                         self.initPickleFN), level=logging.INFO)
             with open(self.initPickleFN) as f:
                 uc = cPickle.load(f)
-        else:
-            self.add_log("Finding maximal cliques: initializing IceInit.",
+
+            # Run IceIterative.
+            self.add_log("Iterative clustering: initializing IceIterative.",
                          level=logging.INFO)
-            self.iceinit = IceInit(readsFa=firstSplit_fa,
-                                   qver_get_func=self._probqv.get_smoothed,
-                                   ice_opts=self.ice_opts,
-                                   sge_opts=self.sge_opts,
-                                   qvmean_get_func=self._probqv.get_mean)
-            uc = self.iceinit.uc
-
-            # Dump uc to a file
-            self.add_log("Dumping initial clusters to {f}".format(
-                         f=self.initPickleFN), level=logging.INFO)
-            with open(self.initPickleFN, 'w') as f:
-                cPickle.dump(uc, f)
-
-        # Run IceIterative.
-        self.add_log("Iterative clustering: initializing IceIterative.",
-                     level=logging.INFO)
-        #self.add_log("In Cluster. DEBUG: Calling Cluster with {0} {1} {2} ".format(self.bas_fofn, self.ccs_fofn, self.fasta_fofn))
-
-
-        self.icec = IceIterative(
-            fasta_filename=firstSplit_fa,
-            fastq_filename=firstSplit_fq,
-            fastq_filenames_to_add=self._flnc_splitted_fqs[1:],
-            all_fasta_filename=self.flnc_fa,
-            ccs_fofn=self.ccs_fofn,
-            root_dir=self.root_dir,
-            ice_opts=self.ice_opts,
-            sge_opts=self.sge_opts,
-            uc=uc,
-            probQV=self._probqv,
-            use_ccs_qv=self.ice_opts.use_finer_qv)
+            self.icec = IceIterative(
+                fasta_filename=firstSplit_fa,
+                fastq_filename=firstSplit_fq,
+                fastq_filenames_to_add=self._flnc_splitted_fqs[1:],
+                all_fasta_filename=self.flnc_fa,
+                ccs_fofn=self.ccs_fofn,
+                root_dir=self.root_dir,
+                ice_opts=self.ice_opts,
+                sge_opts=self.sge_opts,
+                uc=uc,
+                d=self._seed_d,
+                probQV=self._probqv,
+                use_ccs_qv=self.ice_opts.use_finer_qv)
+            self._seed_d = None
         self.add_log("IceIterative log: {f}.".format(f=self.icec.log_fn))
         self.icec.run()
         self.add_log("IceIterative completed.", level=logging.INFO)
-
+        return [self.icec.report_fn]
+
+    def _reset_ice_iterative(self):
+        """Remove the checkpoint journal of an IceIterative run with
+        different inputs or options."""
+        if op.exists(self.journal_dir):
+            shutil.rmtree(self.journal_dir)
+
+    def _run_quiver(self):
+        """Polish clusters with quiver, return the cluster report and
+        quivered fastq files of bins."""
+        self.pol.run_quiver()
+        icepq = self.pol.init_postprocess()
+        return [self.pol.init_quiver().report_fn] + \
+            sorted(icepq.get_existing_binned_quivered_fq())
+
+    def _run_post_quiver(self):
+        """Pick up HQ and LQ isoforms, return their fasta and fastq files."""
+        self.pol.run_postprocess()
+        icepq = self.pol.init_postprocess()
+        return [icepq.quivered_good_fa, icepq.quivered_bad_fa,
+                icepq.quivered_good_fq, icepq.quivered_bad_fq]
+
+    def _write_outputs(self):
+        """Create links to consensus isoforms and cluster report, and
+        write cluster summary."""
         # IceIterative done, write predicted (unplished) consensus isoforms
         # to an output fasta
         self.add_log("Creating a link to unpolished consensus isoforms.")
-        ln(self.icec.final_consensus_fa, self.out_fa)
-
-        #self.add_log("In Cluster. DEBUG: End Cluster with {0} {1} {2} ".format(self.bas_fofn, self.ccs_fofn, self.fasta_fofn))
-
+        ln(self.final_consensus_fa, self.out_fa)
 
         # Call quiver to polish predicted consensus isoforms.
         if self.ice_opts.quiver is not True:
             self.add_log("Creating a link to cluster report.",
                          level=logging.INFO)
-            ln(src=self.icec.report_fn, dst=self.report_fn)
+            ln(src=self.graph.outputs("ice_iterative")[-1], dst=self.report_fn)
 
             # Summarize cluster and write to summary_fn.
             self.write_summary(summary_fn=self.summary_fn,
                                isoforms_fa=self.out_fa)
         else:  # self.ice_opts.quiver is True
-            self.add_log("Polishing clusters: initializing IcePolish.",
+            # cluster report
+            self.add_log("Creating a link to cluster report.",
                          level=logging.INFO)
-            #self.add_log("In Cluster. DEBUG: Calling Polish with {0} {1} {2} ".format(self.bas_fofn, self.ccs_fofn, self.fasta_fofn))
+            ln(src=self.pol.init_quiver().report_fn, dst=self.report_fn)
+
+            # Summarize cluster & polish and write to summary_fn.
+            icepq = self.pol.init_postprocess()
+            self.write_summary(summary_fn=self.summary_fn,
+                               isoforms_fa=self.out_fa,
+                               hq_fa=icepq.quivered_good_fa,
+                               lq_fa=icepq.quivered_bad_fa)
+
+    def build_stage_graph(self, first_split=None):
+        """
+        Return a StageGraph of the stages of cluster:
+            split_flnc --> ice_init --> ice_iterative -->
+            [ice_partial --> ice_quiver --> ice_post_quiver] --> write_outputs
+        Stages which are done with the same inputs and options are skipped
+        on a re-run, e.g., changing ipq_opts only re-runs ice_post_quiver
+        and write_outputs.
+        """
+        g = StageGraph(cache_dir=self.stage_cache_dir,
+                       max_cpus=self.sge_opts.blasr_nproc)
+        ice_params = dict((k, v) for k, v in vars(self.ice_opts).iteritems()
+                          if k != "quiver")
+        g.add(Stage("split_flnc", lambda: self._split_flnc(first_split),
+                    inputs=[self.flnc_fa],
+                    params={'flnc_reads_per_split':
+                            self.ice_opts.flnc_reads_per_split,
+                            'first_split': first_split}))
+        g.add(Stage("ice_init", self._init_clusters, deps=["split_flnc"],
+                    outputs=[self.initPickleFN], params=ice_params,
+                    cpus=self.sge_opts.blasr_nproc))
+        g.add(Stage("ice_iterative", self._run_ice_iterative,
+                    deps=["split_flnc", "ice_init"],
+                    inputs=[self.ccs_fofn] if self.ccs_fofn else [],
+                    outputs=[self.final_consensus_fa, self.final_pickle_fn],
+                    params=ice_params, cpus=self.sge_opts.blasr_nproc,
+                    reset=self._reset_ice_iterative))
+        last = "ice_iterative"
+        if self.ice_opts.quiver is True:
             self.pol = Polish(root_dir=self.root_dir,
                               nfl_fa=self.nfl_fa,
                               bas_fofn=self.bas_fofn,
@@ -312,19 +390,44 @@ class Cluster(IceFiles):
                               nfl_reads_per_split=self.nfl_reads_per_split)
             self.add_log("IcePolish log: {f}.".format(f=self.pol.log_fn),
                          level=logging.INFO)
-            self.pol.run()
-            self.add_log("IcePolish completed.", level=logging.INFO)
+            inputs = [fn for fn in (self.nfl_fa, self.bas_fofn,
+                                    self.ccs_fofn, self.fasta_fofn)
+                      if fn is not None]
+            # fasta_fofn is created by ice_partial if not given
+            outputs = [self.nfl_all_pickle_fn] + \
+                ([self.pol.fasta_fofn] if self.fasta_fofn is None else [])
+            g.add(Stage("ice_partial", self.pol.run_partials,
+                        deps=["ice_iterative"], inputs=inputs,
+                        outputs=outputs,
+                        params={'nfl_reads_per_split':
+                                self.nfl_reads_per_split},
+                        cpus=self.sge_opts.blasr_nproc))
+            g.add(Stage("ice_quiver", self._run_quiver,
+                        deps=["ice_iterative", "ice_partial"],
+                        outputs=[self.support_counts_fn],
+                        cpus=self.sge_opts.blasr_nproc))
+            g.add(Stage("ice_post_quiver", self._run_post_quiver,
+                        deps=["ice_quiver"], params=self.ipq_opts))
+            last = "ice_post_quiver"
+        g.add(Stage("write_outputs", self._write_outputs,
+                    deps=["ice_iterative", last],
+                    outputs=[self.out_fa, self.report_fn, self.summary_fn]))
+        return g
 
-            # cluster report
-            self.add_log("Creating a link to cluster report.",
-                         level=logging.INFO)
-            ln(src=self.pol.iceq.report_fn, dst=self.report_fn)
+    def run(self):
+        """Call ICE to cluster consensus isoforms."""
+        self.add_log("Start to run cluster.", level=logging.INFO)
 
-            # Summarize cluster & polish and write to summary_fn.
-            self.write_summary(summary_fn=self.summary_fn,
-                               isoforms_fa=self.out_fa,
-                               hq_fa=self.pol.icepq.quivered_good_fa,
-                               lq_fa=self.pol.icepq.quivered_bad_fa)
+        if self.ice_opts.targeted_isoseq:
+            first_split = 1000
+            self.ice_opts.flnc_reads_per_split = 10000
+            self.add_log("targeted_isoseq: further splitting JUST first split to 1000. Changing flnc_reads_per_split=10000.")
+        else:
+            first_split = None
+
+        # Stages which are done with the same inputs and options are skipped.
+        self.graph = self.build_stage_graph(first_split=first_split)
+        self.graph.run()
 
         # Create log file.
         self.close_log()
@@ -210,7 +210,8 @@ class ClusterTest(IceFiles):
         self.add_log("Converting first split file {0} + {1} into fastq\n".format(\
                 firstSplit, self.ccs_fofn), level=logging.INFO)
         # Convert this into FASTQ
-        ice_fa2fq(firstSplit, self.ccs_fofn, firstSplit_fq)
+        ice_fa2fq(firstSplit, self.ccs_fofn, firstSplit_fq,
+                  cpus=self.sge_opts.blasr_nproc)
 
         # Set up probabbility and quality value model
         if self.ice_opts.use_finer_qv:
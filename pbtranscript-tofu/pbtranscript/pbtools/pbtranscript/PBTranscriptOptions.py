@@ -75,6 +75,15 @@ def add_classify_arguments(parser):
                            help="TXT file to output classsify summary (" +
                                 "default: *.classify_summary.txt")
 
+    helpstr = "How to find primers: builtin primer search, phmmer, or " + \
+              "validate builtin against phmmer and use phmmer " + \
+              "(default: builtin)"
+    hmm_group.add_argument("--primer_search",
+                           default="builtin",
+                           choices=("builtin", "phmmer", "validate"),
+                           dest="primer_search",
+                           help=helpstr)
+
     chi_group = parser.add_argument_group("Chimera detection options")
 
     helpstr = "Minimum sequence length to output (default: 300)"
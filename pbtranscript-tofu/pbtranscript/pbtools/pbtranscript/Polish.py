@@ -57,6 +57,8 @@ class Polish(IceFiles):
         self.ice_opts = ice_opts
         self.sge_opts = sge_opts
         self.ipq_opts = ipq_opts
+        if self.fasta_fofn is None:
+            self.fasta_fofn = op.join(self.nfl_dir, "input.fasta.fofn")
 
         self.add_log("ece_penalty: {0}, ece_min_len: {1}".format(self.ice_opts.ece_penalty, self.ice_opts.ece_min_len))
 
@@ -111,7 +113,7 @@ class Polish(IceFiles):
         into unpolished isoform clusters and then merge all pickles
         into self.nfl_all_pickle_fn.
         Second, bin every 100 clusters, for each bin, call blasr,
-        samto5h, loadPulses, cmph5tools to create cmp.h5 files and
+        ice_sam_to_cmph5.py to create cmp.h5 files and
         call quiver to polish each isoforms within each bin.
         Finally, pick up good isoform clusters whose QV errors is less
         than a threshold.
@@ -123,11 +125,18 @@ class Polish(IceFiles):
         #             f=self.final_consensus_sa), level=logging.INFO)
         #sa_file = self.get_sa_file()
 
+        self.run_partials()
+        self.run_quiver()
+        self.run_postprocess()
+
+    def run_partials(self):
+        """
+        Create fasta_fofn if it does not exist, split non-full-length reads,
+        and assign them to unpolished isoform clusters (IceAllPartials).
+        """
         # Create input.fasta.fofn from bas_fofn
         self.add_log("Creating fasta fofn from bas/bax.h5 fofn",
                      level=logging.INFO)
-        if self.fasta_fofn is None:
-            self.fasta_fofn = op.join(self.nfl_dir, "input.fasta.fofn")
         self.add_log("bas fofn={f}".format(f=self.bas_fofn))
         self.add_log("fasta fofn={f}".format(f=self.fasta_fofn))
         if op.exists(self.fasta_fofn):
@@ -175,24 +184,39 @@ class Polish(IceFiles):
         self.icep.run()
         self.add_log("IceAllPartials completed.", level=logging.INFO)
 
-        self.add_log("Initializing IceQuiver.", level=logging.INFO)
-        self.iceq = IceQuiver(root_dir=self.root_dir,
-                              bas_fofn=self.bas_fofn,
-                              fasta_fofn=self.fasta_fofn,
-                              sge_opts=self.sge_opts)
-        self.add_log("IceQuiver log: {f}.".format(f=self.iceq.log_fn),
-                     level=logging.INFO)
-        self.iceq.run()
+    def init_quiver(self):
+        """Return IceQuiver of root_dir, create it if needed."""
+        if self.iceq is None:
+            self.add_log("Initializing IceQuiver.", level=logging.INFO)
+            self.iceq = IceQuiver(root_dir=self.root_dir,
+                                  bas_fofn=self.bas_fofn,
+                                  fasta_fofn=self.fasta_fofn,
+                                  sge_opts=self.sge_opts)
+            self.add_log("IceQuiver log: {f}.".format(f=self.iceq.log_fn),
+                         level=logging.INFO)
+        return self.iceq
+
+    def run_quiver(self):
+        """Polish clusters with quiver (IceQuiver)."""
+        self.init_quiver().run()
         self.add_log("IceQuiver finished.", level=logging.INFO)
 
-        self.add_log("Initializing IceQuiverPostprocess.", level=logging.INFO)
-        self.icepq = IceQuiverPostprocess(root_dir=self.root_dir,
-                                          use_sge=self.sge_opts.use_sge,
-                                          quit_if_not_done=False,
-                                          ipq_opts=self.ipq_opts)
-        self.add_log("IceQuiverPostprocess log: {f}.".
-                     format(f=self.icepq.log_fn), level=logging.INFO)
-        self.icepq.run()
+    def init_postprocess(self):
+        """Return IceQuiverPostprocess of root_dir, create it if needed."""
+        if self.icepq is None:
+            self.add_log("Initializing IceQuiverPostprocess.",
+                         level=logging.INFO)
+            self.icepq = IceQuiverPostprocess(root_dir=self.root_dir,
+                                              use_sge=self.sge_opts.use_sge,
+                                              quit_if_not_done=False,
+                                              ipq_opts=self.ipq_opts)
+            self.add_log("IceQuiverPostprocess log: {f}.".
+                         format(f=self.icepq.log_fn), level=logging.INFO)
+        return self.icepq
+
+    def run_postprocess(self):
+        """Pick up high and low quality isoforms (IceQuiverPostprocess)."""
+        self.init_postprocess().run()
         self.add_log("IceQuiverPostprocess finished.", level=logging.INFO)
 
 
@@ -0,0 +1,226 @@
+"""
+In-process primer search for classify, replacing phmmer for the short
+primers of primers.fa.
+
+Each primer is locally aligned to the front (first primer_search_window
+bases) and back (reverse complement of the last primer_search_window
+bases) windows of reads by c_PrimerScanner, in batches of reads, and the
+best hit of each primer in each window is reported as a DOMRecord,
+in the same form as Classifier._getBestFrontBackRecord parses them from
+phmmer output:
+    best_of_front/back: {read_id: {primer_name: DOMRecord}}
+
+For chimera detection, interior_hits() finds primer hits in the middle
+of (trimmed) reads: only regions around exact k-mer seeds of primers are
+aligned, unless a full search of the read is asked for. Since the best
+random hit in a long read scores much higher than in a window, interior
+hits must also have a Karlin-Altschul E-value of at most max_evalue,
+like the --domE cutoff of phmmer.
+
+Scores approximate phmmer bit scores with PBMATRIX.txt and
+--popen 0.07 --pextend 0.07 (~1.1 bits per matched base), so that
+--min_score applies to either one.
+"""
+import math
+from itertools import islice
+from multiprocessing import Pool
+from pbcore.io.FastaIO import FastaReader
+from pbtools.pbtranscript.io.DOMIO import DOMRecord
+from pbtools.pbtranscript.Utils import revcmp
+from pbtools.pbtranscript.c_PrimerScanner import encode_seqs, scan_windows, \
+    kmer_table, find_seeds
+
+# Karlin-Altschul parameters of the default scores, fitted on best hits of
+# a primer in random sequences of 200 to 4000 bases.
+KA_LAMBDA = 1.12
+KA_K = 0.28
+
+
+def evalue(score, pLen, sLen):
+    """Return the expected number of hits scoring at least score of a
+    primer of length pLen in a random sequence of length sLen."""
+    return KA_K * pLen * sLen * math.exp(-KA_LAMBDA * score)
+
+
+class PrimerScanner(object):
+
+    """Find primer hits in front and back windows of reads."""
+
+    def __init__(self, primer_fn, window_size=100, max_start=48,
+                 min_report_score=10, match=1.1, mismatch=-1.5, gap=2.5,
+                 seed_k=10):
+        """
+        primer_fn --- primers to search, as written by
+                      Classifier._processPrimers (F0, R0, F1, R1, ...)
+        window_size --- search primers within the first and the last
+                        window_size bases of reads
+        max_start --- hits must start within the first max_start + 1
+                      bases of windows and primers
+        min_report_score --- only report hits of at least this score
+        seed_k --- length of primer k-mers seeding interior_hits()
+        """
+        self.window_size = window_size
+        self.max_start = max_start
+        self.min_report_score = min_report_score
+        self.match, self.mismatch, self.gap = match, mismatch, gap
+        with FastaReader(primer_fn) as reader:
+            self.primers = [(r.name, r.sequence) for r in reader]
+        self.primer_codes = [encode_seqs([seq], len(seq))[0][0]
+                             for (_name, seq) in self.primers]
+        self.seed_k = seed_k
+        self._seed_table = None
+
+    def scan(self, names, fronts, backs):
+        """
+        Scan front and back windows of reads in names, return
+        (best_of_front, best_of_back) of these reads.
+        """
+        n = len(names)
+        codes, lens = encode_seqs(list(fronts) + list(backs), self.window_size)
+        best_of_front, best_of_back = {}, {}
+        for (pid, pseq), pcodes in zip(self.primers, self.primer_codes):
+            # hits of at least min_report_score have at most this many
+            # gaps (plus one for rounding), so only a band is aligned
+            max_gaps = max(0, int((len(pseq) * self.match -
+                                   self.min_report_score) / self.gap) + 1)
+            score, sStart, sEnd, pStart, pEnd = scan_windows(
+                codes, lens, pcodes, self.match, self.mismatch, self.gap,
+                self.max_start, max_gaps)
+            for k in (score >= self.min_report_score).nonzero()[0]:
+                if pStart[k] > self.max_start:
+                    continue
+                i, bestOf = (k, best_of_front) if k < n else \
+                            (k - n, best_of_back)
+                if names[i] not in bestOf:
+                    bestOf[names[i]] = {}
+                bestOf[names[i]][pid] = DOMRecord(
+                    pid=pid, sid=names[i], score=round(score[k], 1),
+                    pStart=pStart[k], pEnd=pEnd[k], pLen=len(pseq),
+                    sStart=sStart[k], sEnd=sEnd[k], sLen=lens[k])
+        return (best_of_front, best_of_back)
+
+    def _align(self, sid, regions, sLen, min_score, search_len, max_evalue):
+        """
+        Align primers to regions [(start, seq)] of a sequence sid of
+        length sLen, return DOMRecords with score > min_score, and an
+        E-value of at most max_evalue in search_len bases.
+        """
+        width = max(len(seq) for (_start, seq) in regions)
+        codes, lens = encode_seqs([seq for (_start, seq) in regions], width)
+        hits = []
+        for (pid, pseq), pcodes in zip(self.primers, self.primer_codes):
+            score, sStart, sEnd, pStart, pEnd = scan_windows(
+                codes, lens, pcodes, self.match, self.mismatch, self.gap,
+                width)
+            for k in (score > min_score).nonzero()[0]:
+                if evalue(score[k], len(pseq), search_len) > max_evalue:
+                    continue
+                start = regions[k][0]
+                hits.append(DOMRecord(
+                    pid=pid, sid=sid, score=round(score[k], 1),
+                    pStart=pStart[k], pEnd=pEnd[k], pLen=len(pseq),
+                    sStart=start + sStart[k], sEnd=start + sEnd[k],
+                    sLen=sLen))
+        return hits
+
+    def interior_hits(self, sid, seq, min_dist_from_end, min_score,
+                      full_search=False, max_evalue=1e-4):
+        """
+        Return DOMRecords of primer hits in seq with score > min_score
+        and E-value <= max_evalue, which start after and end before
+        min_dist_from_end bases from either end of seq (i.e., hits which
+        make seq a chimera).
+        Only regions around primer k-mer seeds are searched, unless
+        full_search is True.
+        """
+        # hits must lie within seq[lo:hi]
+        lo, hi = min_dist_from_end + 1, len(seq) - min_dist_from_end - 1
+        if hi - lo <= 0:
+            return []
+        if full_search:
+            return self._align(sid, [(lo, seq[lo:hi])], len(seq), min_score,
+                               hi - lo, max_evalue)
+
+        if self._seed_table is None:
+            self._seed_table = kmer_table(self.primer_codes, self.seed_k)
+        codes, lens = encode_seqs([seq[lo:hi]], hi - lo)
+        seeds = find_seeds(codes[0], lens[0], self._seed_table, self.seed_k)
+        if len(seeds) == 0:
+            return []
+        # merge regions of +/- one primer length around seeds
+        flank = max(len(pseq) for (_pid, pseq) in self.primers)
+        regions = []
+        for x in seeds:
+            start = max(lo, lo + x - flank)
+            end = min(hi, lo + x + self.seed_k + flank)
+            if len(regions) > 0 and start <= regions[-1][1]:
+                regions[-1][1] = end
+            else:
+                regions.append([start, end])
+        return self._align(sid, [(start, seq[start:end])
+                                 for (start, end) in regions],
+                           len(seq), min_score, hi - lo, max_evalue)
+
+    def _batches(self, reads, batch_size):
+        """Yield batches of (reads, names, front windows, back windows)."""
+        batch = []
+        for read in reads:
+            batch.append(read)
+            if len(batch) == batch_size:
+                yield self._windows(batch)
+                batch = []
+        if len(batch) > 0:
+            yield self._windows(batch)
+
+    def _windows(self, batch):
+        """Return (batch, names, front windows, back windows)."""
+        w = self.window_size
+        return (batch, [r.name for r in batch],
+                [r.sequence[:w] for r in batch],
+                [revcmp(r.sequence[-w:]) for r in batch])
+
+    def scan_reads(self, reads, cpus=1, batch_size=1000):
+        """
+        Scan reads (an iterable of FastaRecord) in batches with cpus
+        processes, yield (read, front hits, back hits) in input order,
+        where hits are {primer_name: DOMRecord} or None.
+        Only windows are sent to worker processes, at most 4 * cpus
+        batches at a time.
+        """
+        batches = self._batches(reads, batch_size)
+        pool = Pool(processes=cpus, initializer=_init_worker,
+                    initargs=(self,)) if cpus > 1 else None
+        try:
+            while True:
+                group = list(islice(batches, 4 * cpus))
+                if len(group) == 0:
+                    break
+                args = [(names, fronts, backs)
+                        for (_b, names, fronts, backs) in group]
+                if pool is not None:
+                    results = pool.map(_scan_batch, args)
+                else:
+                    results = [self.scan(*x) for x in args]
+                for (batch, _n, _f, _b), (best_of_front, best_of_back) in \
+                        zip(group, results):
+                    for read in batch:
+                        yield (read, best_of_front.get(read.name),
+                               best_of_back.get(read.name))
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+
+_worker_scanner = None
+
+
+def _init_worker(scanner):
+    """Set the PrimerScanner of a worker process."""
+    global _worker_scanner
+    _worker_scanner = scanner
+
+
+def _scan_batch(args):
+    """Scan windows (names, fronts, backs) of a batch in a worker process."""
+    return _worker_scanner.scan(*args)
@@ -0,0 +1,429 @@
+"""
+Define StageGraph, a declarative graph of pipeline stages with
+content-addressed caching of stage outputs and a concurrent executor.
+
+A stage is a function together with everything its outputs depend on:
+its parameters, the input files it reads, and the stages whose outputs
+it reads:
+
+    g = StageGraph(cache_dir=op.join(root_dir, "stages"), max_cpus=24)
+    g.add(Stage("split", split_func, inputs=[flnc_fq],
+                params={'reads_per_split': 20000}))
+    g.add(Stage("init", init_func, deps=["split"], outputs=[uc_pickle],
+                cpus=24))
+    g.run()
+
+The key of a stage is a sha1 hash of its name, parameters and outputs,
+the content of its input files, and the content of the outputs of the
+stages it depends on. When a stage completes, its key and the size and
+mtime of its outputs are written to <cache_dir>/<name>.done. A stage whose
+.done file has the same key, and whose outputs are unchanged (same size
+and mtime), is skipped. Files are only hashed when the key of a stage
+which reads them is computed, and their digests are cached by size and
+mtime, so that outputs which no stage reads, and files which did not
+change, are not hashed. Therefore, a killed run resumes at the first stage
+which did not complete, and a parameter change re-runs the stage it
+belongs to and downstream stages whose inputs actually changed.
+
+Stages whose dependencies are done run concurrently, in threads of this
+process or in forked processes (fork=True), as long as the total cpus
+and mem_mb of running stages are within max_cpus and max_mem_mb.
+Processes are only forked by the thread which calls run(), a thread of
+the stage waits for the process to exit.
+"""
+
+import os
+import os.path as op
+import json
+import logging
+import threading
+import traceback
+from hashlib import md5, sha1
+from multiprocessing import Process, Pipe
+from pbtools.pbtranscript.PBTranscriptException import PBTranscriptException
+from pbtools.pbtranscript.Utils import mkdir, realpath
+
+BLOCK_SIZE = 16 * 1024 * 1024
+
+
+class StageGraphException(PBTranscriptException):
+
+    """Exception class for StageGraph."""
+
+    def __init__(self, msg):
+        PBTranscriptException.__init__(self, "stage", msg)
+
+
+def canonical(obj):
+    """
+    Return a canonical string of parameters obj: dicts are sorted by
+    key, objects (e.g., IceOptions) are represented by their attributes.
+    """
+    if isinstance(obj, unicode):
+        obj = obj.encode("utf-8")
+    if isinstance(obj, dict):
+        return "{" + ",".join(canonical(k) + ":" + canonical(v)
+                              for k, v in sorted(obj.items())) + "}"
+    if isinstance(obj, (list, tuple)):
+        return "[" + ",".join(canonical(x) for x in obj) + "]"
+    if isinstance(obj, (set, frozenset)):
+        return "{" + ",".join(sorted(canonical(x) for x in obj)) + "}"
+    if hasattr(obj, "__dict__"):
+        return type(obj).__name__ + canonical(vars(obj))
+    return repr(obj)
+
+
+def file_digest(filename, block_size=BLOCK_SIZE):
+    """Return md5 hex digest of the content of a file."""
+    h = md5()
+    with open(filename, 'rb') as f:
+        while True:
+            block = f.read(block_size)
+            if len(block) == 0:
+                break
+            h.update(block)
+    return h.hexdigest()
+
+
+def _file_stat(filename):
+    """Return [size, mtime] of a file."""
+    st = os.stat(filename)
+    return [st.st_size, st.st_mtime]
+
+
+def _write_json(obj, filename):
+    """Write obj to filename as json, atomically."""
+    tmp_fn = filename + ".tmp"
+    with open(tmp_fn, 'w') as f:
+        json.dump(obj, f, indent=1, sort_keys=True)
+    os.rename(tmp_fn, filename)
+
+
+def _read_json(filename):
+    """Return json content of filename, or None if it can not be read."""
+    try:
+        with open(filename) as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return None
+
+
+def _reinit_logging_locks():
+    """Re-create locks of logging in a forked process, which another
+    thread of the parent may have held when it forked."""
+    logging._lock = threading.RLock()
+    for handler in logging.getLogger().handlers:
+        handler.createLock()
+
+
+def _child_main(func, conn):
+    """Call func in a forked process and send (ok, result) to conn."""
+    _reinit_logging_locks()
+    try:
+        conn.send((True, func()))
+    except Exception:
+        conn.send((False, traceback.format_exc()))
+    finally:
+        conn.close()
+
+
+def start_child(func):
+    """
+    Call func in a forked process, return (process, receiver) to pass
+    to wait_child. Must be called by the main thread: a process forked
+    by another thread may deadlock on locks held by the main thread.
+    """
+    receiver, sender = Pipe(duplex=False)
+    p = Process(target=_child_main, args=(func, sender))
+    p.start()
+    sender.close()
+    return (p, receiver)
+
+
+def wait_child(child, name):
+    """Wait for a process of start_child, return what its func returns."""
+    p, receiver = child
+    try:
+        ok, result = receiver.recv()
+    except EOFError:
+        ok, result = False, None
+    p.join()
+    if result is None and not ok:
+        result = "process exited with code {c}.".format(c=p.exitcode)
+    if not ok:
+        raise StageGraphException("Stage {n} failed: {e}".
+                                  format(n=name, e=result))
+    return result
+
+
+class Stage(object):
+
+    """A node of StageGraph."""
+
+    def __init__(self, name, func, deps=(), inputs=(), outputs=(),
+                 params=None, cpus=1, mem_mb=0, fork=False, reset=None):
+        """
+        name --- unique name of the stage, also the name of its .done file
+        func --- func() runs the stage, and may return a list of output
+                 files which are only known when it completes
+        deps --- names of stages whose outputs this stage reads
+        inputs --- files this stage reads, which no stage writes
+        outputs --- files this stage writes
+        params --- parameters that determine the outputs, such as options
+                   objects, dicts or lists, saved as canonical(params)
+                   when the stage is created
+        cpus, mem_mb --- cpus and memory (in MB) the stage uses
+        fork --- run func in a forked process instead of a thread
+        reset --- reset() is called before the stage is re-run with a
+                  different key, to remove partial results of a run with
+                  the previous key (e.g., checkpoints), which the stage
+                  would resume from otherwise
+        """
+        self.name = name
+        self.func = func
+        self.deps = list(deps)
+        self.inputs = [realpath(fn) for fn in inputs]
+        self.outputs = [realpath(fn) for fn in outputs]
+        self.params = canonical(params)
+        self.cpus = cpus
+        self.mem_mb = mem_mb
+        self.fork = fork
+        self.reset = reset
+
+
+class StageGraph(object):
+
+    """A graph of Stages, added in topological order."""
+
+    def __init__(self, cache_dir, max_cpus=1, max_mem_mb=None):
+        """
+        cache_dir --- directory of .done files of stages, and digests of
+                      input files
+        max_cpus, max_mem_mb --- budgets of stages running concurrently,
+                      a stage that needs more than a budget runs alone
+        """
+        self.cache_dir = realpath(cache_dir)
+        mkdir(self.cache_dir)
+        self.max_cpus = max(1, max_cpus)
+        self.max_mem_mb = max_mem_mb
+        self.stages = []
+        self.stage_by_name = {}
+        self.done = {}  # name --> .done content of completed stages
+        self._lock = threading.Lock()
+        self._digests = _read_json(self.digests_fn) or {}
+
+    @property
+    def digests_fn(self):
+        """Return <cache_dir>/input_digests.json"""
+        return op.join(self.cache_dir, "input_digests.json")
+
+    def done_fn(self, name):
+        """Return <cache_dir>/<name>.done"""
+        return op.join(self.cache_dir, name + ".done")
+
+    def started_fn(self, name):
+        """Return <cache_dir>/<name>.started"""
+        return op.join(self.cache_dir, name + ".started")
+
+    def add(self, stage):
+        """Add a stage, whose deps must have been added."""
+        if stage.name in self.stage_by_name:
+            raise StageGraphException("Stage {n} already exists.".
+                                      format(n=stage.name))
+        for dep in stage.deps:
+            if dep not in self.stage_by_name:
+                raise StageGraphException("Stage {n} depends on unknown " .
+                                          format(n=stage.name) +
+                                          "stage {d}.".format(d=dep))
+        self.stages.append(stage)
+        self.stage_by_name[stage.name] = stage
+        return stage
+
+    def outputs(self, name):
+        """Return output files of a completed stage, in the order they
+        were declared and returned by the stage."""
+        return [str(fn) for fn in self.done[name]["files"]]
+
+    def input_digest(self, filename):
+        """Return the digest of an input file or an output of a stage,
+        cached by size and mtime."""
+        stat = _file_stat(filename)
+        with self._lock:
+            cached = self._digests.get(filename)
+        if cached is not None and cached[:2] == stat:
+            return cached[2]
+        digest = file_digest(filename)
+        with self._lock:
+            self._digests[filename] = stat + [digest]
+            _write_json(self._digests, self.digests_fn)
+        return digest
+
+    def key_of(self, stage):
+        """Return the key of a stage whose deps are done."""
+        h = sha1()
+        h.update(stage.name + "\n" + stage.params + "\n")
+        for fn in stage.outputs:
+            h.update("output " + fn + "\n")
+        for fn in stage.inputs:
+            if not op.exists(fn):
+                raise StageGraphException("Input {f} of stage {n} does " .
+                                          format(f=fn, n=stage.name) +
+                                          "not exist.")
+            h.update("input " + fn + " " + self.input_digest(fn) + "\n")
+        for dep in stage.deps:
+            for fn in self.done[dep]["files"]:
+                if not op.exists(fn):
+                    raise StageGraphException("Output {f} of stage {d} " .
+                                              format(f=fn, d=dep) +
+                                              "does not exist.")
+                h.update("dep " + fn + " " + self.input_digest(fn) + "\n")
+        return h.hexdigest()
+
+    def is_fresh(self, stage, key):
+        """Return .done content of stage if it is done with key, and its
+        outputs are unchanged, otherwise None."""
+        done = _read_json(self.done_fn(stage.name))
+        if done is None or done["key"] != key:
+            return None
+        for fn, info in done["outputs"].iteritems():
+            if not op.exists(fn) or _file_stat(fn) != info[:2]:
+                return None
+        return done
+
+    def _call_stage(self, stage, key):
+        """Reset a stage if it was started with another key, call its
+        func and return what it returns."""
+        started = _read_json(self.started_fn(stage.name))
+        if started is not None and started["key"] != key and \
+                stage.reset is not None:
+            logging.info("Resetting stage {n}.".format(n=stage.name))
+            stage.reset()
+        if op.exists(self.done_fn(stage.name)):
+            os.remove(self.done_fn(stage.name))
+        _write_json({"key": key}, self.started_fn(stage.name))
+
+        logging.info("Running stage {n}.".format(n=stage.name))
+        return stage.func()
+
+    def _complete_stage(self, stage, key, files):
+        """Write the .done file of a stage whose func returned files."""
+        files = stage.outputs + [realpath(fn) for fn in files or []
+                                 if realpath(fn) not in stage.outputs]
+        outputs = {}
+        for fn in files:
+            if not op.isfile(fn):
+                raise StageGraphException("Stage {n} did not write {f}.".
+                                          format(n=stage.name, f=fn))
+            outputs[fn] = _file_stat(fn)
+        done = {"key": key, "files": files, "outputs": outputs}
+        _write_json(done, self.done_fn(stage.name))
+        return done
+
+    def _worker(self, stage, key, finished, cond, child=None):
+        """Run a stage in a thread, or wait for the child process of
+        start_child running it, append (name, done, error) to finished
+        when it completes."""
+        try:
+            if child is not None:
+                files = wait_child(child, stage.name)
+            else:
+                files = self._call_stage(stage, key)
+            result = (stage.name, self._complete_stage(stage, key, files),
+                      None)
+        except Exception as e:
+            logging.error("Stage {n} failed.\n{t}".
+                          format(n=stage.name, t=traceback.format_exc()))
+            result = (stage.name, None, e)
+        with cond:
+            finished.append(result)
+            cond.notify()
+
+    def run(self):
+        """
+        Run stages which are not done or whose keys changed, as many at
+        a time as budgets allow. Return names of stages that were run.
+        If a stage fails, running stages are completed, no new stages
+        are started, and the first error is raised.
+        """
+        pending = [s for s in self.stages if s.name not in self.done]
+        running = {}  # name --> stage
+        keys = {}  # name --> key of a pending stage whose deps are done
+        finished, ran, errors = [], [], []
+        # cond only guards finished, which worker threads append to;
+        # keys (which may hash files) are computed without holding it
+        cond = threading.Condition()
+        while len(pending) > 0 or len(running) > 0:
+            with cond:
+                completed = list(finished)
+                del finished[:]
+            for name, done, error in completed:
+                del running[name]
+                if error is None:
+                    self.done[name] = done
+                    ran.append(name)
+                else:
+                    errors.append(error)
+
+            progress = False
+            for stage in list(pending) if len(errors) == 0 else []:
+                if any(dep not in self.done for dep in stage.deps):
+                    continue
+                if stage.name not in keys:
+                    keys[stage.name] = self.key_of(stage)
+                    done = self.is_fresh(stage, keys[stage.name])
+                    if done is not None:
+                        logging.info("Stage {n} is up to date.".
+                                     format(n=stage.name))
+                        self.done[stage.name] = done
+                        pending.remove(stage)
+                        progress = True
+                        continue
+                if not self._fits(stage, list(running.values())):
+                    continue
+                running[stage.name] = stage
+                pending.remove(stage)
+                self._start(stage, keys[stage.name], finished, cond)
+                progress = True
+
+            if len(running) == 0 and (len(errors) > 0 or len(pending) == 0):
+                break
+            with cond:
+                if not progress and len(finished) == 0:
+                    if len(running) == 0:
+                        raise StageGraphException(
+                            "Stages {s} can not run.".format(
+                                s=", ".join(s.name for s in pending)))
+                    cond.wait()
+        if len(errors) > 0:
+            raise errors[0]
+        return ran
+
+    def _start(self, stage, key, finished, cond):
+        """Start a stage in a thread; a stage with fork=True is forked
+        here, in the thread of run(), and its thread waits for it."""
+        child = None
+        if stage.fork:
+            try:
+                child = start_child(lambda: self._call_stage(stage, key))
+            except Exception as e:
+                logging.error("Stage {n} failed to start.\n{t}".
+                              format(n=stage.name, t=traceback.format_exc()))
+                with cond:
+                    finished.append((stage.name, None, e))
+                return
+        threading.Thread(target=self._worker,
+                         args=(stage, key, finished, cond, child)).start()
+
+    def _fits(self, stage, running):
+        """Return True if stage can start next to running stages."""
+        if len(running) == 0:
+            return True
+        cpus = sum(min(s.cpus, self.max_cpus) for s in running + [stage])
+        if cpus > self.max_cpus:
+            return False
+        if self.max_mem_mb is not None:
+            mem = sum(min(s.mem_mb, self.max_mem_mb)
+                      for s in running + [stage])
+            if mem > self.max_mem_mb:
+                return False
+        return True
@@ -44,6 +44,7 @@ from pbcore.io.FastaIO import FastaWriter
 from pbcore.io.FastqIO import FastqWriter
 from pbtools.pbtranscript.counting import compare_junctions
 from pbtools.pbtranscript.io import GFF
+from pbtools.pbtranscript.io.SAMSorter import SortedSAMStream
 
 def pick_rep(fa_fq_filename, gff_filename, group_filename, output_filename, is_fq=False, pick_least_err_instead=False, bad_gff_filename=None):
     """
@@ -104,52 +105,90 @@ def pick_rep(fa_fq_filename, gff_filename, group_filename, output_filename, is_f
             fout.writeRecord(_id_, _seq_)
     fout.close()
 
+from bisect import bisect_left, insort
 from collections import defaultdict
 from bx.intervals import IntervalTree
 
+def three_prime_site(r):
+    """
+    Return the genomic coordinate of the 3'-most splice site of r, i.e., the
+    acceptor of its 3' exon: on + strand the start of the last exon,
+    r.ref_exons[-1].start; on - strand, where the 3' exon is the first exon
+    in genomic order, its end, r.ref_exons[0].end. If r has only one exon,
+    this is its 5' end (r.start on +, r.end on -).
+    Transcripts that can be fuzzy-merged (exact, or subset/super sharing the 3'
+    exon) agree on this within internal_fuzzy_max_dist, unless both are single-exon.
+    """
+    return r.ref_exons[-1].start if r.strand == '+' else r.ref_exons[0].end
+
+def can_merge(m, r1, r2, allow_extra_5exon, internal_fuzzy_max_dist):
+    """
+    Return True if r1 and r2, whose junctions compare as m (see
+    compare_junctions), can be merged into one fuzzy group.
+    """
+    if m == 'exact':
+        return True
+    else:
+        if not allow_extra_5exon:
+            return False
+    # below is continued only if (a) is 'subset' or 'super' AND (b) allow_extra_5exon is True
+    if m == 'subset':
+        r1, r2 = r2, r1 #  rotate so r1 is always the longer one
+    if m == 'super' or m == 'subset':
+        n2 = len(r2.ref_exons)
+        # check that (a) r1 and r2 end on same 3' exon, that is the last acceptor site agrees
+        # AND (b) the 5' start of r2 is sandwiched between the matching r1 exon coordinates
+        if r1.strand == '+':
+            return abs(r1.ref_exons[-1].start - r2.ref_exons[-1].start) <= internal_fuzzy_max_dist and \
+                r1.ref_exons[-n2].start <= r2.ref_exons[0].start < r1.ref_exons[-n2].end
+        else:
+            return abs(r1.ref_exons[0].end - r2.ref_exons[0].end) <= internal_fuzzy_max_dist and \
+                r1.ref_exons[n2-1].start <= r2.ref_exons[-1].end < r1.ref_exons[n2].end
+    return False
+
 def collapse_fuzzy_junctions(gff_filename, group_filename, allow_extra_5exon, internal_fuzzy_max_dist):
     def get_fl_from_id(members):
         # ex: 13cycle_1Mag1Diff|i0HQ_SIRV_1d1m|c139597/f1p0/178
         return sum(int(_id.split('/')[1].split('p')[0][1:]) for _id in members)
 
-    def can_merge(m, r1, r2):
-        if m == 'exact':
-            return True
-        else:
-            if not allow_extra_5exon:
-                return False
-        # below is continued only if (a) is 'subset' or 'super' AND (b) allow_extra_5exon is True
-        if m == 'subset':
-            r1, r2 = r2, r1 #  rotate so r1 is always the longer one
-        if m == 'super' or m == 'subset':
-            n2 = len(r2.ref_exons)
-            # check that (a) r1 and r2 end on same 3' exon, that is the last acceptor site agrees
-            # AND (b) the 5' start of r2 is sandwiched between the matching r1 exon coordinates
-            if r1.strand == '+':
-                return abs(r1.ref_exons[-1].start - r2.ref_exons[-1].start) <= internal_fuzzy_max_dist and \
-                    r1.ref_exons[-n2].start <= r2.ref_exons[0].start < r1.ref_exons[-n2].end
-            else:
-                return abs(r1.ref_exons[0].end - r2.ref_exons[0].end) <= internal_fuzzy_max_dist and \
-                    r1.ref_exons[n2-1].start <= r2.ref_exons[-1].end < r1.ref_exons[n2].end
-        return False
-
     d = {}
-    recs = defaultdict(lambda: {'+':IntervalTree(), '-':IntervalTree()}) # chr --> strand --> tree
+    # each fuzzy group is represented by its first transcript, indexed by
+    # chr --> strand --> sorted list of (3' splice site, group index, rep)
+    sites = defaultdict(lambda: {'+':[], '-':[]})
+    # single-exon reps, which match single-exon transcripts on any overlap
+    single_exon = defaultdict(lambda: {'+':IntervalTree(), '-':IntervalTree()}) # chr --> strand --> tree
     fuzzy_match = defaultdict(lambda: [])
+    num_groups = 0
     for r in GFF.collapseGFFReader(gff_filename):
         d[r.seqid] = r
-        has_match = False
         r.segments = r.ref_exons
-        for r2 in recs[r.chr][r.strand].find(r.start, r.end):
-            r2.segments = r2.ref_exons
+        site = three_prime_site(r)
+        _sites = sites[r.chr][r.strand]
+        # candidates: reps within the fuzzy window of the 3' splice site,
+        # tried by start, then group creation order, as IntervalTree.find
+        # returned overlapping reps
+        candidates = []
+        i = bisect_left(_sites, (site - internal_fuzzy_max_dist, ))
+        while i < len(_sites) and _sites[i][0] <= site + internal_fuzzy_max_dist:
+            candidates.append(_sites[i][1:])
+            i += 1
+        if len(r.ref_exons) == 1:
+            candidates += single_exon[r.chr][r.strand].find(r.start, r.end)
+        candidates = sorted(set(candidates), key=lambda x: (x[1].start, x[0]))
+
+        for _order, r2 in candidates:
+            if r2.start >= r.end or r.start >= r2.end: # no overlap
+                continue
             m = compare_junctions.compare_junctions(r, r2, internal_fuzzy_max_dist=internal_fuzzy_max_dist)
-            if can_merge(m, r, r2):
+            if can_merge(m, r, r2, allow_extra_5exon, internal_fuzzy_max_dist):
                 fuzzy_match[r2.seqid].append(r.seqid)
-                has_match = True
                 break
-        if not has_match:
-            recs[r.chr][r.strand].insert(r.start, r.end, r)
+        else:
+            insort(_sites, (site, num_groups, r))
+            if len(r.ref_exons) == 1:
+                single_exon[r.chr][r.strand].insert(r.start, r.end, (num_groups, r))
             fuzzy_match[r.seqid] = [r.seqid]
+            num_groups += 1
 
     group_info = {}
     with open(group_filename) as f:
@@ -185,8 +224,13 @@ def main(args):
         print >> sys.stderr, "Input file {0} does not exist. Abort.".format(args.fasta)
         sys.exit(-1)
     
-    if not os.path.exists(args.sam):
-        print >> sys.stderr, "SAM file {0} does not exist. Abort.".format(args.sam)
+    sams = args.sam.split(',')
+    for sam in sams:
+        if not os.path.exists(sam):
+            print >> sys.stderr, "SAM file {0} does not exist. Abort.".format(sam)
+            sys.exit(-1)
+    if len(sams) > 1 and not args.sort_sam:
+        print >> sys.stderr, "Multiple SAM files must be used with --sort_sam. Abort."
         sys.exit(-1)
 
     # check for duplicate IDs
@@ -205,10 +249,16 @@ def main(args):
     f_txt = open(args.prefix + '.collapsed.group.txt', 'w')
     
     b = branch_simple2.BranchSimple(args.input, cov_threshold=cov_threshold, min_aln_coverage=args.min_aln_coverage, min_aln_identity=args.min_aln_identity, is_fq=args.fq)
-    iter = b.iter_gmap_sam(args.sam, ignored_fout)
+    if args.sort_sam: # sort in-process and stream the sorted records, no sorted SAM is written
+        sam = SortedSAMStream(sams, cpus=args.cpus, buffer_size=args.sort_buffer_size*1024*1024)
+    else:
+        sam = args.sam
+    iter = b.iter_gmap_sam(sam, ignored_fout)
     for recs in iter:
         for v in recs.itervalues():
             if len(v) > 0: b.process_records(v, args.allow_extra_5exon, False, f_good, f_bad, f_txt)
+    if args.sort_sam:
+        sam.close()
     
     ignored_fout.close()
     f_good.close()
@@ -249,6 +299,9 @@ if __name__ == "__main__":
     parser.add_argument("--input", help="Input FA/FQ filename")
     parser.add_argument("--fq", default=False, action="store_true", help="Input is a fastq file (default is fasta)")
     parser.add_argument("-s", "--sam", required=True, help="Sorted GMAP SAM filename")
+    parser.add_argument("--sort_sam", default=False, action="store_true", help="SAM is not sorted, sort it in-process; -s may then be a comma-separated list of SAMs (default: off)")
+    parser.add_argument("--cpus", type=int, default=1, help="Number of processes for --sort_sam (default: 1)")
+    parser.add_argument("--sort_buffer_size", type=int, default=256, help="Max MB of SAM sorted by each process for --sort_sam (default: 256)")
     parser.add_argument("-o", "--prefix", required=True, help="Output filename prefix")
     parser.add_argument("-c", "--min-coverage", dest="min_aln_coverage", type=float, default=.99, help="Minimum alignment coverage (default: 0.99)")
     parser.add_argument("-i", "--min-identity", dest="min_aln_identity", type=float, default=.95, help="Minimum alignment identity (default: 0.95)")
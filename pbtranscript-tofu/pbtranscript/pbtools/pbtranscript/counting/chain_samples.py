@@ -1,9 +1,10 @@
 #!/usr/bin/env python
-import os, sys, glob, shutil
+import os, sys, heapq
 from csv import DictReader
 from collections import defaultdict
+from bx.intervals.cluster import ClusterTree
 from pbtools.pbtranscript.io import GFF
-from pbtools.pbtranscript.counting import combine_abundance_across_samples as sp
+from pbtools.pbtranscript.counting import compare_junctions
 
 def read_config(filename):
     """
@@ -45,8 +46,9 @@ def read_config(filename):
     return sample_dirs, sample_names, group_filename, gff_filename, count_filename
 
 
-def chain_samples(dirs, names, group_filename, gff_filename, count_filename, field_to_use='norm_nfl', fuzzy_junction=0):
-    count_info = {} # key: (sample, PB.1.1) --> count
+def read_count_info(dirs, count_filename, field_to_use):
+    """Return dict of (sample, PB.1.1) --> count"""
+    count_info = {}
     for name, d in dirs.iteritems():
         f = open(os.path.join(d, count_filename))
         while True:
@@ -55,73 +57,131 @@ def chain_samples(dirs, names, group_filename, gff_filename, count_filename, fie
         f.seek(cur)
         for r in DictReader(f, delimiter='\t'):
             count_info[name, r['pbid']] = r[field_to_use]
+        f.close()
+    return count_info
 
-    name = names[0]
-    d = dirs[name]
-    chain = [name]
-
-    o = sp.MegaPBTree(os.path.join(d, gff_filename), os.path.join(d, group_filename), self_prefix=name, internal_fuzzy_max_dist=fuzzy_junction)
-    for name in names[1:]:
-        d = dirs[name]
-        o.add_sample(os.path.join(d, gff_filename), os.path.join(d, group_filename), sample_prefix=name, output_prefix='tmp_'+name)
-        o = sp.MegaPBTree('tmp_'+name+'.gff', 'tmp_'+name+'.group.txt', self_prefix='tmp_'+name, internal_fuzzy_max_dist=fuzzy_junction)
-        chain.append(name)
-
-    # now recursively chain back by looking at mega_info.txt!!!
-    d = {} # ex: (tmp_1009, PB.1.1) --> mega info dict
-    for c in chain[1:]:
-        for r in DictReader(open('tmp_' + c + '.mega_info.txt'),delimiter='\t'):
-            d['tmp_'+c, r['pbid']] = r
-
-    f1 = open('all_samples.chained_ids.txt', 'w')
-    f1.write("superPBID")
-    f2 = open('all_samples.chained_count.txt', 'w')
-    f2.write("superPBID")
-    for c in chain:
-        f1.write('\t' + c)
-        f2.write('\t' + c)
-    f1.write('\n')
-    f2.write('\n')
-
-    reader = DictReader(open('tmp_' + chain[-1] + '.mega_info.txt'),delimiter='\t')
-    for r in reader:
-        saw_NA = False
-        r0 = r
-        answer = defaultdict(lambda: 'NA') # ex: 1009 --> PB.1.1
-        answer2 = defaultdict(lambda: 'NA') # ex: 1009 --> count
-        answer[chain[-1]] = r[chain[-1]]
-        if r[chain[-1]] !='NA':
-            answer2[chain[-1]] = count_info[chain[-1], answer[chain[-1]]]
-        for c in chain[::-1][1:-1]:  # the first sample does not have tmp_, because it's not a chain
-            if r['tmp_'+c] == 'NA':
-                saw_NA = True
-                break
+
+def iter_sorted_records(dirs, names, gff_filename):
+    """
+    Yield (chr, strand, start, end, sample_index, record_index, record)
+    of collapsed GFF records of all samples, sorted by coordinates.
+    """
+    per_sample = []
+    for i, name in enumerate(names):
+        recs = [(r.chr, r.strand, r.start, r.end, i, j, r) for j, r in \
+                enumerate(GFF.collapseGFFReader(os.path.join(dirs[name], gff_filename)))]
+        recs.sort()
+        per_sample.append(recs)
+    return heapq.merge(*per_sample)
+
+
+def sweep_chain(sorted_records, fuzzy_junction=0):
+    """
+    Chain coordinate-sorted records of all samples in one sweep.
+
+    Keep an active set of chained transcripts [representative, {sample_index: record}]
+    overlapping the current position. A record is chained to the first active
+    transcript with the exact same junctions (see MegaPBTree.match_record_to_tree)
+    that has no record of the same sample yet; otherwise it starts a new one.
+    The representative is the longest record (ties go to the later sample).
+
+    Returns dict of (chr, strand) --> list of chained transcripts, sorted by start.
+    """
+    chained = defaultdict(list)
+    key, active = None, []
+    for chrom, strand, start, end, i, _j, r in sorted_records:
+        if (chrom, strand) != key:
+            chained[key].extend(active)
+            key, active = (chrom, strand), []
+        # retire transcripts that end before this record
+        still_active = []
+        for m in active:
+            if m[0].end <= start:
+                chained[key].append(m)
             else:
-                r2 = d['tmp_'+c, r['tmp_'+c]]
-                answer[c] = r2[c]
-                if answer[c] != 'NA':
-                    answer2[c] = count_info[c, answer[c]]
-                r = r2
-        if not saw_NA:
-            answer[chain[0]] = r[chain[0]]
-            if answer[chain[0]] !='NA':
-                answer2[chain[0]] = count_info[chain[0], answer[chain[0]]]
-        f1.write(r0['pbid'])
-        f2.write(r0['pbid'])
-        for c in chain:
-            f1.write("\t" + answer[c]) # each tissue still share the same PB id
-            f2.write("\t" + str(answer2[c]))
-        f1.write('\n')
-        f2.write('\n')
+                still_active.append(m)
+        active = still_active
+
+        r.segments = r.ref_exons
+        for m in active:
+            if i not in m[1] and compare_junctions.compare_junctions(\
+                    r, m[0], internal_fuzzy_max_dist=fuzzy_junction) == 'exact':
+                m[1][i] = r
+                if r.end - r.start >= m[0].end - m[0].start:
+                    m[0] = r
+                break
+        else:
+            active.append([r, {i: r}])
+    chained[key].extend(active)
+    chained.pop(None, None)
+
+    for v in chained.itervalues():
+        v.sort(key=lambda m: (m[0].start, m[0].end))
+    return chained
+
+
+def write_chained(chained, names, count_info, output_prefix='all_samples'):
+    """
+    Write chained transcripts as collapsed GFF (<output_prefix>.chained.gff),
+    with loci re-calculated as in MegaPBTree.write_cluster_tree_as_gff,
+    and per-sample ids and counts (<output_prefix>.chained_ids.txt,
+    <output_prefix>.chained_count.txt).
+    """
+    f_out = open(output_prefix + '.chained.gff', 'w')
+    f1 = open(output_prefix + '.chained_ids.txt', 'w')
+    f2 = open(output_prefix + '.chained_count.txt', 'w')
+    f1.write("superPBID\t" + "\t".join(names) + "\n")
+    f2.write("superPBID\t" + "\t".join(names) + "\n")
+
+    loci_index = 0
+    for k in sorted(set(chrom for chrom, _strand in chained)):
+        for strand in ('+', '-'):
+            recs = chained.get((k, strand), [])
+            cluster_tree = ClusterTree(0, 0)
+            for i, m in enumerate(recs):
+                cluster_tree.insert(m[0].start, m[0].end, i)
+            for _s, _e, rec_indices in cluster_tree.getregions():
+                loci_index += 1
+                isoform_index = 0
+                for i in rec_indices:
+                    isoform_index += 1
+                    tID = "PB.{i}.{j}".format(i=loci_index, j=isoform_index)
+                    r, members = recs[i]
+                    f1.write(tID)
+                    f2.write(tID)
+                    for x, name in enumerate(names):
+                        if x in members:
+                            f1.write("\t" + members[x].seqid)
+                            f2.write("\t" + str(count_info[name, members[x].seqid]))
+                        else:
+                            f1.write("\tNA")
+                            f2.write("\tNA")
+                    f1.write("\n")
+                    f2.write("\n")
+                    f_out.write("{chr}\tPacBio\ttranscript\t{s}\t{e}\t.\t{strand}\t.\tgene_id \"PB.{i}\"; transcript_id \"{tID}\";\n".format(\
+                        chr=k, s=r.start+1, e=r.end, strand=strand, tID=tID, i=loci_index))
+                    for exon in r.ref_exons:
+                        f_out.write("{chr}\tPacBio\texon\t{s}\t{e}\t.\t{strand}\t.\tgene_id \"PB.{i}\"; transcript_id \"{tID}\";\n".format(\
+                            chr=k, s=exon.start+1, e=exon.end, strand=strand, tID=tID, i=loci_index))
+    f_out.close()
     f1.close()
     f2.close()
+    return f_out.name, f1.name, f2.name
+
 
-    shutil.copyfile('tmp_' + chain[-1] + '.gff', 'all_samples.chained.gff')
+def chain_samples(dirs, names, group_filename, gff_filename, count_filename, field_to_use='norm_nfl', fuzzy_junction=0):
+    """
+    Chain collapsed isoforms of all samples in a single N-way sweep over
+    coordinate-sorted transcripts, no intermediate files are written.
+    (group_filename is not needed for the chained output)
+    """
+    count_info = read_count_info(dirs, count_filename, field_to_use)
+    chained = sweep_chain(iter_sorted_records(dirs, names, gff_filename), fuzzy_junction)
+    out_files = write_chained(chained, names, count_info)
 
     print >> sys.stderr, "Chained output written to:"
-    print >> sys.stderr, "all_samples.chained.gff"
-    print >> sys.stderr, f1.name
-    print >> sys.stderr, f2.name
+    for fn in out_files:
+        print >> sys.stderr, fn
 
 
 if __name__ == "__main__":
@@ -1,11 +1,33 @@
 __author__ = 'etseng@pacificbiosciences.com'
 import os, sys
+import numpy as np
 from collections import defaultdict
 from pbtools.pbtranscript.counting import compare_junctions
 from pbtools.pbtranscript.io import GFF
-from bx.intervals import IntervalTree
 from bx.intervals.cluster import ClusterTree
 
+
+class SortedIntervalIndex:
+    """
+    Static interval index over a fixed list of records (with .start/.end):
+    records sorted by start (ties in given order, as bx's IntervalTree.find
+    returns them), plus the running maximum of their ends, so that a query
+    is two binary searches and a scan of the candidates.
+    """
+    def __init__(self, records):
+        self.records = sorted(records, key=lambda r: r.start)
+        self.starts = np.array([r.start for r in self.records], dtype=np.int64)
+        self.ends = np.array([r.end for r in self.records], dtype=np.int64)
+        self.max_ends = np.maximum.accumulate(self.ends) if len(self.ends) > 0 else self.ends
+
+    def find(self, start, end):
+        """Return records overlapping [start, end), in order of start."""
+        # records [lo, hi) start before <end> and some record before hi ends after <start>
+        hi = self.starts.searchsorted(end, 'left')
+        lo = self.max_ends[:hi].searchsorted(start, 'right')
+        return [self.records[k] for k in xrange(lo, hi) if self.ends[k] > start]
+
+
 class MegaPBTree:
     """
     Structure for maintaining a non-redundant set of gene annotations
@@ -16,8 +38,9 @@ class MegaPBTree:
         self.group_filename = group_filename
         self.self_prefix = self_prefix
         self.internal_fuzzy_max_dist = internal_fuzzy_max_dist
-        self.record_d = dict((r.seqid, r) for r in GFF.collapseGFFReader(gff_filename))
-        self.tree = defaultdict(lambda: {'+':IntervalTree(), '-':IntervalTree()}) # chr --> strand --> tree
+        self.records = [r for r in GFF.collapseGFFReader(gff_filename)]
+        self.record_d = dict((r.seqid, r) for r in self.records)
+        self.tree = {} # (chr, strand, number of exons) --> SortedIntervalIndex
 
         #print >> sys.stderr, "self.internal_fuzzy_max_dist is", internal_fuzzy_max_dist
         #raw_input()
@@ -26,10 +49,15 @@ class MegaPBTree:
 
     def read_gff_as_interval_tree(self):
         """
-        Read a collapsed GFF file into an IntervalTree
+        Index the collapsed GFF records by (chr, strand, number of exons),
+        since only records with the same number of exons can be an exact match
         """
-        for r in GFF.collapseGFFReader(self.gff_filename):
-            self.tree[r.chr][r.strand].insert(r.start, r.end, r)
+        groups = defaultdict(list)
+        for r in self.records:
+            r.segments = r.ref_exons
+            groups[r.chr, r.strand, len(r.ref_exons)].append(r)
+        for k, recs in groups.iteritems():
+            self.tree[k] = SortedIntervalIndex(recs)
 
     @staticmethod
     def read_group(group_filename, group_prefix):
@@ -52,31 +80,32 @@ class MegaPBTree:
         Otherwise return None
         *NOTE*: the tree should be non-redundant so can return as soon as exact match is found!
         """
-        matches = self.tree[r.chr][r.strand].find(r.start, r.end)
-        for r2 in matches:
-            r.segments = r.ref_exons
-            r2.segments = r2.ref_exons
+        index = self.tree.get((r.chr, r.strand, len(r.ref_exons)))
+        if index is None:
+            return None
+        r.segments = r.ref_exons
+        for r2 in index.find(r.start, r.end):
             if compare_junctions.compare_junctions(r, r2, internal_fuzzy_max_dist=self.internal_fuzzy_max_dist) == 'exact': # is a match!
                 return r2
         return None
 
     def add_sample(self, gff_filename, group_filename, sample_prefix, output_prefix):
         combined = [] # list of (r1 if r2 is None | r2 if r1 is None | longer of r1 or r2 if both not None)
-        unmatched_recs = self.record_d.keys()
+        unmatched_recs = set(self.record_d)
 
         for r in GFF.collapseGFFReader(gff_filename):
             match_rec = self.match_record_to_tree(r)
             if match_rec is not None:  # found a match! put longer of r1/r2 in
                 combined.append((match_rec, r))
-                try:
-                    unmatched_recs.remove(match_rec.seqid)
-                except ValueError:
-                    pass # already deleted, OK, this happens for single-exon transcripts
+                # may already be matched, OK, this happens for single-exon transcripts
+                unmatched_recs.discard(match_rec.seqid)
             else:  # r is not present in current tree
                 combined.append((None, r))
         # put whatever is left from the tree in
-        for seqid in unmatched_recs:
-            combined.append((self.record_d[seqid], None))
+        for r1 in self.records:
+            if r1.seqid in unmatched_recs:
+                combined.append((r1, None))
+                unmatched_recs.discard(r1.seqid)
 
         # create a ClusterTree to re-calc the loci/transcripts
         final_tree = defaultdict(lambda: {'+': ClusterTree(0, 0), '-':ClusterTree(0, 0)})
@@ -47,7 +47,6 @@ def compare_junctions(r1, r2, internal_fuzzy_max_dist=0):
                    abs(r1.segments[i+k+1].start-r2.segments[j+k+1].start)>internal_fuzzy_max_dist:
                     return "partial"
                 k += 1
-            print i, j, k
             if i+k+1 == len(r1.segments):
                 if j+k+1 == len(r2.segments): 
                     if i == 0:
@@ -1,6 +1,10 @@
 __author__ = 'etseng@pacificbiosciences.com'
 import os, sys
+import heapq, shutil, tempfile
+import numpy as np
 from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
 from cPickle import dump, load
 from csv import DictReader
 from pbcore.io.FastaIO import FastaReader
@@ -35,12 +39,91 @@ def read_group_filename(group_filename, is_cid=True, sample_prefixes=None):
                 if is_cid: cid = cid.split('/')[0]
                 cid_info[None][cid] = pbid
             else:
-                if any(cid.startswith(sample_prefix + '|') for sample_prefix in sample_prefixes):
-                    sample_prefix, cid = cid.split('|', 1)
+                i = cid.find('|')
+                if i >= 0 and cid[:i] in cid_info:
+                    sample_prefix, cid = cid[:i], cid[i+1:]
                     if is_cid: cid = cid.split('/')[0]
                     cid_info[sample_prefix][cid] = pbid
     return cid_info
 
+
+class AbundanceCounter(object):
+    """
+    Accumulate per-isoform counts in numpy arrays, one slot per collapsed
+    isoform (ex: PB.1.1), rows are count_fl, count_nfl (unique nFL only)
+    and count_nfl_amb (weighted ambiguous nFL only), plus the total number
+    of FL, unique-or-unmapped nFL and ambiguous nFL reads.
+
+    Counts take memory proportional to the number of isoforms. The
+    output_read_count_FL/nFL functions which fill a counter merge the
+    reads of pickles by read id (see iter_reads_of_pickles), so that they
+    never hold more than the reads of one pickle.
+    """
+    FL, NFL, NFL_AMB = 0, 1, 2
+
+    def __init__(self):
+        self.pbid_index = {} # PB.1.1 --> index
+        self.pbids = []
+        self.counts = np.zeros((3, 1024), dtype=np.float64)
+        self.total = np.zeros(3, dtype=np.int64)
+
+    def add(self, kind, pbid, weight=1.):
+        """Add weight to count <kind> (FL|NFL|NFL_AMB) of isoform <pbid>."""
+        i = self.pbid_index.get(pbid)
+        if i is None:
+            i = self.pbid_index[pbid] = len(self.pbids)
+            self.pbids.append(pbid)
+            if i == self.counts.shape[1]:
+                self.counts = np.hstack((self.counts, np.zeros_like(self.counts)))
+        self.counts[kind, i] += weight
+
+    def write(self, output_filename, given_total=None, write_header_comments=True):
+        """
+        Write abundance file.
+        If given_total is not None, use it instead of the accumulated totals
+        given_total should be dict of {fl, nfl, nfl_amb}
+        """
+        if given_total is not None:
+            use_total_fl = given_total['fl']
+            use_total_nfl = given_total['fl'] + given_total['nfl']
+            # ToDo: the below is NOT EXACTLY CORRECT!! Fix later!
+            use_total_nfl_amb = given_total['fl'] + given_total['nfl'] + given_total['nfl_amb']
+        else:
+            use_total_fl = int(self.total[self.FL])
+            use_total_nfl = use_total_fl + int(self.total[self.NFL])
+            use_total_nfl_amb = use_total_nfl + int(self.total[self.NFL_AMB])
+
+        f = open(output_filename,'w')
+        if write_header_comments:
+            f.write("#\n")
+            f.write("# -----------------\n")
+            f.write("# Field explanation\n")
+            f.write("# -----------------\n")
+            f.write("# count_fl: Number of associated FL reads\n")
+            f.write("# count_nfl: Number of associated FL + unique nFL reads\n")
+            f.write("# count_nfl_amb: Number of associated FL + unique nFL + weighted ambiguous nFL reads\n")
+            f.write("# norm_fl: count_fl / total number of FL reads\n")
+            f.write("# norm_nfl: count_nfl / total number of FL + unique nFL reads\n")
+            f.write("# norm_nfl_amb: count_nfl_amb / total number of all reads\n")
+            f.write("# Total Number of FL reads: {0}\n".format(use_total_fl))
+            f.write("# Total Number of FL + unique nFL reads: {0}\n".format(use_total_nfl))
+            f.write("# Total Number of all reads: {0}\n".format(use_total_nfl_amb))
+            f.write("#\n")
+        f.write("pbid\tcount_fl\tcount_nfl\tcount_nfl_amb\tnorm_fl\tnorm_nfl\tnorm_nfl_amb\n")
+
+        n = len(self.pbids)
+        a = self.counts[self.FL, :n].astype(np.int64)
+        b = a + self.counts[self.NFL, :n].astype(np.int64)
+        c = b + self.counts[self.NFL_AMB, :n]
+        order = range(n)
+        order.sort(key=lambda i: map(int, self.pbids[i].split('.')[1:])) # sort by PB.1, PB.2....
+        for i in order:
+            # count_nfl_amb is only fractional if there are ambiguous nFL reads
+            _c = float(c[i]) if self.counts[self.NFL_AMB, i] > 0 else int(b[i])
+            f.write("{0}\t{1}\t{2}\t{3}\t".format(self.pbids[i], int(a[i]), int(b[i]), _c))
+            f.write("{0:.4e}\t{1:.4e}\t{2:.4e}\n".format(a[i]*1./use_total_fl, b[i]*1./use_total_nfl, c[i]*1./use_total_nfl_amb))
+        f.close()
+
 def output_read_count_IsoSeq_csv(cid_info, csv_filename, output_filename, output_mode='w'):
     """
     Given an Iso-Seq csv output file w/ format:
@@ -109,18 +192,53 @@ def output_read_count_RoI(cid_info, roi_filename, output_filename):
             id=r.name, len=get_roi_len(r.name), is_fl='Y', stat=stat, pbid=pbid))
     f.close()
 
-def output_read_count_FL(cid_info, pickle_prefix_list, output_filename, output_mode='w', restricted_movies=None):
+def iter_reads_of_pickles(pickle_prefix_list, pairs_of_pickle, tmp_dir):
+    """
+    Yield (read id, pbids) of the reads of all pickles, sorted by read id,
+    where pbids are the pbids of all clusters the read is a member of.
+
+    pairs_of_pickle(sample_prefix, pickle_filename) returns [(read id,
+    pbid)] of the members of a pickle, pbid is '' if not (yet) mapped.
+    A read is only known to be unmapped or uniquely mapped once all
+    pickles are processed, so rather than keeping every read id until
+    the end, the pairs of each pickle are sorted and written to a run in
+    a temporary directory under tmp_dir, and the runs are merged. Memory
+    is bounded by the pairs of the largest pickle.
+    """
+    run_dir = tempfile.mkdtemp(prefix="read_runs.", dir=tmp_dir)
+    try:
+        run_filenames = []
+        for sample_prefix, pickle_filename in pickle_prefix_list:
+            pairs = pairs_of_pickle(sample_prefix, pickle_filename)
+            pairs.sort()
+            run_filenames.append(os.path.join(run_dir, "{0}.txt".format(len(run_filenames))))
+            with open(run_filenames[-1], 'w') as f:
+                for x, pbid in pairs:
+                    f.write("{0}\t{1}\n".format(x, pbid))
+            del pairs
+        # lines "<id>\t<pbid>" sort like (id, pbid), because ids and pbids have no characters below tab
+        handles = [open(run_filename) for run_filename in run_filenames]
+        try:
+            rows = (line.rstrip('\n').split('\t') for line in heapq.merge(*handles))
+            for x, group in groupby(rows, key=itemgetter(0)):
+                yield x, [pbid for (_x, pbid) in group if pbid != '']
+        finally:
+            for h in handles:
+                h.close()
+    finally:
+        shutil.rmtree(run_dir)
+
+def output_read_count_FL(cid_info, pickle_prefix_list, output_filename, output_mode='w', restricted_movies=None, counter=None):
     """
     If restricted_movies is None, all nonFL reads are output.
     Otherwise (esp. in case where I binned by size then pooled in the end), give the list of movies associated
     with a particular list of cell runs (ex: brain_2to3k_phusion nonFL only)
 
-    Because may have multiple pickles, can ONLY determine which FL reads are unmapped at the VERY END
-    """
-    unmapped_holder = set() # will hold anything that was unmapped in one of the pickles
-    mapped_holder = set() # will hold anything that was mapped in (must be exactly) one of the pickles
-    # then to get the true unmapped just to {unmapped} - {mapped}
+    Because may have multiple pickles, can ONLY determine which FL reads are unmapped at the VERY END,
+    reads are therefore merged across pickles by iter_reads_of_pickles.
 
+    If counter (AbundanceCounter) is given, FL counts are accumulated in it as well.
+    """
     if output_mode == 'w':
         f = open(output_filename, 'w')
         f.write("id\tlength\tis_fl\tstat\tpbid\n")
@@ -129,50 +247,47 @@ def output_read_count_FL(cid_info, pickle_prefix_list, output_filename, output_m
     else:
         raise Exception, "Output mode {0} not valid!".format(output_mode)
 
-    for sample_prefix, pickle_filename in pickle_prefix_list:
+    def pairs_of_pickle(sample_prefix, pickle_filename):
         with open(pickle_filename) as h:
             uc = load(h)['uc']
+        _cid_info = cid_info[sample_prefix]
+        pairs = []
         for cid_no_prefix, members in uc.iteritems():
-            cid = 'c' + str(cid_no_prefix)
-            if cid in cid_info[sample_prefix]:
-                # can immediately add all (movie-restricted) members to mapped
-                pbid, stat = cid_info[sample_prefix][cid], 'unique'
-                for x in members:
-                    movie = x.split('/')[0]
-                    if restricted_movies is None or movie in restricted_movies:
-                        mapped_holder.add(x)
-                        f.write("{id}\t{len}\t{is_fl}\t{stat}\t{pbid}\n".format(\
-                        id=x, len=get_roi_len(x), is_fl='Y', stat=stat, pbid=pbid))
-            else:
-                # is only potentially unmapped, add all (movie-restricted) members to unmapped holder
-                for x in members:
-                    movie = x.split('/')[0]
-                    if restricted_movies is None or movie in restricted_movies:
-                        unmapped_holder.add(x)
-
-    # now with all the pickles processed we can determine which of all (movie-restricted) FL reads
-    # are not mapped in any of the pickles
-    unmapped_holder = unmapped_holder.difference(mapped_holder)
-    pbid, stat = 'NA', 'unmapped'
-    for x in unmapped_holder:
-        f.write("{id}\t{len}\t{is_fl}\t{stat}\t{pbid}\n".format(\
-        id=x, len=get_roi_len(x), is_fl='Y', stat=stat, pbid=pbid))
+            # '' if is only potentially unmapped
+            pbid = _cid_info.get('c' + str(cid_no_prefix), '')
+            pairs.extend((x, pbid) for x in members
+                         if restricted_movies is None or x.split('/', 1)[0] in restricted_movies)
+        return pairs
+
+    num_reads = 0
+    tmp_dir = os.path.dirname(os.path.abspath(output_filename))
+    for x, pbids in iter_reads_of_pickles(pickle_prefix_list, pairs_of_pickle, tmp_dir):
+        num_reads += 1
+        # mapped in (must be exactly) one of the pickles, or not mapped in any of them
+        for pbid in pbids:
+            f.write("{id}\t{len}\t{is_fl}\t{stat}\t{pbid}\n".format(\
+            id=x, len=get_roi_len(x), is_fl='Y', stat='unique', pbid=pbid))
+            if counter is not None:
+                counter.add(counter.FL, pbid)
+        if len(pbids) == 0:
+            f.write("{id}\t{len}\t{is_fl}\t{stat}\t{pbid}\n".format(\
+            id=x, len=get_roi_len(x), is_fl='Y', stat='unmapped', pbid='NA'))
     f.close()
+    if counter is not None:
+        counter.total[counter.FL] += num_reads
 
-def output_read_count_nFL(cid_info, pickle_prefix_list, output_filename, output_mode='w', restricted_movies=None):
+def output_read_count_nFL(cid_info, pickle_prefix_list, output_filename, output_mode='w', restricted_movies=None, counter=None):
     """
     If restricted_movies is None, all nonFL reads are output.
     Otherwise (esp. in case where I binned by size then pooled in the end), give the list of movies associated
     with a particular list of cell runs (ex: brain_2to3k_phusion nonFL only)
 
     There is no guarantee that the non-FL reads are shared between the pickles, they might be or not
-    Instead determine unmapped (movie-restricted) non-FL reads at the very end
-    """
-    unmapped_holder = set() # will hold anything that was unmapped in one of the pickles
-    # then to get the true unmapped just to {unmapped} - {mapped}
-
-    mapped = {}  # nFL seq -> list of (sample_prefix, cluster) it belongs to
+    Instead determine unmapped (movie-restricted) non-FL reads at the very end, reads are therefore
+    merged across pickles by iter_reads_of_pickles.
 
+    If counter (AbundanceCounter) is given, nFL counts are accumulated in it as well.
+    """
     if output_mode == 'w':
         f = open(output_filename, 'w')
         f.write("id\tlength\tis_fl\tstat\tpbid\n")
@@ -181,125 +296,91 @@ def output_read_count_nFL(cid_info, pickle_prefix_list, output_filename, output_
     else:
         raise Exception, "Output mode {0} not valid!".format(output_mode)
 
-    for sample_prefix, pickle_filename in pickle_prefix_list:
+    def pairs_of_pickle(sample_prefix, pickle_filename):
         with open(pickle_filename) as h:
             result = load(h)
-            uc = result['partial_uc']
-            if restricted_movies is None:
-                unmapped_holder.update(result['nohit'])
-            else:
-                unmapped_holder.update(filter(lambda x: x.split('/')[0] in restricted_movies, result['nohit']))
-
+        pairs = [(x, '') for x in result['nohit']
+                 if restricted_movies is None or x.split('/', 1)[0] in restricted_movies]
+        uc = result['partial_uc']
+        del result
+        _cid_info = cid_info[sample_prefix]
         for cid_no_prefix, members in uc.iteritems():
-            cid = 'c' + str(cid_no_prefix)
-            if cid in cid_info[sample_prefix]: # is at least mapped
-                pbid = cid_info[sample_prefix][cid]
-                for x in members:
-                    movie = x.split('/')[0]
-                    if restricted_movies is None or movie in restricted_movies:
-                        if x not in mapped: mapped[x] = set()
-                        mapped[x].add(pbid)
-            else: # not entirely sure it is unmapped but put it in in the meantime
-                for x in members:
-                    movie = x.split('/')[0]
-                    if restricted_movies is None or movie in restricted_movies:
-                        unmapped_holder.add(x)
-
-    # now we can go through the list of mapped to see which are uniquely mapped which are not
-    for seqid, pbids in mapped.iteritems():
-        if len(pbids) == 1: # unique
+            # '' if not entirely sure it is unmapped
+            pbid = _cid_info.get('c' + str(cid_no_prefix), '')
+            pairs.extend((x, pbid) for x in members
+                         if restricted_movies is None or x.split('/', 1)[0] in restricted_movies)
+        return pairs
+
+    # now we can go through the reads to see which are uniquely mapped which are not
+    num_unique, num_unmapped, num_amb = 0, 0, 0
+    tmp_dir = os.path.dirname(os.path.abspath(output_filename))
+    for seqid, pbids in iter_reads_of_pickles(pickle_prefix_list, pairs_of_pickle, tmp_dir):
+        pbids = sorted(set(pbids))
+        if len(pbids) == 0:
+            num_unmapped += 1
+            pbids, stat = ['NA'], 'unmapped'
+        elif len(pbids) == 1:
+            num_unique += 1
             stat = 'unique'
+            if counter is not None:
+                counter.add(counter.NFL, pbids[0])
         else:
+            num_amb += 1
             stat = 'ambiguous'
+            if counter is not None:
+                for pbid in pbids:
+                    counter.add(counter.NFL_AMB, pbid, 1. / len(pbids))
         for pbid in pbids:
             f.write("{id}\t{len}\t{is_fl}\t{stat}\t{pbid}\n".format(\
                 id=seqid, len=get_roi_len(seqid), is_fl='N', stat=stat, pbid=pbid))
-
-    unmapped_holder = unmapped_holder.difference(mapped)
-
-    # write the nohits
-    for seqid in unmapped_holder:
-        f.write("{id}\t{len}\t{is_fl}\t{stat}\t{pbid}\n".format(\
-            id=seqid, len=get_roi_len(seqid), is_fl='N', stat='unmapped', pbid='NA'))
     f.close()
+    if counter is not None:
+        counter.total[counter.NFL] += num_unique + num_unmapped
+        counter.total[counter.NFL_AMB] += num_amb
 
 
 def make_abundance_file(read_count_filename, output_filename, given_total=None, restricted_movies=None, write_header_comments=True):
     """
     If given_total is not None, use it instead of the total count based on <read_count_filename>
     given_total should be dict of {fl, nfl, nfl_amb}
+
+    Streams through <read_count_filename>, which lists each FL, unique or
+    unmapped read once (as written by output_read_count_FL/nFL); only
+    ambiguous nFL reads are kept, since their lines need not be consecutive.
     """
-    total_ids = {'fl':set(), 'nfl':set(), 'nfl_amb':set()}
-    tally = defaultdict(lambda: {'fl':0, 'nfl':0, 'nfl_amb':0}) # pbid, could be NA --> # of FL reads mapped to it
-    amb_count = defaultdict(lambda: []) # non-fl id --> list of pbid matches
-
-    reader = DictReader(open(read_count_filename), delimiter='\t')
-    for r in reader:
-        movie = r['id'].split('/')[0]
-        if restricted_movies is None or movie in restricted_movies:
-            if r['pbid'] != 'NA':
-                if r['is_fl'] == 'Y': # FL, must be uniquely mapped
-                    assert r['stat'] == 'unique'
-                    tally[r['pbid']]['fl'] += 1
-                    total_ids['fl'].add(r['id'])
+    counter = AbundanceCounter()
+    amb_count = defaultdict(lambda: []) # ambiguous non-fl id --> list of pbid matches
+
+    f = open(read_count_filename)
+    header = f.readline().strip().split('\t')
+    i_id, i_is_fl, i_stat, i_pbid = [header.index(x) for x in ('id', 'is_fl', 'stat', 'pbid')]
+    for line in f:
+        raw = line.strip().split('\t')
+        seqid, is_fl, stat, pbid = raw[i_id], raw[i_is_fl], raw[i_stat], raw[i_pbid]
+        if restricted_movies is None or seqid.split('/', 1)[0] in restricted_movies:
+            if pbid != 'NA':
+                if is_fl == 'Y': # FL, must be uniquely mapped
+                    assert stat == 'unique'
+                    counter.add(counter.FL, pbid)
+                    counter.total[counter.FL] += 1
                 else: # non-FL, can be ambiguously mapped
-                    if r['stat'] == 'unique':
-                        tally[r['pbid']]['nfl'] += 1
-                        total_ids['nfl'].add(r['id'])
+                    if stat == 'unique':
+                        counter.add(counter.NFL, pbid)
+                        counter.total[counter.NFL] += 1
                     else:
-                        assert r['stat'] == 'ambiguous'
-                        amb_count[r['id']].append(r['pbid'])
-                        total_ids['nfl_amb'].add(r['id'])
+                        assert stat == 'ambiguous'
+                        amb_count[seqid].append(pbid)
             else: # even if it is unmapped it still counts in the abundance total!
-                if r['is_fl'] == 'Y':
-                    total_ids['fl'].add(r['id'])
+                if is_fl == 'Y':
+                    counter.total[counter.FL] += 1
                 else:
-                    total_ids['nfl'].add(r['id'])
-
+                    counter.total[counter.NFL] += 1
+    f.close()
 
-    # put the ambiguous back in tally weighted
+    # put the ambiguous back in the counter weighted
     for seqid, pbids in amb_count.iteritems():
-        weight = 1. / len(pbids)
         for pbid in pbids:
-             tally[pbid]['nfl_amb'] += weight
-
-    if given_total is not None:
-        use_total_fl = given_total['fl']
-        use_total_nfl = given_total['fl'] + given_total['nfl']
-        # ToDo: the below is NOT EXACTLY CORRECT!! Fix later!
-        use_total_nfl_amb = given_total['fl'] + given_total['nfl'] + given_total['nfl_amb']
-    else:
-        use_total_fl = len(total_ids['fl'])
-        use_total_nfl = len(total_ids['fl']) + len(total_ids['nfl'])
-        use_total_nfl_amb = len(total_ids['fl']) + len(total_ids['nfl']) + len(total_ids['nfl_amb'])
-
-    f = open(output_filename,'w')
-    if write_header_comments:
-        f.write("#\n")
-        f.write("# -----------------\n")
-        f.write("# Field explanation\n")
-        f.write("# -----------------\n")
-        f.write("# count_fl: Number of associated FL reads\n")
-        f.write("# count_nfl: Number of associated FL + unique nFL reads\n")
-        f.write("# count_nfl_amb: Number of associated FL + unique nFL + weighted ambiguous nFL reads\n")
-        f.write("# norm_fl: count_fl / total number of FL reads\n")
-        f.write("# norm_nfl: count_nfl / total number of FL + unique nFL reads\n")
-        f.write("# norm_nfl_amb: count_nfl_amb / total number of all reads\n")
-        f.write("# Total Number of FL reads: {0}\n".format(use_total_fl))
-        f.write("# Total Number of FL + unique nFL reads: {0}\n".format(use_total_nfl))
-        f.write("# Total Number of all reads: {0}\n".format(use_total_nfl_amb))
-        f.write("#\n")
-    f.write("pbid\tcount_fl\tcount_nfl\tcount_nfl_amb\tnorm_fl\tnorm_nfl\tnorm_nfl_amb\n")
-
-    keys = tally.keys()
-    keys.sort(key=lambda x: map(int, x.split('.')[1:])) # sort by PB.1, PB.2....
-    for k in keys:
-        v = tally[k]
-        a = v['fl']
-        b = a + v['nfl']
-        c = b + v['nfl_amb']
-        f.write("{0}\t{1}\t{2}\t{3}\t".format(k, a, b, c))
-        f.write("{0:.4e}\t{1:.4e}\t{2:.4e}\n".format(a*1./use_total_fl, b*1./use_total_nfl, c*1./use_total_nfl_amb))
-    f.close()
-
+            counter.add(counter.NFL_AMB, pbid, 1. / len(pbids))
+    counter.total[counter.NFL_AMB] += len(amb_count)
 
+    counter.write(output_filename, given_total=given_total, write_header_comments=write_header_comments)
@@ -3,7 +3,6 @@ from pbtools.pbtranscript.io import GFF
 from collections import defaultdict
 from pbtools.pbtranscript.counting import compare_junctions
 from pbcore.io.FastqIO import FastqReader, FastqWriter
-from csv import DictReader, DictWriter
 
 
 def can_merge(m, r1, r2, internal_fuzzy_max_dist):
@@ -18,26 +17,46 @@ def can_merge(m, r1, r2, internal_fuzzy_max_dist):
             return abs(r1.ref_exons[0].end - r2.ref_exons[0].end) <= internal_fuzzy_max_dist and \
                     r1.ref_exons[n2-1].start <= r2.ref_exons[-1].end < r1.ref_exons[n2].end
 
+def three_prime_junction(r):
+    """
+    Return the 3'-most splice site of r, which a 5'-truncated subset of r must share:
+    start of the last exon (+ strand) or end of the first exon (- strand).
+    For single-exon transcripts this is just the 5' end.
+    """
+    return r.ref_exons[-1].start if r.strand == '+' else r.ref_exons[0].end
+
+
 def filter_out_subsets(recs, internal_fuzzy_max_dist):
-    # recs must be sorted by start becuz that's the order they are written
-    i = 0
-    while i < len(recs)-1:
-        j = i + 1
-        while j < len(recs):
-            if recs[j].start > recs[i].end: 
+    """
+    Remove (in place) transcripts that are 5'-truncated subsets of another
+    transcript in recs (ex: the isoforms of one locus), see can_merge().
+    Candidate supersets are looked up by their 3'-most splice site, hashed into
+    buckets of width internal_fuzzy_max_dist+1, so only transcripts sharing
+    the 3' junction chain end (within fuzzy distance) are compared.
+    """
+    w = internal_fuzzy_max_dist + 1
+    index = defaultdict(list) # (strand, bucket of 3' splice site) --> list of recs
+    for r in recs:
+        r.segments = r.ref_exons
+        index[r.strand, three_prime_junction(r) / w].append(r)
+
+    subsets = set()
+    for r2 in recs:
+        b = three_prime_junction(r2) / w
+        n2 = len(r2.ref_exons)
+        for key in ((r2.strand, b-1), (r2.strand, b), (r2.strand, b+1)):
+            for r1 in index.get(key, ()):
+                if r1 is r2 or len(r1.ref_exons) < n2 or \
+                        r1.start >= r2.end or r2.start >= r1.end:
+                    continue
+                m = compare_junctions.compare_junctions(r1, r2, internal_fuzzy_max_dist)
+                if m == 'super' and can_merge(m, r1, r2, internal_fuzzy_max_dist):
+                    subsets.add(r2.seqid)
+                    break
+            if r2.seqid in subsets:
                 break
-            recs[i].segments = recs[i].ref_exons
-            recs[j].segments = recs[j].ref_exons
-            m = compare_junctions.compare_junctions(recs[i], recs[j], internal_fuzzy_max_dist)
-            if can_merge(m, recs[i], recs[j], internal_fuzzy_max_dist):
-                if m == 'super': # pop recs[j] 
-                    recs.pop(j)
-                else:
-                    recs.pop(i)
-                    j += 1
-            else:
-                j += 1
-        i += 1
+
+    recs[:] = [r for r in recs if r.seqid not in subsets]
 
 
 def main():
@@ -54,38 +73,26 @@ def main():
     gff_filename = args.input_prefix + '.gff'
     rep_filename = args.input_prefix + '.rep.fq'
 
-    recs = defaultdict(lambda: [])
-    reader = GFF.collapseGFFReader(gff_filename)
-    for r in reader:
-        assert r.seqid.startswith('PB.')
-        recs[int(r.seqid.split('.')[1])].append(r)
-
-    good = []
+    # collapsed GFF lists isoforms locus by locus (PB.1.*, PB.2.*, ...),
+    # so filter each locus as soon as the next one starts
+    good = set()
     f = open(args.output_prefix + '.gff', 'w')
-    keys = recs.keys()
-    keys.sort()
-    for k in recs:
-        xxx = recs[k]
-        filter_out_subsets(xxx, args.fuzzy_junction)
-        for r in xxx:
+
+    def flush(locus_recs):
+        filter_out_subsets(locus_recs, args.fuzzy_junction)
+        for r in locus_recs:
             GFF.write_collapseGFF_format(f, r)
-            good.append(r.seqid)
-    f.close()
+            good.add(r.seqid)
 
-    # read abundance first
-    f = open(count_filename)
-    count_header = ''
-    while True:
-        cur_pos = f.tell()
-        line = f.readline()
-        if not line.startswith('#'):
-            f.seek(cur_pos)
-            break
-        else:
-            count_header += line
-    d = dict((r['pbid'], r) for r in DictReader(f, delimiter='\t'))
-    for k,v in d.iteritems():
-        print k,v
+    locus, locus_recs = None, []
+    for r in GFF.collapseGFFReader(gff_filename):
+        assert r.seqid.startswith('PB.')
+        k = int(r.seqid.split('.')[1])
+        if k != locus:
+            flush(locus_recs)
+            locus, locus_recs = k, []
+        locus_recs.append(r)
+    flush(locus_recs)
     f.close()
 
     # write output rep.fq
@@ -95,15 +102,13 @@ def main():
            f.writeRecord(r)
     f.close()
 
-    # write output to .abundance.txt
+    # write output to .abundance.txt, keeping the header
     f = open(args.output_prefix + '.abundance.txt', 'w')
-    f.write(count_header)
-    writer = DictWriter(f, fieldnames=['pbid','count_fl','count_nfl','count_nfl_amb','norm_fl','norm_nfl','norm_nfl_amb'], \
-                        delimiter='\t', lineterminator='\n')
-    writer.writeheader()
-    for k in good:
-        r = d[k]
-        writer.writerow(r)
+    with open(count_filename) as h:
+        for line in h:
+            if line.startswith('#') or line.startswith('pbid\t') or \
+                    line.split('\t', 1)[0] in good:
+                f.write(line)
     f.close()
 
 
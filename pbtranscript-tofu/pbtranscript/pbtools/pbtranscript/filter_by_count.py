@@ -4,7 +4,6 @@ __author__ = 'etseng@pacb.com'
 
 from pbtools.pbtranscript.io import GFF
 from pbcore.io.FastqIO import FastqReader, FastqWriter
-from csv import DictReader, DictWriter
 
 def filter_by_count(input_prefix, output_prefix, min_count):
 
@@ -32,24 +31,26 @@ def filter_by_count(input_prefix, output_prefix, min_count):
             group_max_count_p[pbid] = max(group_max_count_p[pbid], p_count)
     f.close()
 
-    # read abundance first
+    # read abundance first, keeping the header and the row of each pbid
     f = open(count_filename)
     count_header = ''
-    while True:
-        cur_pos = f.tell()
-        line = f.readline()
-        if not line.startswith('#'):
-            f.seek(cur_pos)
-            break
-        else:
+    rows = [] # list of (pbid, line)
+    count_fl = {}
+    i_count_fl = None
+    for line in f:
+        if line.startswith('#'):
             count_header += line
-    d = dict((r['pbid'], r) for r in DictReader(f, delimiter='\t'))
-    for k,v in d.iteritems():
-        print k,v
+        elif i_count_fl is None: # column header
+            count_header += line
+            i_count_fl = line.strip().split('\t').index('count_fl')
+        else:
+            raw = line.strip().split('\t')
+            rows.append((raw[0], line))
+            count_fl[raw[0]] = int(raw[i_count_fl])
     f.close()
 
     # group_max_count_p NOT used for now
-    good = filter(lambda x: int(d[x]['count_fl']) >= min_count and group_max_count_fl[x] >= min_count and group_max_count_p >= 0, d)
+    good = set(x for x in count_fl if count_fl[x] >= min_count and group_max_count_fl[x] >= min_count and group_max_count_p >= 0)
 
     # write output GFF
     f = open(output_prefix + '.gff', 'w')
@@ -68,12 +69,9 @@ def filter_by_count(input_prefix, output_prefix, min_count):
     # write output to .abundance.txt
     f = open(output_prefix + '.abundance.txt', 'w')
     f.write(count_header)
-    writer = DictWriter(f, fieldnames=['pbid','count_fl','count_nfl','count_nfl_amb','norm_fl','norm_nfl','norm_nfl_amb'], \
-                        delimiter='\t', lineterminator='\n')
-    writer.writeheader()
-    for k in good:
-        r = d[k]
-        writer.writerow(r)
+    for pbid, line in rows:
+        if pbid in good:
+            f.write(line)
     f.close()
 
 
@@ -15,14 +15,13 @@ from pbcore.io.FastqIO import FastqWriter
 
 from bx.intervals.cluster import ClusterTree
 
-def pick_rep(fa_fq_filename, sam_filename, gff_filename, group_filename, output_filename, is_fq=False, pick_least_err_instead=False):
+def write_fusion_gff_and_rep(fa_fq_filename, fusion_groups, merged_exons, query_len_dict, gff_filename, output_filename, is_fq=False):
     """
-    For each group, select the representative record
-
-    If is FASTA file (is_fa False) -- then always pick the longest one
-    If is FASTQ file (is_fq True) -- then 
-          If pick_least_err_instead is True, pick the one w/ least number of expected base errors
-          Else, pick the longest one
+    For each fusion group (PBfusion.<i> --> (loci, member qIDs)), select the
+    longest member as representative, write the rep's record at each locus as
+    PBfusion.<i>.1, PBfusion.<i>.2, ... to <gff_filename> and the rep sequence,
+    named PBfusion.<i>|<coords of all loci>|<rep qID>, to <output_filename>.
+    The rep's records are looked up in merged_exons, so the SAM is not re-read.
     """
     if is_fq:
         fd = LazyFastqReader(fa_fq_filename)
@@ -31,85 +30,30 @@ def pick_rep(fa_fq_filename, sam_filename, gff_filename, group_filename, output_
         fd = LazyFastaReader(fa_fq_filename)
         fout = FastaWriter(output_filename)
 
-
-#    for line in open(gff_filename):
-#        # ex: chr1    PacBio  transcript      27567   29336   .       -       .       gene_id "PBfusion.1"; transcript_id "PBfusion.1.1";
-#        raw = line.strip().split('\t')
-#        if raw[2] == 'transcript':
-#            # check if this is first or 2+ part of fusion
-#            tid = raw[-1].split('; ')[1].split()[1][1:-2] # ex: tid = PBfusion.1.1
-#            gid = tid[:tid.rfind('.')] # ex: gid = PBfusion.1
-#            if tid.endswith('.1'):
-#                coords[gid] = "{0}:{1}-{2}({3})".format(raw[0], raw[3], raw[4], raw[6])
-#            else:
-#                assert gid in coords
-#                coords[gid] += "+{0}:{1}-{2}({3})".format(raw[0], raw[3], raw[4], raw[6])
-
-    rep_info = {}
-    id_to_rep = {}
-    for line in open(group_filename):
-        pb_id, members = line.strip().split('\t')
-        print >> sys.stderr, "Picking representative sequence for", pb_id
-        best_id = None
-        best_seq = None
-        best_qual = None
-        best_err = 9999999
-        err = 9999999
-        max_len = 0
-        for x in members.split(','):
-            if is_fq and pick_least_err_instead:
-                err = sum(i**-(i/10.) for i in fd[x].quality)
-            if (is_fq and pick_least_err_instead and err < best_err) or ((not is_fq or not pick_least_err_instead) and len(fd[x].sequence) >= max_len):
-                best_id = x
-                best_seq = fd[x].sequence
-                if is_fq:
-                    best_qual = fd[x].quality
-                    best_err = err
-                max_len = len(fd[x].sequence)
-        rep_info[pb_id] = (best_id, best_seq, best_qual)
-        id_to_rep[best_id] = pb_id
-
     f_gff = open(gff_filename, 'w')
-    coords = {}
-    record_storage = {} # temporary storage for the .1 record to write in conjunction with second record
-    for r in BioReaders.GMAPSAMReader(sam_filename, True):
-        if r.qID in id_to_rep:
-            pb_id = id_to_rep[r.qID]
-            best_id, best_seq, best_qual = rep_info[pb_id]
-
-            # make coordinates & write the SAM file
-            if r.qID not in coords:
-                # this is the .1 portion
-                coords[r.qID] = "{0}:{1}-{2}({3})".format(r.sID, r.sStart, r.sEnd, r.flag.strand)
-                isoform_index = 1
-                record_storage[pb_id] = r
-            else:
-                # this is the .2 portion
-                coords[r.qID] += "+{0}:{1}-{2}({3})".format(r.sID, r.sStart, r.sEnd, r.flag.strand)
-                isoform_index = 1
-
-                old_r = record_storage[pb_id]
-                f_gff.write("{chr}\tPacBio\ttranscript\t{s}\t{e}\t.\t{strand}\t.\tgene_id \"{pi}\"; transcript_id \"{pi}.{j}\";\n".format(\
-                    chr=old_r.sID, s=old_r.segments[0].start+1, e=old_r.segments[-1].end, pi=pb_id, j=isoform_index, strand=old_r.flag.strand))
-                for s in old_r.segments:
-                    f_gff.write("{chr}\tPacBio\texon\t{s}\t{e}\t.\t{strand}\t.\tgene_id \"{pi}\"; transcript_id \"{pi}.{j}\";\n".format(\
-                        chr=old_r.sID, s=s.start+1, e=s.end, pi=pb_id, j=isoform_index, strand=old_r.flag.strand))
-                isoform_index = 2
-                f_gff.write("{chr}\tPacBio\ttranscript\t{s}\t{e}\t.\t{strand}\t.\tgene_id \"{pi}\"; transcript_id \"{pi}.{j}\";\n".format(\
-                    chr=r.sID, s=r.segments[0].start+1, e=r.segments[-1].end, pi=pb_id, j=isoform_index, strand=r.flag.strand))
-                for s in r.segments:
-                    f_gff.write("{chr}\tPacBio\texon\t{s}\t{e}\t.\t{strand}\t.\tgene_id \"{pi}\"; transcript_id \"{pi}.{j}\";\n".format(\
-                        chr=r.sID, s=s.start+1, e=s.end, pi=pb_id, j=isoform_index, strand=r.flag.strand))
-    f_gff.close()
-
-    for pb_id in rep_info:
-        best_id, best_seq, best_qual = rep_info[pb_id]
-        _id_ = "{0}|{1}|{2}".format(pb_id, coords[best_id], best_id)
-        _seq_ = best_seq
+    for pb_id, (loci, members) in fusion_groups:
+        best_id, max_len = None, 0
+        for x in members:
+            if query_len_dict[x] >= max_len:
+                best_id, max_len = x, query_len_dict[x]
+
+        coords = []
+        for isoform_index, i in enumerate(loci, start=1):
+            r = next(r for r in merged_exons[i] if r.qID == best_id)
+            coords.append("{0}:{1}-{2}({3})".format(r.sID, r.sStart, r.sEnd, r.flag.strand))
+            f_gff.write("{chr}\tPacBio\ttranscript\t{s}\t{e}\t.\t{strand}\t.\tgene_id \"{pi}\"; transcript_id \"{pi}.{j}\";\n".format(\
+                chr=r.sID, s=r.segments[0].start+1, e=r.segments[-1].end, pi=pb_id, j=isoform_index, strand=r.flag.strand))
+            for e in r.segments:
+                f_gff.write("{chr}\tPacBio\texon\t{s}\t{e}\t.\t{strand}\t.\tgene_id \"{pi}\"; transcript_id \"{pi}.{j}\";\n".format(\
+                    chr=r.sID, s=e.start+1, e=e.end, pi=pb_id, j=isoform_index, strand=r.flag.strand))
+
+        _id_ = "{0}|{1}|{2}".format(pb_id, "+".join(coords), best_id)
         if is_fq:
-            fout.writeRecord(_id_, _seq_, best_qual)
+            fout.writeRecord(_id_, fd[best_id].sequence, fd[best_id].quality)
         else:
-            fout.writeRecord(_id_, _seq_)
+            fout.writeRecord(_id_, fd[best_id].sequence)
+    f_gff.close()
+    fout.close()
 
 def sep_by_strand(records):
     output = {'+':[], '-':[]}
@@ -190,73 +134,76 @@ def merge_fusion_exons(records, max_fusion_point_dist, max_exon_end_dist, allow_
     Returns a list of grouped records, ex: [[r1,r2], [r3], [r4, r5, r6]]....
     which can be sent to BranchSimple.process_records for writing out
     """
-    output = [[records[0]]]
-    for r1 in records[1:]:
-        merged = False
-        # go through output, seeing if mergeable
-        for i, r2s in enumerate(output):
-#            _ids = 'i1a_c1603/f67p459/1248,i1b_c19881/f7p368/1235,newClontech_i0HQ|c18279/f6p24/1229,i2b_c22046/f2p494/2157,i2a_c4714/f10p554/2152'.split(',')
-#            if r1.qID in _ids and any(r2.qID in _ids for r2 in r2s):
-#                pdb.set_trace()
-            if all(is_fusion_compatible(r1, r2, max_fusion_point_dist, max_exon_end_dist, allow_extra_5_exons) for r2 in r2s):
-                output[i].append(r1)
-                merged = True
-                break
-        if not merged:
-            output.append([r1])
+    # records in the 5' and 3' portion of their reads are never compatible,
+    # so only compare records within the same portion
+    output = []
+    for portion in (True, False):
+        _output = []
+        for r1 in records:
+            if (r1.qStart <= .5*r1.qLen) != portion:
+                continue
+            # go through output, seeing if mergeable
+            for r2s in _output:
+                if all(is_fusion_compatible(r1, r2, max_fusion_point_dist, max_exon_end_dist, allow_extra_5_exons) for r2 in r2s):
+                    r2s.append(r1)
+                    break
+            else:
+                _output.append([r1])
+        output += _output
     return output
 
-def iter_gmap_sam_for_fusion(gmap_sam_filename, fusion_candidates, transfrag_len_dict):
+def iter_gmap_sam_for_fusion(records):
     """
-    Iterate through a sorted GMAP SAM file
+    Iterate through GMAP SAM records of fusion candidates, sorted by coordinates
     Continuously yield a group of overlapping records {'+': [r1, r2, ...], '-': [r3, r4....]}
     """
-    records = []
-    iter = BioReaders.GMAPSAMReader(gmap_sam_filename, True, query_len_dict=transfrag_len_dict)
-    for r in iter:
-        if r.qID in fusion_candidates: 
-            records = [r]
-            break
-
-    for r in iter:
-        if len(records) >= 1 and (r.sID==records[-1].sID and r.sStart < records[-1].sStart):
-            print >> sys.stderr, "SAM file is NOT sorted. ABORT!"
-            sys.exit(-1)
-        if len(records) >= 1 and (r.sID != records[0].sID or r.sStart > records[-1].sEnd):
-            yield(sep_by_strand(records))
-            records = []
-        if r.qID in fusion_candidates:
-            records.append(r)
+    group = []
+    for r in records:
+        if len(group) >= 1 and (r.sID != group[0].sID or r.sStart > group[-1].sEnd):
+            yield(sep_by_strand(group))
+            group = []
+        group.append(r)
 
-    if len(records) > 0:
-        yield(sep_by_strand(records))
+    if len(group) > 0:
+        yield(sep_by_strand(group))
 
 
 def find_fusion_candidates(sam_filename, query_len_dict, min_locus_coverage=.05, min_locus_coverage_bp=1, min_total_coverage=.99, min_dist_between_loci=10000):
     """
-    Return list of fusion candidates qIDs
+    Return list of GMAP SAM records of fusion candidates, in SAM (sorted) order
     (1) must map to 2 or more loci
     (2) minimum coverage for each loci is 5% AND minimum coverage in bp is >= 1 bp
     (3) total coverage is >= 95%
     (4) distance between the loci is at least 10kb
+
+    The SAM is streamed once, keeping only a compact TmpRec and the file offset
+    of each alignment; records of the candidates are then re-read by offset.
     """
-    TmpRec = namedtuple('TmpRec', ['qCov', 'qLen', 'qStart', 'qEnd', 'sStart', 'sEnd', 'iden'])
+    TmpRec = namedtuple('TmpRec', ['qCov', 'qLen', 'qStart', 'qEnd', 'sStart', 'sEnd', 'iden', 'offset'])
     def total_coverage(tmprecs):
         tree = ClusterTree(0, 0)
         for r in tmprecs: tree.insert(r.qStart, r.qEnd, -1)
         return sum(reg[1]-reg[0] for reg in tree.getregions())
 
     d = defaultdict(lambda: [])
-    reader = BioReaders.GMAPSAMReader(sam_filename, True, query_len_dict=query_len_dict)
-    for r in reader:
-        if r.sID == '*': continue
+    reader = BioReaders.GMAPSAMReader(sam_filename, True, query_len_dict=query_len_dict, mapped_only=True)
+    prev = None
+    while True:
+        offset = reader.f.tell()
+        try:
+            r = reader.next()
+        except StopIteration:
+            break
+        if prev is not None and r.sID == prev.sID and r.sStart < prev.sStart:
+            print >> sys.stderr, "SAM file is NOT sorted. ABORT!"
+            sys.exit(-1)
+        prev = r
         if r.flag.strand == '+':
-            d[r.qID].append(TmpRec(qCov=r.qCoverage, qLen=r.qLen, qStart=r.qStart, qEnd=r.qEnd, sStart=r.sStart, sEnd=r.sEnd, iden=r.identity))
+            d[r.qID].append(TmpRec(qCov=r.qCoverage, qLen=r.qLen, qStart=r.qStart, qEnd=r.qEnd, sStart=r.sStart, sEnd=r.sEnd, iden=r.identity, offset=offset))
         else:
-            d[r.qID].append(TmpRec(qCov=r.qCoverage, qLen=r.qLen, qStart=r.qLen-r.qEnd, qEnd=r.qLen-r.qStart, sStart=r.sStart, sEnd=r.sEnd, iden=r.identity))
-    fusion_candidates = []
+            d[r.qID].append(TmpRec(qCov=r.qCoverage, qLen=r.qLen, qStart=r.qLen-r.qEnd, qEnd=r.qLen-r.qStart, sStart=r.sStart, sEnd=r.sEnd, iden=r.identity, offset=offset))
+    offsets = []
     for k, data in d.iteritems():
-#        if k.startswith('i3_c68723/f6p549'): pdb.set_trace()
         if len(data) > 1 and \
             all(a.iden>=.95 for a in data) and \
             all(a.qCov>=min_locus_coverage for a in data) and \
@@ -264,18 +211,25 @@ def find_fusion_candidates(sam_filename, query_len_dict, min_locus_coverage=.05,
             total_coverage(data)*1./data[0].qLen >= min_total_coverage and \
             all(max(a.sStart,b.sStart)-min(a.sEnd,b.sEnd)>=min_dist_between_loci \
                            for a,b in itertools.combinations(data, 2)):
-                    fusion_candidates.append(k)
-    return fusion_candidates
+                    offsets += [a.offset for a in data]
+    d.clear()
+
+    records = []
+    for offset in sorted(offsets):
+        reader.f.seek(offset)
+        records.append(reader.next())
+    reader.f.close()
+    return records
 
 def fusion_main(fa_or_fq_filename, sam_filename, output_prefix, is_fq=False, allow_extra_5_exons=True, skip_5_exon_alt=True, prefix_dict_pickle_filename=None, min_locus_coverage=.05, min_total_coverage=.99, min_locus_coverage_bp=1, min_dist_between_loci=10000):
     """
     (1) identify fusion candidates (based on mapping, total coverage, identity, etc)
     (2) group/merge the fusion exons, using an index to point to each individual part
-    (3) use BranchSimple to write out a tmp GFF where 
+    (3) group reads by the ordered tuple of loci they map to, each group is
+         a fusion gene PBfusion.1, PBfusion.2, ...
+    (4) write out a GFF where
          PBfusion.1.1 is the first part of a fusion gene
          PBfusion.1.2 is the second part of a fusion gene
-    (4) read the tmp file from <3> and modify it so that 
-         PBfusion.1 just represents the fusion gene (a single transcript GFF format)
     """
     compressed_records_pointer_dict = defaultdict(lambda: [])
     merged_exons = []
@@ -286,10 +240,11 @@ def fusion_main(fa_or_fq_filename, sam_filename, output_prefix, is_fq=False, all
 
     # step (1). identify fusion candidates
     bs = branch_simple2.BranchSimple(fa_or_fq_filename, is_fq=is_fq)
-    fusion_candidates = find_fusion_candidates(sam_filename, bs.transfrag_len_dict, min_locus_coverage, min_locus_coverage_bp, min_total_coverage, min_dist_between_loci)
+    candidate_records = find_fusion_candidates(sam_filename, bs.transfrag_len_dict, min_locus_coverage, min_locus_coverage_bp, min_total_coverage, min_dist_between_loci)
 
-    # step (2). merge the fusion exons
-    for recs in iter_gmap_sam_for_fusion(sam_filename, fusion_candidates, bs.transfrag_len_dict):
+    # step (2). merge the fusion exons, each merged group is a locus,
+    # and record for each read the ordered list of loci it maps to
+    for recs in iter_gmap_sam_for_fusion(candidate_records):
         for v in recs.itervalues():
             if len(v) > 0:
                 o = merge_fusion_exons(v, max_fusion_point_dist=100, max_exon_end_dist=0, allow_extra_5_exons=allow_extra_5_exons)
@@ -297,60 +252,28 @@ def fusion_main(fa_or_fq_filename, sam_filename, output_prefix, is_fq=False, all
                     merged_exons.append(group)
                     for r in group: compressed_records_pointer_dict[r.qID].append(merged_i)
                     merged_i += 1
+    del candidate_records
 
-    # step (3). use BranchSimple to write a temporary file
-#    f_good = open(output_prefix + '.gff', 'w')
-    f_group = open('branch_tmp.group.txt', 'w')
-#    f_bad = f_good
-    gene_index = 1
-    already_seen = set()
-    for qid,indices in compressed_records_pointer_dict.iteritems():
-        combo = tuple(indices)
-        if combo in already_seen:
-            print "combo seen:", combo
-            #raw_input("")
-            continue
-        already_seen.add(combo)
-#        if gene_index == 7:
-#            pdb.set_trace()
-        for isoform_index,i in enumerate(indices):
-            bs.cuff_index = gene_index # for set to the same
-            records = merged_exons[i]
-            f_group.write("{p}.{i}.{j}\t{ids}\n".format(p="PBfusion", i=gene_index, j=isoform_index, ids=",".join(r.qID for r in records)))
-#            bs.process_records(records, allow_extra_5_exons, skip_5_exon_alt, \
-#                    f_good, f_bad, f_group, tolerate_end=100, \
-#                    starting_isoform_index=isoform_index, gene_prefix='PBfusion')
-        gene_index += 1
-#    f_good.close()
-#    f_bad.close()
-    f_group.close()
-
-
-    # step (4). read the tmp file and modify to display per fusion gene
+    # step (3). reads with the same ordered tuple of loci form a fusion gene
+    fusion_members = defaultdict(lambda: []) # tuple of loci --> list of qIDs
+    for qid, indices in compressed_records_pointer_dict.iteritems():
+        fusion_members[tuple(indices)].append(qid)
+    fusion_groups = [] # list of (PBfusion.<i>, (loci, qIDs))
     f_group = open(output_prefix + '.group.txt', 'w')
-    group_info = {} # ex: PBfusion.1 --> [id1, id2, id3...]
-    count = 0
-    with open('branch_tmp.group.txt') as f:
-        while True:
-            line = f.readline().strip()
-            if len(line) == 0: break
-            pbid1, groups1 = line.strip().split('\t')
-            pbid2, groups2 = f.readline().strip().split('\t')
-            assert pbid1.split('.')[1] == pbid2.split('.')[1]
-            group = set(groups1.split(',')).intersection(groups2.split(','))
-            f_group.write("{0}\t{1}\n".format(pbid1[:pbid1.rfind('.')], ",".join(group)))
-            group_info[pbid1[:pbid1.rfind('.')]] = list(group)
-            count += 1
+    for gene_index, loci in enumerate(sorted(fusion_members), start=1):
+        pb_id = "PBfusion.{0}".format(gene_index)
+        f_group.write("{0}\t{1}\n".format(pb_id, ",".join(fusion_members[loci])))
+        fusion_groups.append((pb_id, (loci, fusion_members[loci])))
     f_group.close()
-    #os.remove('branch_tmp.group.txt')
+    count = len(fusion_groups)
 
+    # step (4). write the GFF (one transcript per locus of the rep) and the rep sequences
     gff_filename = output_prefix + '.gff'
-    group_filename = output_prefix + '.group.txt'
     if is_fq:
         output_filename = output_prefix + '.rep.fq'
     else:
         output_filename = output_prefix + '.rep.fa'
-    pick_rep(fa_or_fq_filename, sam_filename, gff_filename, group_filename, output_filename, is_fq=is_fq, pick_least_err_instead=False)
+    write_fusion_gff_and_rep(fa_or_fq_filename, fusion_groups, merged_exons, bs.transfrag_len_dict, gff_filename, output_filename, is_fq=is_fq)
 
     print >> sys.stderr, "{0} fusion candidates identified.".format(count)
     print >> sys.stderr, "Output written to: {0}.gff, {0}.group.txt, {1}".format(output_prefix, output_filename)
@@ -0,0 +1,144 @@
+"""
+Define ClusterStore, a packed per-cluster file store.
+
+Instead of one directory (grouped per 10k) per cluster, each holding a
+few tiny files which are deleted and recreated every iteration, small
+per-cluster files are appended to a single segment file:
+    $tmp_dir/clusters.pack      --- append-only segment of file contents
+    $tmp_dir/clusters.pack.idx  --- append-only index, one line per put:
+                                    cid<TAB>name<TAB>offset<TAB>length
+                                    (length -1 marks a deleted cluster)
+The last index line for a (cid, name) wins. export() writes entries of
+a cluster back to the legacy layout, i.e., IceFiles.cluster_dir(cid).
+"""
+import os
+import os.path as op
+from pbtools.pbtranscript.Utils import mkdir
+
+
+class ClusterStore(object):
+
+    """Append-only segment file plus an index keyed by (cid, name)."""
+
+    def __init__(self, store_dir, reset=False):
+        """
+        store_dir --- directory to keep clusters.pack and clusters.pack.idx
+        reset --- if True, discard any existing content
+        """
+        self.store_dir = store_dir
+        mkdir(store_dir)
+        if reset:
+            for fn in (self.pack_fn, self.idx_fn):
+                if op.exists(fn):
+                    os.remove(fn)
+
+        # (cid, name) --> (offset, length); cid --> set of names
+        self.index = {}
+        self.names_of = {}
+        if op.exists(self.idx_fn):
+            with open(self.idx_fn) as f:
+                for line in f:
+                    raw = line.rstrip('\n').split('\t')
+                    if len(raw) != 4:
+                        break  # truncated last line
+                    self._update_index(int(raw[0]), raw[1],
+                                       int(raw[2]), int(raw[3]))
+
+        self.pack_f = open(self.pack_fn, 'a+b')
+        self.pack_f.seek(0, os.SEEK_END)
+        self.idx_f = open(self.idx_fn, 'a')
+
+    @property
+    def pack_fn(self):
+        """Return $store_dir/clusters.pack"""
+        return op.join(self.store_dir, "clusters.pack")
+
+    @property
+    def idx_fn(self):
+        """Return $store_dir/clusters.pack.idx"""
+        return op.join(self.store_dir, "clusters.pack.idx")
+
+    def _update_index(self, cid, name, offset, length):
+        """Apply one index entry."""
+        if length < 0:
+            for _name in self.names_of.pop(cid, ()):
+                del self.index[(cid, _name)]
+        else:
+            self.index[(cid, name)] = (offset, length)
+            self.names_of.setdefault(cid, set()).add(name)
+
+    def put(self, cid, name, data):
+        """Append data as file <name> of cluster cid."""
+        self.pack_f.seek(0, os.SEEK_END)
+        offset = self.pack_f.tell()
+        self.pack_f.write(data)
+        self.idx_f.write("{0}\t{1}\t{2}\t{3}\n".format(
+            cid, name, offset, len(data)))
+        self._update_index(cid, name, offset, len(data))
+
+    def get(self, cid, name):
+        """Return content of file <name> of cluster cid."""
+        offset, length = self.index[(cid, name)]
+        self.pack_f.flush()
+        self.pack_f.seek(offset)
+        return self.pack_f.read(length)
+
+    def has(self, cid, name):
+        """Return True if cluster cid has file <name> in store."""
+        return (cid, name) in self.index
+
+    def names(self, cid):
+        """Return names of files of cluster cid in store."""
+        return sorted(self.names_of.get(cid, ()))
+
+    def delete(self, cid):
+        """Delete all files of cluster cid."""
+        if cid in self.names_of:
+            self.idx_f.write("{0}\t*\t0\t-1\n".format(cid))
+            self._update_index(cid, None, 0, -1)
+
+    def flush(self):
+        """Flush segment and index to disk."""
+        self.pack_f.flush()
+        self.idx_f.flush()
+        os.fsync(self.pack_f.fileno())
+        os.fsync(self.idx_f.fileno())
+
+    def export(self, cid, out_dir, names=None):
+        """
+        Write files of cluster cid (or only those in names) to out_dir,
+        i.e., the legacy per-cluster layout. Return exported file paths.
+        """
+        mkdir(out_dir)
+        out_fns = []
+        for name in (self.names(cid) if names is None else names):
+            out_fn = op.join(out_dir, name)
+            with open(out_fn, 'w') as writer:
+                writer.write(self.get(cid, name))
+            out_fns.append(out_fn)
+        return out_fns
+
+    def compact(self):
+        """Rewrite segment and index with live entries only."""
+        self.flush()
+        tmp_pack_fn, tmp_idx_fn = self.pack_fn + ".tmp", self.idx_fn + ".tmp"
+        new_index = {}
+        with open(tmp_pack_fn, 'wb') as pack_w, open(tmp_idx_fn, 'w') as idx_w:
+            for (cid, name) in sorted(self.index):
+                data = self.get(cid, name)
+                new_index[(cid, name)] = (pack_w.tell(), len(data))
+                idx_w.write("{0}\t{1}\t{2}\t{3}\n".format(
+                    cid, name, pack_w.tell(), len(data)))
+                pack_w.write(data)
+        self.close()
+        os.rename(tmp_pack_fn, self.pack_fn)
+        os.rename(tmp_idx_fn, self.idx_fn)
+        self.index = new_index
+        self.pack_f = open(self.pack_fn, 'a+b')
+        self.pack_f.seek(0, os.SEEK_END)
+        self.idx_f = open(self.idx_fn, 'a')
+
+    def close(self):
+        """Close segment and index files."""
+        self.pack_f.close()
+        self.idx_f.close()
@@ -7,6 +7,7 @@ import os
 import os.path as op
 import time
 import logging
+from cPickle import load
 from multiprocessing import Process
 from pbcore.util.Process import backticks
 from pbcore.io import FastaReader
@@ -128,6 +129,19 @@ class IceFiles(object):
         """Return $root_dir/output/final.pickle"""
         return op.join(self.out_dir, "final.pickle")
 
+    @property
+    def support_counts_fn(self):
+        """Return $root_dir/output/final.support_counts.txt, numbers of
+        FL and nFL reads of each cluster in final_pickle_fn and
+        nfl_all_pickle_fn."""
+        return op.join(self.out_dir, "final.support_counts.txt")
+
+    @property
+    def journal_dir(self):
+        """Return $root_dir/output/journal, where IceIterative keeps its
+        snapshot and append-only checkpoint journal."""
+        return op.join(self.out_dir, "journal")
+
     @property
     def submitted_quiver_jobs_log(self):
         """Return $root_dir/log/submitted_quiver_jobs.txt"""
@@ -289,6 +303,44 @@ class IceFiles(object):
                     for r in partial_uc[c]:
                         f.write("c{c},{r},NonFL\n".format(r=r, c=c))
 
+    def write_support_counts(self, uc, partial_uc):
+        """
+        Write numbers of FL (uc) and nFL (partial_uc) reads of each
+        cluster to support_counts_fn, each line contains three columns:
+            cluster_id, num_fl and num_nfl
+        """
+        tmp_fn = self.support_counts_fn + ".tmp"
+        with open(tmp_fn, 'w') as f:
+            for c in uc.keys():
+                f.write("{c}\t{fl}\t{nfl}\n".format(
+                    c=c, fl=len(uc[c]),
+                    nfl=len(partial_uc[c]) if c in partial_uc else 0))
+        os.rename(tmp_fn, self.support_counts_fn)
+
+    def load_support_counts(self):
+        """
+        Return {cluster_id: (num_fl, num_nfl)} from support_counts_fn.
+        If support_counts_fn is missing or older than the uc/partial_uc
+        pickles, write it from the pickles first.
+        """
+        fn = self.support_counts_fn
+        pickles = [self.final_pickle_fn, self.nfl_all_pickle_fn]
+        if not op.exists(fn) or \
+                any(op.getmtime(p) > op.getmtime(fn) for p in pickles):
+            self.add_log("Counting FL and nFL reads of clusters from {fs}.".
+                         format(fs=", ".join(pickles)))
+            uc = load(open(self.final_pickle_fn))['uc']
+            partial_uc = load(open(self.nfl_all_pickle_fn))['partial_uc']
+            self.write_support_counts(uc, partial_uc)
+            del uc, partial_uc
+
+        counts = {}
+        with open(fn) as f:
+            for line in f:
+                c, fl, nfl = line.split('\t')
+                counts[int(c)] = (int(fl), int(nfl))
+        return counts
+
     def write_summary(self, summary_fn, isoforms_fa, hq_fa=None, lq_fa=None):
         """Extract number of consensus isoforms predicted, and total
         number of bases in all consensuus isoforms from isoforms_fa and write
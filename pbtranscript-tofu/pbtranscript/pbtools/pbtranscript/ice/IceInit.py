@@ -7,10 +7,11 @@ __author__ = 'etseng@pacificbiosciences.com'
 
 import os
 import time
-import networkx as nx
 import logging
+from array import array
 from pbcore.io import FastaReader
 import numpy as np
+from scipy import sparse
 from pbcore.util.Process import backticks
 from pbtools.pbtranscript.Utils import real_upath
 import pbtools.pbtranscript.ice.pClique as pClique
@@ -18,16 +19,102 @@ from pbtools.pbtranscript.ice.IceUtils import blasr_against_ref, get_daligner_se
 from pbtools.pbtranscript.icedalign.IceDalignUtils import DazzIDHandler, DalignerRunner
 from pbtools.pbtranscript.icedalign.IceDalignReader import dalign_against_ref
 
+class ReadEdgeStore(object):
+    """
+    Compact store of read-to-read hits from the all-vs-all alignment.
+    Read ids are interned to indices once, hits are kept as parallel
+    arrays of (query index, target index, log probability), which costs
+    16 bytes per hit instead of a networkx edge.
+    """
+    def __init__(self, readsFa):
+        self.read_ids = []
+        self.read_lens = []
+        with FastaReader(readsFa) as reader:
+            for r in reader:
+                self.read_ids.append(r.name.split()[0])
+                self.read_lens.append(len(r.sequence))
+        self.index = dict((rid, i) for i, rid in enumerate(self.read_ids))
+        self.qs = array('i')
+        self.ts = array('i')
+        self.logprobs = array('d')
+
+    def __len__(self):
+        return len(self.qs)
+
+    def add(self, qID, tID, logprob=np.nan):
+        """Add a hit of qID against tID, logprob = log P(qID|tID)."""
+        self.qs.append(self.index[qID])
+        self.ts.append(self.index[tID])
+        self.logprobs.append(logprob)
+
+    def to_csr(self):
+        """Return the symmetric 0/1 adjacency matrix in CSR format."""
+        n = len(self.read_ids)
+        qs = np.frombuffer(self.qs, dtype=np.int32) if len(self) > 0 \
+             else np.zeros(0, dtype=np.int32)
+        ts = np.frombuffer(self.ts, dtype=np.int32) if len(self) > 0 \
+             else np.zeros(0, dtype=np.int32)
+        rows = np.concatenate([qs, ts])
+        cols = np.concatenate([ts, qs])
+        H = sparse.csr_matrix((np.ones(len(rows), dtype=np.int32),
+                               (rows, cols)), shape=(n, n))
+        # collapse duplicated hits into 0/1 entries
+        H.data[:] = 1
+        H.eliminate_zeros()
+        return H
+
+    def seed_probs(self, uc, self_prob_func):
+        """
+        Return an initial probability dict d (read id --> cid --> logprob)
+        for clusters uc, using members of each cluster as stand-ins for
+        its consensus: d[q][c] is the best scored hit of query q against
+        any member of c. A hit is scored with the QVs of its query, so it
+        only gives a prob of its query; the all-vs-all alignment has the
+        hit of the other direction as well. A singleton is its own
+        consensus, so its prob comes from self_prob_func(read id, read
+        length). A member of a quasi-clique without a scored hit to any
+        other member has no prob to its own cluster; IceIterative
+        computes those, and rescores all seeded probs against consensus
+        sequences (see IceIterative.rescore_seeded).
+        """
+        cid_of = np.empty(len(self.read_ids), dtype=np.int64)
+        d = {}
+        for cid, members in uc.iteritems():
+            for rid in members:
+                cid_of[self.index[rid]] = cid
+                d[rid] = {}
+
+        for q, t, p in zip(self.qs, self.ts, self.logprobs):
+            if p != p:  # NaN, hit was not scored
+                continue
+            probs = d[self.read_ids[q]]
+            c = int(cid_of[t])
+            if c not in probs or p > probs[c]:
+                probs[c] = p
+
+        for cid, members in uc.iteritems():
+            if len(members) == 1:
+                rid = members[0]
+                d[rid][cid] = self_prob_func(rid, self.read_lens[self.index[rid]])
+        return d
+
+
 class IceInit(object):
     """Iterative clustering and error correction."""
     def __init__(self, readsFa, qver_get_func, qvmean_get_func,
-        ice_opts, sge_opts):
-
+        ice_opts, sge_opts, calc_prob_func=None):
+        """
+        calc_prob_func --- if given, e.g. ProbFromFastq.calc_prob_from_aln,
+            hits are scored and kept in self.edges so that seed_d() can
+            provide initial probabilities to IceIterative.
+        """
         self.readsFa = readsFa
         self.qver_get_func = qver_get_func
+        self.calc_prob_func = calc_prob_func
         self.ice_opts = ice_opts
         self.sge_opts = sge_opts
         self.uc = None
+        self.edges = None
 
         self.uc = self.init_cluster_by_clique(
             readsFa=readsFa,
@@ -73,8 +160,8 @@ class IceInit(object):
 
     # version using BLASR
     def _makeGraphFromM5(self, m5FN, qver_get_func, qvmean_get_func, ice_opts, max_missed_start, max_missed_end):
-        """Construct a graph from a BLASR M5 file."""
-        alignGraph = nx.Graph()
+        """Construct a graph (ReadEdgeStore) from a BLASR M5 file."""
+        alignGraph = ReadEdgeStore(self.readsFa)
 
         for r in blasr_against_ref(output_filename=m5FN,
             is_FL=True,
@@ -89,11 +176,20 @@ class IceInit(object):
                 continue # self hit, ignore
             if r.ece_arr is not None:
                 logging.debug("adding edge {0},{1}".format(r.qID, r.cID))
-                alignGraph.add_edge(r.qID, r.cID)
+                self._add_hit(alignGraph, r)
         return alignGraph
 
+    def _add_hit(self, alignGraph, r):
+        """Add a HitItem to alignGraph, scored if calc_prob_func is set."""
+        if self.calc_prob_func is not None:
+            alignGraph.add(r.qID, r.cID, self.calc_prob_func(
+                r.qID, r.qStart, r.qEnd, r.fakecigar))
+        else:
+            alignGraph.add(r.qID, r.cID)
+
     def _makeGraphFromLasOut(self, las_out_filenames, dazz_obj, qver_get_func, ice_opts, max_missed_start, max_missed_end, qvmean_get_func=None):
-        alignGraph = nx.Graph()
+        """Construct a graph (ReadEdgeStore) from LA4Ice outputs."""
+        alignGraph = ReadEdgeStore(self.readsFa)
 
         for las_out_filename in las_out_filenames:
             count = 0
@@ -106,7 +202,7 @@ class IceInit(object):
                       max_missed_start=max_missed_start, max_missed_end=max_missed_end):
                 if r.qID == r.cID: continue # self hit, ignore
                 if r.ece_arr is not None:
-                    alignGraph.add_edge(r.qID, r.cID)
+                    self._add_hit(alignGraph, r)
                     count += 1
             logging.debug("total {0} edges added from {1}; took {2} sec".format(count, las_out_filename, time.time()-start_t))
         return alignGraph
@@ -117,8 +213,8 @@ class IceInit(object):
         Find all mutually exclusive cliques within the graph, with decreased
         size.
 
-        alignGraph - a graph, each node represent a read and each edge
-        represents an alignment between two end points.
+        alignGraph - a ReadEdgeStore, each read is a node and each hit
+        represents an edge between two reads.
 
         Return a dictionary of clique indices and nodes.
             key = index of a clique
@@ -128,44 +224,55 @@ class IceInit(object):
         of size 1.
         """
         uc = {}    # To keep cliques found
-        used = []  # nodes within any cliques
         ind = 0    # index of clique to discover
 
-        deg = alignGraph.degree().items()
-        # Sort tuples of (node, degree) by degree, descendingly
-        deg.sort(key=lambda x:x[1], reverse=True)
-        for d in deg:
-            node = d[0]  # node which has the largest degree in alignGraph
-            if node not in alignGraph:
+        H = alignGraph.to_csr()
+        n = H.shape[0]
+        used = np.zeros(n, dtype=bool)  # nodes within any cliques
+
+        deg = np.diff(H.indptr)
+        # Sort nodes by degree, descendingly
+        for node in np.argsort(-deg, kind='mergesort'):
+            if used[node] or deg[node] == 0:
+                continue
+            # just get the immediate neighbors (not yet in a clique)
+            # since we're looking for perfect cliques
+            nbrs = H.indices[H.indptr[node]:H.indptr[node+1]]
+            nbrs = nbrs[~used[nbrs]]
+            if len(nbrs) == 0:
                 continue
-            # just get the immediate neighbors since we're looking for perfect
-            # cliques
-            subGraph = alignGraph.subgraph([node] + alignGraph.neighbors(node))
-            subNodes = subGraph.nodes()
-            # Convert from networkx.Graph to a sparse matrix
-            S, H = pClique.convert_graph_connectivity_to_sparse(
-                subGraph, subNodes)
-            # index of the 'node' in the sub-graph
-            seed_i = subNodes.index(node)
+            subNodes = np.concatenate([[node], nbrs])
+            # Sub-graph adjacency, the seed 'node' is at index 0
+            subH = H[subNodes, :][:, subNodes].tocsr()
             # Grasp a clique from subGraph, and return indices of clique nodes
             # setting gamma=0.8 means to find quasi-0.8-cliques!
-            tQ = pClique.grasp(S, H, gamma=0.8, maxitr=5, given_starting_node=seed_i)
+            tQ = pClique.grasp(None, subH, gamma=0.8, maxitr=5, given_starting_node=0)
             if len(tQ) > 0:
                 c = [subNodes[i] for i in tQ]  # nodes in the clique
-                uc[ind] = c  # Add the clique to uc
+                uc[ind] = [alignGraph.read_ids[i] for i in c]  # Add the clique to uc
                 ind += 1
-                used += c    # Add clique nodes to used
-                # Remove clique nodes from alignGraph and continue
-                alignGraph.remove_nodes_from(c)
+                # Mark clique nodes as used and continue
+                used[c] = True
 
-        with FastaReader(readsFa) as reader:
-            for r in reader:
-                rid = r.name.split()[0]
-                if rid not in used:
-                    uc[ind] = [rid]
-                    ind += 1
+        for i, rid in enumerate(alignGraph.read_ids):
+            if not used[i]:
+                uc[ind] = [rid]
+                ind += 1
         return uc
 
+    def seed_d(self, self_prob_func=None):
+        """
+        Return initial probabilities (read id --> cid --> logprob) for
+        self.uc from the scored all-vs-all hits, so IceIterative can skip
+        aligning the same reads against fresh consensus sequences.
+        Return None if hits were not scored (no calc_prob_func).
+        """
+        if self.edges is None or self.calc_prob_func is None:
+            return None
+        if self_prob_func is None:
+            self_prob_func = lambda rid, l: self.calc_prob_func(rid, 0, l, 'M' * l)
+        return self.edges.seed_probs(self.uc, self_prob_func)
+
     def init_cluster_by_clique(self, readsFa, qver_get_func,
             ice_opts, sge_opts, qvmean_get_func):
         """
@@ -202,6 +309,7 @@ class IceInit(object):
             alignGraph = self._makeGraphFromM5(outFN, qver_get_func, qvmean_get_func, ice_opts, \
                                                max_missed_start=_ignore5, max_missed_end=_ignore3)
 
+        self.edges = alignGraph
         uc = self._findCliques(alignGraph=alignGraph, readsFa=readsFa)
         return uc
 
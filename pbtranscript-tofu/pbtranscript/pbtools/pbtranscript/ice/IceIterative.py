@@ -10,11 +10,12 @@ import logging
 import random
 import time
 import numpy as np
-from pbcore.io.FastaIO import FastaReader, FastaWriter
+from pbcore.io.FastaIO import FastaReader, FastaWriter, FastaRecord
 from pbcore.io.FastqIO import FastqReader, FastqWriter
+from multiprocessing import Pool
 from multiprocessing.pool import ThreadPool
 from datetime import datetime
-from pbtools.pbtranscript.Utils import mknewdir, real_upath
+from pbtools.pbtranscript.Utils import mknewdir, mkdir, real_upath
 from pbtools.pbtranscript.io.FastaRandomReader import FastqRandomReader
 from pbtools.pbtranscript.io.BLASRRecord import BLASRM5Reader
 from pbtools.pbtranscript.ice.ProbModel import ProbFromQV, ProbFromFastq
@@ -23,8 +24,12 @@ from pbtools.pbtranscript.ice.IceUtils import sanity_check_gcon, \
     sanity_check_sge, possible_merge, blasr_against_ref, \
     get_the_only_fasta_record, cid_with_annotation, \
     get_daligner_sensitivity_setting, \
-    sanity_check_daligner
+    sanity_check_daligner, cids_missing_own_prob
 from pbtools.pbtranscript.ice.IceFiles import IceFiles, wait_for_sge_jobs
+from pbtools.pbtranscript.ice.IceJournal import IceJournal
+from pbtools.pbtranscript.ice.IceClusterStore import ClusterStore
+from pbtools.pbtranscript.ice.IceSketch import minimizer_sketch, \
+    sketch_candidate_pairs, candidate_groups
 from pbtools.pbtranscript.ice_pbdagcon import runConsensus
 from pbtools.pbtranscript.ice.IceUtils import ice_fa2fq, ice_fq2fa
 from pbtools.pbtranscript.icedalign.IceDalignUtils import DazzIDHandler, DalignerRunner
@@ -32,6 +37,57 @@ from pbtools.pbtranscript.icedalign.IceDalignReader import dalign_against_ref, L
 
 random.seed(0)
 
+# (query_obj, ref_obj, probQV, dalign_kwargs) shared with the forked
+# scoring workers of IceIterative.g2(). Set right before the pool is
+# created so the workers inherit it (copy-on-write) instead of having
+# the QV store pickled over to them.
+_g2_shared_args = None
+
+
+def _score_las_out(las_out_filename):
+    """
+    Score all hits in one LA4Ice output (one per daligner block).
+    Return compact (qIDs, cIDs, logprobs) arrays; logprob is NaN
+    for hits that did not pass the alignment checks, so the qID
+    is still recorded with no probability.
+    """
+    query_obj, ref_obj, probQV, kwargs = _g2_shared_args
+    qids, cids, probs = [], [], []
+    for hit in dalign_against_ref(query_obj, ref_obj, las_out_filename,
+                                  **kwargs):
+        qids.append(hit.qID)
+        cids.append(hit.cID)
+        if hit.fakecigar is not None:
+            probs.append(probQV.calc_prob_from_aln(
+                hit.qID, hit.qStart, hit.qEnd, hit.fakecigar))
+        else:
+            probs.append(np.nan)
+    return (qids, np.array(cids, dtype=np.int64),
+            np.array(probs, dtype=np.float64))
+
+
+def score_las_outs(las_out_filenames, query_obj, ref_obj, probQV, kwargs,
+                   num_processes=1):
+    """
+    Score LA4Ice outputs with _score_las_out, in a pool of num_processes
+    forked processes if num_processes > 1, and return their results in
+    the order of las_out_filenames. The pool is terminated even if
+    scoring fails or is interrupted, so that no workers are left behind.
+    """
+    global _g2_shared_args
+    _g2_shared_args = (query_obj, ref_obj, probQV, kwargs)
+    pool = None
+    try:
+        if num_processes == 1:
+            return [_score_las_out(fn) for fn in las_out_filenames]
+        pool = Pool(processes=num_processes)
+        return pool.map(_score_las_out, las_out_filenames)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        _g2_shared_args = None
+
 
 class IceIterative(IceFiles):
 
@@ -47,7 +103,7 @@ class IceIterative(IceFiles):
                  ice_opts, sge_opts,
                  uc=None, probQV=None,
                  refs=None, d=None, is_FL=True, qv_prob_threshold=.03,
-                 use_ccs_qv=False):
+                 use_ccs_qv=False, journal_offset=None):
         """
         fasta_filename --- the current fasta filename containing
             all the "active" reads (reads that are allowed to move
@@ -94,10 +150,25 @@ class IceIterative(IceFiles):
                            DBsplit results in smaller DBs.
             gcon_nproc : number of processes for DAGCON/DAZCON
             quiver_nproc : number of processes for Quiver
+
+        journal_offset --- if not None, resume appending to the existing
+            checkpoint journal at this offset (see from_journal), instead
+            of starting a new journal with a snapshot of the initial state.
         """
         super(IceIterative, self).__init__(prog_name="IceIterative",
                                            root_dir=root_dir, ccs_fofn=ccs_fofn)
 
+        # append-only checkpoint journal, started at the end of __init__
+        self.journal = IceJournal(self.journal_dir)
+
+        # packed store for files of clusters which are too small to run
+        # gcon on (<= 2 reads), instead of per-cluster directories
+        self.store = ClusterStore(self.tmp_dir, reset=(journal_offset is None))
+
+        # cid --> (hash of consensus sequence, length, minimizer sketch),
+        # so that post-ICE merging only sketches new/changed consensus
+        self.sketches = {}
+
         self.fasta_filename = fasta_filename
         self.fastq_filenames_to_add = fastq_filenames_to_add
         self.all_fasta_filename = all_fasta_filename
@@ -121,6 +192,12 @@ class IceIterative(IceFiles):
 
         # probability dict, seqid --> cluster index i --> P(seq|C_i)
         self.d = {}
+        # seqids whose rows of self.d changed since the last checkpoint,
+        # journaled right before the next commit
+        self.d_changed = set()
+        # cids whose probs in self.d were seeded by IceInit from hits to
+        # members, not computed against their consensus, see rescore_seeded
+        self.seeded_cids = set()
 
         self.refs = {}  # cluster index --> gcon output consensus filename
         self.uc = {}  # cluster index --> list of member seqids
@@ -171,7 +248,8 @@ class IceIterative(IceFiles):
             self.fastq_filename = self.fasta_filename[:self.fasta_filename.rfind('.')] + '.fastq'
             self.add_log("Converting input fasta + ccs_fofn --> fastq.",
                         level=logging.INFO)
-            ice_fa2fq(self.fasta_filename, ccs_fofn, self.fastq_filename)
+            ice_fa2fq(self.fasta_filename, ccs_fofn, self.fastq_filename,
+                      cpus=self.blasr_nproc)
 
         self.use_ccs_qv = use_ccs_qv
         if probQV is not None:
@@ -220,10 +298,23 @@ class IceIterative(IceFiles):
             self.add_log("Loading probabilities from a prob dict directly.",
                          level=logging.INFO)
             self.d = d
+            if journal_offset is None:
+                # e.g., seeded by IceInit, which may not have a read's
+                # prob to its own cluster
+                self.seeded_cids = set(self.uc)
+                self.calc_missing_own_prob()
 
         self.removed_qids = set() #
         self.global_count = 0
 
+        if journal_offset is None:
+            self.add_log("Starting checkpoint journal in {d}.".format(
+                         d=self.journal_dir), level=logging.INFO)
+            self.journal.start(self.state_dict())
+            self.d_changed = set()
+        else:
+            self.journal.resume(journal_offset)
+
     @property
     def tmpConsensusFa(self):
         """Return tmp consensus Fasta file. e.g.,
@@ -312,7 +403,37 @@ class IceIterative(IceFiles):
         if self.refs is None:
             return
         for cid in self.uc:
-            assert cid in self.refs and op.exists(self.refs[cid])
+            assert cid in self.refs and \
+                (op.exists(self.refs[cid]) or
+                 self.store.has(cid, op.basename(self.refs[cid])))
+
+    def ref_record(self, cid):
+        """
+        Return the FastaRecord of the consensus of cluster cid, which is
+        read from the packed store if kept there, otherwise from refs[cid].
+        """
+        name = op.basename(self.refs[cid])
+        if self.store.has(cid, name):
+            header, seq = self.store.get(cid, name)[1:].split('\n')[:2]
+            return FastaRecord(name=header, sequence=seq)
+        return get_the_only_fasta_record(self.refs[cid])
+
+    def export_cluster_store(self, refs_only=True):
+        """
+        Write files kept in the packed store back to the legacy layout,
+        $tmp_dir/<cid/10000>/c<cid>/, so that refs[cid] are real files
+        for downstream tools (e.g., ice_quiver). If refs_only is False,
+        export every stored file (e.g., in.fa) as well.
+        """
+        self.add_log("Exporting packed cluster store to legacy layout.",
+                     level=logging.INFO)
+        for cid in self.uc:
+            if refs_only:
+                name = op.basename(self.refs[cid])
+                if self.store.has(cid, name):
+                    self.store.export(cid, self.cluster_dir(cid), [name])
+            else:
+                self.store.export(cid, self.cluster_dir(cid))
 
     @staticmethod
     def from_pickle(pickle_filename, probQV):
@@ -344,6 +465,73 @@ class IceIterative(IceFiles):
             d=a['d'],
             qv_prob_threshold=a['qv_prob_threshold'])
         obj.changes = a['changes']
+        obj.seeded_cids = set(a.get('seeded_cids', ()))
+        return obj
+
+    @staticmethod
+    def from_journal(root_dir, probQV=None):
+        """
+        Load an instance of IceIterative from the snapshot + checkpoint
+        journal under root_dir, as of the last commit.
+        current.fasta/fastq are regenerated from newids. gcon is re-run
+        for clusters whose files were touched after the last commit, so
+        that refs match the committed uc. Rows of d are journaled at
+        each commit, so only probabilities to these clusters are
+        recalculated.
+        """
+        journal = IceJournal(op.join(real_upath(root_dir), "output", "journal"))
+        a, touched, dirty, offset = journal.replay()
+
+        newids = a['newids']
+        with FastqWriter(a['fastq_filename']) as writer:
+            for r in FastqReader(a['all_fasta_filename']):
+                if r.name.split()[0] in newids:
+                    writer.writeRecord(r.name, r.sequence, r.quality)
+        ice_fq2fa(a['fastq_filename'], a['fasta_filename'])
+        if probQV is None:
+            probQV = ProbFromFastq(a['fastq_filename'])
+
+        # every member needs an entry in d
+        for members in a['uc'].itervalues():
+            for qid in members:
+                if qid not in a['d']:
+                    a['d'][qid] = {}
+
+        obj = IceIterative(
+            fasta_filename=a['fasta_filename'],
+            fastq_filename=a['fastq_filename'],
+            fastq_filenames_to_add=a['fastq_filenames_to_add'],
+            all_fasta_filename=a['all_fasta_filename'],
+            ccs_fofn=a['ccs_fofn'],
+            root_dir=a['root_dir'],
+            ice_opts=a['ice_opts'],
+            sge_opts=a['sge_opts'],
+            uc=a['uc'],
+            probQV=probQV,
+            refs=a['refs'],
+            d=a['d'],
+            qv_prob_threshold=a['qv_prob_threshold'],
+            journal_offset=offset)
+        obj.iterNum = a.get('iterNum', 0)
+        obj.seeded_cids = set(a.get('seeded_cids', ()))
+        obj.add_log("Resumed from checkpoint journal; {n} clusters changed "
+                    "since the last snapshot, {m} clusters touched after "
+                    "the last commit.".format(n=len(touched), m=len(dirty)),
+                    level=logging.INFO)
+
+        # files of clusters which do not exist at the last commit
+        for cid in dirty.difference(obj.uc):
+            if op.exists(obj.cluster_dir(cid)):
+                shutil.rmtree(obj.cluster_dir(cid))
+            obj.store.delete(cid)
+        dirty.intersection_update(obj.uc)
+        if len(dirty) > 0:
+            obj.run_gcon_parallel(dirty)
+            obj.changes = dirty
+            obj.calc_cluster_prob()
+        obj.freeze_d()
+        obj.changes = set()
+        obj.checkpoint(tag="resume")
         return obj
 
     def write_final_consensus(self):
@@ -358,19 +546,18 @@ class IceIterative(IceFiles):
         self.write_consensus(fasta_filename=self.final_consensus_fa,
                              sa_filename=None)
 
-    def write_consensus(self, fasta_filename, sa_filename=None):
+    def write_consensus(self, fasta_filename, sa_filename=None, cids=None):
         """
         Write output to fasta_file
         Sequence ID format
         >c<cid>/abundance/length
+        If cids is not None, only write consensus of these clusters.
         """
         with open(fasta_filename, 'w') as f:
-            for cid, filename in self.refs.iteritems():
+            for cid in (self.refs if cids is None else cids):
                 assert cid in self.uc
                 #r = SeqIO.read(open(filename), 'fasta')
-                rs = [x for x in FastaReader(filename)]
-                assert(len(rs) == 1)
-                r = rs[0]
+                r = self.ref_record(cid)
                 newid = "c{cid}/{ab}/{le}".format(cid=cid,
                                                   ab=len(self.uc[cid]),
                                                   le=len(r.sequence))
@@ -396,7 +583,11 @@ class IceIterative(IceFiles):
     def write_pickle(self, pickle_filename):
         """Write an instance of IceIterative to a pickle file."""
         with open(pickle_filename, 'w') as f:
-            d = {'uc': self.uc,
+            cPickle.dump(self.state_dict(), f)
+
+    def state_dict(self):
+        """Return a dict of the state to be pickled or snapshotted."""
+        return {'uc': self.uc,
                  'd': self.d,
                  'refs': self.refs,
                  'ccs_fofn': self.ccs_fofn,
@@ -409,9 +600,33 @@ class IceIterative(IceFiles):
                  'root_dir': self.root_dir,
                  'newids': self.newids,
                  'changes': self.changes,
-                 'qv_prob_threshold': self.qv_prob_threshold
-                 }
-            cPickle.dump(d, f)
+                 'qv_prob_threshold': self.qv_prob_threshold,
+                 'iterNum': self.iterNum,
+                 'seeded_cids': self.seeded_cids
+                }
+
+    def checkpoint(self, tag):
+        """
+        Mark a consistent point in the checkpoint journal, which is
+        where from_journal() resumes. Compact the journal into a new
+        snapshot once it grows too large.
+        """
+        self.store.flush()
+        if len(self.d_changed) > 0:
+            self.journal.record('d', dict((qid, self.d.get(qid))
+                                          for qid in self.d_changed))
+            self.d_changed = set()
+        self.journal.commit(tag, {
+            'fasta_filename': self.fasta_filename,
+            'fastq_filename': self.fastq_filename,
+            'fastq_filenames_to_add': list(self.fastq_filenames_to_add),
+            'newids': self.newids,
+            'iterNum': self.iterNum,
+            'seeded_cids': self.seeded_cids})
+        if self.journal.need_compaction():
+            self.add_log("Compacting checkpoint journal.", level=logging.INFO)
+            self.journal.snapshot(self.state_dict())
+            self.store.compact()
 
     def auto_detect_length_to_set_scores(self):
         """
@@ -452,6 +667,7 @@ class IceIterative(IceFiles):
         """Add a new cluster to self.uc."""
         best_i = max(self.uc.keys()) + 1
         self.uc[best_i] = []
+        self.journal.record('set', best_i, [])
         return best_i
 
     def remove_from_cluster(self, qID, from_i):
@@ -460,31 +676,47 @@ class IceIterative(IceFiles):
         delete this cluster if it is empty.
         """
         self.uc[from_i].remove(qID)
+        self.journal.record('rm', from_i, qID)
         self.changes.add(from_i)
         if len(self.uc[from_i]) == 0:
             self.delete_cluster(from_i)
 
-    def delete_cluster(self, from_i):
+    def delete_cluster(self, from_i, prune_d=True):
         """
         1) delete it from self.uc
         2) delete all related entries from self.d
+           (unless prune_d is False, then the caller must call
+            self.prune_d later, e.g. once for a batch of deletions)
         3) delete self.refs
         4) remove the directory
         5) remove from self.changes (if there)
         """
+        self.journal.touch([from_i])
         del self.uc[from_i]
-        for k in self.d:
-            if from_i in self.d[k]:
-                del self.d[k][from_i]
+        self.journal.record('del', from_i)
+        if prune_d:
+            self.prune_d([from_i])
         del self.refs[from_i]
+        self.sketches.pop(from_i, None)
 
         dirname = self.cluster_dir(from_i)
         #op.join(self.tmp_dir, str(from_i/10000), 'c'+str(from_i))
 
-        shutil.rmtree(dirname)
+        if op.exists(dirname):
+            shutil.rmtree(dirname)
+        self.store.delete(from_i)
         if from_i in self.changes:
             self.changes.remove(from_i)
 
+    def prune_d(self, cids):
+        """Delete all entries of deleted clusters cids from self.d."""
+        cids = set(cids)
+        if len(cids) == 0:
+            return
+        for v in self.d.itervalues():
+            for cid in cids.intersection(v):
+                del v[cid]
+
     def no_moves_possible(self):
         """
         Check self.uc, return True if no moves are possible, False otherwise."""
@@ -552,6 +784,9 @@ class IceIterative(IceFiles):
         # calculate effective chunk size
         #effective_cids = filter(lambda cid: len(self.uc[cid])>2, cids)
 
+        # consensus files and store entries of cids are about to change
+        self.journal.touch(cids)
+
         # Create $root_dir/scripts/$iterNum/, e.g, clusterOut/scripts/0
         mknewdir(op.join(self.script_dir, str(self.iterNum)))
 
@@ -577,16 +812,21 @@ class IceIterative(IceFiles):
         jobs = []
         for cid in cids:
             dirname = self.cluster_dir(cid)
-            if op.exists(dirname):
-                shutil.rmtree(dirname)
-            os.makedirs(dirname)
-            in_fa_filename = self.write_in_fasta(cid)
-
             if len(self.uc[cid]) <= 2:  # don't even bother running gcon
-                # for now do nothing and let the else statement below
-                # take care of it
-                pass
+                # no directory, in.fa and ref go to the packed store;
+                # let choose_ref_file below take care of it
+                if op.exists(dirname):
+                    shutil.rmtree(dirname)
+                self.write_in_fasta(cid)
             else:
+                self.store.delete(cid)
+                # reuse the directory, only clear stale consensus outputs
+                mkdir(dirname)
+                for fn in (self.g_consensus_fa_of_cluster(cid),
+                           self.g_consensus_ref_fa_of_cluster(cid)):
+                    if op.exists(fn):
+                        os.remove(fn)
+                in_fa_filename = self.write_in_fasta(cid)
                 job_i = effective_i / chunk_size
                 argstr = " {infa} ".format(infa=real_upath(in_fa_filename)) + \
                          " {cdir}/g_consensus".\
@@ -698,6 +938,7 @@ class IceIterative(IceFiles):
         #self.add_log(msg, level=logging.INFO)
         for cid in cids:
             self.refs[cid] = self.choose_ref_file(cid)
+            self.journal.record('ref', cid, self.refs[cid])
             #msg = "Choosing ref file for {cid} = {f}".format(
             #    cid=cid, f=self.refs[cid])
             #self.add_log(msg)
@@ -735,10 +976,10 @@ class IceIterative(IceFiles):
             return None
         else:  # pick the 1st sequence
             #self.add_log("Picking up the very first sequence as reference.")
+            # kept in the packed store, see ref_record()
             rname = self.first_seq_fa_of_cluster(cid)
-            with open(rname, 'w') as h:
-                h.write(">c{0}\n{1}\n".
-                        format(cid, self.seq_dict[self.uc[cid][0]].sequence))
+            self.store.put(cid, op.basename(rname), ">c{0}\n{1}\n".
+                           format(cid, self.seq_dict[self.uc[cid][0]].sequence))
             return rname
 
     def clean_prob_for_cids(self, cids):
@@ -753,6 +994,7 @@ class IceIterative(IceFiles):
             # self.add_log(msg)
             for cid in set(cids).intersection(self.d[qid]):
                 del self.d[qid][cid]
+                self.d_changed.add(qid)
 
     def final_round_before_freeze(self, min_cluster_size):
         """
@@ -782,6 +1024,7 @@ class IceIterative(IceFiles):
                         format(qid, cid, self.d[qid])
                     self.add_log(msg)
                     del self.d[qid]
+                    self.d_changed.add(qid)
                     self.remove_from_cluster(qid, cid)
                     if (cid in self.uc and
                             len(self.uc[cid]) < self.rerun_gcon_size):
@@ -793,16 +1036,21 @@ class IceIterative(IceFiles):
         """
         Write the ./tmp/<cid/10000 mod>/c<cid>/in.fa for cluster cid.
         (Liz) unless write_all is True, only write the first <self.dagcon_in_fa_subsample> to save time
+        Clusters with <= 2 reads have their in.fa in the packed store.
         """
         #in_filename = op.join('./tmp/', str(cid/10000), 'c'+str(cid), 'in.fa')
         in_filename = op.join(self.clusterInFa(cid))
         seqids = self.uc[cid]
         if not write_all:
             seqids = random.sample(seqids, min(self.dagcon_in_fa_subsample, len(seqids)))
-        with open(in_filename, 'w') as f:
-            for seqid in seqids:
-                f.write(">{0}\n{1}\n".format(seqid,
-                    self.seq_dict[seqid].sequence))
+        content = "".join([">{0}\n{1}\n".format(seqid,
+                           self.seq_dict[seqid].sequence) for seqid in seqids])
+        if len(self.uc[cid]) <= 2:
+            self.store.put(cid, op.basename(in_filename), content)
+        else:
+            mkdir(self.cluster_dir(cid))
+            with open(in_filename, 'w') as f:
+                f.write(content)
         return in_filename
 
     def add_seq_to_cluster(self):
@@ -831,6 +1079,7 @@ class IceIterative(IceFiles):
                     # the in.fa along with the whole folder
                     self.changes.add(cid)
                 self.uc[cid].append(r.name.split()[0])
+                self.journal.record('add', cid, r.name.split()[0])
         return orphan
 
     def add_uc(self, uc):
@@ -842,6 +1091,7 @@ class IceIterative(IceFiles):
         for k, v in uc.iteritems():
             cid = k + i
             self.uc[cid] = v
+            self.journal.record('set', cid, v)
             self.changes.add(cid)
             # even if it's a size-1/2 cluster, it still needs to
             # be in changes for the dir to be created
@@ -859,12 +1109,49 @@ class IceIterative(IceFiles):
                     continue  # no way it's needed
                 for qid in set(self.uc[cid]).difference(self.newids):
                     self.d[qid] = {cid: -0}
+                    self.d_changed.add(qid)
         else:
             for cid, qids in self.uc.iteritems():
                 if len(self.uc[cid]) < self.rerun_gcon_size:
                     continue  # no way it's needed
                 for qid in set(qids).difference(self.newids):
                     self.d[qid] = {cid: -0}
+                    self.d_changed.add(qid)
+
+    def calc_missing_own_prob(self):
+        """
+        Call calc_cluster_prob on clusters which have a member without
+        a prob to its own cluster in self.d, so that every read of a
+        given (not computed) prob dict is scored against its cluster.
+        """
+        for qids in self.uc.itervalues():
+            for qid in qids:
+                self.d.setdefault(qid, {})
+        cids = cids_missing_own_prob(self.uc, self.d)
+        if len(cids) == 0:
+            return
+        self.add_log("Calculating probs of {n} clusters missing in the prob dict.".
+                     format(n=len(cids)), level=logging.INFO)
+        self.changes = cids
+        self.calc_cluster_prob()
+        self.changes = set()
+
+    def rescore_seeded(self):
+        """
+        Call calc_cluster_prob on clusters whose probs are still those
+        seeded by IceInit, i.e., whose consensus did not change since,
+        so that all probs are computed against consensus sequences.
+        """
+        cids = self.seeded_cids.intersection(self.uc)
+        self.seeded_cids = set()
+        if len(cids) == 0:
+            return
+        self.add_log("Calculating probs of {n} clusters with seeded probs.".
+                     format(n=len(cids)), level=logging.INFO)
+        self.changes = cids
+        self.calc_cluster_prob()
+        self.freeze_d()
+        self.changes = set()
 
     def calc_cluster_prob(self, force_calc=False, use_blasr=False):
         """
@@ -879,9 +1166,7 @@ class IceIterative(IceFiles):
         # write to ref_consensus.fasta
         with open(self.refConsensusFa, 'w') as f:
             for cid in _todo:
-                rs = [r for r in FastaReader(self.refs[cid])]
-                assert(len(rs) == 1)
-                r = rs[0]
+                r = self.ref_record(cid)
                 f.write(">{0}\n{1}\n".format(r.name.split()[0],
                                              r.sequence))
 
@@ -939,6 +1224,7 @@ class IceIterative(IceFiles):
 
         time_5 = datetime.now()
         self.clean_prob_for_cids(_todo)
+        self.seeded_cids.difference_update(_todo)
         time_6 = datetime.now()
         msg = "Total time for cleaning probs for {n} clusters is {t}".\
               format(n=len(_todo), t=time_6 - time_5)
@@ -965,20 +1251,43 @@ class IceIterative(IceFiles):
         like g(), calculates membership prob and update self.d dict
         by going through the .las.out files
         (REMEMBER to pre-clean the self.d)
+
+        Each .las.out (one per daligner block) is scored by a pool of
+        up to <blasr_nproc> forked processes which share self.probQV
+        read-only; the compact (qID, cID, logprob) arrays they return
+        are merged into self.d in block order.
+        """
+        kwargs = {'is_FL': True, 'sID_starts_with_c': True,
+                  'qver_get_func': self.probQV.get_smoothed,
+                  'qvmean_get_func': self.probQV.get_mean,
+                  'qv_prob_threshold': self.qv_prob_threshold,
+                  'ece_penalty': self.ece_penalty,
+                  'ece_min_len': self.ece_min_len,
+                  'same_strand_only': True,
+                  'no_qv_or_aln_checking': False,
+                  'max_missed_start': self._ignore5,
+                  'max_missed_end': self._ignore3}
+        num_processes = max(1, min(self.blasr_nproc, len(las_out_filenames)))
+        if num_processes > 1:
+            self.add_log("Scoring {n} daligner outputs with {p} processes.".
+                         format(n=len(las_out_filenames), p=num_processes))
+        results = score_las_outs(las_out_filenames, query_obj, ref_obj,
+                                 self.probQV, kwargs, num_processes)
+
+        for qids, cids, probs in results:
+            self.merge_scored_hits(qids, cids, probs)
+
+    def merge_scored_hits(self, qids, cids, probs):
+        """
+        Merge (qID, cID, logprob) arrays returned by _score_las_out
+        into self.d. NaN logprob means the hit did not pass checks.
         """
-        for las_out_filename in las_out_filenames:
-            for hit in dalign_against_ref(query_obj, ref_obj, las_out_filename, is_FL=True, sID_starts_with_c=True,
-                      qver_get_func=self.probQV.get_smoothed,
-                      qvmean_get_func=self.probQV.get_mean,
-                      qv_prob_threshold=self.qv_prob_threshold,
-                      ece_penalty=self.ece_penalty, ece_min_len=self.ece_min_len,
-                      same_strand_only=True, no_qv_or_aln_checking=False,
-                      max_missed_start=self._ignore5, max_missed_end=self._ignore3):
-                if hit.qID not in self.d:
-                    self.d[hit.qID] = {}
-                if hit.fakecigar is not None:
-                    self.d[hit.qID][hit.cID] = self.probQV.calc_prob_from_aln(
-                        hit.qID, hit.qStart, hit.qEnd, hit.fakecigar)
+        self.d_changed.update(qids)
+        for qid, cid, prob in zip(qids, cids.tolist(), probs.tolist()):
+            if qid not in self.d:
+                self.d[qid] = {}
+            if prob == prob:  # not NaN
+                self.d[qid][cid] = prob
 
     def g(self, output_filename):
         """
@@ -1003,6 +1312,7 @@ class IceIterative(IceFiles):
 
             if hit.qID not in self.d:
                 self.d[hit.qID] = {}
+            self.d_changed.add(hit.qID)
 
             if hit.fakecigar is not None:
                 self.d[hit.qID][hit.cID] = self.probQV.calc_prob_from_aln(
@@ -1065,14 +1375,14 @@ class IceIterative(IceFiles):
             for cid in self.changes:
                 if cid in self.refs:
                     current_gcon_seq_in_changes[cid] = \
-                        get_the_only_fasta_record(self.refs[cid]).sequence
+                        self.ref_record(cid).sequence
 
             self.run_gcon_parallel(self.changes)
             # remove from self.changes ones that did not change
             _cids = set(self.changes)
             for cid in _cids:
                 if cid in current_gcon_seq_in_changes:
-                    seq = get_the_only_fasta_record(self.refs[cid]).sequence
+                    seq = self.ref_record(cid).sequence
                     if seq == current_gcon_seq_in_changes[cid]:
                         msg = "REMOVING " + str(cid) + \
                               " from changes because no gcon change"
@@ -1119,6 +1429,7 @@ class IceIterative(IceFiles):
 
                     # move qID to best_i
                     self.uc[best_i].append(qID)
+                    self.journal.record('add', best_i, qID)
 
                     # ToDo: make more flexible
                     # changes were made to from_i and best_i
@@ -1148,6 +1459,7 @@ class IceIterative(IceFiles):
                             self.add_log(msg)
 
                             self.uc[best_i].append(qID)
+                            self.journal.record('add', best_i, qID)
                             if len(self.uc[best_i]) < self.rerun_gcon_size:
                                 self.changes.add(best_i)
                             self.changes.add(old_i)
@@ -1218,6 +1530,7 @@ class IceIterative(IceFiles):
         for r in FastqReader(self.fastq_filename):
             rid = r.name.split()[0]
             self.d[rid] = {}
+            self.d_changed.add(rid)
             self.newids.add(rid)
 
         self.fasta_filename = self.currentFa
@@ -1350,7 +1663,9 @@ class IceIterative(IceFiles):
         """
         # for f in files:
         while (len(self.fastq_filenames_to_add) > 0):
-            f = self.fastq_filenames_to_add.pop(0)
+            # only pop f once it is really added, so that checkpoints
+            # taken while merging still list f as to be added
+            f = self.fastq_filenames_to_add[0]
             self.add_log("adding file {f}".format(f=f))
             self.run_post_ICE_merging(
                 consensusFa=self.tmpConsensusFa,
@@ -1364,13 +1679,13 @@ class IceIterative(IceFiles):
                     max_iter=6,
                     use_blasr=True)
             # out_prefix='output/tmp',
+            self.fastq_filenames_to_add.pop(0)
             self.add_new_batch(f)
             self.check_cluster_sanity()
             for _i in xrange(1):
                 self.run_for_new_batch()
                 sizes.append(len(self.uc))
-            self.write_pickle(self.uptoPickleFN(f))
-            #'output/upto_'+f+'.pickle')
+            self.checkpoint(tag=self.uptoPickleFN(f))
             self.write_consensus(self.uptoConsensusFa(f))
             #'output/upto_'+f+'.consensus.fa')
 
@@ -1388,19 +1703,18 @@ class IceIterative(IceFiles):
             self.add_log("Running post-iterative-merging iterate {n}".
                          format(n=_i), level=logging.INFO)
             self.changes = set()
-            self.add_log("Writing pickle file: " + pickle_filename)
-            self.write_pickle(pickle_filename)
+            self.add_log("Checkpointing: " + pickle_filename)
+            self.checkpoint(tag=pickle_filename)
             
-            self.add_log("Writing consensus file: " + consensus_filename)
-            self.write_consensus(consensus_filename, sa_filename=consensus_filename+'.sa' if use_blasr else None)
-
-            iters = self.find_mergeable_consensus(consensus_filename, use_blasr=use_blasr)
+            iters = self.find_mergeable_candidates(consensus_filename, use_blasr=use_blasr)
 
             self.old_rec = {}
             self.new_rec = {}
 
             for r in iters:
                 self.do_icec_merge_nogcon(r)
+            # clusters merged away, i.e., keys of old_rec, are deleted
+            self.prune_d(self.old_rec.keys())
 
             if len(self.changes) == 0:
                 self.add_log("No more merges, break!")
@@ -1411,6 +1725,67 @@ class IceIterative(IceFiles):
 
             self.add_log("After merging: {0} clusters".format(len(self.uc)))
 
+    def sketch_consensus(self):
+        """
+        Return ({cid: minimizer sketch}, {cid: consensus length}) of
+        all clusters, only sketching consensus sequences which are new
+        or have changed since the last call.
+        """
+        sketches, lengths = {}, {}
+        for cid in self.refs:
+            seq = self.ref_record(cid).sequence
+            h = hash(seq)
+            if cid not in self.sketches or self.sketches[cid][0] != h:
+                self.sketches[cid] = (h, len(seq), minimizer_sketch(seq))
+            _h, lengths[cid], sketches[cid] = self.sketches[cid]
+        return sketches, lengths
+
+    def find_mergeable_candidates(self, fasta_filename, use_blasr=False):
+        """
+        Find candidate pairs of consensus sequences which share
+        minimizers and have compatible lengths, and families of similar
+        consensus (too many to pair by minimizers), then only align
+        consensus sequences within groups of candidates (connected
+        components), instead of all consensus sequences all-vs-all.
+        Yield BLASRM5 record of mergeable candidate pairs.
+        fasta_filename --- prefix of consensus files of groups
+        """
+        sketches, lengths = self.sketch_consensus()
+        pairs, families = sketch_candidate_pairs(
+            sketches=sketches, lengths=lengths,
+            max_missed_start=self._ignore5, max_missed_end=self._ignore3)
+        family_of = dict((cid, n) for n, fam in enumerate(families)
+                         for cid in fam)
+        groups = candidate_groups(pairs, families=families)
+        self.add_log("Found {p} candidate pairs and {f} families of {n} consensus in {g} groups.".
+                     format(p=len(pairs), f=len(families), n=len(sketches),
+                            g=len(groups)))
+
+        prefix = fasta_filename[:fasta_filename.rfind('.')] \
+            if fasta_filename.endswith(('.fa', '.fasta')) else fasta_filename
+        for n, group in enumerate(groups):
+            group_fa = "{p}.g{n}.fasta".format(p=prefix, n=n)
+            self.write_consensus(group_fa, sa_filename=group_fa+'.sa'
+                                 if use_blasr else None, cids=group)
+            for r in self.find_mergeable_consensus(group_fa, use_blasr=use_blasr):
+                i = int(r.qID.split('/')[0][1:])
+                j = int(r.sID.split('/')[0][1:])
+                if (min(i, j), max(i, j)) in pairs or \
+                        family_of.get(i, -1) == family_of.get(j, -2):
+                    yield r
+            self.remove_consensus_files(group_fa)
+
+    def remove_consensus_files(self, fasta_filename):
+        """Remove fasta_filename and files created by aligning it."""
+        dazz_filename = fasta_filename[:fasta_filename.rfind('.')] + '.dazz.fasta'
+        if op.exists(dazz_filename + '.db'):
+            self.run_cmd_and_log("DBrm " + real_upath(dazz_filename))
+        for fn in (fasta_filename, fasta_filename + '.sa',
+                   self.selfBlasrFN(fasta_filename),
+                   dazz_filename, dazz_filename + '.pickle'):
+            if op.exists(fn):
+                os.remove(fn)
+
     def find_mergeable_consensus(self, fasta_filename, use_blasr=False):
         """
         run self-blasr on input fasta (likely tmp.consensus.fa)
@@ -1484,7 +1859,8 @@ class IceIterative(IceFiles):
                 k = self.old_rec[i]
                 self.add_log("case 1: Merging clusters {0} and {1} --> {2}".format(i, j, k))
                 self.uc[k] += self.uc[j]
-                self.delete_cluster(j)
+                self.journal.record('set', k, self.uc[k])
+                self.delete_cluster(j, prune_d=False)
                 self.freeze_d([k])  # k is already in self.changes, and i is already deleted
                 self.old_rec[j] = k
                 return k
@@ -1493,7 +1869,8 @@ class IceIterative(IceFiles):
                 k = self.old_rec[j]
                 self.add_log("case 2: Merging clusters {0} and {1} --> {2}".format(i, j, k))
                 self.uc[k] += self.uc[i]
-                self.delete_cluster(i)
+                self.journal.record('set', k, self.uc[k])
+                self.delete_cluster(i, prune_d=False)
                 self.freeze_d([k])  # k is already in self.changes, and j is already deleted
                 self.old_rec[i] = k
                 return k
@@ -1501,8 +1878,9 @@ class IceIterative(IceFiles):
                 k = self.make_new_cluster()
                 self.add_log("case 3: Merging clusters {0} and {1} --> {2}".format(i, j, k))
                 self.uc[k] = self.uc[i] + self.uc[j]
-                self.delete_cluster(i)
-                self.delete_cluster(j)
+                self.journal.record('set', k, self.uc[k])
+                self.delete_cluster(i, prune_d=False)
+                self.delete_cluster(j, prune_d=False)
                 self.freeze_d([k])
                 self.changes.add(k)
                 self.old_rec[i] = k
@@ -1562,6 +1940,8 @@ class IceIterative(IceFiles):
         msg = "First one run of run_til_end()."
         self.add_log(msg, level=logging.INFO)
         self.run_til_end(1)
+        # probs seeded by IceInit only drive the first round of moves
+        self.rescore_seeded()
         sizes = [len(self.uc)]
 
         msg = "Adding new reads to constructed clusters."
@@ -1600,8 +1980,13 @@ class IceIterative(IceFiles):
             sizes=', '.join([str(s) for s in sizes]))
         self.add_log(msg, level=logging.INFO)
 
+        # refs in the final pickle must be real files
+        self.export_cluster_store(refs_only=True)
+
        # Write final pickle
         self.write_final_pickle()
+        self.checkpoint(tag=self.final_pickle_fn)
+        self.journal.close()
 
         # write final consensus.fa and final_consensus.fa.sa
         self.write_final_consensus()
@@ -0,0 +1,204 @@
+"""
+Define IceJournal, an append-only checkpoint journal for IceIterative.
+
+Instead of pickling the whole IceIterative state at every checkpoint,
+cluster mutations are appended to a journal as they happen:
+    ('add', cid, qid)      --- qid appended to cluster cid
+    ('rm', cid, qid)       --- qid removed from cluster cid
+    ('set', cid, members)  --- cluster cid created/replaced with members
+    ('del', cid)           --- cluster cid deleted
+    ('ref', cid, filename) --- consensus of cluster cid updated
+    ('touch', cids)        --- files of clusters cids are about to change
+    ('d', rows)            --- rows of the prob dict d (qid --> {cid: prob},
+                               None if deleted) changed since the last
+                               commit, written right before a commit
+    ('commit', tag, meta)  --- consistent point; meta is a small dict of
+                               scalar state (fasta_filename, newids, ...)
+A full snapshot (the same dict IceIterative.write_pickle dumps) is only
+written when the journal is started and periodically compacted.
+Recovery loads the snapshot and replays the journal up to the last
+'commit' record. Clusters touched after the last commit are reported as
+dirty, because their consensus files and packed store entries may have
+been changed by a run that did not commit.
+"""
+import os
+import os.path as op
+import cPickle
+from pbtools.pbtranscript.Utils import mkdir
+
+
+class IceJournal(object):
+
+    """Append-only journal + compacted snapshot of IceIterative state."""
+
+    def __init__(self, journal_dir, max_records=500000):
+        """
+        journal_dir --- directory containing snapshot.pickle and journal.log
+        max_records --- compact (i.e., write a new snapshot and truncate
+                        the journal) once this many records are appended
+        """
+        self.journal_dir = journal_dir
+        self.max_records = max_records
+        self.num_records = 0
+        self.f = None
+
+    @property
+    def snapshot_fn(self):
+        """Return $journal_dir/snapshot.pickle"""
+        return op.join(self.journal_dir, "snapshot.pickle")
+
+    @property
+    def journal_fn(self):
+        """Return $journal_dir/journal.log"""
+        return op.join(self.journal_dir, "journal.log")
+
+    def exists(self):
+        """Return True if there is a snapshot to recover from."""
+        return op.exists(self.snapshot_fn)
+
+    def start(self, state):
+        """Write an initial snapshot of state and start an empty journal."""
+        mkdir(self.journal_dir)
+        self.snapshot(state)
+
+    def snapshot(self, state):
+        """
+        Write state to snapshot.pickle (atomically, via rename) and
+        truncate the journal, since everything in it is now in state.
+        """
+        self.close()
+        tmp_fn = self.snapshot_fn + ".tmp"
+        with open(tmp_fn, 'wb') as f:
+            cPickle.dump(state, f, cPickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.rename(tmp_fn, self.snapshot_fn)
+        self.f = open(self.journal_fn, 'wb')
+        self.num_records = 0
+
+    def resume(self, offset):
+        """
+        Continue appending to an existing journal, discarding any
+        uncommitted records after <offset> (as returned by replay()).
+        """
+        self.close()
+        self.f = open(self.journal_fn, 'r+b' if op.exists(self.journal_fn)
+                      else 'wb')
+        self.f.truncate(offset)
+        self.f.seek(offset)
+        self.num_records = 0
+
+    def record(self, *rec):
+        """Append a record. A no-op until start() or resume() is called."""
+        if self.f is not None:
+            cPickle.dump(rec, self.f, cPickle.HIGHEST_PROTOCOL)
+            self.num_records += 1
+
+    def touch(self, cids):
+        """
+        Append a 'touch' record and flush it, before files of clusters
+        cids (consensus, in.fa, packed store entries) are changed.
+        """
+        if self.f is not None:
+            self.record('touch', list(cids))
+            self.f.flush()
+
+    def commit(self, tag, meta):
+        """Append a 'commit' record and flush it to disk."""
+        if self.f is not None:
+            self.record('commit', tag, meta)
+            self.f.flush()
+            os.fsync(self.f.fileno())
+
+    def need_compaction(self):
+        """Return True if the journal should be folded into a snapshot."""
+        return self.num_records >= self.max_records
+
+    def close(self):
+        """Close the journal file."""
+        if self.f is not None:
+            self.f.close()
+            self.f = None
+
+    def replay(self):
+        """
+        Load the snapshot and replay journal records up to the last
+        commit. Return (state, touched_cids, dirty_cids, offset), where
+        touched_cids are clusters modified after the snapshot,
+        dirty_cids are clusters whose files were touched after the last
+        commit (and may not match state), and offset is the journal file
+        position right after the last commit (0 if nothing was committed
+        after the snapshot).
+        """
+        with open(self.snapshot_fn, 'rb') as f:
+            state = cPickle.load(f)
+
+        touched = set()
+        offset = 0
+        pending = []
+        if op.exists(self.journal_fn):
+            with open(self.journal_fn, 'rb') as f:
+                while True:
+                    try:
+                        rec = cPickle.load(f)
+                    except Exception:
+                        # EOF, or a record truncated by a crash
+                        break
+                    if rec[0] == 'commit':
+                        apply_records(state, pending, touched)
+                        state.update(rec[2])
+                        pending = []
+                        offset = f.tell()
+                    else:
+                        pending.append(rec)
+
+        touched.intersection_update(state['uc'])
+        dirty = set()
+        for rec in pending:
+            if rec[0] == 'touch':
+                dirty.update(rec[1])
+        return state, touched, dirty, offset
+
+
+def apply_records(state, records, touched):
+    """
+    Apply journal records of one commit to state['uc'], state['refs']
+    and state['d'] in place.
+    """
+    uc, refs, d = state['uc'], state['refs'], state['d']
+    rows, deleted = {}, set()
+    for rec in records:
+        op_name, cid = rec[0], rec[1]
+        if op_name == 'd':
+            rows.update(rec[1])
+            continue
+        elif op_name == 'add':
+            uc[cid].append(rec[2])
+        elif op_name == 'rm':
+            uc[cid].remove(rec[2])
+        elif op_name == 'set':
+            uc[cid] = list(rec[2])
+        elif op_name == 'del':
+            uc.pop(cid, None)
+            refs.pop(cid, None)
+            deleted.add(cid)
+            continue
+        elif op_name == 'ref':
+            refs[cid] = rec[2]
+        elif op_name == 'touch':
+            continue  # committed, so the files match state
+        else:
+            raise ValueError("Unknown journal record {r}.".format(r=rec))
+        touched.add(cid)
+
+    # drop probabilities to clusters deleted by this commit, then replace
+    # rows of d which changed (after any deletion) with their committed rows
+    if len(deleted) > 0:
+        for v in d.itervalues():
+            for cid in deleted.intersection(v):
+                del v[cid]
+    for qid, row in rows.iteritems():
+        if row is None:
+            d.pop(qid, None)
+        else:
+            d[qid] = row
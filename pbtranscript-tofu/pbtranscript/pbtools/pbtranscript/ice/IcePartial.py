@@ -227,7 +227,7 @@ def build_uc_from_partial(input_fasta, ref_fasta, out_pickle,
         else:
             input_fastq = input_fasta[:input_fasta.rfind('.')] + '.fastq'
             logging.info("Converting {i} + {f} --> {fq}".format(i=input_fasta, f=ccs_fofn, fq=input_fastq))
-            ice_fa2fq(input_fasta, ccs_fofn, input_fastq)
+            ice_fa2fq(input_fasta, ccs_fofn, input_fastq, cpus=blasr_nproc)
             logging.info("Loading QVs from {fq} took {s} secs".format(fq=input_fastq, s=time.time()-start_t))
             probqv = ProbFromFastq(input_fastq)
 
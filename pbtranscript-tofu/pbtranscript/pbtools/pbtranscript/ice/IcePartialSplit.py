@@ -121,7 +121,7 @@ from pbtools.pbtranscript.__init__ import get_version
 from pbtools.pbtranscript.PBTranscriptOptions import add_nfl_fa_argument, \
     add_cluster_root_dir_as_positional_argument
 from pbtools.pbtranscript.ice.IceFiles import IceFiles
-from pbtools.pbtranscript.ice.IceUtils import num_reads_in_fasta
+from pbtools.pbtranscript.io.SeqIndex import SeqFileIndex
 from pbtools.pbtranscript.Utils import touch, real_ppath, mkdir, nfs_exists
 from pbtools.pbtranscript.io.FastaSplitter import splitFasta
 
@@ -150,6 +150,7 @@ class IcePartialSplit(object):
         self.root_dir = root_dir
         self.nfl_fa = nfl_fa
         self.N = int(N)
+        self.nfl_index = None  # SeqFileIndex of nfl_fa
         if N >= 1000:
             raise ValueError("N = {N} > 1000 is too large.".format(N=self.N))
 
@@ -203,7 +204,9 @@ class IcePartialSplit(object):
         if len(errMsg) != 0:
             raise ValueError(errMsg)
 
-        num_reads = num_reads_in_fasta(nfl_fa)
+        # Index nfl_fa once, to count and split its reads.
+        self.nfl_index = SeqFileIndex(nfl_fa, is_fq=False)
+        num_reads = len(self.nfl_index)
         reads_per_split = int(max(1, ceil(num_reads / N)))
 
         return (num_reads, reads_per_split, nfl_dir, splitted_nfl_fas)
@@ -226,7 +229,8 @@ class IcePartialSplit(object):
             input_fasta=real_ppath(self.nfl_fa),
             reads_per_split=reads_per_split,
             out_dir=nfl_dir,
-            out_prefix="input.split")
+            out_prefix="input.split",
+            index=self.nfl_index)
 
         logging.info("Splitted files are: " + "\n".join(splitted_fas_done))
         for fa in splitted_fas_todo:
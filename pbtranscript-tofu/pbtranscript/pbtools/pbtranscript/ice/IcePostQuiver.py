@@ -4,16 +4,15 @@
 import os, sys, re
 import logging
 import os.path as op
-from collections import defaultdict
-from cPickle import load
 from time import sleep
 from pbtools.pbtranscript.__init__ import get_version
 from pbtools.pbtranscript.PBTranscriptOptions import \
         add_polished_isoforms_arguments
-from pbtools.pbtranscript.Utils import phred_to_qv, \
-        get_all_files_in_dir, ln
+from pbtools.pbtranscript.Utils import get_all_files_in_dir, ln
 from pbtools.pbtranscript.ice.IceFiles import IceFiles
-from pbcore.io import FastaWriter, FastqReader, FastqWriter
+from pbtools.pbtranscript.ice.IceUtils import iter_quivered_fastq, \
+        quality_stats
+from pbcore.io import FastaWriter
 
 
 class IcePostQuiver(IceFiles):
@@ -155,59 +154,50 @@ class IcePostQuiver(IceFiles):
         return op.join(self.root_dir, "all_quivered_lq.fastq")
 
     def pickup_best_clusters(self, fq_filenames):
-        """Pick up hiqh QV clusters."""
+        """Pick up hiqh QV clusters.
+        Quivered fastq files are streamed, and each cluster is written to
+        HQ or LQ files as soon as it is read. A cluster is HQ if its
+        expected number of errors in seq[qv_trim_5:-qv_trim_3] is at
+        most qv_max_err.
+        """
         self.add_log("Picking up the best clusters according to QVs from {fs}.".
                      format(fs=", ".join(fq_filenames)))
-        a = load(open(self.final_pickle_fn))
-        uc = a['uc']
-        quivered = {}
-
-        for fq in fq_filenames:
-            self.add_log("Looking at quivered fq {f}".format(f=fq))
-            for r in FastqReader(fq):
-                cid = r.name.split('|')[0]
-                if cid.endswith('_ref'):
-                    cid = cid[:-4]
-                cid = int(cid[1:])
-                quivered[cid] = r
-
-        good = []
-
-        for cid, r in quivered.iteritems():
-            q = [phred_to_qv(x) for x in r.quality]
-            if sum(q[self.qv_trim_5: -self.qv_trim_3]) <= self.qv_max_err:
-                good.append(cid)
-
-        partial_uc = load(open(self.nfl_all_pickle_fn))['partial_uc']
-        partial_uc2 = defaultdict(lambda: [])
-        partial_uc2.update(partial_uc)
+        # cluster id --> (number of FL reads, number of nFL reads)
+        counts = self.load_support_counts()
 
         self.add_log("Writing hiqh-quality isoforms to {f}|fq".
                      format(f=self.quivered_good_fa))
         self.add_log("Writing low-quality isoforms to {f}|fq".
                      format(f=self.quivered_bad_fa))
+        seen = set()
         with FastaWriter(self.quivered_good_fa) as good_fa_writer, \
              FastaWriter(self.quivered_bad_fa) as bad_fa_writer, \
-             FastqWriter(self.quivered_good_fq) as good_fq_writer, \
-             FastqWriter(self.quivered_bad_fq) as bad_fq_writer:
-            for cid in quivered:
-                r = quivered[cid]
+             open(self.quivered_good_fq, 'w') as good_fq_writer, \
+             open(self.quivered_bad_fq, 'w') as bad_fq_writer:
+            for cid, name, seq, qual in iter_quivered_fastq(fq_filenames):
+                if cid in seen:
+                    self.add_log("Ignoring another quivered {n} of cluster {c}.".
+                                 format(n=name, c=cid), level=logging.WARNING)
+                    continue
+                seen.add(cid)
+                num_fl, num_nfl = counts.get(cid, (0, 0))
+                _qv_len, err_sum, num_low_qv = quality_stats(
+                    qual, self.qv_trim_5, self.qv_trim_3)
+                is_good = err_sum <= self.qv_max_err
+
                 newname = "c{cid}/f{flnc_num}p{nfl_num}/{read_len}".\
-                        format(cid=cid,
-                               flnc_num=len(uc[cid]),
-                               nfl_num=len(partial_uc2[cid]),
-                               read_len=len(r.sequence))
-
-                if cid in good:
-                    self.add_log("processing quivered cluster {c} --> good.".
-                                 format(c=cid))
-                    good_fa_writer.writeRecord(newname, r.sequence)
-                    good_fq_writer.writeRecord(newname, r.sequence, r.quality)
-                else:
-                    self.add_log("processing quivered cluster {c} --> bad.".
-                                 format(c=cid))
-                    bad_fa_writer.writeRecord(newname, r.sequence)
-                    bad_fq_writer.writeRecord(newname, r.sequence, r.quality)
+                        format(cid=cid, flnc_num=num_fl, nfl_num=num_nfl,
+                               read_len=len(seq))
+
+                self.add_log("processing quivered cluster {c} --> {t} ".
+                             format(c=cid, t="good" if is_good else "bad") +
+                             "({e:.2f} expected errors, {n} bases < QV20).".
+                             format(e=err_sum, n=num_low_qv))
+                fa_writer, fq_writer = (good_fa_writer, good_fq_writer) \
+                    if is_good else (bad_fa_writer, bad_fq_writer)
+                fa_writer.writeRecord(newname, seq)
+                fq_writer.write("@{n}\n{s}\n+\n{q}\n".
+                                format(n=newname, s=seq, q=qual))
 
         self.add_log("-" * 60, level=logging.INFO)
         self.add_log("High-quality Quivered consensus written " +
@@ -5,7 +5,6 @@
 import os.path as op
 import time
 from datetime import datetime
-import random
 import logging
 import shutil
 from cPickle import load
@@ -17,9 +16,11 @@ from pbtools.pbtranscript.PBTranscriptOptions import  add_fofn_arguments, \
 from pbtools.pbtranscript.Utils import mkdir, real_upath, nfs_exists
 from pbtools.pbtranscript.ice.IceUtils import get_the_only_fasta_record, \
     get_files_from_fofn, is_blank_sam, concat_sam, \
-    blasr_sam_for_quiver, write_in_raw_fasta, write_in_raw_fasta_starhelper
+    blasr_sam_for_quiver, write_in_raw_fasta, write_in_raw_fasta_starhelper, \
+    subsample_reads, quiver_cost, balanced_partition
 from pbtools.pbtranscript.ice.IceFiles import IceFiles
 from pbtools.pbtranscript.io.FastaRandomReader import MetaSubreadFastaReader
+from pbtools.pbtranscript.io.SubreadExtractor import zmw_subread_bases
 
 
 class IceQuiver(IceFiles):
@@ -140,11 +141,7 @@ class IceQuiver(IceFiles):
             # $root_dir/tmp/?/c{k}/in.raw_with_partial.fa
             raw_fa = self.raw_fa_of_cluster(k)
 
-            in_seqids = uc[k]
-            if len(in_seqids) > 100:
-                in_seqids = random.sample(in_seqids, 100)
-            else:
-                in_seqids += random.sample(partial_uc[k], min(len(partial_uc[k]), 100 - len(in_seqids)))
+            in_seqids = subsample_reads(k, uc[k], partial_uc[k])
             # write cluster k's associated raw subreads to raw_fa
             #data_queue.append([d, in_seqids, raw_fa, True])
             write_in_raw_fasta(input_fasta_d=d,
@@ -243,9 +240,9 @@ class IceQuiver(IceFiles):
         return valid_cids
 
     def quiver_cmds_for_bin(self, cids, quiver_nproc=2):
-        """Return a list of quiver related cmds, to convert sam & ref to cmp.h5
-        and call quiver, including samtoh5, loadPulses, comph5tools.py,
-        samtools, loadChemistry, quiver...
+        """Return a list of quiver related cmds, to convert sam & ref to a
+        sorted, pulse-loaded cmp.h5 in one pass (ice_sam_to_cmph5.py, see
+        io/CmpH5Writer.py), index ref by samtools and call quiver.
         """
         first, last = cids[0], cids[-1]
         self.add_log("Creating quiver cmds for c{first} to c{last}".
@@ -257,24 +254,14 @@ class IceQuiver(IceFiles):
         bin_fq = self.fq_of_quivered_bin(first, last)
 
         cmds = []
-        cmds.append("samtoh5 {sam} {ref} {cmph5} -smrtTitle".format(
-            sam=real_upath(bin_sam_file),
-            ref=real_upath(bin_ref_fa),
-            cmph5=real_upath(bin_cmph5)))
-        # (Liz) don't gzip the sa
-        #cmds.append("gzip {sam}".format(sam=real_upath(bin_sam_file)))
-        metrics = ["QualityValue", "InsertionQV", "MergeQV", "DeletionQV",
-                   "DeletionTag", "SubstitutionTag", "SubstitutionQV"]
-        cmds.append("loadPulses {bas_fofn} ".
-                    format(bas_fofn=real_upath(self.bas_fofn)) +
-                    "{cmph5} ".format(cmph5=real_upath(bin_cmph5)) +
-                    "-byread -metrics " + ",".join(metrics))
-        cmds.append("cmph5tools.py sort {cmph5}".
-                    format(cmph5=real_upath(bin_cmph5)))
-        cmds.append("samtools faidx {ref}".format(ref=real_upath(bin_ref_fa)))
-        cmds.append("loadChemistry.py {bas_fofn} {cmph5}".
-                    format(bas_fofn=real_upath(self.bas_fofn),
+        # replaces samtoh5, loadPulses -byread, cmph5tools.py sort and
+        # loadChemistry.py, pulse metrics are read from bax.h5 in batches.
+        cmds.append("ice_sam_to_cmph5.py {sam} {ref} {bas_fofn} {cmph5}".
+                    format(sam=real_upath(bin_sam_file),
+                           ref=real_upath(bin_ref_fa),
+                           bas_fofn=real_upath(self.bas_fofn),
                            cmph5=real_upath(bin_cmph5)))
+        cmds.append("samtools faidx {ref}".format(ref=real_upath(bin_ref_fa)))
         cmds.append("quiver {cmph5} ".format(cmph5=real_upath(bin_cmph5)) +
                     "-v -j{n} ".format(n=quiver_nproc) +
                     "-r {ref} ".format(ref=real_upath(bin_ref_fa)) +
@@ -363,7 +350,7 @@ class IceQuiver(IceFiles):
         (3) Concat all sam files of `valid` clusters to sam_of_quivered_bin, and
             concat ref seqs of all `valid` clusters to ref_fa_of_quivered_bin
         (4) Make commands including
-                samtoh5, loadPulses, cmph5tools.py, loadChemistry, ..., quiver
+                ice_sam_to_cmph5.py, samtools faidx, quiver
             in order to convert sam_of_quivered_bin to cmph5_of_quivered_bin.
             Write these commands to script_of_quivered_bin
               * qsub all jobs later when scripts of all quivered bins are done.
@@ -393,46 +380,88 @@ class IceQuiver(IceFiles):
         # Write quiver cmds for this bin to $root_dir/quivered/c{}_{}.sh
         return self.create_quiver_sh_for_bin(cids=cids, cmds=cmds)
 
-    def create_quiver_bins(self, d, uc, partial_uc, refs, keys, start, end,
-                           sge_opts):
+    def cluster_costs(self, uc, partial_uc, refs):
+        """
+        Return {cluster id: estimated Quiver workload} of all clusters in
+        uc (see quiver_cost), where consensus lengths are approximated by
+        sizes of reference files, and subread bases of ZMWs are read from
+        subread indices of fasta files in fasta_fofn.
+        """
+        zmw_bases = zmw_subread_bases(get_files_from_fofn(self.fasta_fofn))
+        self.add_log("Estimating quiver workload of {n} clusters from ".
+                     format(n=len(uc)) +
+                     "subread bases of {z} ZMWs.".format(z=len(zmw_bases)))
+        return dict((k, quiver_cost(in_seqids=subsample_reads(k, uc[k],
+                                                              partial_uc[k]),
+                                    ref_len=op.getsize(refs[k]),
+                                    zmw_bases=zmw_bases))
+                    for k in uc)
+
+    def quiver_bins(self, cids, costs, max_clusters_per_bin=100):
+        """
+        Divide clusters in cids into bins of roughly the same workload,
+        as many as bins of max_clusters_per_bin clusters.
+        Return [cids of bin], the most expensive bin first.
+        """
+        num_bins = int(ceil(len(cids) / float(max_clusters_per_bin)))
+        bins = balanced_partition(dict((k, costs[k]) for k in cids), num_bins)
+        return [bin_cids for (_cost, bin_cids) in bins]
+
+    def create_quiver_bins(self, d, uc, partial_uc, refs, bins, sge_opts):
         """
-        Create quiver bins by putting every 100 clusters into a bin.
-        For each bin, create a bash script (e.g., script_of_quivered_bin).
+        For each bin of clusters in bins, create a bash script
+        (e.g., script_of_quivered_bin).
         Return a list of scripts to run.
         """
         bin_scripts = []
-        for i in xrange(start, end, 100):  # Put every 100 clusters to a bin
-            cids = keys[i:min(end, i + 100)]
+        for cids in bins:
             bin_sh = self.create_a_quiver_bin(cids=cids, d=d, uc=uc,
                                               partial_uc=partial_uc,
                                               refs=refs, sge_opts=sge_opts)
-            bin_scripts += bin_sh
+            bin_scripts.append(bin_sh)
         return bin_scripts
 
-    def create_quiver_bins_and_submit_jobs(self, d, uc, partial_uc, refs, keys,
-                                           start, end, submitted, sge_opts):
+    def create_quiver_bins_and_submit_jobs(self, d, uc, partial_uc, refs,
+                                           bins, submitted, sge_opts):
         """
-        Put every 100 clusters together and create bins. Create a bash script
-        (e.g., script_of_quivered_bin), for each bin, and submit the script
-        either using qsub or running it locally.
+        For each bin of clusters in bins (most expensive first), create a
+        bash script (e.g., script_of_quivered_bin), and submit the script
+        either using qsub or running it locally, as soon as it is created.
+        Local scripts are run by max(1, blasr_nproc / quiver_nproc) worker
+        threads, which take scripts in the order of bins.
         return all bash scripts in a list.
         """
         all_todo = []
-        for i in xrange(start, end, 100):  # Put every 100 clusters to a bin
-            cids = keys[i:min(end, i + 100)]
-            time0 = time.time()
-            bin_sh = self.create_a_quiver_bin(cids=cids, d=d, uc=uc,
-                                              partial_uc=partial_uc,
-                                              refs=refs, sge_opts=sge_opts)
-            all_todo += bin_sh
-            self.add_log("DEBUG: Total time for create_a_quiver_bin: {0}".format(time.time()-time0))
-            # assert bin_sh == self.script_of_quivered_bin(first, last)
-            # submit the created script of this quiver bin
-            time1 = time.time()
-            self.submit_todo_quiver_jobs(todo=[bin_sh], submitted=submitted,
-                                         sge_opts=sge_opts)
-            self.add_log("DEBUG: Total time for submit_todo_quiver_jobs: {0}".format(time.time()-time1))
-        # end of for i in xrange(start, end, 100):
+        pool, pending = None, []
+        if sge_opts.use_sge is not True or sge_opts.max_sge_jobs == 0:
+            num_workers = max(1, sge_opts.blasr_nproc /
+                              max(1, sge_opts.quiver_nproc))
+            pool = ThreadPool(processes=num_workers)
+        try:
+            for cids in bins:
+                time0 = time.time()
+                bin_sh = self.create_a_quiver_bin(cids=cids, d=d, uc=uc,
+                                                  partial_uc=partial_uc,
+                                                  refs=refs, sge_opts=sge_opts)
+                all_todo.append(bin_sh)
+                self.add_log("DEBUG: Total time for create_a_quiver_bin: {0}".format(time.time()-time0))
+                # submit the created script of this quiver bin
+                if pool is not None:
+                    pending.append(pool.apply_async(
+                        self.submit_todo_quiver_jobs,
+                        ([bin_sh], submitted, sge_opts)))
+                else:
+                    time1 = time.time()
+                    self.submit_todo_quiver_jobs(todo=[bin_sh], submitted=submitted,
+                                                 sge_opts=sge_opts)
+                    self.add_log("DEBUG: Total time for submit_todo_quiver_jobs: {0}".format(time.time()-time1))
+            # raise errors of local quiver jobs, if any
+            for result in pending:
+                result.get()
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
         return all_todo
 
     @property
@@ -508,26 +537,29 @@ class IceQuiver(IceFiles):
         if i == 0:
             self.write_report(report_fn=self.report_fn,
                               uc=uc, partial_uc=partial_uc)
+            # FL/nFL counts of clusters, for post-quiver HQ/LQ selection
+            self.write_support_counts(uc=uc, partial_uc=partial_uc)
 
         # index fasta files in fasta_fofn, and save to d
         d = self.index_fasta()
 
         # good = [x for x in uc if len(uc[x]) > 1 or len(partial_uc2[x]) >= 10]
         # bug 24984, call quiver on everything, no selection is needed.
-        keys = sorted([x for x in uc])  # sort cluster ids
-
-        # Compute number of clusters in i-th chunk
-        num_clusters_per_chunk = int(ceil(len(keys) / float(num_chunks)))
-        num_clusters_in_chunk_i = max(0, min(len(keys) - i * num_clusters_per_chunk,
-                                             num_clusters_per_chunk))
-        start = i * num_clusters_per_chunk
-        end = start + num_clusters_in_chunk_i
+        # Divide clusters into num_chunks chunks of roughly the same
+        # estimated workload; every chunk process computes the same
+        # partition, and takes the i-th most expensive chunk.
+        costs = self.cluster_costs(uc=uc, partial_uc=partial_uc, refs=refs)
+        chunk_cost, cids = balanced_partition(costs, num_chunks)[i]
+        bins = self.quiver_bins(cids=cids, costs=costs)
+        self.add_log("Chunk {i} of {N}: {n} clusters in {b} bins, ".
+                     format(i=i, N=num_chunks, n=len(cids), b=len(bins)) +
+                     "estimated workload {c}.".format(c=chunk_cost))
 
         submitted = []
         # Create quiver bins and submit jobs
         all_todo = self.create_quiver_bins_and_submit_jobs(d=d, uc=uc,
-                                                           partial_uc=partial_uc, refs=refs, keys=keys, start=start,
-                                                           end=end, submitted=submitted, sge_opts=self.sge_opts)
+                                                           partial_uc=partial_uc, refs=refs, bins=bins,
+                                                           submitted=submitted, sge_opts=self.sge_opts)
 
         # Write submitted quiver jobs to
         # $root_dir/log/submitted_quiver_jobs.{i}of{num_chunks}.txt
@@ -127,11 +127,11 @@ from pbtools.pbtranscript.PBTranscriptOptions import \
     add_cluster_root_dir_as_positional_argument, \
     add_ice_post_quiver_hq_lq_arguments, \
     add_cluster_summary_report_arguments
-from pbtools.pbtranscript.Utils import phred_to_qv, \
-    get_all_files_in_dir, ln, nfs_exists
+from pbtools.pbtranscript.Utils import get_all_files_in_dir, ln, nfs_exists
 from pbtools.pbtranscript.ice.IceFiles import IceFiles
-from pbtools.pbtranscript.ice.IceUtils import cid_with_annotation, locally_run_failed_quiver_jobs
-from pbcore.io import FastaWriter, FastqReader, FastqWriter
+from pbtools.pbtranscript.ice.IceUtils import cid_with_annotation, \
+    locally_run_failed_quiver_jobs, iter_quivered_fastq, quality_stats
+from pbcore.io import FastaWriter
 
 
 class IceQuiverPostprocess(IceFiles):
@@ -307,72 +307,62 @@ class IceQuiverPostprocess(IceFiles):
         return op.join(self.root_dir, "all_quivered_lq.fastq")
 
     def pickup_best_clusters(self, fq_filenames):
-        """Pick up hiqh QV clusters."""
+        """Pick up hiqh QV clusters.
+        Quivered fastq files are streamed, and each cluster is written to
+        HQ or LQ files as soon as it is read. A cluster is HQ if its
+        predicted accuracy in seq[qv_trim_5:-qv_trim_3] is at least
+        hq_quiver_min_accuracy and it has at least 2 FL reads.
+        """
         self.add_log("Picking up the best clusters according to QVs from {fs}.".
                      format(fs=", ".join(fq_filenames)))
-        a = load(open(self.final_pickle_fn))
-        uc = a['uc']
-        quivered = {}
-
-        for fq in fq_filenames:
-            self.add_log("Looking at quivered fq {f}".format(f=fq))
-            for r in FastqReader(fq):
-                # possible ID: c0/0_1611|quiver
-                cid = r.name.split('|')[0]
-                if cid.endswith('_ref'):
-                    cid = cid[:-4]
-                i = cid.find('/')
-                if i > 0:
-                    cid = cid[:i]
-                cid = int(cid[1:])
-                quivered[cid] = r
-
-        good = []
-
-        for cid, r in quivered.iteritems():
-            qv_len = max(0, len(r.quality) - self.qv_trim_5 - self.qv_trim_3)
-            if qv_len != 0:
-                q = [phred_to_qv(x) for x in r.quality]
-                err_sum = sum(q[self.qv_trim_5: -self.qv_trim_3])
-                # LIZ HACK: definitely of HQ must include # of FL >= 2 !!!
-                if 1.0 - (err_sum / float(qv_len)) >= self.hq_quiver_min_accuracy and len(uc[cid]) >= 2:
-                    good.append(cid)
-
-        partial_uc = load(open(self.nfl_all_pickle_fn))['partial_uc']
-        partial_uc2 = defaultdict(lambda: [])
-        partial_uc2.update(partial_uc)
-
         if self.report_fn is not None:
+            uc = load(open(self.final_pickle_fn))['uc']
+            partial_uc = load(open(self.nfl_all_pickle_fn))['partial_uc']
+            partial_uc2 = defaultdict(lambda: [])
+            partial_uc2.update(partial_uc)
             self.write_report(report_fn=self.report_fn,
                               uc=uc, partial_uc=partial_uc2)
+            del uc, partial_uc, partial_uc2
+
+        # cluster id --> (number of FL reads, number of nFL reads)
+        counts = self.load_support_counts()
 
         self.add_log("Writing hiqh-quality isoforms to {f}|fq".
                      format(f=self.quivered_good_fa))
         self.add_log("Writing low-quality isoforms to {f}|fq".
                      format(f=self.quivered_bad_fa))
+        seen = set()
         with FastaWriter(self.quivered_good_fa) as good_fa_writer, \
                 FastaWriter(self.quivered_bad_fa) as bad_fa_writer, \
-                FastqWriter(self.quivered_good_fq) as good_fq_writer, \
-                FastqWriter(self.quivered_bad_fq) as bad_fq_writer:
-            for cid in quivered:
-                r = quivered[cid]
+                open(self.quivered_good_fq, 'w') as good_fq_writer, \
+                open(self.quivered_bad_fq, 'w') as bad_fq_writer:
+            for cid, name, seq, qual in iter_quivered_fastq(fq_filenames):
+                if cid in seen:
+                    self.add_log("Ignoring another quivered {n} of cluster {c}.".
+                                 format(n=name, c=cid), level=logging.WARNING)
+                    continue
+                seen.add(cid)
+                num_fl, num_nfl = counts.get(cid, (0, 0))
+                qv_len, err_sum, num_low_qv = quality_stats(
+                    qual, self.qv_trim_5, self.qv_trim_3)
+                # LIZ HACK: definitely of HQ must include # of FL >= 2 !!!
+                is_good = qv_len != 0 and num_fl >= 2 and \
+                    1.0 - (err_sum / float(qv_len)) >= self.hq_quiver_min_accuracy
+
                 newname = "c{cid}/f{flnc_num}p{nfl_num}/{read_len}".\
-                    format(cid=cid,
-                           flnc_num=len(uc[cid]),
-                           nfl_num=len(partial_uc2[cid]),
-                           read_len=len(r.sequence))
+                    format(cid=cid, flnc_num=num_fl, nfl_num=num_nfl,
+                           read_len=len(seq))
                 newname = cid_with_annotation(newname)
 
-                if cid in good:
-                    self.add_log("processing quivered cluster {c} --> good.".
-                                 format(c=cid))
-                    good_fa_writer.writeRecord(newname, r.sequence)
-                    good_fq_writer.writeRecord(newname, r.sequence, r.quality)
-                else:
-                    self.add_log("processing quivered cluster {c} --> bad.".
-                                 format(c=cid))
-                    bad_fa_writer.writeRecord(newname, r.sequence)
-                    bad_fq_writer.writeRecord(newname, r.sequence, r.quality)
+                self.add_log("processing quivered cluster {c} --> {t} ".
+                             format(c=cid, t="good" if is_good else "bad") +
+                             "({e:.2f} expected errors, {n} bases < QV20).".
+                             format(e=err_sum, n=num_low_qv))
+                fa_writer, fq_writer = (good_fa_writer, good_fq_writer) \
+                    if is_good else (bad_fa_writer, bad_fq_writer)
+                fa_writer.writeRecord(newname, seq)
+                fq_writer.write("@{n}\n{s}\n+\n{q}\n".
+                                format(n=newname, s=seq, q=qual))
 
         self.add_log("-" * 60, level=logging.INFO)
         self.add_log("High-quality Quivered consensus written " +
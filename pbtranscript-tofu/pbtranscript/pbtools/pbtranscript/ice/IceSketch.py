@@ -0,0 +1,170 @@
+"""
+Minimizer sketches for finding candidate pairs of consensus sequences.
+
+Post-ICE merging used to align all consensus sequences all-vs-all.
+Since two clusters can only merge if their consensus sequences align
+(almost) end to end with high identity, a pair is only worth aligning
+if both sequences have similar lengths and share a number of
+minimizers. sketch_candidate_pairs() finds such pairs through an
+inverted index of minimizers whose postings are sorted by sequence
+length, so that each posting is only paired with postings in the
+same length bucket.
+
+Minimizers in more than max_occ sequences are either repeats (poly-A),
+shared by unrelated sequences, or shared by a family of more than
+max_occ similar sequences (e.g., isoforms of a highly expressed gene).
+Pairing all sequences of such postings is quadratic, so only sequences
+next to each other in a posting are linked; sequences linked by at least
+min_shared of these postings form a family, and all pairs within a
+family are candidates, as they were when aligning all-vs-all.
+"""
+from collections import defaultdict
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+# A, C, G, T (either case) --> 0, 1, 2, 3; anything else --> 4
+_ENCODE = np.empty(256, dtype=np.uint8)
+_ENCODE.fill(4)
+for _i, _c in enumerate("ACGT"):
+    _ENCODE[ord(_c)] = _i
+    _ENCODE[ord(_c.lower())] = _i
+
+_MAX_HASH = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+def kmer_hashes(seq, k):
+    """
+    Return hashes (uint64) of all k-mers of seq, k <= 32.
+    k-mers containing a non-ACGT base are hashed to _MAX_HASH.
+    """
+    n = len(seq) - k + 1
+    if n <= 0:
+        return np.zeros(0, dtype=np.uint64)
+    codes = _ENCODE[np.frombuffer(seq, dtype=np.uint8)]
+    vals = np.zeros(n, dtype=np.uint64)
+    for j in xrange(k):
+        vals = (vals << np.uint64(2)) | (codes[j:j+n] & 3).astype(np.uint64)
+    # invertible integer mix, so that minimizers are not biased
+    # towards poly-A and other low complexity k-mers
+    vals ^= vals >> np.uint64(31)
+    vals *= np.uint64(0x9E3779B97F4A7C15)
+    vals ^= vals >> np.uint64(29)
+    # mask k-mers with a non-ACGT base
+    bad = np.concatenate(([0], np.cumsum(codes == 4)))
+    vals[(bad[k:] - bad[:n]) > 0] = _MAX_HASH
+    return vals
+
+
+def minimizer_sketch(seq, k=15, w=10):
+    """Return the sorted array of (w, k)-minimizers of seq."""
+    h = kmer_hashes(seq, k)
+    if len(h) > w:
+        h = as_strided(h, shape=(len(h) - w + 1, w),
+                       strides=(h.strides[0], h.strides[0])).min(axis=1)
+    h = np.unique(h)
+    return h[h != _MAX_HASH]
+
+
+def max_length_diff(length, max_missed_start, max_missed_end,
+                    max_indel_rate=0.1):
+    """
+    Return the largest length difference of two sequences, the longer
+    of which is of <length>, that could still align end to end
+    (see IceUtils.possible_merge).
+    """
+    return max_missed_start + max_missed_end + int(length * max_indel_rate)
+
+
+def sketch_candidate_pairs(sketches, lengths, max_missed_start,
+                           max_missed_end, min_shared=3, max_occ=200):
+    """
+    sketches --- {sid: minimizer_sketch(seq)}
+    lengths --- {sid: len(seq)}
+    Return (pairs, families): a set of pairs (a, b), a < b, of sequence
+    ids that share at least min_shared minimizers and have compatible
+    lengths, and a list of families (sorted lists of sequence ids), any
+    two sequences of which are also candidates.
+    Sequences of a minimizer seen in more than max_occ sequences are
+    only linked to the next sequence (by length) of its posting, and a
+    family is formed by sequences linked by at least min_shared such
+    minimizers (see candidate_groups).
+    """
+    postings = defaultdict(list)
+    for sid, sketch in sketches.iteritems():
+        for m in sketch.tolist():
+            postings[m].append((lengths[sid], sid))
+
+    shared = defaultdict(int)
+    linked = defaultdict(int)
+    for p in postings.itervalues():
+        if len(p) < 2:
+            continue
+        p.sort()
+        if len(p) > max_occ:
+            for x in xrange(len(p) - 1):
+                (len_a, a), (len_b, b) = p[x], p[x + 1]
+                if len_b - len_a <= max_length_diff(len_b, max_missed_start,
+                                                    max_missed_end):
+                    linked[(a, b) if a < b else (b, a)] += 1
+            continue
+        for x in xrange(len(p) - 1):
+            len_a, a = p[x]
+            for y in xrange(x + 1, len(p)):
+                len_b, b = p[y]
+                # postings sorted by length: later ones are only longer
+                if len_b - len_a > max_length_diff(len_b, max_missed_start,
+                                                   max_missed_end):
+                    break
+                shared[(a, b) if a < b else (b, a)] += 1
+
+    pairs = set(pair for pair, n in shared.iteritems() if n >= min_shared)
+    links = [pair for pair, n in linked.iteritems() if n >= min_shared]
+    return pairs, candidate_groups(links, max_group_size=0)
+
+
+def candidate_groups(pairs, max_group_size=1000, families=()):
+    """
+    Group sequences of candidate pairs and families by connected
+    components, and pack components into groups of at most
+    max_group_size sequences (a larger component forms a group of its
+    own), so that aligning each group all-vs-all covers all candidate
+    pairs and all pairs within families.
+    Return a list of sorted lists of sequence ids.
+    """
+    parent = {}
+
+    def find(x):
+        """Return root of x, with path halving."""
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(a, b):
+        """Merge components of a and b."""
+        parent.setdefault(a, a)
+        parent.setdefault(b, b)
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[max(ra, rb)] = min(ra, rb)
+
+    for a, b in pairs:
+        union(a, b)
+    for fam in families:
+        for x in xrange(len(fam) - 1):
+            union(fam[x], fam[x + 1])
+
+    components = defaultdict(list)
+    for x in parent:
+        components[find(x)].append(x)
+
+    groups, cur = [], []
+    for root in sorted(components):
+        comp = sorted(components[root])
+        if len(cur) > 0 and len(cur) + len(comp) > max_group_size:
+            groups.append(cur)
+            cur = []
+        cur += comp
+    if len(cur) > 0:
+        groups.append(cur)
+    return groups
@@ -6,18 +6,19 @@ import logging
 import shutil
 import filecmp
 import random
+import heapq
 import numpy as np
-from multiprocessing import Process, Manager
 from cPickle import dump, load
 from collections import defaultdict
 from pbcore.util.Process import backticks
-from pbcore.io import FastaReader, FastaWriter, FastqReader, FastqWriter, \
-        BasH5Reader
+from pbcore.io import FastaReader, FastaWriter, FastqReader, FastqWriter
 from pbtools.pbtranscript.Utils import realpath, mkdir, \
         get_files_from_fofn, write_files_to_fofn, real_upath
 from pbtools.pbtranscript.io.BLASRRecord import BLASRM5Reader
+from pbtools.pbtranscript.io.SeqIndex import count_records
+from pbtools.pbtranscript.io.SubreadExtractor import extract_subreads_of_files
 from pbtools.pbtranscript.findECE import findECE
-from pbtools.pbtranscript.io.BasQV import basQVcacher
+from pbtools.pbtranscript.io.BasQV import basQVcacher, read_qvs
 from pbtools.pbtranscript.icedalign.IceDalignUtils import DazzIDHandler, DalignerRunner
 
 __author__ = 'etseng@pacificbiosciences.com'
@@ -635,88 +636,40 @@ def concat_sam(samfiles, outsam_filename):
     os.remove(f_sq.name)
     os.remove(f_bd.name)
 
-def convert_fofn_to_fasta_worker(in_queue):
-    while not in_queue.empty():
-        stuff = in_queue.get()
-        pls2fasta_cmd, tmp_out_file, out_file = stuff
-        _out, _code, _msg = backticks(pls2fasta_cmd)
-        if _code != 0:
-            raise RuntimeError("CMD failed: {cmd}\n".format(cmd=pls2fasta_cmd) + _msg)
-        trim_subread_flanks(tmp_out_file, out_file)
-        if op.exists(tmp_out_file):
-            os.remove(tmp_out_file)
-
 def convert_fofn_to_fasta(fofn_filename, out_filename, fasta_out_dir,
                           force_overwrite=False, cpus=1):
     """
     For each .bax.h5 file, create .bax.h5.fasta file and save paths to
-    out_filename, which should usually be 'input.fasta.fofn'
+    out_filename, which should usually be 'input.fasta.fofn'.
+    Subreads are extracted and flank-trimmed in one pass by
+    extract_subreads (equivalent to pls2fasta -trimByRegion
+    -minSubreadLength 300 -minReadScore 750 + trim_subread_flanks),
+    using a pool of cpus processes.
     """
     logging.info("Converting fofn {fofn} to fasta.".format(fofn=fofn_filename))
     in_fns = get_files_from_fofn(fofn_filename)
-    #out_fns = []
     mkdir(fasta_out_dir)
 
-    # multiprocessing worker stuff
-    manager = Manager()
-    in_queue = manager.Queue(len(in_fns))
-    in_queue_count = 0
-    outfile_track = {} # expected out file --> (cmd, tmp)
-    pool = []
     out_fns = []
-
+    todo_in_fns, todo_out_fns = [], []
     for in_fn in in_fns:
-        #print >> sys.stderr, "DEBUG: converting h5 file:", in_fn
         logging.debug("converting h5 file: {f}.".format(f=in_fn))
         if not (in_fn.endswith('.bax.h5') or in_fn.endswith('.bas.h5')):
             raise ValueError("fofn file {fofn} ".format(fofn=fofn_filename) +
                              "should only contain bax/bas.h5 files.")
 
-        # e.g. m111xxxx.1.bax.h5 ==>
-        #      tmp_out_file = m11xxxx.1.bax.h5.fasta.tmp
-        #      out_file = m11xxxx.1.bax.h5.fasta
-        in_basename = op.basename(in_fn)
-        tmp_out_file = op.join(fasta_out_dir, in_basename + '.fasta.tmp')
-        out_file = op.join(fasta_out_dir, in_basename + '.fasta')
+        # e.g. m111xxxx.1.bax.h5 ==> out_file = m11xxxx.1.bax.h5.fasta
+        out_file = op.join(fasta_out_dir, op.basename(in_fn) + '.fasta')
+        out_fns.append(out_file)
         if op.exists(out_file) and not force_overwrite:
             logging.debug("File {0} already exists. skipping.".format(out_file))
-            out_fns.append(out_file)
-            if op.exists(tmp_out_file):
-                os.remove(tmp_out_file)
         else:
-            cmd = "pls2fasta {in_fn} ".format(in_fn=real_upath(in_fn)) + \
-                  " {out} ".format(out=real_upath(tmp_out_file)) + \
-                  "-minSubreadLength 300 -minReadScore 750 -trimByRegion"
-            print >> sys.stderr, "DEBUG: putting in queue:", cmd, tmp_out_file, out_file
-            in_queue.put((cmd, tmp_out_file, out_file))
-            in_queue_count += 1
-            outfile_track[out_file] = (cmd, tmp_out_file)
-            print >> sys.stderr, "DEBUG: put in queue:", cmd, tmp_out_file, out_file
-
-    cpus = min(cpus, in_queue_count) # cap max CPU if there's fewer files to convert
-    for i in xrange(cpus):
-        p = Process(target=convert_fofn_to_fasta_worker, args=(in_queue,))
-        pool.append(p)
-
-    #error_flag = False
-    # starting & joining pool worakers
-    for p in pool:
-        p.start()
-        #print >> sys.stderr, "Starting worker", p.name
-    for p in pool:
-        #print >> sys.stderr, "Waiting join", p.name
-        p.join(timeout=1200)
-        if p.is_alive(): p.terminate()
-
-    # check that all files exists
-    # if it does not, force to run locally
-    for out_file,(cmd, tmp_out_file) in outfile_track.iteritems():
-        in_queue.put((cmd, tmp_out_file, out_file))
-        convert_fofn_to_fasta_worker(in_queue)
-        out_fns.append(out_file)
+            todo_in_fns.append(in_fn)
+            todo_out_fns.append(out_file)
 
-    #if error_flag:
-    #    raise Exception, "Unable to successfuly run convert_fofn_to_fasta, ABORT!"
+    nums = extract_subreads_of_files(todo_in_fns, todo_out_fns, cpus=cpus)
+    for out_file, num in zip(todo_out_fns, nums):
+        logging.debug("{n} subreads written to {f}.".format(n=num, f=out_file))
 
     write_files_to_fofn(out_fns, out_filename)
 
@@ -725,6 +678,7 @@ def trim_subread_flanks(fasta_filename, output_filename,
                         trim_len=100, min_len=100):
     """
     fasta_filename --- should be subread output from pls2fasta
+    (convert_fofn_to_fasta trims flanks while extracting subreads)
 
     trim first/last 100bp (which contains primer&polyA) away and correct
     coordinates
@@ -761,6 +715,70 @@ def build_sa(input_fasta, out_sa):
         raise IOError("Unable to find fasta file {f}.".format(f=input_fasta))
 
 
+def subsample_reads(cid, fl_reads, nfl_reads, max_reads=100, seed=0):
+    """
+    Return at most max_reads read ids of cluster cid for Quiver, FL reads
+    having priority over nFL reads. Reads are picked by a reservoir
+    sample seeded by (seed, cid), so that the same reads are picked
+    whenever (and wherever) the cluster is processed.
+    """
+    rand = random.Random(seed * 1000003 + cid)
+
+    def reservoir(reads, n):
+        """Return a uniform sample of n reads, in input order."""
+        sample = []
+        for i, r in enumerate(reads):
+            if i < n:
+                sample.append((i, r))
+            else:
+                j = rand.randint(0, i)
+                if j < n:
+                    sample[j] = (i, r)
+        return [r for (_i, r) in sorted(sample)]
+
+    if len(fl_reads) > max_reads:
+        return reservoir(fl_reads, max_reads)
+    return list(fl_reads) + reservoir(nfl_reads, max_reads - len(fl_reads))
+
+
+def quiver_cost(in_seqids, ref_len, zmw_bases):
+    """
+    Return the estimated Quiver workload of a cluster: total subread bases
+    of ZMWs of in_seqids (from zmw_bases, {movie/holeNumber: bases},
+    ref_len if unknown) times consensus length ref_len.
+    """
+    zmws = set(seqid[:seqid.rfind('/')] for seqid in in_seqids)
+    return sum(zmw_bases.get(zmw, ref_len) for zmw in zmws) * ref_len
+
+
+def balanced_partition(costs, num_parts):
+    """
+    Partition keys of costs ({key: cost}) into num_parts parts of
+    roughly equal total cost (greedy, largest cost first to the least
+    loaded part). Return [(total cost, sorted keys)] of all parts, sorted
+    by total cost, largest first. The result only depends on costs.
+    """
+    parts = [(0, i, []) for i in xrange(num_parts)]
+    heapq.heapify(parts)
+    for key in sorted(costs, key=lambda k: (-costs[k], k)):
+        total, i, keys = heapq.heappop(parts)
+        keys.append(key)
+        heapq.heappush(parts, (total + costs[key], i, keys))
+    return [(total, sorted(keys)) for (total, _i, keys) in
+            sorted(parts, key=lambda x: (-x[0], x[1]))]
+
+
+def cids_missing_own_prob(uc, d):
+    """
+    Return the set of cids of clusters in uc (cid --> members) which have
+    a member qID without a probability to its own cluster in d
+    (qID --> cid --> logprob), e.g., a member of a quasi-clique with no
+    scored hit to any other member.
+    """
+    return set(cid for cid, qids in uc.iteritems()
+               if any(cid not in d.get(qid, {}) for qid in qids))
+
+
 def write_in_raw_fasta_starhelper(args):
     write_in_raw_fasta(*args)
 
@@ -820,13 +838,7 @@ def num_reads_in_fasta(in_fa):
     """Return the number of reads in the in_fa fasta file."""
     if not op.exists(in_fa):
         raise IOError("fasta file {f} does not exist.".format(f=in_fa))
-    cmd = "grep '>' {f} | wc -l ".format(f=in_fa)
-    logging.debug("CMD: " + cmd)
-    _out, _code, _msg = backticks(cmd)
-    if _code != 0:
-        raise RuntimeError("CMD failed: {cmd}\n{e}".
-                           format(cmd=cmd, e=_msg))
-    return int(_out[0])
+    return count_records(in_fa, is_fq=False)
 
 
 def combine_nfl_pickles(splitted_pickles, out_pickle):
@@ -859,6 +871,50 @@ def combine_nfl_pickles(splitted_pickles, out_pickle):
             dump({'nohit': nohit, 'partial_uc': partial_uc}, f)
         logging.debug("{f} created.".format(f=out_pickle))
 
+# error probability of each phred+33 quality byte
+QUAL_ERR_PROB = 10 ** (-(np.arange(256) - 33) / 10.)
+
+
+def iter_quivered_fastq(fq_filenames):
+    """
+    Yield (cid, name, sequence, quality string) of records in quivered
+    fastq files (4 lines per record, as written by quiver), where cid is
+    the integer cluster id of names like c0/0_1611|quiver or c0_ref|quiver.
+    """
+    for fq in fq_filenames:
+        with open(fq) as f:
+            while True:
+                header = f.readline()
+                if len(header) == 0:
+                    break
+                seq = f.readline().rstrip()
+                f.readline()
+                qual = f.readline().rstrip()
+                if not header.startswith('@') or len(seq) != len(qual):
+                    raise ValueError("{f} is not a 4-line fastq file.".
+                                     format(f=fq))
+                name = header[1:].rstrip()
+                cid = name.split('|')[0]
+                if cid.endswith('_ref'):
+                    cid = cid[:-4]
+                i = cid.find('/')
+                if i > 0:
+                    cid = cid[:i]
+                yield int(cid[1:]), name, seq, qual
+
+
+def quality_stats(qual, trim_5, trim_3, low_qv=20):
+    """
+    Return (length, expected number of errors, number of bases with
+    QV < low_qv) of qual[trim_5:len(qual)-trim_3], where qual is a
+    phred+33 quality string.
+    """
+    end = max(trim_5, len(qual) - trim_3)
+    q = np.frombuffer(qual, dtype=np.uint8)[trim_5:end]
+    return (len(q), float(QUAL_ERR_PROB[q].sum()),
+            int((q < low_qv + 33).sum()))
+
+
 def cid_with_annotation(cid):
     """Given a cluster id, return cluster id with human readable annotation.
     e.g., c0 --> c0 isoform=c0
@@ -935,9 +991,11 @@ def ice_fq2fa(in_fq, out_fa):
     for r in FastqReader(in_fq):
         handle.writeRecord(r.name, r.sequence)
 
-def ice_fa2fq(in_fa, ccs_fofn, out_fq):
+def ice_fa2fq(in_fa, ccs_fofn, out_fq, cpus=1):
     """Convert an input FASTA file to an output FASTQ file,
        reading QVs from the input ccs.h5 or ccs FOFN.
+       QVs of all reads are read in batches, movie by movie in parallel
+       using cpus processes (see BasQV.read_qvs).
     """
 
     qver = basQVcacher()
@@ -947,38 +1005,20 @@ def ice_fa2fq(in_fa, ccs_fofn, out_fq):
         for ccs_fn in get_files_from_fofn(ccs_fofn):
             qver.add_bash5(ccs_fn)
 
-    bas_handlers = {}
+    with FastaReader(in_fa) as reader:
+        seqids = [r.name.split(' ')[0] for r in reader]
+    logging.debug("Getting QVs for {n} reads ...".format(n=len(seqids)))
+    qvs = read_qvs(qver.bas_files, seqids, ["QualityValue"], cpus=cpus)
 
     with FastaReader(in_fa) as reader, \
             FastqWriter(out_fq) as writer:
         for r in reader:
             seqid = r.name.split(' ')[0]
-            movie, hn, s_e = "", "", ""
-            try:
-                movie, hn, s_e = seqid.split('/')
-                hn = int(hn)
-            except ValueError:
-                raise ValueError("{seqid} is not a valid CCS read".
-                                 format(seqid=seqid))
-            try:
-                bas_file = qver.bas_files[movie][seqid]
-                if bas_file not in bas_handlers:
-                    bas_handlers[bas_file] = BasH5Reader(bas_file)
-            except KeyError:
-                raise IOError("Could not read {s} from input ccs fofn.".
-                              format(s=seqid))
-            logging.debug("Getting QVs for {name} ...".format(name=r.name))
-            qvs = get_qv_from_bas_handler(bas_handler=bas_handlers[bas_file],
-                                          hn=hn, s_e=s_e,
-                                          qv_name="QualityValue")
-            if len(r.sequence) != len(qvs):
+            qv = qvs[seqid]["QualityValue"]
+            if len(r.sequence) != len(qv):
                 raise ValueError("Sequence and QVs of {r} should be the same!".
                                  format(r=r.name))
-            writer.writeRecord(r.name, r.sequence, qvs)
-
-    for bas_file, bas_handler in bas_handlers.iteritems():
-        logging.debug("Closing {bas_file} ...".format(bas_file=bas_file))
-        bas_handler.close()
+            writer.writeRecord(r.name, r.sequence, qv)
 
 
 def locally_run_failed_quiver_jobs(bad_sh_files, max_fail=3):
@@ -1,9 +1,8 @@
 #!/usr/bin/env python
 """Given input.fofn, for each movie.bas|bax.h5 file in the fofn,
-call pls2fasta to generate a movie.bax|bas.h5.fasta file in a
-specified directory, and then trim both ends of each read in fasta
-files. Finally, add all these fasta files to fasta_fofn
-(e.g., input.fasta.fofn).
+extract subreads to a movie.bax|bas.h5.fasta file in a specified
+directory, trimming both ends of each subread. Finally, add all these
+fasta files to fasta_fofn (e.g., input.fasta.fofn).
 """
 
 import logging
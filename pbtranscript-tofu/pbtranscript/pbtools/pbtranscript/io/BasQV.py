@@ -37,61 +37,197 @@
 
 """
 Read and cache quality value from Base/CCS.H5 files.
+
+QVs are read in batches: read ids are grouped by movie and sorted by
+hole number, and the QV datasets of each bax/ccs.h5 file are read in
+large contiguous hyperslabs (at most max_slab_size bases), from which the
+range of each read is sliced in memory. Movies are read in parallel:
+
+    qvs = read_qvs({movie: [movie.1.bax.h5, ...]}, seqids,
+                   ['InsertionQV', 'DeletionQV'], cpus=4)
+    qvs[seqid]['InsertionQV'] --> numpy uint8 array of QVs of seqid
 """
 
 import os
+import os.path as op
 import logging
 from collections import defaultdict
+from multiprocessing import Pool
+import numpy as np
+import h5py
 import pbtools.pbtranscript.io.c_basQV as c_basQV
 from pbcore.io.FastqIO import FastqReader
 
-class h5_wrapper(object):
+BASECALLS = "PulseData/BaseCalls"
+CCS_BASECALLS = "PulseData/ConsensusBaseCalls"
+MAX_SLAB_SIZE = 64 * 1024 * 1024
 
+
+def parse_seqid(seqid):
     """
-    Wrap the .1.ccs.h5, .2.ccs.h5, .3.ccs.h5 to give the illusion of one
-    (like what .bas.h5 does for .bax.h5)
+    Return (movie, hn, s, e, strand, is_CCS, get_all) of a read id
+    movie/hn/s_e (subread), movie/hn/s_e_CCS or movie/hn/ccs (CCS read),
+    where s < e, and strand is '-' if the read id has s > e.
     """
+    try:
+        movie, hn, s_e = seqid.split()[0].split('/')
+        hn = int(hn)
+        get_all = s_e == "ccs"
+        is_CCS = get_all or s_e.endswith('_CCS')
+        if get_all:
+            s, e = 0, 0
+        elif is_CCS:
+            s, e = map(int, s_e.split('_')[:2])
+        else:
+            s, e = map(int, s_e.split('_'))
+    except ValueError:
+        raise ValueError("{seqid} is not a valid read id.".format(seqid=seqid))
+    strand = '+'
+    if s > e:
+        s, e, strand = e, s, '-'
+    return (movie, hn, s, e, strand, is_CCS, get_all)
 
-    def __init__(self, file_prefix, suffix='.ccs.h5'):
-        """
-        Expects <prefix>.1.ccs.h5, .2.ccs.h5, and .3.ccs.h5
-        or .1.bax.h5, .2.bax.h5, .3.bax.h5
-        """
-        if suffix not in ('.ccs.h5', '.bax.h5'):
-            errMsg = "bas.h5 is not supported, use ccs.h5 or bax.h5."
-            raise ValueError(errMsg)
-        self.files = [file_prefix + '.1' + suffix,
-                      file_prefix + '.2' + suffix,
-                      file_prefix + '.3' + suffix]
-        # Sometimes may use only one bax.h5 file as input.
-        # assert all(os.path.exists(f) for f in self.files)
-
-        self.hn_range = [(0, 54493), (54494, 108987), (108988, 170000)]
-
-    def __getitem__(self, seqid):
-        if seqid.count('/') == 1 or seqid.count('/') == 2:
-            hn = int(seqid.split('/')[1])
+
+def bash5_parts(bash5_filename):
+    """Return part files of a multi-part bas.h5, or [bash5_filename]."""
+    with h5py.File(bash5_filename, 'r') as f:
+        if "MultiPart/Parts" in f:
+            d = op.dirname(bash5_filename)
+            return [op.join(d, part) for part in f["MultiPart/Parts"][:]]
+    return [bash5_filename]
+
+
+class ZmwIndex(object):
+
+    """Start and end of the bases of each ZMW in a base calls group."""
+
+    def __init__(self, h5, group):
+        if group + "/ZMW/HoleNumber" in h5:
+            self.holes = h5[group + "/ZMW/HoleNumber"][:]
+            num_events = h5[group + "/ZMW/NumEvent"][:]
         else:
-            errMsg = "Cannot recognize" + seqid
-            logging.error(errMsg)
-            raise ValueError(errMsg)
+            self.holes = num_events = np.zeros(0, dtype=np.int64)
+        self.offsets = np.zeros(len(num_events) + 1, dtype=np.int64)
+        np.cumsum(num_events, out=self.offsets[1:])
 
-        for i in xrange(3):
-            if self.hn_range[i][0] <= hn and \
-               hn <= self.hn_range[i][1]:
-                return self.files[i]
+    def locate(self, hn):
+        """Return (start, end) of bases of hole number hn, or None."""
+        i = np.searchsorted(self.holes, hn)
+        if i < len(self.holes) and self.holes[i] == hn:
+            return int(self.offsets[i]), int(self.offsets[i + 1])
+        return None
 
-        errMsg = "Unlocated holeNumber" + hn
-        raise ValueError(errMsg)
 
-    def __delitem__(self, seqid):
-        raise NotImplementedError("h5_wrapper.__delitem__ not implemented.")
+def _slabs(ranges, max_slab_size):
+    """
+    Group ranges [(start, end, ...)] sorted by start into slabs
+    [(lo, hi, ranges in slab)] of at most max_slab_size bases, unless a
+    single range is longer.
+    """
+    slabs = []
+    for r in ranges:
+        if len(slabs) > 0 and max(slabs[-1][1], r[1]) - slabs[-1][0] <= \
+                max_slab_size:
+            slabs[-1][1] = max(slabs[-1][1], r[1])
+            slabs[-1][2].append(r)
+        else:
+            slabs.append([r[0], r[1], [r]])
+    return slabs
 
-    def __setitem__(self, seqid):
-        raise NotImplementedError("h5_wrapper.__setitem__ not implemented.")
 
-    def __len__(self, seqid):
-        return len(self.files)
+def read_qvs_of_files(h5_filenames, reads, qv_names,
+                      max_slab_size=MAX_SLAB_SIZE):
+    """
+    Read QVs of reads of a movie from its bax/ccs.h5 files.
+    reads --- [(seqid, hn, s, e, strand, is_CCS, get_all)], sorted by hn
+    Return {seqid: {qv_name: numpy array of QVs}}.
+    CCS reads of ZMWs without CCS base calls (reads_of_insert w/ 0-pass)
+    are read from raw base calls, like IceUtils.get_qv_from_bas_handler.
+    """
+    result = {}
+    todo = reads
+    for fn in h5_filenames:
+        if len(todo) == 0:
+            break
+        with h5py.File(fn, 'r') as h5:
+            raw_index = ZmwIndex(h5, BASECALLS)
+            ccs_index = ZmwIndex(h5, CCS_BASECALLS)
+            ranges = {BASECALLS: [], CCS_BASECALLS: []}
+            not_here = []
+            for (seqid, hn, s, e, strand, is_CCS, get_all) in todo:
+                group, zmw = CCS_BASECALLS, None
+                if is_CCS:
+                    zmw = ccs_index.locate(hn)
+                if zmw is None or zmw[0] == zmw[1]:
+                    group, zmw = BASECALLS, raw_index.locate(hn)
+                if zmw is None:
+                    not_here.append((seqid, hn, s, e, strand, is_CCS,
+                                     get_all))
+                    continue
+                start, end = zmw if get_all else (zmw[0] + s, zmw[0] + e)
+                ranges[group].append((start, end, seqid, strand))
+            todo = not_here
+
+            for group, group_ranges in ranges.iteritems():
+                group_ranges.sort()
+                for lo, hi, slab_ranges in _slabs(group_ranges, max_slab_size):
+                    for qv_name in qv_names:
+                        data = h5[group + "/" + qv_name][lo:hi]
+                        for start, end, seqid, strand in slab_ranges:
+                            qvs = data[start - lo:end - lo]
+                            if strand == '-':
+                                qvs = qvs[::-1]
+                            result.setdefault(seqid, {})[qv_name] = qvs.copy()
+    if len(todo) > 0:
+        raise IOError("Could not read {s} from {f}.".
+                      format(s=todo[0][0], f=", ".join(h5_filenames)))
+    return result
+
+
+def _read_qvs_of_movie(args):
+    """Read QVs of reads of a movie in a worker process."""
+    bash5_filenames, reads, qv_names = args
+    h5_filenames = [part for fn in bash5_filenames for part in bash5_parts(fn)]
+    return read_qvs_of_files(h5_filenames, reads, qv_names)
+
+
+def read_qvs(bas_files, seqids, qv_names, cpus=1):
+    """
+    Read QVs of type qv_names of seqids, where bas_files is
+    {movie: [bas/bax/ccs.h5 files of movie]}, in parallel across movies.
+    Return {seqid: {qv_name: numpy array of QVs}}, QVs of reads with
+    start > end are reversed.
+    """
+    movie_reads = defaultdict(lambda: [])
+    for seqid in seqids:
+        movie, hn, s, e, strand, is_CCS, get_all = parse_seqid(seqid)
+        if movie not in bas_files:
+            raise IOError("Could not read {s} from input bas/ccs fofn.".
+                          format(s=seqid))
+        movie_reads[movie].append((seqid.split()[0], hn, s, e, strand,
+                                   is_CCS, get_all))
+    jobs = [(bas_files[movie], sorted(reads, key=lambda x: x[1]), qv_names)
+            for movie, reads in movie_reads.iteritems()]
+
+    cpus = max(1, min(cpus, len(jobs)))
+    if cpus == 1:
+        results = [_read_qvs_of_movie(job) for job in jobs]
+    else:
+        pool = Pool(processes=cpus)
+        try:
+            results = pool.map(_read_qvs_of_movie, jobs, chunksize=1)
+        finally:
+            pool.terminate()
+            pool.join()
+    qvs = {}
+    for result in results:
+        qvs.update(result)
+    return qvs
+
+
+def qv_to_prob(qvs):
+    """Return a list of error probabilities of QVs."""
+    return (10 ** (-np.asarray(qvs, dtype=np.float64) / 10.)).tolist()
 
 
 class basQVcacher:
@@ -127,58 +263,43 @@ class basQVcacher:
         return self.qv_mean[seqid][qv_name]
 
     def add_bash5(self, bash5_filename):
-        """Add a bas.h5/ccs.h5 to cacher."""
+        """Add a bas.h5/bax.h5/ccs.h5 to cacher."""
         basename = os.path.basename(bash5_filename)
-        if bash5_filename.endswith('.bax.h5'):
-            movie = basename[:-9]
-            if movie not in self.bas_files:
-                self.bas_files[movie] = h5_wrapper(bash5_filename[:-9],
-                                                   suffix='.bax.h5')
-        elif bash5_filename.endswith('.1.ccs.h5') or \
+        if bash5_filename.endswith('.bax.h5') or \
+                bash5_filename.endswith('.1.ccs.h5') or \
                 bash5_filename.endswith('.2.ccs.h5') or \
                 bash5_filename.endswith('.3.ccs.h5'):
-            movie = basename[:-9]
-            if movie not in self.bas_files:
-                self.bas_files[movie] = h5_wrapper(bash5_filename[:-9])
-        elif bash5_filename.endswith('.ccs.h5'):
-            # a single .ccs.h5 (post 150k runs), treat the same as .bas.h5
-            movie = basename[:-7]
-            self.bas_files[movie] = defaultdict(lambda: bash5_filename)
+            # add all existing parts of the movie, hole numbers of reads
+            # are looked up in each part
+            movie, suffix = basename[:-9], bash5_filename[-7:]
+            prefix = bash5_filename[:-9]
+            parts = [fn for fn in [prefix + '.' + i + suffix for i in "123"]
+                     if op.exists(fn)]
+            if bash5_filename not in parts:
+                parts.append(bash5_filename)
         else:
-            assert bash5_filename.endswith('.bas.h5')
+            # a single .ccs.h5 (post 150k runs) or a .bas.h5
+            assert bash5_filename.endswith('.ccs.h5') or \
+                bash5_filename.endswith('.bas.h5')
             movie = basename[:-7]
-            self.bas_files[movie] = defaultdict(lambda: bash5_filename)
+            parts = [bash5_filename]
+        files = self.bas_files.setdefault(movie, [])
+        files.extend(fn for fn in parts if fn not in files)
 
-    def precache(self, seqids):
+    def precache(self, seqids, cpus=1):
         """
-        Precache QV probabilities for seqids.
+        Precache QV probabilities for seqids, reading movies with
+        cpus processes.
         """
         # for subread ex:
         # m120407_063017_4.../13/2571_3282
         # for CCS ex:
         # m120407_063017_4.../13/300_10_CCS
-
-        # sort seqids by movie to save time
-        seqids.sort(key=lambda x: (x.split('/')[0], int(x.split('/')[1])))
-
-        # split seq IDs by bas filename
-        # bas file --> list of seqids belonging to that bas file
-        bas_job_dict = defaultdict(lambda: [])
-
-        for seqid in seqids:
-            # logging.debug("precaching " + seqid)
-            movie, hn, _s_e = seqid.split('/')
-            hn = int(hn)
-            try:
-                bas_file = self.bas_files[movie][seqid]
-                bas_job_dict[bas_file].append(seqid)
-            except KeyError:
-                raise IOError("Could not read {s} from input bas/ccs fofn.".
-                              format(s=seqid))
-
-        for bas_file, seqids in bas_job_dict.iteritems():
-            c_basQV.precache_helper(bas_file, seqids,
-                                    basQVcacher.qv_names, self.qv)
+        qvs = read_qvs(self.bas_files, seqids, basQVcacher.qv_names,
+                       cpus=cpus)
+        for seqid, d in qvs.iteritems():
+            self.qv[seqid] = dict((qv_name, qv_to_prob(d[qv_name]))
+                                  for qv_name in basQVcacher.qv_names)
 
         self.make_qv_mean(seqids)
 
@@ -1,6 +1,7 @@
 import re, sys
 from collections import namedtuple
 from exceptions import StopIteration
+from array import array
 
 Interval = namedtuple('Interval', ['start', 'end'])
        
@@ -127,12 +128,21 @@ class SimpleSAMRecord:
 class SAMReader:
     SAMheaders = ['@HD', '@SQ', '@RG', '@PG', '@CO']    
     def __init__(self, filename, has_header, ref_len_dict=None, query_len_dict=None):
-        self.filename = filename
-        self.f = open(filename)
-        self.header = ''
+        """
+        filename --- SAM filename, or an open SAM stream with a .header
+                     (ex: io.SAMSorter.SortedSAMStream)
+        """
         self.ref_len_dict = ref_len_dict
         self.query_len_dict = query_len_dict
-        if has_header:
+        if hasattr(filename, 'readline'):
+            self.filename = filename.name
+            self.f = filename
+            self.header = filename.header
+        else:
+            self.filename = filename
+            self.f = open(filename)
+            self.header = ''
+        if has_header and self.f is not filename:
             while True:
                 cur = self.f.tell()
                 line = self.f.readline()
@@ -435,75 +445,383 @@ class BLASRSAMRecord(SAMRecord):
             
             
 class GMAPSAMReader(SAMReader):
+    """
+    Reader of GMAP SAM, yields lazily parsed GMAPSAMRecord.
+
+    Optional pre-filter, evaluated on the raw line before a record is made:
+    mapped_only --- skip unmapped records
+    min_coverage --- skip records with query coverage below (needs query_len_dict)
+    min_identity --- skip records with identity below (or without NM:i:)
+    The number of skipped records is kept in .num_filtered.
+    """
+    def __init__(self, filename, has_header, ref_len_dict=None, query_len_dict=None,
+                 mapped_only=False, min_coverage=None, min_identity=None):
+        SAMReader.__init__(self, filename, has_header, ref_len_dict, query_len_dict)
+        if min_coverage is not None and query_len_dict is None:
+            raise ValueError("min_coverage requires query_len_dict!")
+        self.mapped_only = mapped_only or min_coverage is not None or min_identity is not None
+        self.min_coverage = min_coverage
+        self.min_identity = min_identity
+        self.num_filtered = 0
+
     def next(self):
         while True:
             line = self.f.readline().strip()
             if len(line) == 0:
                 raise StopIteration
-            if not line.startswith('@'): # header can occur at file end if the SAM was sorted
-                break
-        return GMAPSAMRecord(line, self.ref_len_dict, self.query_len_dict)
-    
-class GMAPSAMRecord(SAMRecord):
-    def process(self, record_line, ref_len_dict=None, query_len_dict=None):
-        """
-        SAM files from pbalign.py have following optional fields:
-            XS: 1-based qStart, XE: 1-based qEnd, XQ: query length, NM: number of non-matches
-    
-        0. qID
-        1. flag
-        2. sID
-        3. 1-based offset sStart
-        4. mapping quality (ignore)
-        5. cigar
-        6. name of ref of mate alignment (ignore)
-        7. 1-based offset sStart of mate (ignore)
-        8. inferred fragment length (ignore)
-        9. sequence (ignore)
-        10. read qual (ignore)
-        11. optional fields
-        """
-        raw = record_line.split('\t')
-        self.qID = raw[0]
-        self.sID = raw[2]
-        if self.sID == '*': # means no match! STOP here
-            return
-        self.sStart = int(raw[3]) - 1
-        self.cigar = raw[5]
-        self.segments = self.parse_cigar(self.cigar, self.sStart)
-        self.sEnd = self.segments[-1].end
-        self.flag = SAMRecord.parse_sam_flag(int(raw[1])) # strand can be overwritten by XS:A flag
-        self._flag_strand = self.flag.strand # serve as backup for debugging
-        # In Yuan Li's BLASR-to-SAM, XQ:i:<subread length>
-        # see https://github.com/PacificBiosciences/blasr/blob/master/common/datastructures/alignmentset/SAMAlignment.h
-        for x in raw[11:]:
-            if x.startswith('NM:i:'): # number of non-matches
-                self.num_nonmatches = int(x[5:])
-                self.identity = 1. - (self.num_nonmatches * 1. / (self.num_del + self.num_ins + self.num_mat_or_sub))
-            elif x.startswith('XS:A:'): # strand ifnormation
-                _s = x[5:]
-                if _s!='?':
-                    self._flag_strand = self.flag.strand # serve as backup for debugging
-                    self.flag = SAMRecord.SAMflag(self.flag.is_paired, _s, self.flag.PE_read_num)
+            if line.startswith('@'): # header can occur at file end if the SAM was sorted
+                continue
+            if self.mapped_only and not gmap_line_passes(line, self.query_len_dict, self.min_coverage, self.min_identity):
+                self.num_filtered += 1
+                continue
+            return GMAPSAMRecord(line, self.ref_len_dict, self.query_len_dict)
+
+
+# number of fixed SAM columns, optional fields start after the last one
+DEF NUM_COLS = 11
+# indices into the cigar stats of _scan_cigar
+DEF CLIP5 = 0
+DEF QALN = 1
+DEF INS = 2
+DEF DEL = 3
+DEF MAT = 4
+
+cdef int _find_tabs(char* c, Py_ssize_t n, Py_ssize_t* ends):
+    """
+    Set ends[i] to the end offset of fixed column i (i < NUM_COLS),
+    return the number of columns found.
+    """
+    cdef Py_ssize_t i
+    cdef int k = 0
+    for i in range(n):
+        if c[i] == 9: # tab
+            ends[k] = i
+            k += 1
+            if k == NUM_COLS:
+                return k
+    ends[k] = n
+    return k + 1
+
+
+cdef inline Py_ssize_t _col_start(Py_ssize_t* ends, int i):
+    """Return the start offset of column i."""
+    return 0 if i == 0 else ends[i-1] + 1
+
+
+cdef long _atol(char* c, Py_ssize_t start, Py_ssize_t end):
+    """Return the non-negative integer in c[start:end]."""
+    cdef long v = 0
+    cdef Py_ssize_t i
+    for i in range(start, end):
+        v = v * 10 + (c[i] - 48)
+    return v
+
+
+cdef long _scan_cigar(char* c, Py_ssize_t start, Py_ssize_t end, long sStart, long* stats,
+                      object exon_starts, object exon_ends):
+    """
+    Scan CIGAR c[start:end] (see SAMRecord.parse_cigar), fill in stats
+    (CLIP5, QALN, INS, DEL, MAT) and, if exon_starts/exon_ends (array('l'))
+    are given, append the genomic segments to them. Return the end of the
+    last segment.
+    """
+    cdef Py_ssize_t i
+    cdef long num = 0, cur_start = sStart, cur_end = sStart
+    cdef bint first_thing = True
+    cdef char t
+    stats[CLIP5] = stats[QALN] = stats[INS] = stats[DEL] = stats[MAT] = 0
+    for i in range(start, end):
+        t = c[i]
+        if 48 <= t <= 57:
+            num = num * 10 + (t - 48)
+            continue
+        if t == 72 or t == 83: # H, S
+            if first_thing:
+                stats[CLIP5] += num
+        elif t == 73: # I
+            stats[QALN] += num
+            stats[INS] += num
+        elif t == 77: # M
+            cur_end += num
+            stats[QALN] += num
+            stats[MAT] += num
+        elif t == 68: # D
+            cur_end += num
+            stats[DEL] += num
+        elif t == 78: # N, junction, make a new segment
+            if exon_starts is not None:
+                exon_starts.append(cur_start)
+                exon_ends.append(cur_end)
+            cur_start = cur_end + num
+            cur_end = cur_start
+        first_thing = False
+        num = 0
+    if cur_start != cur_end and exon_starts is not None:
+        exon_starts.append(cur_start)
+        exon_ends.append(cur_end)
+    return cur_end
+
+
+cdef long _find_tag(char* c, Py_ssize_t start, Py_ssize_t n, char t0, char t1, char typ):
+    """Return the offset of the value of optional field <t0><t1>:<typ>: in c[start:n], or -1."""
+    cdef Py_ssize_t i = start
+    while i + 5 <= n:
+        if c[i] == t0 and c[i+1] == t1 and c[i+2] == 58 and c[i+3] == typ and c[i+4] == 58:
+            return i + 5
+        while i < n and c[i] != 9:
+            i += 1
+        i += 1
+    return -1
+
+
+cdef Py_ssize_t _tag_end(char* c, Py_ssize_t k, Py_ssize_t n):
+    """Return the end offset of the optional field value starting at k."""
+    while k < n and c[k] != 9:
+        k += 1
+    return k
+
+
+def _query_len(query_len_dict, qID):
+    """Return query_len_dict[qID], or that of qID without the blasr /<start>_<end> suffix."""
+    try:
+        return query_len_dict[qID]
+    except KeyError: # HACK for blasr's extended qID
+        k = qID.rfind('/')
+        if k >= 0:
+            return query_len_dict[qID[:k]]
+        else:
+            return query_len_dict[qID]
 
-        if ref_len_dict is not None:
-            self.sCoverage = (self.sEnd - self.sStart) * 1. / ref_len_dict[self.sID]
-            self.sLen = ref_len_dict[self.sID]
 
-        if self.flag.strand == '-' and self.qLen is not None:
-            self.qStart, self.qEnd = self.qLen - self.qEnd, self.qLen - self.qStart
+def gmap_line_passes(bytes line, query_len_dict=None, min_coverage=None, min_identity=None):
+    """
+    Return True if the GMAP SAM line is mapped, and has query coverage
+    >= min_coverage and identity >= min_identity (if given), computed
+    like GMAPSAMRecord but without making one.
+    """
+    cdef char* c = line
+    cdef Py_ssize_t n = len(line)
+    cdef Py_ssize_t ends[NUM_COLS + 1]
+    cdef long stats[5]
+    cdef long k
+    if _find_tabs(c, n, ends) < NUM_COLS or (c[_col_start(ends, 2)] == 42 and ends[2] - _col_start(ends, 2) == 1): # '*'
+        return False
+    if min_coverage is None and min_identity is None:
+        return True
+    _scan_cigar(c, _col_start(ends, 5), ends[5], 0, stats, None, None)
+    if min_identity is not None:
+        k = _find_tag(c, ends[NUM_COLS-1] + 1, n, 78, 77, 105) # NM:i:
+        if k < 0 or 1. - (_atol(c, k, _tag_end(c, k, n)) * 1. / (stats[DEL] + stats[INS] + stats[MAT])) < min_identity:
+            return False
+    if min_coverage is not None:
+        if stats[QALN] * 1. / _query_len(query_len_dict, line[:ends[0]]) < min_coverage:
+            return False
+    return True
+
+
+cdef class GMAPSAMRecord:
+    """
+    GMAP SAM record, with the same attributes as SAMRecord, parsed lazily:
+    the fixed columns are decoded when first accessed, and the CIGAR is
+    scanned once into typed arrays (exon_starts, exon_ends, array('l')) only
+    when segments or any of the derived alignment stats is needed.
+    The strand of flag is overwritten by the XS:A field, if any.
+    qStart/qEnd are not flipped for '-' strand since GMAP SAM has no XQ field.
+    """
+    cdef readonly bytes record_line
+    cdef object ref_len_dict, query_len_dict
+    cdef Py_ssize_t ends[NUM_COLS + 1]
+    cdef int num_cols
+    cdef bint cigar_scanned
+    cdef long stats[5]
+    cdef object _segments, _exon_starts, _exon_ends, _flag, _qLen
+    cdef object _qID, _sID
+
+    def __init__(self, bytes record_line, ref_len_dict=None, query_len_dict=None):
+        self.record_line = record_line
+        self.ref_len_dict = ref_len_dict
+        self.query_len_dict = query_len_dict
+        self.num_cols = _find_tabs(record_line, len(record_line), self.ends)
+        self.cigar_scanned = False
+
+    cdef bytes _col(self, int i):
+        return self.record_line[_col_start(self.ends, i):self.ends[i]]
+
+    cdef bint _mapped(self):
+        return self.num_cols >= NUM_COLS and self.sID != '*'
+
+    cdef _scan(self):
+        cdef char* c = self.record_line
+        if not self.cigar_scanned:
+            self._exon_starts, self._exon_ends = array('l'), array('l')
+            _scan_cigar(c, _col_start(self.ends, 5), self.ends[5], self.sStart,
+                                     self.stats, self._exon_starts, self._exon_ends)
+            self.cigar_scanned = True
+
+    cdef long _tag(self, char t0, char t1, char typ):
+        cdef char* c = self.record_line
+        if self.num_cols < NUM_COLS:
+            return -1
+        return _find_tag(c, self.ends[NUM_COLS-1] + 1, len(self.record_line), t0, t1, typ)
+
+    property qID:
+        def __get__(self):
+            if self._qID is None:
+                self._qID = self._col(0)
+            return self._qID
+
+    property sID:
+        def __get__(self):
+            if self._sID is None:
+                self._sID = self._col(2)
+            return self._sID
+
+    property sStart:
+        def __get__(self):
+            if not self._mapped(): return None
+            return _atol(self.record_line, _col_start(self.ends, 3), self.ends[3]) - 1
+
+    property cigar:
+        def __get__(self):
+            return self._col(5) if self._mapped() else None
+
+    property exon_starts:
+        def __get__(self):
+            if not self._mapped(): return None
+            self._scan()
+            return self._exon_starts
+
+    property exon_ends:
+        def __get__(self):
+            if not self._mapped(): return None
+            self._scan()
+            return self._exon_ends
+
+    property segments:
+        def __get__(self):
+            if not self._mapped(): return None
+            if self._segments is None:
+                self._scan()
+                self._segments = [Interval(s, e) for s, e in zip(self._exon_starts, self._exon_ends)]
+            return self._segments
+
+    property sEnd:
+        def __get__(self):
+            if not self._mapped(): return None
+            self._scan()
+            return self._exon_ends[-1]
+
+    property qStart:
+        def __get__(self):
+            if not self._mapped(): return 0
+            self._scan()
+            return self.stats[CLIP5]
+
+    property qEnd:
+        def __get__(self):
+            if not self._mapped(): return None
+            self._scan()
+            return self.stats[CLIP5] + self.stats[QALN]
+
+    property num_ins:
+        def __get__(self):
+            if not self._mapped(): return None
+            self._scan()
+            return self.stats[INS]
+
+    property num_del:
+        def __get__(self):
+            if not self._mapped(): return None
+            self._scan()
+            return self.stats[DEL]
+
+    property num_mat_or_sub:
+        def __get__(self):
+            if not self._mapped(): return None
+            self._scan()
+            return self.stats[MAT]
+
+    property _flag_strand:
+        def __get__(self):
+            if not self._mapped(): return None
+            return SAMRecord.parse_sam_flag(_atol(self.record_line, _col_start(self.ends, 1), self.ends[1])).strand
+
+    property flag:
+        def __get__(self):
+            cdef long k
+            if not self._mapped(): return None
+            if self._flag is None:
+                self._flag = SAMRecord.parse_sam_flag(_atol(self.record_line, _col_start(self.ends, 1), self.ends[1]))
+                k = self._tag(88, 83, 65) # XS:A:, strand information
+                if k >= 0 and k < len(self.record_line) and self.record_line[k:k+1] != '?':
+                    self._flag = SAMRecord.SAMflag(self._flag.is_paired, self.record_line[k:k+1], self._flag.PE_read_num)
+            return self._flag
+
+    property num_nonmatches:
+        def __get__(self):
+            cdef long k
+            if not self._mapped(): return None
+            k = self._tag(78, 77, 105) # NM:i:
+            if k < 0: return None
+            return _atol(self.record_line, k, _tag_end(self.record_line, k, len(self.record_line)))
+
+    property identity:
+        def __get__(self):
+            nm = self.num_nonmatches
+            if nm is None: return None
+            self._scan()
+            return 1. - (nm * 1. / (self.stats[DEL] + self.stats[INS] + self.stats[MAT]))
+
+    property sLen:
+        def __get__(self):
+            if not self._mapped() or self.ref_len_dict is None: return None
+            return self.ref_len_dict[self.sID]
+
+    property sCoverage:
+        def __get__(self):
+            if not self._mapped() or self.ref_len_dict is None: return None
+            return (self.sEnd - self.sStart) * 1. / self.sLen
+
+    property qLen:
+        def __get__(self):
+            if not self._mapped() or self.query_len_dict is None: return None
+            if self._qLen is None:
+                self._qLen = _query_len(self.query_len_dict, self.qID)
+            return self._qLen
+
+    property qCoverage:
+        def __get__(self):
+            if not self._mapped() or self.query_len_dict is None: return None
+            self._scan()
+            return self.stats[QALN] * 1. / self.qLen
 
-        if self.qLen is not None:
-            self.qCoverage = (self.qEnd - self.qStart) * 1. / self.qLen
-           
-        if query_len_dict is not None: # over write qLen and qCoverage, should be done LAST
-            try:
-                self.qLen = query_len_dict[self.qID]
-            except KeyError: # HACK for blasr's extended qID
-                k = self.qID.rfind('/')
-                if k >= 0:
-                    self.qLen = query_len_dict[self.qID[:self.qID.rfind('/')]]
-                else:
-                    self.qLen = query_len_dict[self.qID]
-            self.qCoverage = (self.qEnd - self.qStart) * 1. / self.qLen    
-                
+    def __str__(self):
+        return """
+        qID: {q}
+        sID: {s}
+        cigar: {c}
+        sStart-sEnd: {ss}-{se}
+        qStart-qEnd: {qs}-{qe}
+        segments: {seg}
+        flag: {f}
+
+        coverage (of query): {qcov}
+        coverage (of subject): {scov}
+        alignment identity: {iden}
+        """.format(q=self.qID, s=self.sID, seg=self.segments, c=self.cigar, f=self.flag,\
+            ss=self.sStart, se=self.sEnd, qs=self.qStart, qe=self.qEnd, iden=self.identity,\
+            qcov=self.qCoverage, scov=self.sCoverage)
+
+    def __richcmp__(self, other, int op):
+        if op != 2 and op != 3:
+            return NotImplemented
+        eq = self.qID == other.qID and self.sID == other.sID and\
+             self.sStart == other.sStart and self.sEnd == other.sEnd and\
+             self.segments == other.segments and self.qCoverage == other.qCoverage and\
+             self.sCoverage == other.sCoverage and self.qLen == other.qLen and\
+             self.sLen == other.sLen and self.qStart == other.qStart and\
+             self.cigar == other.cigar and self.flag == other.flag and self.identity == other.identity
+        return eq if op == 2 else not eq
+
+    def __hash__(self):
+        return id(self)
@@ -0,0 +1,287 @@
+"""
+Compiled parsing of GFF files, used by GFF.collapseGFFReader,
+GFF.gmapGFFReader and GFF.GTF.
+
+ex of collapsed GFF:
+chr1    PacBio  transcript      897326  901092  .       +       .       gene_id "PB.1"; transcript_id "PB.1.1";
+chr1    PacBio  exon    897326  897427  .       +       .       gene_id "PB.1"; transcript_id "PB.1.1";
+"""
+import sys
+import numpy as np
+from array import array
+from bx.intervals.intersection import Interval
+
+
+class collapseGFFRecord(object):
+    """
+    Lightweight record of a transcript in a collapsed GFF, with the same
+    fields as GFF.gmapRecord but stored in __slots__; start (0-based) and
+    end (1-based) are plain ints instead of __getattr__ lookups.
+    For collapsed GFF, seq_exons is the same list as ref_exons.
+    """
+    __slots__ = ('chr', 'strand', 'seqid', 'start', 'end', 'coverage',
+                 'identity', 'ref_exons', 'seq_exons', 'scores', 'segments')
+
+    def __init__(self, chr, strand, seqid):
+        self.chr = chr
+        self.strand = strand
+        self.seqid = seqid
+        self.start = -1
+        self.end = -1
+        self.coverage = None
+        self.identity = None
+        self.ref_exons = []
+        self.seq_exons = self.ref_exons
+        self.scores = []
+        self.segments = None
+
+    def __str__(self):
+        return """
+        chr: {0}
+        strand: {1}
+        coverage: {2}
+        identity: {3}
+        seqid: {4}
+        ref exons: {5}
+        seq exons: {6}
+        scores: {7}
+        """.format(self.chr, self.strand, self.coverage, self.identity, self.seqid, self.ref_exons, self.seq_exons, self.scores)
+
+    @property
+    def rstart(self): return self.start
+
+    @property
+    def rend(self): return self.end
+
+    def get_start(self): return self.start
+
+    def get_end(self): return self.end
+
+    def add_exon(self, rStart0, rEnd1, sStart0=None, sEnd1=None, rstrand='+', score=None):
+        """Append an exon, exons must be added in order."""
+        assert rStart0 < rEnd1
+        assert len(self.ref_exons) == 0 or self.end <= rStart0
+        if len(self.ref_exons) == 0:
+            self.start = rStart0
+        self.end = rEnd1
+        self.scores.append(score)
+        self.ref_exons.append(Interval(rStart0, rEnd1))
+
+
+cdef str parse_transcript_id(str blurb):
+    """Return <tid> from 'gene_id "PB.1"; transcript_id "<tid>";'"""
+    cdef Py_ssize_t i = blurb.find('transcript_id')
+    if i < 0:
+        return None
+    i = blurb.find('"', i) + 1
+    return blurb[i:blurb.find('"', i)]
+
+
+def iter_collapse_gff(f):
+    """Yield collapseGFFRecord of each transcript in open collapsed GFF file f."""
+    cdef str line
+    cdef list raw
+    cdef long s, e
+    rec = None
+    for line in f:
+        raw = line.strip().split('\t')
+        if len(raw) < 9:
+            continue
+        if raw[2] == 'transcript':
+            if rec is not None:
+                yield rec
+            rec = collapseGFFRecord(raw[0], raw[6], parse_transcript_id(raw[8]))
+        elif raw[2] == 'exon':
+            s, e = int(raw[3]) - 1, int(raw[4])
+            assert s < e
+            if len(rec.ref_exons) == 0:
+                rec.start = s
+            else:
+                assert rec.end <= s
+            rec.end = e
+            rec.scores.append(None)
+            rec.ref_exons.append(Interval(s, e))
+        else:
+            raise ValueError("Unexpected feature {0} in collapsed GFF!".format(raw[2]))
+    if rec is not None:
+        yield rec
+
+
+def load_collapse_gff(filename):
+    """
+    Bulk-load a collapsed GFF into columns, return a dict of numpy arrays:
+    seqid, chr, strand --- (n,) arrays of str
+    start, end --- (n,) int64, 0-based start, 1-based end of transcripts
+    exon_offsets --- (n+1,) int64, exons of the i-th transcript are
+        exon_start[exon_offsets[i]:exon_offsets[i+1]] and likewise exon_end
+    exon_start, exon_end --- (total number of exons,) int64
+    """
+    cdef str line
+    cdef list raw
+    cdef list seqids = [], chrs = [], strands = []
+    starts, ends = array('l'), array('l')
+    offsets = array('l', [0])
+    exon_starts, exon_ends = array('l'), array('l')
+    cdef long n_exons = 0
+    with open(filename) as f:
+        for line in f:
+            raw = line.strip().split('\t')
+            if len(raw) < 9:
+                continue
+            if raw[2] == 'transcript':
+                if len(seqids) > 0:
+                    offsets.append(n_exons)
+                seqids.append(parse_transcript_id(raw[8]))
+                chrs.append(raw[0])
+                strands.append(raw[6])
+                starts.append(int(raw[3]) - 1)
+                ends.append(int(raw[4]))
+            elif raw[2] == 'exon':
+                exon_starts.append(int(raw[3]) - 1)
+                exon_ends.append(int(raw[4]))
+                n_exons += 1
+            else:
+                raise ValueError("Unexpected feature {0} in collapsed GFF!".format(raw[2]))
+    if len(seqids) > 0:
+        offsets.append(n_exons)
+    return {'seqid': np.array(seqids, dtype=object),
+            'chr': np.array(chrs, dtype=object),
+            'strand': np.array(strands, dtype=object),
+            'start': np.array(starts, dtype=np.int64),
+            'end': np.array(ends, dtype=np.int64),
+            'exon_offsets': np.array(offsets, dtype=np.int64),
+            'exon_start': np.array(exon_starts, dtype=np.int64),
+            'exon_end': np.array(exon_ends, dtype=np.int64)}
+
+
+cdef tuple parse_target(str blurb):
+    """
+    Return (sStart1, sEnd1, sStrand) from 'Target=<seqid> <s> <e> <strand>'
+    in the attributes of a GMAP GFF line, or None if there is no Target.
+    """
+    cdef str blob
+    cdef list t
+    for blob in blurb.split(';'):
+        if blob.startswith('Target='):
+            t = blob.split()
+            return int(t[1]), int(t[2]), t[3]
+    return None
+
+
+def iter_gmap_gff(f, record_class):
+    """
+    Yield a record_class(chr, coverage, identity, strand, seqid), which is
+    GFF.gmapRecord, for each alignment in open GMAP GFF file f. Lines are
+    read with f.readline(), so f.tell() stays at the end of the last
+    alignment. Alignments are delimited by '###' lines:
+    gene, mRNA (coverage=, identity=, Name=), then exon and CDS lines.
+    """
+    cdef str line, blob, feature, rstrand
+    cdef list raw
+    cdef long rstart1, rend1
+    cdef long sstart1 = 0, send1 = 0
+    cdef tuple target
+    while True:
+        line = f.readline()
+        if len(line) == 0:
+            return
+        raw = line.strip().split('\t')
+        while raw[0].startswith('#'):
+            line = f.readline()
+            if len(line) == 0:
+                return
+            raw = line.strip().split('\t')
+
+        assert raw[2] == 'gene'
+        raw = f.readline().strip().split('\t')
+        assert raw[2] == 'mRNA'
+        coverage, identity, seqid = None, None, None
+        for blob in raw[8].split(';'):
+            if blob.startswith('coverage='): coverage = float(blob[9:])
+            elif blob.startswith('identity='): identity = float(blob[9:])
+            elif blob.startswith('Name='): seqid = blob[5:]
+        rec = record_class(raw[0], coverage, identity, raw[6], seqid)
+
+        cds_exons = []
+        cds_seq_start = None
+        cds_seq_end = None
+        while True:
+            line = f.readline().strip()
+            if line.startswith('###'):
+                rec.cds_exons = cds_exons
+                rec.cds_seq_start = cds_seq_start
+                rec.cds_seq_end = cds_seq_end
+                break
+            raw = line.split('\t')
+            feature = raw[2]
+            if feature == 'exon':
+                rstart1, rend1 = int(raw[3]), int(raw[4])
+                score = float(raw[5])
+                rstrand = raw[6] # this is the strand on the reference genome
+                target = parse_target(raw[8])
+                if target is not None:
+                    # sstrand is the strand on the query sequence
+                    sstart1, send1, rec.sstrand = target
+                try:
+                    rec.add_exon(rstart1-1, rend1, sstart1-1, send1, rstrand, score)
+                except AssertionError:
+                    print >> sys.stderr, "{0} has non-colinear exons!".format(rec.seqid)
+                    while not f.readline().strip().startswith('###'):
+                        pass
+                    break
+                rec.strand = rstrand
+            elif feature == 'CDS':
+                cds_exons.append(Interval(int(raw[3])-1, int(raw[4])))
+                target = parse_target(raw[8])
+                if target is not None:
+                    cds_seq_start = target[0]-1 if cds_seq_start is None else cds_seq_start
+                    cds_seq_end = target[1]
+            else:
+                raise Exception, "Not supposed to see type {0} here!!".format(feature)
+        yield rec
+
+
+def read_gtf(filename, genome, transcript, exon, transcript_info):
+    """
+    Read a GTF file into the dicts of GFF.GTF:
+    genome --- chr --> IntervalTree of (0-start, 1-end, transcript ID)
+    transcript --- tID --> IntervalTree of (0-start, 1-end, {'ith', 'chr'})
+    exon --- (0-start, 1-end) --> list of (tID, ith exon, chr)
+    transcript_info --- tID --> {'chr', 'gname', 'gid', 'type', 'status',
+                                 'strand', 'tags'}
+    """
+    cdef str line, chr, feature, strand, stuff, _a, _b
+    cdef list raw, gtags
+    cdef long start0, end1
+    cdef int ith = 0
+    tID, gID = None, None
+    with open(filename) as f:
+        for line in f:
+            if line.startswith('#'): continue # header section, ignore
+            line = line.strip()
+            if len(line) == 0: continue # some gtf files have blank lines
+            raw = line.split('\t')
+            chr = raw[0]
+            feature = raw[2]
+            strand = raw[6]
+            start0, end1 = int(raw[3])-1, int(raw[4])
+            gtype, gstat = 'NA', 'NA'
+            gName = 'NA'
+            gtags = []
+            for stuff in raw[8].split('; '):
+                _a, _b = stuff.split(None, 1)
+                if _a == "transcript_id": tID = _b[1:-1] # removing quotes ""
+                elif _a == 'gene_name': gName = _b[1:-1]
+                elif _a == "gene_id": gID = _b[1:-1] # removing quotes ""
+                elif _a == "gene_type": gtype = _b[1:-1]
+                elif _a == "gene_status": gstat = _b[1:-1]
+                elif _a == 'tag': gtags.append(_b[1:-1])
+
+            if feature == 'transcript':
+                genome[chr].insert(start0, end1, tID)
+                transcript_info[tID] = {'chr':chr, 'gname':gName, 'gid':gID, 'type': gtype, 'status': gstat, 'strand': strand, 'tags': gtags}
+                ith = 0
+            elif feature == 'exon':
+                transcript[tID].insert(start0, end1, {'ith':ith,'chr':chr})
+                exon[(start0,end1)].append((tID, ith, chr))
+                ith += 1
@@ -0,0 +1,165 @@
+"""
+Compiled local alignment of a primer against many short read windows
+(the first/last primer_search_window bases of reads), used by
+PrimerScanner instead of phmmer.
+
+Windows of a batch of reads are packed into one uint8 matrix (one row per
+window, padded with N), so that a primer is aligned to all of them in a
+single call without per-read Python overhead. Each alignment fills a
+Smith-Waterman matrix one cell at a time, which is cheap because primers
+and windows are short. Given the number of gaps an alignment may have and
+still be reported, cells which such an alignment (starting within the
+first max_start + 1 bases of a window) can not reach are skipped, so that
+only a band of the matrix is filled.
+"""
+import numpy as np
+cimport numpy as np
+cimport cython
+
+# A, C, G, T --> 0, 1, 2, 3; anything else (N, padding) --> 4
+BASE_CODES = np.empty(256, dtype=np.uint8)
+BASE_CODES.fill(4)
+for _i, _b in enumerate("ACGT"):
+    BASE_CODES[ord(_b)] = _i
+    BASE_CODES[ord(_b.lower())] = _i
+
+
+def encode_seqs(seqs, int width):
+    """
+    Return (codes, lens): a len(seqs) x width uint8 matrix of base codes
+    of seqs (truncated to width, padded with N), and their lengths.
+    """
+    cdef int n = len(seqs)
+    codes = np.empty((n, width), dtype=np.uint8)
+    codes.fill(4)
+    lens = np.zeros(n, dtype=np.int32)
+    for i, seq in enumerate(seqs):
+        seq = seq[:width]
+        if len(seq) > 0:
+            codes[i, :len(seq)] = BASE_CODES[np.frombuffer(seq, dtype=np.uint8)]
+        lens[i] = len(seq)
+    return codes, lens
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def scan_windows(np.ndarray[np.uint8_t, ndim=2] windows,
+                 np.ndarray[np.int32_t, ndim=1] lens,
+                 np.ndarray[np.uint8_t, ndim=1] primer,
+                 double match, double mismatch, double gap, int max_start,
+                 int max_gaps=-1):
+    """
+    Locally align primer to each row of windows (plain Smith-Waterman
+    with linear gap penalty), where alignments may only start within the
+    first max_start + 1 bases of a window.
+    If max_gaps >= 0, only alignments with at most max_gaps gaps are
+    guaranteed to be found: row i of the matrix is only filled up to
+    window position i + max_start + max_gaps. An alignment which scores
+    at least S has at most (len(primer) * match - S) / gap gaps, so with
+    this max_gaps all alignments scoring at least S are found as with
+    the full matrix. If max_gaps < 0, all len(primer) x lens[r] cells
+    are filled.
+    Return arrays (score, sStart, sEnd, pStart, pEnd) of the best alignment
+    of each window, starts are 0-based and ends are exclusive. Windows
+    without a positive scoring alignment have score 0.
+    """
+    cdef int n = windows.shape[0]
+    cdef int width = windows.shape[1]
+    cdef int m = primer.shape[0]
+    cdef int r, i, j, L, jmax
+    cdef int diag_s, diag_p, up_s, up_p, hs, hp
+    cdef int best_ss, best_se, best_ps, best_pe
+    cdef double diag, up, h, s, best
+    cdef unsigned char p
+    cdef np.ndarray[np.double_t, ndim=1] H = np.zeros(width + 1, dtype=np.double)
+    cdef np.ndarray[np.int32_t, ndim=1] HS = np.zeros(width + 1, dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1] HP = np.zeros(width + 1, dtype=np.int32)
+
+    cdef np.ndarray[np.double_t, ndim=1] score = np.zeros(n, dtype=np.double)
+    cdef np.ndarray[np.int32_t, ndim=1] sStart = np.zeros(n, dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1] sEnd = np.zeros(n, dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1] pStart = np.zeros(n, dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1] pEnd = np.zeros(n, dtype=np.int32)
+
+    for r in range(n):
+        L = lens[r]
+        best, best_ss, best_se, best_ps, best_pe = 0, 0, 0, 0, 0
+        # H[j], HS[j], HP[j]: score, read start and primer start of the
+        # best alignment ending at (i, j); 0 means no alignment
+        for j in range(L + 1):
+            H[j] = 0
+        for i in range(1, m + 1):
+            p = primer[i - 1]
+            diag, diag_s, diag_p = 0, 0, 0
+            # cells right of the band are never filled and stay 0
+            jmax = L if max_gaps < 0 else min(L, i + max_start + max_gaps)
+            for j in range(1, jmax + 1):
+                up, up_s, up_p = H[j], HS[j], HP[j]
+                s = match if (p == windows[r, j - 1] and p < 4) else mismatch
+                h, hs, hp = 0, 0, 0
+                if diag > 0:
+                    h, hs, hp = diag + s, diag_s, diag_p
+                elif j - 1 <= max_start:
+                    h, hs, hp = s, j - 1, i - 1
+                # skip a primer base
+                if up - gap > h and up > 0:
+                    h, hs, hp = up - gap, up_s, up_p
+                # skip a read base
+                if H[j - 1] - gap > h and H[j - 1] > 0:
+                    h, hs, hp = H[j - 1] - gap, HS[j - 1], HP[j - 1]
+                if h < 0:
+                    h = 0
+                diag, diag_s, diag_p = up, up_s, up_p
+                H[j], HS[j], HP[j] = h, hs, hp
+                if h > best:
+                    best, best_ss, best_se, best_ps, best_pe = h, hs, j, hp, i
+        score[r] = best
+        sStart[r], sEnd[r], pStart[r], pEnd[r] = best_ss, best_se, best_ps, best_pe
+    return score, sStart, sEnd, pStart, pEnd
+
+
+def kmer_table(primers, int k):
+    """
+    Return a uint8 table of size 4^k, where table[x] is 1 if k-mer x
+    (2 bits per base, first base highest) is in any of primers
+    (base code arrays), otherwise 0.
+    """
+    table = np.zeros(1 << (2 * k), dtype=np.uint8)
+    for codes in primers:
+        for x in kmers(codes, len(codes), k)[1]:
+            table[x] = 1
+    return table
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def kmers(np.ndarray[np.uint8_t, ndim=1] codes, int L, int k):
+    """
+    Return (positions, values) of k-mers without N in codes[:L].
+    """
+    cdef int i, n = 0
+    cdef int since_n = 0
+    cdef long x = 0
+    cdef long mask = (1 << (2 * k)) - 1
+    cdef np.ndarray[np.int32_t, ndim=1] pos = np.zeros(max(L, 1), dtype=np.int32)
+    cdef np.ndarray[np.int64_t, ndim=1] val = np.zeros(max(L, 1), dtype=np.int64)
+    for i in range(L):
+        if codes[i] > 3:
+            since_n = 0
+            x = 0
+            continue
+        x = ((x << 2) | codes[i]) & mask
+        since_n += 1
+        if since_n >= k:
+            pos[n], val[n] = i - k + 1, x
+            n += 1
+    return pos[:n], val[:n]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def find_seeds(np.ndarray[np.uint8_t, ndim=1] codes, int L,
+               np.ndarray[np.uint8_t, ndim=1] table, int k):
+    """Return start positions of k-mers of codes[:L] in table."""
+    pos, val = kmers(codes, L, k)
+    return pos[table[val] > 0]
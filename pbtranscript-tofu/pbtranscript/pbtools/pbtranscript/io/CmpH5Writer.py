@@ -0,0 +1,429 @@
+#!/usr/bin/env python
+"""
+Write a sorted, pulse-loaded cmp.h5 file of SAM alignments in-process,
+replacing
+
+    samtoh5 bin.sam bin_ref.fa bin.cmp.h5 -smrtTitle
+    loadPulses bas.fofn bin.cmp.h5 -byread -metrics QualityValue,...
+    cmph5tools.py sort bin.cmp.h5
+    loadChemistry.py bas.fofn bin.cmp.h5
+
+with one pass over the alignments:
+
+    write_cmph5("bin.sam", "bin_ref.fa", bas_files, "bin.cmp.h5")
+
+Alignments of each reference are sorted by target start and written to
+one alignment group, /refNNNNNN/rg1-0, in reference (forward strand)
+orientation, together with the nBackRead and nReadOverlap indices of
+cmph5tools sort. Pulse features of aligned reads are read from bax.h5
+files with BasQV.read_qvs, i.e. in batches of hole numbers per movie,
+and chemistry information (binding kit, sequencing kit, basecaller
+version) of movies is copied from their bax.h5 files.
+
+Query names must be subread ids movie/holeNumber/start_end, where
+start and end are coordinates of the subread sequence in its ZMW read.
+"""
+
+import os
+import os.path as op
+import re
+import sys
+import logging
+from hashlib import md5
+import numpy as np
+import h5py
+from pbcore.io import FastaReader
+from pbcore.util.ToolRunner import PBToolRunner
+from pbtools.pbtranscript.__init__ import get_version
+from pbtools.pbtranscript.Utils import get_files_from_fofn
+from pbtools.pbtranscript.io.BasQV import BASECALLS, parse_seqid, \
+    bash5_parts, read_qvs, basQVcacher
+
+PULSE_METRICS = ["QualityValue", "InsertionQV", "MergeQV", "DeletionQV",
+                 "DeletionTag", "SubstitutionTag", "SubstitutionQV"]
+
+CMPH5_VERSION = "2.0.0"
+
+ALN_INDEX_COLUMNS = ["AlnID", "AlnGroupID", "MovieID", "RefGroupID",
+                     "tStart", "tEnd", "RCRefStrand", "HoleNumber",
+                     "SetNumber", "StrobeNumber", "MoleculeID",
+                     "rStart", "rEnd", "MapQV", "nM", "nMM", "nIns",
+                     "nDel", "Offset_begin", "Offset_end", "nBackRead",
+                     "nReadOverlap"]
+
+# 4-bit base codes of AlnArray, read base << 4 | reference base
+GAP = 0
+BASE_CODES = np.empty(256, dtype=np.uint8)
+BASE_CODES.fill(15)  # N
+for _base, _code in zip("-ACGTacgt", [GAP, 1, 2, 4, 8, 1, 2, 4, 8]):
+    BASE_CODES[ord(_base)] = _code
+
+# Complements of DeletionTag/SubstitutionTag bases, N and others unchanged
+COMPLEMENT = np.arange(256, dtype=np.uint8)
+for _base, _comp in zip("ACGTacgt", "TGCAtgca"):
+    COMPLEMENT[ord(_base)] = ord(_comp)
+
+# Values of pulse features at gaps of reads
+QV_GAP_VALUE = 255
+TAG_GAP_VALUE = ord('-')
+
+_CIGAR_RE = re.compile(r"(\d+)([MIDNSHP=X])")
+
+
+def _to_str(value):
+    """Return a str of an HDF5 string attribute."""
+    return value if isinstance(value, str) else value.decode("utf-8")
+
+
+class SamAlignment(object):
+
+    """An alignment of a subread to a reference, in cmp.h5 terms."""
+
+    def __init__(self, ref_name, movie, hn, t_start, t_end, rc, r_start,
+                 r_end, map_qv, aln_array):
+        self.ref_name = ref_name
+        self.movie = movie
+        self.hn = hn
+        self.t_start, self.t_end = t_start, t_end
+        self.rc = rc
+        self.r_start, self.r_end = r_start, r_end
+        self.map_qv = map_qv
+        self.aln_array = aln_array
+
+    @property
+    def feature_id(self):
+        """Read id of the aligned part of the subread, in alignment
+        orientation (i.e., end_start if the alignment is on '-')."""
+        s, e = (self.r_end, self.r_start) if self.rc else \
+               (self.r_start, self.r_end)
+        return "{m}/{hn}/{s}_{e}".format(m=self.movie, hn=self.hn, s=s, e=e)
+
+    @property
+    def read_mask(self):
+        """Return a mask of columns of aln_array with a read base."""
+        return (self.aln_array >> 4) != GAP
+
+    def counts(self):
+        """Return (nM, nMM, nIns, nDel) of this alignment."""
+        read, ref = self.aln_array >> 4, self.aln_array & 15
+        n_ins = int(np.count_nonzero(ref == GAP))
+        n_del = int(np.count_nonzero(read == GAP))
+        n_m = int(np.count_nonzero((read == ref) & (read != GAP)))
+        return n_m, len(self.aln_array) - n_m - n_ins - n_del, n_ins, n_del
+
+
+def sam_to_alignment(line, ref_seqs):
+    """
+    Convert a SAM alignment line to a SamAlignment, where ref_seqs is
+    {reference name: sequence}. Return None if the read is unmapped.
+    """
+    fields = line.rstrip('\n').split('\t')
+    qname, flag, rname, pos, map_qv, cigar, seq = \
+        fields[0], int(fields[1]), fields[2], int(fields[3]), \
+        int(fields[4]), fields[5], fields[9]
+    if flag & 0x4 or rname == '*':
+        return None
+    if seq == '*':
+        raise ValueError("Alignment of {q} has no query sequence.".
+                         format(q=qname))
+    movie, hn, s, _e, _strand, _is_CCS, _get_all = parse_seqid(qname)
+    ref_seq = ref_seqs[rname]
+
+    ops = [(int(n), op) for n, op in _CIGAR_RE.findall(cigar)]
+    clip_5 = clip_3 = 0  # clipped query bases before|after the alignment
+    read_aln, ref_aln = [], []
+    q, t = 0, pos - 1  # position in SEQ and in reference
+    for n, op in ops:
+        if op in "SH":
+            if len(read_aln) == 0:
+                clip_5 += n
+            else:
+                clip_3 += n
+            if op == 'S':
+                q += n
+        elif op in "M=X":
+            read_aln.append(seq[q:q + n])
+            ref_aln.append(ref_seq[t:t + n])
+            q, t = q + n, t + n
+        elif op == 'I':
+            read_aln.append(seq[q:q + n])
+            ref_aln.append('-' * n)
+            q += n
+        elif op in "DN":
+            read_aln.append('-' * n)
+            ref_aln.append(ref_seq[t:t + n])
+            t += n
+    read_aln, ref_aln = "".join(read_aln), "".join(ref_aln)
+    aln_array = (BASE_CODES[np.frombuffer(read_aln, dtype=np.uint8)] << 4) | \
+        BASE_CODES[np.frombuffer(ref_aln, dtype=np.uint8)]
+
+    rc = bool(flag & 0x10)
+    # SEQ of a reverse strand alignment is the reverse complement of the
+    # subread, so that its 3' clip is at the start of the subread.
+    aligned_len = len(read_aln) - read_aln.count('-')
+    r_start = s + (clip_3 if rc else clip_5)
+    return SamAlignment(ref_name=rname, movie=movie, hn=hn,
+                        t_start=pos - 1, t_end=t, rc=rc,
+                        r_start=r_start, r_end=r_start + aligned_len,
+                        map_qv=map_qv, aln_array=aln_array)
+
+
+def read_sam_alignments(sam_filename, ref_seqs):
+    """Yield SamAlignments of mapped reads of a SAM file."""
+    with open(sam_filename, 'r') as f:
+        for line in f:
+            if line.startswith('@') or len(line.strip()) == 0:
+                continue
+            aln = sam_to_alignment(line, ref_seqs)
+            if aln is not None:
+                yield aln
+
+
+def read_locator_indices(t_start, t_end):
+    """
+    Return (nBackRead, nReadOverlap) of alignments sorted by t_start,
+    as computed by cmph5tools sort: for alignment j, nBackRead is j - i
+    of the smallest i < j with t_end[i] > t_start[j] (or 0), and
+    nReadOverlap is the number of such i.
+
+    The smallest i is the first one where the running max of t_end
+    exceeds t_start[j]. Since t_end[i] > t_start[i] >= t_start[j] for
+    every i >= j, the i with t_end[i] <= t_start[j] are all before j,
+    and are counted by a search in the sorted t_end.
+    """
+    t_start = np.asarray(t_start, dtype=np.int64)
+    t_end = np.asarray(t_end, dtype=np.int64)
+    j = np.arange(len(t_start))
+    first = np.searchsorted(np.maximum.accumulate(t_end), t_start,
+                            side='right')
+    n_back = np.where(first < j, j - first, 0).astype(np.uint32)
+    n_overlap = (j - np.searchsorted(np.sort(t_end), t_start,
+                                     side='right')).astype(np.uint32)
+    return n_back, n_overlap
+
+
+def movie_info(bash5_filename):
+    """
+    Return (frame rate, binding kit, sequencing kit, basecaller version)
+    of the movie of a bas/bax.h5 file, like loadChemistry.py reads them.
+    """
+    with h5py.File(bash5_parts(bash5_filename)[0], 'r') as h5:
+        def attr(group, name, default):
+            """Return attribute name of group, or default."""
+            if group in h5 and name in h5[group].attrs:
+                return h5[group].attrs[name]
+            return default
+        return (float(attr("ScanData/AcqParams", "FrameRate", 75.0)),
+                _to_str(attr("ScanData/RunInfo", "BindingKit", "")),
+                _to_str(attr("ScanData/RunInfo", "SequencingKit", "")),
+                _to_str(attr(BASECALLS, "ChangeListID", "")))
+
+
+def available_metrics(bas_files, movies, metrics):
+    """Return pulse metrics in metrics which are in bax.h5 files of all
+    movies, where bas_files is {movie: [bas/bax.h5 files]}."""
+    available = list(metrics)
+    for movie in movies:
+        with h5py.File(bash5_parts(bas_files[movie][0])[0], 'r') as h5:
+            for metric in list(available):
+                if BASECALLS + "/" + metric not in h5:
+                    logging.warning("Pulse metric {m} is not in movie {mv}.".
+                                    format(m=metric, mv=movie))
+                    available.remove(metric)
+    return available
+
+
+def _string_dataset(group, name, values):
+    """Create a variable length string dataset."""
+    group.create_dataset(name, data=np.array(values, dtype=object),
+                         dtype=h5py.special_dtype(vlen=str))
+
+
+def write_cmph5(sam_filename, ref_filename, bas_files, out_filename,
+                metrics=PULSE_METRICS, cpus=1):
+    """
+    Write alignments of sam_filename against references in ref_filename
+    to a sorted cmp.h5 file out_filename, with pulse metrics of movies
+    in bas_files ({movie: [bas/bax.h5 files of movie]}), read by cpus
+    processes. The file is written to out_filename.tmp and renamed when
+    complete. Return the number of alignments written.
+    """
+    refs = []  # [(name, full name, sequence)]
+    with FastaReader(ref_filename) as reader:
+        for r in reader:
+            refs.append((r.name.split()[0], r.name, r.sequence.upper()))
+    ref_seqs = dict((name, seq) for (name, _fullname, seq) in refs)
+    ref_ids = dict((name, i + 1) for i, (name, _f, _s) in enumerate(refs))
+
+    alns = list(read_sam_alignments(sam_filename, ref_seqs))
+    alns.sort(key=lambda a: (ref_ids[a.ref_name], a.t_start, a.t_end))
+    movies = sorted(set(a.movie for a in alns))
+    movie_ids = dict((movie, i + 1) for i, movie in enumerate(movies))
+    for movie in movies:
+        if movie not in bas_files:
+            raise IOError("Could not find movie {m} in bas files.".
+                          format(m=movie))
+    metrics = available_metrics(bas_files, movies, metrics)
+    features = read_qvs(bas_files, set(a.feature_id for a in alns),
+                        metrics, cpus=cpus)
+
+    tmp_filename = out_filename + ".tmp"
+    with h5py.File(tmp_filename, 'w') as h5:
+        h5.attrs["Version"] = CMPH5_VERSION
+        h5.attrs["ReadType"] = "standard"
+        h5.attrs.create("Index", ["REF_ID", "TARGET_START", "TARGET_END"],
+                        dtype=h5py.special_dtype(vlen=str))
+
+        _string_dataset(h5, "RefInfo/FullName",
+                        [fullname for (_n, fullname, _s) in refs])
+        h5["RefInfo/ID"] = np.arange(1, len(refs) + 1, dtype=np.uint32)
+        h5["RefInfo/Length"] = np.array([len(seq) for (_n, _f, seq) in refs],
+                                        dtype=np.uint32)
+        _string_dataset(h5, "RefInfo/MD5",
+                        [md5(seq).hexdigest() for (_n, _f, seq) in refs])
+
+        infos = [movie_info(bas_files[movie][0]) for movie in movies]
+        h5["MovieInfo/ID"] = np.arange(1, len(movies) + 1, dtype=np.uint32)
+        _string_dataset(h5, "MovieInfo/Name", movies)
+        h5["MovieInfo/FrameRate"] = np.array([x[0] for x in infos],
+                                             dtype=np.float32)
+        for i, name in enumerate(["BindingKit", "SequencingKit",
+                                  "SoftwareVersion"]):
+            _string_dataset(h5, "MovieInfo/" + name, [x[i + 1] for x in infos])
+
+        # one reference group and one alignment group per aligned reference
+        index = np.zeros((len(alns), len(ALN_INDEX_COLUMNS)), dtype=np.uint32)
+        col = dict((name, i) for i, name in enumerate(ALN_INDEX_COLUMNS))
+        group_refs, offset_table, molecules = [], [], {}
+        begin = 0
+        while begin < len(alns):
+            ref_name = alns[begin].ref_name
+            end = begin
+            while end < len(alns) and alns[end].ref_name == ref_name:
+                end += 1
+            group_refs.append(ref_name)
+            group_id = len(group_refs)
+            offset_table.append((group_id, begin, end))
+
+            group_alns = alns[begin:end]
+            # alignments followed by a 0 (gap to gap) separator
+            offsets = np.zeros(len(group_alns) + 1, dtype=np.int64)
+            np.cumsum([len(a.aln_array) + 1 for a in group_alns],
+                      out=offsets[1:])
+            aln_array = np.zeros(offsets[-1], dtype=np.uint8)
+            for k, a in enumerate(group_alns):
+                aln_array[offsets[k]:offsets[k] + len(a.aln_array)] = \
+                    a.aln_array
+            path = "/ref{i:06d}/rg1-0".format(i=group_id)
+            h5[path + "/AlnArray"] = aln_array
+            for metric in metrics:
+                dtype = features[group_alns[0].feature_id][metric].dtype
+                data = np.empty(offsets[-1], dtype=dtype)
+                data.fill(TAG_GAP_VALUE if metric.endswith("Tag")
+                          else QV_GAP_VALUE)
+                for k, a in enumerate(group_alns):
+                    view = data[offsets[k]:offsets[k] + len(a.aln_array)]
+                    values = features[a.feature_id][metric]
+                    if a.rc and metric.endswith("Tag"):
+                        # loadPulses stores tags of '-' reads complemented
+                        values = COMPLEMENT[values]
+                    view[a.read_mask] = values
+                h5[path + "/" + metric] = data
+
+            t_start = np.array([a.t_start for a in group_alns], dtype=np.int64)
+            t_end = np.array([a.t_end for a in group_alns], dtype=np.int64)
+            n_back, n_overlap = read_locator_indices(t_start, t_end)
+            for k, a in enumerate(group_alns):
+                molecule = molecules.setdefault((a.movie, a.hn),
+                                                len(molecules) + 1)
+                row = index[begin + k]
+                row[col["AlnID"]] = begin + k + 1
+                row[col["AlnGroupID"]] = group_id
+                row[col["MovieID"]] = movie_ids[a.movie]
+                row[col["RefGroupID"]] = group_id
+                row[col["tStart"]], row[col["tEnd"]] = a.t_start, a.t_end
+                row[col["RCRefStrand"]] = int(a.rc)
+                row[col["HoleNumber"]] = a.hn
+                row[col["MoleculeID"]] = molecule
+                row[col["rStart"]], row[col["rEnd"]] = a.r_start, a.r_end
+                row[col["MapQV"]] = a.map_qv
+                row[col["nM"]:col["nDel"] + 1] = a.counts()
+                row[col["Offset_begin"]] = offsets[k]
+                row[col["Offset_end"]] = offsets[k] + len(a.aln_array)
+                row[col["nBackRead"]] = n_back[k]
+                row[col["nReadOverlap"]] = n_overlap[k]
+            begin = end
+
+        h5["AlnInfo/AlnIndex"] = index
+        group_ids = np.arange(1, len(group_refs) + 1, dtype=np.uint32)
+        h5["AlnGroup/ID"] = group_ids
+        _string_dataset(h5, "AlnGroup/Path",
+                        ["/ref{i:06d}/rg1-0".format(i=i) for i in group_ids])
+        h5["RefGroup/ID"] = group_ids
+        _string_dataset(h5, "RefGroup/Path",
+                        ["/ref{i:06d}".format(i=i) for i in group_ids])
+        h5["RefGroup/RefInfoID"] = np.array([ref_ids[name] for name in
+                                             group_refs], dtype=np.uint32)
+        h5["RefGroup/OffsetTable"] = np.array(offset_table, dtype=np.uint32). \
+            reshape((len(offset_table), 3))
+    os.rename(tmp_filename, out_filename)
+    return len(alns)
+
+
+class CmpH5WriterRunner(PBToolRunner):
+
+    """cmp.h5 writer runner."""
+
+    def __init__(self):
+        desc = "Convert sam alignments of subreads to a sorted cmp.h5 " + \
+               "file with pulse metrics and chemistry information."
+        PBToolRunner.__init__(self, desc)
+        self.parser.add_argument("in_sam", type=str, help="Input sam file.")
+        self.parser.add_argument("ref_fasta", type=str,
+                                 help="Reference fasta file.")
+        self.parser.add_argument("bas_fofn", type=str,
+                                 help="File of bas.h5/bax.h5 file names.")
+        self.parser.add_argument("out_cmph5", type=str,
+                                 help="Output cmp.h5 file.")
+        self.parser.add_argument("--metrics", type=str,
+                                 default=",".join(PULSE_METRICS),
+                                 help="Comma-separated pulse metrics to load.")
+        self.parser.add_argument("--cpus", type=int, default=1,
+                                 help="Number of processes reading bax.h5 files.")
+
+    def getVersion(self):
+        """Get version string."""
+        return get_version()
+
+    def run(self):
+        """Run"""
+        logging.info("Running {f} v{v}.".format(f=op.basename(__file__),
+                                                v=self.getVersion()))
+        try:
+            qver = basQVcacher()
+            for fn in get_files_from_fofn(self.args.bas_fofn):
+                qver.add_bash5(fn)
+            n = write_cmph5(sam_filename=self.args.in_sam,
+                            ref_filename=self.args.ref_fasta,
+                            bas_files=qver.bas_files,
+                            out_filename=self.args.out_cmph5,
+                            metrics=self.args.metrics.split(','),
+                            cpus=self.args.cpus)
+            logging.info("{n} alignments written to {f}.".
+                         format(n=n, f=self.args.out_cmph5))
+        except (ValueError, IOError, KeyError) as e:
+            logging.error(str(e))
+            import traceback
+            traceback.print_exc()
+            return 1
+        return 0
+
+
+def main():
+    """Main function"""
+    runner = CmpH5WriterRunner()
+    return runner.start()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,7 @@ smaller files each containing `reads_per_split` reads."""
 
 import os
 import os.path as op
-from pbcore.io import FastqReader, FastqWriter
+from pbtools.pbtranscript.io.SeqIndex import SeqFileIndex
 from pbtools.pbtranscript.Utils import mkdir
 
 
@@ -13,8 +13,12 @@ class FastqSplitter(object):
     """An object of `FastqSplitter` splits a fastq file into
     smaller chunks with a given prefix."""
 
-    def __init__(self, input_fastq, reads_per_split, out_dir, out_prefix):
+    def __init__(self, input_fastq, reads_per_split, out_dir, out_prefix,
+                 index=None):
         self.input_fastq = input_fastq
+        # SeqFileIndex of input_fastq, built by split() if None
+        self.index = index
+        self.num_reads = None  # Number of reads in input_fastq
         self.out_dir = out_dir
         self.reads_per_split = reads_per_split  # Number of reads per split
         self.out_prefix = out_prefix
@@ -44,25 +48,18 @@ class FastqSplitter(object):
 
     def split(self, first_split=None):
         """Split `input_fastq` into smaller files each containing
-        `reads_per_split` reads. Return splitted fastq."""
-        split_index = 0
+        `reads_per_split` reads, except that the first one contains
+        `first_split` reads if it is not None. Records are copied as
+        byte ranges of `input_fastq`. Return splitted fastq."""
+        if self.index is None:
+            self.index = SeqFileIndex(self.input_fastq, is_fq=True)
+        self.num_reads = len(self.index)
         self.out_fns = []
-        writer = FastqWriter(self._out_fn(split_index))
-        self.out_fns.append(self._out_fn(split_index))
-
-        if first_split is None:
-            first_split = self.reads_per_split
-        with FastqReader(self.input_fastq) as reader:
-            for ridx, r in enumerate(reader):
-                if ((split_index == 0 and ridx == first_split) or (split_index > 0 and ridx % self.reads_per_split == 0)) \
-                    and ridx != 0:
-                    split_index += 1
-                    writer.close()
-                    writer = FastqWriter(self._out_fn(split_index))
-                    self.out_fns.append(self._out_fn(split_index))
-                writer.writeRecord(r.name, r.sequence, r.quality)
-
-        writer.close()
+        for split_index, (start, end) in enumerate(
+                self.index.split_by_count(self.reads_per_split, first_split)):
+            out_fn = self._out_fn(split_index)
+            self.index.copy(start, end, out_fn)
+            self.out_fns.append(out_fn)
         return list(self.out_fns)
 
     def rmOutFNs(self):
@@ -72,15 +69,18 @@ class FastqSplitter(object):
         self.out_fns = []
 
 
-def splitFastq(input_fastq, reads_per_split, out_dir, out_prefix, first_split=None):
+def splitFastq(input_fastq, reads_per_split, out_dir, out_prefix, first_split=None,
+               index=None):
     """
     Split input_fastq into small fastq files each containing at most
     reads_per_split reads. All splitted fastq files will be placed under
     out_dir with out_prefix. Return paths to splitted files in a list.
+    index --- SeqFileIndex of input_fastq, if already built
     """
     obj = FastqSplitter(input_fastq=input_fastq,
                         reads_per_split=reads_per_split,
-                        out_dir=out_dir, out_prefix=out_prefix)
+                        out_dir=out_dir, out_prefix=out_prefix,
+                        index=index)
     return obj.split(first_split)
 
 
@@ -5,6 +5,8 @@ from bx.intervals.intersection import IntervalNode
 from bx.intervals.intersection import IntervalTree
 from collections import defaultdict
 from csv import DictReader
+from pbtools.pbtranscript.io.c_GFF import collapseGFFRecord, iter_collapse_gff, \
+    load_collapse_gff, iter_gmap_gff, read_gtf
 
 class GTF:
     def __init__(self, gtf_filename):
@@ -28,35 +30,9 @@ class GTF:
         (6) strand: +|-
         (7) phase
         (8) extra stuff (gene ID, transcript ID...) 
+        Parsing is done in c_GFF.read_gtf.
         """
-        for line in open(filename):
-            if line.startswith('#'): continue # header section, ignore
-            if len(line.strip()) == 0: continue # some gtf files have blank lines
-            raw = line.strip().split('\t')
-            chr = raw[0]
-            type = raw[2]
-            strand = raw[6]
-            start0, end1 = int(raw[3])-1, int(raw[4])
-            gtype, gstat = 'NA', 'NA'
-            gName = 'NA'
-            gtags = []
-            for stuff in raw[8].split('; '):
-                _a, _b = stuff.split(None, 1)
-                if _a == "transcript_id": tID = _b[1:-1] # removing quotes ""
-                elif _a == 'gene_name': gName = _b[1:-1]
-                elif _a == "gene_id": gID = _b[1:-1] # removing quotes ""
-                elif _a == "gene_type": gtype = _b[1:-1]
-                elif _a == "gene_status": gstat = _b[1:-1]           
-                elif _a == 'tag': gtags.append(_b[1:-1]) 
-                
-            if type == 'transcript':
-                self.genome[chr].insert(start0, end1, tID)
-                self.transcript_info[tID] = {'chr':chr, 'gname':gName, 'gid':gID, 'type': gtype, 'status': gstat, 'strand': strand, 'tags': gtags}
-                ith = 0
-            elif type == 'exon':
-                self.transcript[tID].insert(start0, end1, {'ith':ith,'chr':chr})
-                self.exon[(start0,end1)].append((tID, ith, chr))
-                ith += 1
+        read_gtf(filename, self.genome, self.transcript, self.exon, self.transcript_info)
         
     def get_exons(self, tID):
         """
@@ -369,6 +345,7 @@ class gmapGFFReader:
     def __init__(self, filename):
         self.filename = filename
         self.f = open(filename)
+        self.it = None
         
     def __iter__(self):
         return self
@@ -390,73 +367,11 @@ class gmapGFFReader:
         (8) extra stuff (gene ID, transcript ID...) 
         
         For gmap output, a series is delimited by '###' line
+        Parsing is done in c_GFF.iter_gmap_gff.
         """
-        cur = self.f.tell()
-        line = self.f.readline().strip()
-        if self.f.tell() == cur:
-            raise StopIteration, "EOF reached!!"
-        raw = line.strip().split('\t')
-        while raw[0].startswith('#'):
-            line = self.f.readline().strip()
-            raw = line.strip().split('\t')
-        
-        assert raw[2] == 'gene'
-        raw = self.f.readline().strip().split('\t')
-        assert raw[2] == 'mRNA'
-        chr = raw[0]
-        strand = raw[6]
-        for blob in raw[8].split(';') :
-            if blob.startswith('coverage='): coverage = float(blob[9:])
-            elif blob.startswith('identity='): identity = float(blob[9:])
-            elif blob.startswith('Name='): seqid = blob[5:]
-      
-        rec = gmapRecord(chr, coverage, identity, strand, seqid)
-        
-        cds_exons = []
-        cds_seq_start = None
-        cds_seq_end = None
-        while True:
-            line = self.f.readline().strip()
-            if line.startswith('###'):
-                rec.cds_exons = cds_exons
-                rec.cds_seq_start = cds_seq_start
-                rec.cds_seq_end = cds_seq_end
-                return rec
-            raw = line.split('\t')
-            type = raw[2]            
-            if type == 'exon':
-                rstart1, rend1 = int(raw[3]), int(raw[4])
-                score = float(raw[5])
-                rstrand = raw[6] # this is the strand on the reference genome
-                for blob in raw[8].split(';'):
-                    if blob.startswith('Target='):
-                        # sstrand is the strand on the query sequence
-                        junk, sstart1, send1, sstrand = blob.split()
-                        sstart1 = int(sstart1)
-                        send1 = int(send1)
-                        rec.sstrand = sstrand
-                try:
-                    rec.add_exon(rstart1-1, rend1, sstart1-1, send1, rstrand, score)
-                except AssertionError:
-                    print >> sys.stderr, "{0} has non-colinear exons!".format(rec.seqid)
-                    while True:
-                        line = self.f.readline().strip()
-                        if line.startswith('###'): return rec
-                rec.strand = rstrand
-            elif type == 'CDS':
-                rstart1, rend1 = int(raw[3]), int(raw[4])
-                cds_exons.append(Interval(rstart1-1, rend1))
-                for blob in raw[8].split(';'):
-                    if blob.startswith('Target='):
-                        junk, sstart1, send1, sstrand = blob.split()
-                        sstart1 = int(sstart1)
-                        send1 = int(send1)
-                        cds_seq_start = sstart1-1 if cds_seq_start is None else cds_seq_start
-                        cds_seq_end = send1
-            else:
-                raise Exception, "Not supposed to see type {0} here!!".format(type)
-
-        return rec
+        if self.it is None:
+            self.it = iter_gmap_gff(self.f, gmapRecord)
+        return next(self.it)
     
             
 class pasaGFFReader(gmapGFFReader):
@@ -560,55 +475,33 @@ def write_collapseGFF_format(f, r):
     
 
 class collapseGFFReader(gmapGFFReader):
+    """
+    PacBio-style GFF from the collapsed output, which is
+    0) chrmosome
+    1) source (PacBio)
+    2) feature (transcript|exon)
+    3) start (1-based)
+    4) end (1-based)
+    5) score (always .)
+    6) strand
+    7) frame (always .)
+    8) blurb
+
+    ex:
+    chr1    PacBio  transcript      897326  901092  .       +       .       gene_id "PB.1"; transcript_id "PB.1.1";
+    chr1    PacBio  exon    897326  897427  .       +       .       gene_id "PB.1"; transcript_id "PB.1.1";
+
+    Parsing is done by the compiled c_GFF.iter_collapse_gff, which yields
+    c_GFF.collapseGFFRecord (same fields as gmapRecord, in __slots__).
+    load_collapse_gff bulk-loads the same file into numpy columns instead.
+    """
+    def __init__(self, filename):
+        gmapGFFReader.__init__(self, filename)
+        self.it = iter_collapse_gff(self.f)
+
     def read(self):
-        """
-        PacBio-style GFF from the collapsed output, which is
-        0) chrmosome
-        1) source (PacBio)
-        2) feature (transcript|exon)
-        3) start (1-based)
-        4) end (1-based)
-        5) score (always .)
-        6) strand
-        7) frame (always .)
-        8) blurb
+        return next(self.it)
 
-        ex: 
-        chr1    PacBio  transcript      897326  901092  .       +       .       gene_id "PB.1"; transcript_id "PB.1.1";
-        chr1    PacBio  exon    897326  897427  .       +       .       gene_id "PB.1"; transcript_id "PB.1.1";
-        """
-        cur = self.f.tell()
-        line = self.f.readline().strip()
-        if self.f.tell() == cur:
-            raise StopIteration, "EOF reached!!"
-                
-        raw = line.strip().split('\t')
-        assert raw[2] == 'transcript'
-        chr = raw[0]
-        strand = raw[6] 
-        seqid = None
-        for stuff in raw[8].split(';'):
-            a, b = stuff.strip().split()
-            if a == 'transcript_id':
-                seqid = b[1:-1]
-                break
-      
-        rec = gmapRecord(chr, coverage=None, identity=None, strand=strand, seqid=seqid)
-        
-        while True:
-            cur = self.f.tell()
-            line = self.f.readline().strip()
-            if self.f.tell() == cur:
-                return rec
-            raw = line.split('\t')
-            if raw[2] == 'exon':
-                s, e = int(raw[3])-1, int(raw[4])
-                rec.add_exon(s, e, s, e, rstrand='+', score=None)
-            else: # another new record, wind back and return
-                self.f.seek(cur)
-                return rec
-        raise Exception, "Should not reach here!"
-                
 
 class ucscGFFReader(gmapGFFReader):
     def read(self):
@@ -0,0 +1,146 @@
+"""
+External merge sort of (GMAP) SAM files by reference and position.
+
+Equivalent to `sort -k3,3 -k4,4n`, except that header lines are kept
+(they are returned separately instead of being sorted into the records,
+GMAP/sort may leave them at the end of the file), and that the sorted
+records are streamed instead of written to a sorted SAM file. Several
+SAM files (ex: GMAP outputs of chunks of reads) can be sorted together:
+
+    stream = SortedSAMStream(sam_filename, cpus=4)
+    for r in BioReaders.GMAPSAMReader(stream, True):
+        ...
+
+The inputs are cut into byte ranges of at most buffer_size bytes at line
+boundaries; each range is sorted by a worker process into a run file,
+and the runs are k-way merged lazily. An input that fits in a single
+range is sorted in memory without run files.
+"""
+import os.path as op
+import shutil
+import heapq
+import tempfile
+from multiprocessing import Pool
+
+
+def sam_sort_key(line):
+    """Return (reference, position) of a SAM record line."""
+    raw = line.split('\t', 4)
+    return raw[2], int(raw[3])
+
+
+def split_ranges(filename, buffer_size):
+    """Return [(start, end)] byte ranges of filename, cut at line ends."""
+    size = op.getsize(filename)
+    ranges = []
+    with open(filename) as f:
+        start = 0
+        while start < size:
+            end = start + buffer_size
+            if end < size:
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            else:
+                end = size
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def read_range(filename, start, end):
+    """
+    Return (headers, records) --- lists of header and record lines
+    in [start, end) of filename.
+    """
+    headers, records = [], []
+    with open(filename) as f:
+        f.seek(start)
+        for line in f.read(end - start).splitlines(True):
+            if line.startswith('@'):
+                headers.append(line)
+            elif len(line.strip()) > 0:
+                records.append(line if line.endswith('\n') else line + '\n')
+    return headers, records
+
+
+def _sort_run(args):
+    """Sort records of a byte range into a run file, return header lines."""
+    filename, start, end, run_filename = args
+    headers, records = read_range(filename, start, end)
+    records.sort(key=sam_sort_key)
+    with open(run_filename, 'w') as f:
+        f.writelines(records)
+    return headers
+
+
+def _iter_run(run_filename, run_index):
+    """Yield (key, run_index, line_index, line) of a sorted run file."""
+    with open(run_filename) as f:
+        for i, line in enumerate(f):
+            yield sam_sort_key(line), run_index, i, line
+
+
+class SortedSAMStream(object):
+
+    """
+    Sorted, file-like view of a SAM file: `header` holds the header
+    lines, readline() returns records in sorted order ('' at the end).
+    """
+
+    def __init__(self, filename, cpus=1, buffer_size=256*1024*1024,
+                 tmp_dir=None):
+        """
+        filename --- input SAM, or a list of input SAMs, may be unsorted
+        cpus --- number of processes to sort runs with
+        buffer_size --- max bytes of input sorted by a process at a time,
+                        memory use is about cpus * buffer_size
+        tmp_dir --- directory for run files, default: next to filename
+        """
+        filenames = [filename] if isinstance(filename, basestring) else filename
+        self.name = ",".join(filenames)
+        self.run_dir = None
+        ranges = [(fn, start, end) for fn in filenames
+                  for (start, end) in split_ranges(fn, buffer_size)]
+        if len(ranges) <= 1:
+            headers, records = read_range(*ranges[0]) if len(ranges) == 1 else ([], [])
+            records.sort(key=sam_sort_key)
+            self.it = iter(records)
+        else:
+            self.run_dir = tempfile.mkdtemp(prefix="sam_sort.",
+                dir=tmp_dir if tmp_dir is not None else op.dirname(op.abspath(filenames[0])))
+            jobs = [(fn, start, end, op.join(self.run_dir, "run{0}".format(i)))
+                    for i, (fn, start, end) in enumerate(ranges)]
+            pool = Pool(processes=max(1, min(cpus, len(jobs))))
+            try:
+                results = pool.map(_sort_run, jobs)
+            finally:
+                pool.close()
+                pool.join()
+            # each input SAM has its own copy of @SQ etc., keep one
+            headers, seen = [], set()
+            for line in (line for h in results for line in h):
+                if line not in seen:
+                    headers.append(line)
+                    seen.add(line)
+            self.it = (x[-1] for x in heapq.merge(
+                *[_iter_run(job[-1], i) for i, job in enumerate(jobs)]))
+        self.header = ''.join(headers)
+
+    def __iter__(self):
+        return self.it
+
+    def readline(self):
+        """Return the next record line, or '' if there is none."""
+        try:
+            return next(self.it)
+        except StopIteration:
+            self.close()
+            return ''
+
+    def close(self):
+        """Remove run files."""
+        self.it = iter([])
+        if self.run_dir is not None:
+            shutil.rmtree(self.run_dir, ignore_errors=True)
+            self.run_dir = None
@@ -0,0 +1,192 @@
+"""
+Byte-level index of records in a FASTA or FASTQ file, used to count and
+split reads without parsing records into objects and writing them back.
+
+The file is read in blocks of block_size bytes, and record boundaries
+are found with str.find/str.count within blocks, so that indexing a
+large file is bound by I/O rather than by Python. Records can then be
+split by number of reads or number of bases, and each split is copied
+from the input as a byte range:
+
+    index = SeqFileIndex("ccs.fastq", is_fq=True)
+    print len(index), index.total_bases
+    for i, (start, end) in enumerate(index.split_by_bases(8)):
+        index.copy(start, end, "chunk{0}.fastq".format(i))
+
+FASTQ records must have exactly 4 lines (as written by pbcore FastqWriter),
+FASTA records may have multi-line sequences.
+"""
+import os.path as op
+from array import array
+
+BLOCK_SIZE = 16 * 1024 * 1024
+
+
+def _index_fasta_block(block, base, offsets, bases):
+    """Append offsets and numbers of bases of records in block, which
+    starts at file offset base and ends with a complete line.
+    Bases of a record continued from the previous block are added to it.
+    """
+    n, i = len(block), 0
+    while i < n:
+        if block[i] == '>':  # header of a new record
+            offsets.append(base + i)
+            bases.append(0)
+            i = block.find('\n', i) + 1
+            if i == 0:
+                break
+        # sequence lines up to the next header
+        j = block.find('\n>', max(0, i - 1))
+        end = n if j < 0 else j + 1
+        if len(bases) > 0:
+            bases[-1] += (end - i) - block.count('\n', i, end) - \
+                block.count('\r', i, end)
+        i = end
+
+
+def _index_fastq_block(block, base, offsets, bases, phase):
+    """Append offsets and numbers of bases of 4-line records in block,
+    which starts at file offset base with line `phase` of a record and ends
+    with a complete line. Return the phase at the end of block."""
+    i = 0
+    while True:
+        j = block.find('\n', i)
+        if j < 0:
+            return phase
+        if phase == 0:
+            if block[i] != '@':
+                raise ValueError("Expected a FASTQ header at offset " +
+                                 "{0}.".format(base + i))
+            offsets.append(base + i)
+        elif phase == 1:
+            bases.append(j - i - (1 if j > i and block[j - 1] == '\r' else 0))
+        phase = (phase + 1) % 4
+        i = j + 1
+
+
+class SeqFileIndex(object):
+
+    """
+    Start offsets and numbers of bases of records in a FASTA or FASTQ
+    file. offsets[i] is the byte offset of the i-th record, and
+    offsets[len(self)] is the end of the last record.
+    """
+
+    def __init__(self, filename, is_fq=False, block_size=BLOCK_SIZE):
+        self.filename = filename
+        self.is_fq = is_fq
+        self.offsets = array('l')
+        self.bases = array('l')
+        base, phase = 0, 0
+        with open(filename) as f:
+            while True:
+                block = f.read(block_size)
+                if len(block) == 0:
+                    break
+                if not block.endswith('\n'):
+                    block += f.readline()
+                if is_fq:
+                    phase = _index_fastq_block(block, base, self.offsets,
+                                               self.bases, phase)
+                else:
+                    _index_fasta_block(block, base, self.offsets, self.bases)
+                base += len(block)
+        if is_fq and len(self.bases) < len(self.offsets):
+            raise ValueError("Truncated FASTQ record at the end of " +
+                             "{0}.".format(filename))
+        self.offsets.append(base)
+
+    def __len__(self):
+        """Return the number of records."""
+        return len(self.bases)
+
+    @property
+    def total_bases(self):
+        """Return the total number of bases of all records."""
+        return sum(self.bases)
+
+    def split_by_count(self, reads_per_split, first_split=None):
+        """
+        Return [(start, end)] record index ranges, the first containing
+        first_split (default: reads_per_split) records, the next ones
+        ending at multiples of reads_per_split. An empty file has one
+        empty range.
+        """
+        if first_split is None:
+            first_split = reads_per_split
+        n = len(self)
+        cuts = [0]
+        if 0 < first_split < n:
+            cuts.append(first_split)
+            cut = (first_split / reads_per_split + 1) * reads_per_split
+            while cut < n:
+                cuts.append(cut)
+                cut += reads_per_split
+        cuts.append(n)
+        return zip(cuts[:-1], cuts[1:])
+
+    def split_by_bases(self, n_chunks):
+        """
+        Return [(chunk index, start, end)] record index ranges of at most
+        n_chunks chunks of roughly equal number of bases, in record order.
+        A record goes to chunk (bases before it) / (total / n_chunks),
+        so that chunk indices may skip a number after a very long record.
+        """
+        per_chunk = max(1., self.total_bases * 1. / n_chunks)
+        chunks = []
+        bases = 0
+        for k in xrange(len(self)):
+            i = min(n_chunks - 1, int(bases / per_chunk))
+            if len(chunks) == 0 or chunks[-1][0] != i:
+                if len(chunks) > 0:
+                    chunks[-1][2] = k
+                chunks.append([i, k, None])
+            bases += self.bases[k]
+        if len(chunks) > 0:
+            chunks[-1][2] = len(self)
+        return [tuple(x) for x in chunks]
+
+    def byte_range(self, start, end):
+        """Return the [begin, end) byte range of records [start, end)."""
+        return self.offsets[start], self.offsets[end]
+
+    def copy(self, start, end, out_filename, buffer_size=BLOCK_SIZE):
+        """Copy records [start, end) to out_filename, byte by byte."""
+        begin, stop = self.byte_range(start, end)
+        with open(self.filename) as f, open(out_filename, 'w') as writer:
+            f.seek(begin)
+            remaining = stop - begin
+            while remaining > 0:
+                data = f.read(min(buffer_size, remaining))
+                if len(data) == 0:
+                    break
+                writer.write(data)
+                remaining -= len(data)
+            if remaining == 0 and stop > begin and stop == self.offsets[-1]:
+                # the last record may lack a trailing newline
+                f.seek(stop - 1)
+                if f.read(1) != '\n':
+                    writer.write('\n')
+
+
+def count_records(filename, is_fq=False, block_size=BLOCK_SIZE):
+    """
+    Return the number of records in a FASTA (lines starting with '>')
+    or a 4-line FASTQ file, without indexing them.
+    """
+    if not op.exists(filename):
+        raise IOError("File {f} does not exist.".format(f=filename))
+    num, num_lines, last = 0, 0, '\n'
+    with open(filename) as f:
+        while True:
+            block = f.read(block_size)
+            if len(block) == 0:
+                break
+            if is_fq:
+                num_lines += block.count('\n')
+            else:
+                num += block.count('\n>') + (last == '\n' and block[0] == '>')
+            last = block[-1]
+    if is_fq:
+        return (num_lines + (last != '\n')) / 4
+    return num
@@ -0,0 +1,138 @@
+"""
+Extract subreads of a bas.h5/bax.h5 file to fasta in-process, replacing
+
+    pls2fasta movie.bax.h5 tmp.fasta -minSubreadLength 300 \
+        -minReadScore 750 -trimByRegion
+    IceUtils.trim_subread_flanks(tmp.fasta, movie.bax.h5.fasta)
+
+with one streaming pass over the ZMWs of the file: subreads are clipped
+to the HQ region by pbcore, subreads shorter than min_subread_length and
+ZMWs with read score less than min_read_score are dropped, and trim_len
+bases are trimmed from both ends of each subread, which is kept only if
+at least min_len bases remain:
+
+    n = extract_subreads("m1.1.bax.h5", "m1.1.bax.h5.fasta")
+
+Sequences are written on a single line, and a subread index
+(<fasta>.idx, "subread_id\\tsequence_offset\\tlength" per line) is
+written as a by-product, so that subreads can be read back with one seek.
+"""
+import os
+import os.path as op
+from collections import defaultdict
+from multiprocessing import Pool
+from pbcore.io import BasH5Reader
+
+
+def subread_index_of(fasta_filename):
+    """Return the subread index file of fasta_filename."""
+    return fasta_filename + ".idx"
+
+
+def zmw_subreads(zmw, min_subread_length=300, min_read_score=0.75,
+                 trim_len=100, min_len=100):
+    """
+    Yield (name, sequence) of flank-trimmed subreads of a ZMW, where
+    name is <movie>/<holeNumber>/<start>_<end> of trimmed coordinates.
+    """
+    if zmw.readScore < min_read_score:
+        return
+    for subread in zmw.subreads:
+        s, e = subread.readStart, subread.readEnd
+        if e - s < min_subread_length:
+            continue
+        s2, e2 = s + trim_len, e - trim_len
+        if e2 - s2 < min_len:
+            continue
+        name = "{0}/{1}_{2}".format(zmw.zmwName, s2, e2)
+        seq = subread.basecalls()
+        yield name, seq[trim_len:len(seq) - trim_len]
+
+
+def extract_subreads(in_filename, out_filename, min_subread_length=300,
+                     min_read_score=0.75, trim_len=100, min_len=100):
+    """
+    Write flank-trimmed subreads of sequencing ZMWs of bas/bax.h5 file
+    in_filename to out_filename, and their index to
+    subread_index_of(out_filename). Both are written to .tmp files first
+    and renamed when complete. Return the number of subreads written.
+    """
+    tmp_out_fn = out_filename + ".tmp"
+    idx_fn = subread_index_of(out_filename)
+    tmp_idx_fn = idx_fn + ".tmp"
+    num = 0
+    reader = BasH5Reader(in_filename)
+    try:
+        with open(tmp_out_fn, 'w') as writer, open(tmp_idx_fn, 'w') as idx:
+            offset = 0
+            for hn in reader.sequencingZmws:
+                for name, seq in zmw_subreads(
+                        reader[hn], min_subread_length=min_subread_length,
+                        min_read_score=min_read_score, trim_len=trim_len,
+                        min_len=min_len):
+                    header = ">" + name + "\n"
+                    writer.write(header)
+                    writer.write(seq + "\n")
+                    idx.write("{0}\t{1}\t{2}\n".format(
+                        name, offset + len(header), len(seq)))
+                    offset += len(header) + len(seq) + 1
+                    num += 1
+    finally:
+        reader.close()
+    os.rename(tmp_idx_fn, idx_fn)
+    os.rename(tmp_out_fn, out_filename)
+    return num
+
+
+def _extract_subreads_star(args):
+    """Call extract_subreads(in_filename, out_filename) in a worker."""
+    in_filename, out_filename = args
+    return extract_subreads(in_filename, out_filename)
+
+
+def extract_subreads_of_files(in_filenames, out_filenames, cpus=1):
+    """
+    Extract subreads of each bas/bax.h5 file in in_filenames to the
+    corresponding fasta file in out_filenames, using a pool of cpus
+    processes. Return numbers of subreads written to each file.
+    An error in any file is raised after the pool is cleaned up.
+    """
+    jobs = zip(in_filenames, out_filenames)
+    cpus = max(1, min(cpus, len(jobs)))
+    if cpus == 1:
+        return [_extract_subreads_star(job) for job in jobs]
+    pool = Pool(processes=cpus)
+    try:
+        # hand out one file at a time, files differ in size
+        return pool.map(_extract_subreads_star, jobs, chunksize=1)
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def read_subread_index(idx_filename):
+    """Return {subread_id: (sequence_offset, length)} of a subread index."""
+    d = {}
+    with open(idx_filename) as f:
+        for line in f:
+            name, offset, length = line.rstrip('\n').split('\t')
+            d[name] = (int(offset), int(length))
+    return d
+
+
+def zmw_subread_bases(fasta_filenames):
+    """
+    Return {movie/holeNumber: total bases of subreads} of ZMWs in subread
+    fasta files, read from their subread indices. Files without an index
+    (not written by extract_subreads) are skipped.
+    """
+    bases = defaultdict(lambda: 0)
+    for fn in fasta_filenames:
+        idx_fn = subread_index_of(fn)
+        if not op.exists(idx_fn):
+            continue
+        with open(idx_fn) as f:
+            for line in f:
+                name, _offset, length = line.rstrip('\n').split('\t')
+                bases[name[:name.rfind('/')]] += int(length)
+    return dict(bases)
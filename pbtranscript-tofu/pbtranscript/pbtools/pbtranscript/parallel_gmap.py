@@ -0,0 +1,130 @@
+"""
+Map reads with GMAP in size-balanced chunks, using several concurrent
+GMAP processes which share the same on-disk genome index.
+
+GMAP's own threading stops scaling past a few threads, so instead of a
+single GMAP run with -t <cpus> per input, each input is split into chunks
+of roughly equal number of bases, and the chunks of all inputs are mapped
+by one pool of (cpus / threads_per_job) GMAP processes, largest first.
+The chunk SAMs of an input are sorted and merged in coordinate order by
+io.SAMSorter.SortedSAMStream (see collapse_isoforms_by_sam.py --sort_sam).
+
+The aligner is a command template, so a local stand-in aligner can be
+used instead of GMAP (ex: in tests). It is formatted with
+{gmap_db}, {gmap_name}, {threads}, {input}, {output}, {log}.
+
+A chunk is mapped to <chunk>.sam.tmp, which is renamed to <chunk>.sam
+when the aligner succeeds, next to the command in <chunk>.sam.cmd. A
+re-run (ex: after the pipeline was killed) only maps chunks without a
+<chunk>.sam newer than the chunk and made by the same command; chunks
+whose reads did not change are not rewritten by a re-run.
+"""
+import os
+import sys
+import filecmp
+import subprocess
+import os.path as op
+from multiprocessing.pool import ThreadPool
+from pbtools.pbtranscript.io.SeqIndex import SeqFileIndex
+from pbtools.pbtranscript.Utils import mkdir
+
+GMAP_CMD = "gmap -D {gmap_db} -d {gmap_name} -n 0 -t {threads} " + \
+           "-z sense_force --cross-species -f samse {input} " + \
+           "> {output} 2> {log}"
+
+
+def split_by_bases(filename, n_chunks, out_dir, is_fq=True):
+    """
+    Split reads in filename into at most n_chunks files
+    <out_dir>/chunk<i>.fastq (or .fasta) of roughly equal number of
+    bases, keeping the read order. Return [(chunk filename, # of bases)].
+    An existing chunk file with the same reads is kept as is (with its
+    mtime), so that its mapping can be reused.
+    """
+    index = SeqFileIndex(filename, is_fq=is_fq)
+    mkdir(out_dir)
+    chunks = []
+    for i, start, end in index.split_by_bases(n_chunks):
+        chunk_fn = op.join(out_dir, "chunk{0}.{1}".format(
+            i, "fastq" if is_fq else "fasta"))
+        index.copy(start, end, chunk_fn + ".tmp")
+        if op.exists(chunk_fn) and \
+                filecmp.cmp(chunk_fn, chunk_fn + ".tmp", shallow=False):
+            os.remove(chunk_fn + ".tmp")
+        else:
+            os.rename(chunk_fn + ".tmp", chunk_fn)
+        chunks.append((chunk_fn, sum(index.bases[start:end])))
+    return chunks
+
+
+def _run_cmd(cmd):
+    """Run cmd in shell, return its exit code."""
+    print >> sys.stderr, "CMD:", cmd
+    return subprocess.call(cmd, shell=True)
+
+
+def _run_job(job):
+    """Run cmd of job (cmd, tmp output, output), if cmd succeeds, write
+    cmd to <output>.cmd and rename tmp output to output. Return the exit
+    code of cmd."""
+    cmd, tmp_fn, out_fn = job
+    ret = _run_cmd(cmd)
+    if ret == 0:
+        with open(out_fn + '.cmd', 'w') as f:
+            f.write(cmd)
+        os.rename(tmp_fn, out_fn)
+    return ret
+
+
+def is_mapped(chunk_fn, cmd):
+    """Return True if chunk_fn has a SAM made by cmd since the chunk."""
+    sam_fn = chunk_fn + '.sam'
+    if not op.exists(sam_fn) or not op.exists(sam_fn + '.cmd') or \
+            op.getmtime(sam_fn) < op.getmtime(chunk_fn):
+        return False
+    with open(sam_fn + '.cmd') as f:
+        return f.read() == cmd
+
+
+def run_gmap_chunks(filenames, gmap_db, gmap_name, cpus=24, threads_per_job=4,
+                    chunks_per_job=2, is_fq=True, aligner_cmd=GMAP_CMD):
+    """
+    Map reads of each of filenames in chunks (<filename>.gmap_chunks/)
+    with a single pool of max(1, cpus/threads_per_job) aligner processes.
+    Each pool process gets about chunks_per_job chunks, which are shared
+    among the inputs by size. Return a list of chunk SAM filenames per
+    input, in chunk order. Chunks which are already mapped are skipped.
+    """
+    num_jobs = max(1, cpus / threads_per_job)
+    threads = max(1, min(threads_per_job, cpus))
+    sizes = [max(1, op.getsize(fn)) for fn in filenames]
+    total_chunks = max(len(filenames), num_jobs * chunks_per_job)
+
+    sams, jobs = [], []
+    for fn, size in zip(filenames, sizes):
+        n_chunks = max(1, int(round(total_chunks * size * 1. / sum(sizes))))
+        chunks = split_by_bases(fn, n_chunks, fn + '.gmap_chunks', is_fq=is_fq)
+        sams.append([])
+        for chunk_fn, bases in chunks:
+            sams[-1].append(chunk_fn + '.sam')
+            cmd = aligner_cmd.format(gmap_db=gmap_db, gmap_name=gmap_name,
+                threads=threads, input=chunk_fn, output=chunk_fn + '.sam.tmp',
+                log=chunk_fn + '.sam.log')
+            if is_mapped(chunk_fn, cmd):
+                print >> sys.stderr, "Skipping mapped chunk", chunk_fn
+                continue
+            jobs.append((bases, (cmd, chunk_fn + '.sam.tmp', chunk_fn + '.sam')))
+    if len(jobs) == 0:
+        return sams
+
+    # largest chunks first, so that the pool finishes at about the same time
+    jobs.sort(key=lambda x: x[0], reverse=True)
+    pool = ThreadPool(processes=max(1, min(num_jobs, len(jobs))))
+    rets = pool.map(_run_job, [job for (_bases, job) in jobs], chunksize=1)
+    pool.close()
+    pool.join()
+    for (_bases, (cmd, _tmp_fn, _sam_fn)), ret in zip(jobs, rets):
+        if ret != 0:
+            raise RuntimeError("CMD failed: {0}".format(cmd))
+    return sams
+
@@ -114,7 +114,8 @@ class PBTranscript(PBMultiToolRunner):
                                  out_nfl_fn=self.args.nfl_fa,
                                  ignore_polyA=self.args.ignore_polyA,
                                  keep_primer=self.args.keep_primer,
-                                 reuse_dom=self.args.reuse_dom)
+                                 reuse_dom=self.args.reuse_dom,
+                                 primer_search=self.args.primer_search)
                 obj.run()
             elif cmd == 'cluster':
                 ice_opts = IceOptions(quiver=self.args.quiver,
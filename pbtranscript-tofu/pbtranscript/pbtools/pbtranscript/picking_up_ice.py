@@ -87,12 +87,34 @@ def pickup_icec_job(pickle_filename, ccs_fofn, flnc_filename, fasta_files_to_add
     print >> sys.stderr, "Sanity check done. Resuming ICE job."
     icec.run()
 
+def pickup_icec_job_from_journal(root_dir, fasta_files_to_add):
+    """
+    Resume ICE from the snapshot + checkpoint journal in root_dir.
+    Unlike pickup_icec_job, gcon is only re-run for clusters whose
+    consensus files were touched after the last commit.
+    """
+    print >> sys.stderr, "Replaying checkpoint journal...."
+    icec = ice.IceIterative.from_journal(root_dir)
+    if fasta_files_to_add is not None:
+        for file in fasta_files_to_add.split(','):
+            if not os.path.exists(file):
+                raise Exception, "{0} is not a valid fasta file to add!".format(file)
+            if file in icec.fastq_filenames_to_add:
+                print >> sys.stderr, "{0} is already in to-add list. Ignore.".format(file)
+                continue
+            icec.fastq_filenames_to_add.append(file)
+    print >> sys.stderr, "Sanity checking now...."
+    icec.sanity_check_uc_refs()
+    icec.ensure_probQV_newid_consistency()
+    print >> sys.stderr, "Sanity check done. Resuming ICE job."
+    icec.run()
+
 
 if __name__ == "__main__":
     from argparse import ArgumentParser
 
     parser = ArgumentParser()
-    parser.add_argument("pickle_filename", help="Last successful pickle (ex: clusterOut/output/input.split_00.fa.pickle)")
+    parser.add_argument("pickle_filename", nargs="?", default=None, help="Last successful pickle (ex: clusterOut/output/input.split_00.fa.pickle). If not given, resume from the checkpoint journal in root_dir/output/journal")
     parser.add_argument("--root_dir", default="clusterOut/", help="root dir (default: clusterOut/)")
     parser.add_argument("--ccs_fofn", default="reads_of_insert.fofn", help="(default: reads_of_insert.fofn)")
     parser.add_argument("--flnc", default="isoseq_flnc.fasta", help="(default: isoseq_flnc.fasta)")
@@ -100,4 +122,7 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    pickup_icec_job(args.pickle_filename, args.ccs_fofn, args.flnc, args.fasta_files_to_add, args.root_dir)
+    if args.pickle_filename is None:
+        pickup_icec_job_from_journal(args.root_dir, args.fasta_files_to_add)
+    else:
+        pickup_icec_job(args.pickle_filename, args.ccs_fofn, args.flnc, args.fasta_files_to_add, args.root_dir)
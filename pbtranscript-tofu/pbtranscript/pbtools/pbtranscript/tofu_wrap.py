@@ -5,11 +5,13 @@ from pbcore.io.FastaIO import FastaReader
 from pbcore.io.FastqIO import FastqReader, FastqWriter
 from pbtools.pbtranscript.Utils import realpath
 from pbtools.pbtranscript.Cluster import Cluster
+from pbtools.pbtranscript.StageGraph import Stage, StageGraph
 from pbtools.pbtranscript.ClusterOptions import IceOptions, SgeOptions, \
             IceQuiverHQLQOptions
 from pbtools.pbtranscript.PBTranscriptOptions import add_cluster_arguments
 from pbtools.pbtranscript.ice.IceUtils import convert_fofn_to_fasta
 from pbtools.pbtranscript.counting import get_read_count_from_collapsed as sp
+from pbtools.pbtranscript.parallel_gmap import run_gmap_chunks
 from bisect import bisect_right
 from collections import defaultdict
 from pbtools.pbtranscript.__init__ import get_version
@@ -153,23 +155,16 @@ def combine_quiver_results(split_dirs, output_dir, hq_filename, lq_filename, tof
     print >> sys.stderr, "LQ quivered output combined to:", fout_lq.file.name
     return fout_hq.file.name,fout_lq.file.name,prefix_dict_hq,prefix_dict_lq
 
-def run_collapse_sam(fastq_filename, gmap_db_dir, gmap_db_name, cpus=24, min_coverage=0.99, min_identity=0.95, dun_merge_5_shorter=False, max_fuzzy_junction=5):
+def run_collapse_sam(fastq_filename, gmap_db_dir, gmap_db_name, cpus=24, min_coverage=0.99, min_identity=0.95, dun_merge_5_shorter=False, max_fuzzy_junction=5, sam_filenames=None):
     """
     Wrapper for running collapse script
-    (a) run GMAP
-    (b) sort GMAP sam
-    (c) run collapse_isoforms_by_sam
+    (a) run GMAP on size-balanced chunks of reads in parallel (unless sam_filenames are given)
+    (b) run collapse_isoforms_by_sam, which sorts and merges the GMAP sams in-process
     """
-    if not os.path.exists(fastq_filename + '.sam'):
-        cmd = "gmap -D {d} -d {name} -n 0 -t {cpus} -z sense_force --cross-species -f samse {fq} > {fq}.sam 2> {fq}.sam.log".format(\
-                d=gmap_db_dir, name=gmap_db_name, cpus=cpus, fq=fastq_filename)
-        print >> sys.stderr, "CMD:", cmd
-        subprocess.check_call(cmd, shell=True)
-    cmd = "sort -k 3,3 -k 4,4n {fq}.sam > {fq}.sorted.sam".format(fq=fastq_filename)
-    print >> sys.stderr, "CMD:", cmd
-    subprocess.check_call(cmd, shell=True) 
-    cmd = "collapse_isoforms_by_sam.py --input {fq} --fq -s {fq}.sorted.sam --max_fuzzy_junction {j} -c {c} -i {i}".format(\
-            c=min_coverage, i=min_identity, 
+    if sam_filenames is None:
+        sam_filenames = run_gmap_chunks([fastq_filename], gmap_db_dir, gmap_db_name, cpus=cpus, is_fq=True)[0]
+    cmd = "collapse_isoforms_by_sam.py --input {fq} --fq -s {sams} --sort_sam --cpus {cpus} --max_fuzzy_junction {j} -c {c} -i {i}".format(\
+            c=min_coverage, i=min_identity, cpus=cpus, sams=",".join(sam_filenames),
             fq=fastq_filename, j=max_fuzzy_junction)
     if dun_merge_5_shorter:
         cmd += " --dun-merge-5-shorter -o {fq}.no5merge".format(fq=fastq_filename)
@@ -200,9 +195,10 @@ def get_abundance(collapse_prefix, prefix_dict, output_prefix, restricted_movies
             raise Exception, "Expected nFL pickle file {0} but not found!".format(file)
         nfl_pickles.append((i, file))
 
-    sp.output_read_count_FL(cid_info, fl_pickles, output_prefix + '.read_stat.txt', 'w', restricted_movies=restricted_movies)
-    sp.output_read_count_nFL(cid_info, nfl_pickles, output_prefix + '.read_stat.txt', 'a', restricted_movies=restricted_movies)
-    sp.make_abundance_file(output_prefix + '.read_stat.txt', output_prefix + '.abundance.txt', restricted_movies=restricted_movies)
+    counter = sp.AbundanceCounter()
+    sp.output_read_count_FL(cid_info, fl_pickles, output_prefix + '.read_stat.txt', 'w', restricted_movies=restricted_movies, counter=counter)
+    sp.output_read_count_nFL(cid_info, nfl_pickles, output_prefix + '.read_stat.txt', 'a', restricted_movies=restricted_movies, counter=counter)
+    counter.write(output_prefix + '.abundance.txt')
     print >> sys.stderr, "Abundance file written to", output_prefix + '.abundance.txt'
 
 def run_filtering_by_count(input_prefix, output_prefix, min_count):
@@ -219,6 +215,22 @@ def run_filtering_away_subsets(input_prefix, output_prefix, fuzzy_junction):
     print >> sys.stderr, "CMD:", cmd
     subprocess.check_call(cmd, shell=True)
 
+def get_tofu_prefix(cache_dir, output_seqid_prefix=None):
+    """
+    Return output_seqid_prefix if given, otherwise the random prefix of a
+    previous run saved in cache_dir, or a new one, so that a re-run does
+    not invalidate the combined results.
+    """
+    if output_seqid_prefix is not None:
+        return output_seqid_prefix
+    prefix_fn = os.path.join(cache_dir, "tofu_prefix.txt")
+    if os.path.exists(prefix_fn):
+        return open(prefix_fn).read().strip()
+    tofu_prefix = binascii.b2a_hex(os.urandom(3))
+    with open(prefix_fn, 'w') as f:
+        f.write(tofu_prefix + "\n")
+    return tofu_prefix
+
 def tofu_wrap_main():
     parser = argparse.ArgumentParser(prog='tofu_wrap')
     add_cluster_arguments(parser, show_sge_env_name=True, show_sge_queue=True)
@@ -232,6 +244,7 @@ def tofu_wrap_main():
     parser.add_argument("--output_seqid_prefix", type=str, default=None, help="Output seqid prefix. If not given, a random ID is generated")
     parser.add_argument("--mem_debug", default=False, action="store_true", help=argparse.SUPPRESS)
     parser.add_argument("--max_fuzzy_junction", default=5, type=int, help="Max fuzzy junction (default: 5 bp)")
+    parser.add_argument("--max_cpus", default=None, type=int, help="Maximum number of CPUs used by stages running concurrently, e.g., ICE/Quiver of different bins (default: blasr_nproc)")
     parser.add_argument("--version", action='version', version='%(prog)s ' + str(get_version()))
     args = parser.parse_args()
 
@@ -259,7 +272,12 @@ def tofu_wrap_main():
         sys.exit(-1)
     # #################################################################
 
-    tofu_prefix = binascii.b2a_hex(os.urandom(3)) if args.output_seqid_prefix is None else args.output_seqid_prefix
+    # Stages which are done with the same inputs and parameters are skipped
+    # when tofu_wrap is re-run; independent stages (e.g., ICE/Quiver of
+    # different bins) run concurrently within --max_cpus.
+    max_cpus = args.max_cpus if args.max_cpus is not None else args.blasr_nproc
+    graph = StageGraph(cache_dir=os.path.join(args.root_dir, "stages"), max_cpus=max_cpus)
+    tofu_prefix = get_tofu_prefix(graph.cache_dir, args.output_seqid_prefix)
 
     ice_opts = IceOptions(quiver=args.quiver,
             use_finer_qv=args.use_finer_qv,
@@ -289,14 +307,19 @@ def tofu_wrap_main():
     quiver_lq_filename = "all_quivered_lq.fastq"
 
     # (1) separate input flnc into size bins or primers
-    if args.bin_by_primer:
-        split_files = sep_flnc_by_primer(args.flnc_fa, os.path.abspath(args.root_dir))
-    else:
-        bin_manual = eval(args.bin_manual) if args.bin_manual is not None else None
-        split_files = sep_flnc_by_size(args.flnc_fa, args.root_dir, bin_size_kb=args.bin_size_kb, bin_manual=bin_manual, max_base_limit_MB=args.max_base_limit_MB)
-    print >> sys.stderr, "split input {0} into {1} bins".format(args.flnc_fa, len(split_files))
+    def split_flnc():
+        if args.bin_by_primer:
+            split_files = sep_flnc_by_primer(args.flnc_fa, os.path.abspath(args.root_dir))
+        else:
+            bin_manual = eval(args.bin_manual) if args.bin_manual is not None else None
+            split_files = sep_flnc_by_size(args.flnc_fa, args.root_dir, bin_size_kb=args.bin_size_kb, bin_manual=bin_manual, max_base_limit_MB=args.max_base_limit_MB)
+        print >> sys.stderr, "split input {0} into {1} bins".format(args.flnc_fa, len(split_files))
+        return split_files
+    graph.add(Stage("split_flnc", split_flnc, inputs=[args.flnc_fa],
+                    params=[args.bin_by_primer, args.bin_size_kb, args.bin_manual, args.max_base_limit_MB]))
 
     # (2) if fasta_fofn already is there, use it; otherwise make it first
+    fofn_deps = []
     if args.quiver and args.fasta_fofn is None:
         print >> sys.stderr, "Making fasta_fofn now"
         nfl_dir = os.path.abspath(os.path.join(args.root_dir, "fasta_fofn_files"))
@@ -305,10 +328,12 @@ def tofu_wrap_main():
         args.fasta_fofn = os.path.join(nfl_dir, 'input.fasta.fofn')
         print >> sys.stderr, "fasta_fofn", args.fasta_fofn
         print >> sys.stderr, "nfl_dir", nfl_dir
-        convert_fofn_to_fasta(fofn_filename=args.bas_fofn,
+        graph.add(Stage("fasta_fofn", lambda: convert_fofn_to_fasta(fofn_filename=args.bas_fofn,
                             out_filename=args.fasta_fofn,
                             fasta_out_dir=nfl_dir,
-                            cpus=args.blasr_nproc)
+                            cpus=args.blasr_nproc),
+                        inputs=[args.bas_fofn], outputs=[args.fasta_fofn], cpus=args.blasr_nproc))
+        fofn_deps = ["fasta_fofn"]
     else:
         if not os.path.exists(args.fasta_fofn):
             raise Exception, "fasta_fofn {0} does not exist!".format(args.fasta_fofn)
@@ -316,18 +341,10 @@ def tofu_wrap_main():
             file = line.strip()
             if len(file) > 0 and not os.path.exists(file):
                 raise Exception, "File {0} does not exists in {1}".format(file, args.fasta_fofn)
+    graph.run()
 
     # (3) run ICE/Quiver (the whole thing), providing the fasta_fofn
-    split_dirs = []
-    for cur_file in split_files:
-        cur_dir = os.path.abspath(os.path.dirname(cur_file))
-        split_dirs.append(cur_dir)
-        cur_out_cons = os.path.join(cur_dir, args.consensusFa)
-        
-        hq_quiver = os.path.join(cur_dir, quiver_hq_filename)
-        if os.path.exists(hq_quiver):
-            print >> sys.stderr, "{0} already exists. SKIP!".format(hq_quiver)
-            continue
+    def run_cluster(cur_file, cur_dir):
         print >> sys.stderr, "running ICE/Quiver on", cur_dir
         start_t = time.time()
 
@@ -337,16 +354,16 @@ def tofu_wrap_main():
                 bas_fofn=realpath(args.bas_fofn),
                 ccs_fofn=realpath(args.ccs_fofn),
                 fasta_fofn=realpath(args.fasta_fofn),
-                out_fa=cur_out_cons,
+                out_fa=os.path.join(cur_dir, args.consensusFa),
                 sge_opts=sge_opts,
                 ice_opts=ice_opts,
                 ipq_opts=ipq_opts,
                 report_fn=args.report_fn,
                 summary_fn=args.summary_fn,
                 nfl_reads_per_split=args.nfl_reads_per_split)
-        
+
         # DEBUG
-        if args.mem_debug: 
+        if args.mem_debug:
             mem_usage = memory_usage(obj.run, interval=60)
             end_t = time.time()
             with open('mem_debug.log', 'a') as f:
@@ -356,29 +373,66 @@ def tofu_wrap_main():
         else:
             obj.run()
 
+    split_dirs, cluster_stages = [], []
+    cluster_inputs = [x for x in (args.nfl_fa, args.bas_fofn, args.ccs_fofn) if x is not None] + \
+            ([args.fasta_fofn] if len(fofn_deps) == 0 else [])
+    for cur_file in graph.outputs("split_flnc"):
+        cur_dir = os.path.abspath(os.path.dirname(cur_file))
+        split_dirs.append(cur_dir)
+        name = "cluster_" + os.path.basename(cur_dir)
+        # each bin is run in its own process, ICE/Quiver stages within
+        # a bin are cached in cur_dir/stages
+        graph.add(Stage(name, lambda f=cur_file, d=cur_dir: run_cluster(f, d),
+                        deps=["split_flnc"] + fofn_deps, inputs=cluster_inputs,
+                        outputs=[os.path.join(cur_dir, quiver_hq_filename),
+                                 os.path.join(cur_dir, quiver_lq_filename),
+                                 os.path.join(cur_dir, 'output/final.pickle'),
+                                 os.path.join(cur_dir, 'output/map_noFL/nfl.all.partial_uc.pickle')],
+                        params=[ice_opts, ipq_opts, args.nfl_reads_per_split, args.consensusFa],
+                        cpus=args.blasr_nproc, fork=True))
+        cluster_stages.append(name)
+
     combined_dir = os.path.join(args.root_dir, 'combined')
     if not os.path.exists(combined_dir):
         os.makedirs(combined_dir)
+    pre_dict_pickle = os.path.join(args.root_dir, 'combined', 'combined.hq_lq_pre_dict.pickle')
+    hq_filename = os.path.join(combined_dir, 'all_sizes.quivered_hq.fastq')
+    lq_filename = os.path.join(combined_dir, 'all_sizes.quivered_lq.fastq')
     # (4) combine quivered HQ/LQ results
-    hq_filename, lq_filename, hq_pre_dict, lq_pre_dict = \
-            combine_quiver_results(split_dirs, combined_dir, quiver_hq_filename, quiver_lq_filename,\
-            tofu_prefix)
-    with open(os.path.join(args.root_dir, 'combined', 'combined.hq_lq_pre_dict.pickle'), 'w') as f:
-        dump({'HQ': hq_pre_dict, 'LQ': lq_pre_dict}, f)
+    def combine():
+        hq_filename, lq_filename, hq_pre_dict, lq_pre_dict = \
+                combine_quiver_results(split_dirs, combined_dir, quiver_hq_filename, quiver_lq_filename,\
+                tofu_prefix)
+        with open(pre_dict_pickle, 'w') as f:
+            dump({'HQ': hq_pre_dict, 'LQ': lq_pre_dict}, f)
+        return [hq_filename, lq_filename]
+    graph.add(Stage("combine", combine, deps=cluster_stages, outputs=[pre_dict_pickle, hq_filename, lq_filename],
+                    params=[tofu_prefix, quiver_hq_filename, quiver_lq_filename]))
     # (5) collapse quivered HQ results
-    collapse_prefix_hq = run_collapse_sam(hq_filename, args.gmap_db, args.gmap_name, cpus=args.blasr_nproc, max_fuzzy_junction=args.max_fuzzy_junction, dun_merge_5_shorter=True)
-    # (6) make abundance 
-    get_abundance(collapse_prefix_hq, hq_pre_dict, collapse_prefix_hq)
+    graph.add(Stage("gmap_hq", lambda: run_gmap_chunks([hq_filename], args.gmap_db, args.gmap_name, cpus=args.blasr_nproc, is_fq=True)[0],
+                    deps=["combine"], params=[args.gmap_db, args.gmap_name], cpus=args.blasr_nproc))
+    collapse_prefix_hq = hq_filename + '.no5merge.collapsed'
+    graph.add(Stage("collapse_hq", lambda: run_collapse_sam(hq_filename, args.gmap_db, args.gmap_name, cpus=args.blasr_nproc, max_fuzzy_junction=args.max_fuzzy_junction, dun_merge_5_shorter=True, sam_filenames=graph.outputs("gmap_hq")),
+                    deps=["combine", "gmap_hq"], outputs=[collapse_prefix_hq + x for x in ('.gff', '.group.txt', '.rep.fq')],
+                    params=[args.max_fuzzy_junction], cpus=args.blasr_nproc))
+    # (6) make abundance
+    graph.add(Stage("abundance_hq", lambda: get_abundance(collapse_prefix_hq, load(open(pre_dict_pickle))['HQ'], collapse_prefix_hq),
+                    deps=["collapse_hq", "combine"] + cluster_stages,
+                    outputs=[collapse_prefix_hq + x for x in ('.read_stat.txt', '.abundance.txt')]))
     # (7) run filtering & removing subsets in no5merge
-    if args.targeted_isoseq:
-        run_filtering_by_count(collapse_prefix_hq, collapse_prefix_hq+'.min_fl_5', min_count=5)
-        run_filtering_away_subsets(collapse_prefix_hq+'.min_fl_5', collapse_prefix_hq+'.min_fl_5.filtered', args.max_fuzzy_junction)
-    else:
-        run_filtering_by_count(collapse_prefix_hq, collapse_prefix_hq+'.min_fl_2', min_count=2)
-        run_filtering_away_subsets(collapse_prefix_hq+'.min_fl_2', collapse_prefix_hq+'.min_fl_2.filtered', args.max_fuzzy_junction)
+    min_count = 5 if args.targeted_isoseq else 2
+    filtered_prefix = collapse_prefix_hq + '.min_fl_{0}'.format(min_count)
+    graph.add(Stage("filter_by_count", lambda: run_filtering_by_count(collapse_prefix_hq, filtered_prefix, min_count=min_count),
+                    deps=["collapse_hq", "abundance_hq"],
+                    outputs=[filtered_prefix + x for x in ('.gff', '.rep.fq', '.abundance.txt')]))
+    graph.add(Stage("filter_away_subsets", lambda: run_filtering_away_subsets(filtered_prefix, filtered_prefix+'.filtered', args.max_fuzzy_junction),
+                    deps=["filter_by_count"],
+                    outputs=[filtered_prefix + '.filtered' + x for x in ('.gff', '.rep.fq', '.abundance.txt')],
+                    params=[args.max_fuzzy_junction]))
     # Now do it for LQ (turned OFF for now)
     #collapse_prefix_lq = run_collapse_sam(lq_filename, args.gmap_db, args.gmap_name, cpus=args.blasr_nproc)
     #get_abundance(collapse_prefix_lq, lq_pre_dict, collapse_prefix_lq)
+    graph.run()
 
 if __name__ == "__main__":
     tofu_wrap_main()
@@ -22,6 +22,10 @@ ext_modules = [
                          ["pbtools/pbtranscript/ice/C/ProbModel.cpp"], language="c++"),
                 Extension("pbtools.pbtranscript.BioReaders",
                          ["pbtools/pbtranscript/io/C/BioReaders.c"]),
+                Extension("pbtools.pbtranscript.io.c_GFF",
+                         ["pbtools/pbtranscript/io/C/c_GFF.c"]),
+                Extension("pbtools.pbtranscript.c_PrimerScanner",
+                         ["pbtools/pbtranscript/io/C/c_PrimerScanner.c"]),
                 Extension("pbtools.pbtranscript.modified_bx_intervals.intersection_unique",
                          ["pbtools/pbtranscript/branch/C/modified_bx_intervals/intersection_unique.c"]),
                 Extension("pbtools.pbtranscript.c_branch", 
@@ -53,6 +57,7 @@ setup(
     entry_points={'console_scripts': [
         'fasta_splitter.py = pbtools.pbtranscript.io.FastaSplitter:main',
         'filter_sam.py = pbtools.pbtranscript.io.filter_sam:main',
+        'ice_sam_to_cmph5.py = pbtools.pbtranscript.io.CmpH5Writer:main',
         'ice_polish.py = pbtools.pbtranscript.Polish:main',
 #        'ice_partial.py = pbtools.pbtranscript.ice.IcePartial:main',
 #        'ice_all_partials.py = pbtools.pbtranscript.ice.IceAllPartials:main',
@@ -0,0 +1,492 @@
+#!/usr/bin/env python
+"""
+Benchmarks of pbtranscript on simulated Iso-Seq data.
+
+Micro-benchmarks time hot functions (eval_blasr_alignment,
+calc_prob_from_aln, pClique.grasp, BranchSimple.process_records, readers),
+end-to-end benchmarks time classify, ICE clique initialization and
+collapse_isoforms_by_sam at a given scale. Data is made once per scale
+and seed by simulate_isoseq.py, alignments of reads against each other
+are made by the stand-in blasr in bench/bin, which is put first in PATH
+together with a failing fasta2DB, so that no external aligner is used.
+
+    make develop
+    python tests/bench/bench_pbtranscript.py [--scale small|medium|large]
+        [--only name1,name2] [--kind micro|e2e] [--repeat 3]
+
+(make develop builds extension modules in place, so that the installed
+pbtools.pbtranscript which is benchmarked is this source tree.)
+
+Each repeat of a benchmark runs in a forked process. Its setup is not
+timed; wall time, cpu time (including commands it runs) and memory are
+recorded. On Linux, the peak RSS of the process is reset (through
+/proc/self/clear_refs) when setup is done, so that peak_rss_mb is the
+peak while the benchmark runs, and rss_delta_mb is how much it exceeds
+the RSS left by setup (and inherited from the parent); commands run by
+the benchmark are recorded as children_peak_rss_mb. Results are
+appended as json lines to --history together with the commit, scale and
+host, and compared with the last recorded run of the same benchmark.
+"""
+
+import os
+import os.path as op
+import sys
+import json
+import time
+import socket
+import shutil
+import argparse
+import resource
+import subprocess
+import traceback
+from multiprocessing import Process, Pipe
+
+from simulate_isoseq import simulate
+
+BENCH_DIR = op.dirname(op.abspath(__file__))
+ROOT_DIR = op.dirname(op.dirname(BENCH_DIR))  # has pbtools and setup.py
+SCRIPT_DIR = op.join(ROOT_DIR, "pbtools", "pbtranscript")
+
+# reads of insert, genes, and flnc reads used by ICE benchmarks
+SCALES = {"small": {"n_reads": 2000, "n_genes": 50, "ice_reads": 300},
+          "medium": {"n_reads": 20000, "n_genes": 500, "ice_reads": 1000},
+          "large": {"n_reads": 100000, "n_genes": 2000, "ice_reads": 3000}}
+
+
+class BenchData(object):
+
+    """Simulated data of a scale and seed, made on first use."""
+
+    def __init__(self, data_dir, scale, seed):
+        self.scale = scale
+        self.seed = seed
+        self.params = SCALES[scale]
+        self.dir = op.join(data_dir, "{0}_seed{1}".format(scale, seed))
+
+    def fn(self, name):
+        """Return path of name in data dir."""
+        return op.join(self.dir, name)
+
+    @property
+    def env(self):
+        """Return environment with stand-in aligners first in PATH."""
+        env = dict(os.environ)
+        env["PATH"] = op.join(BENCH_DIR, "bin") + os.pathsep + env["PATH"]
+        env["ISOSEQ_SIM_TRUTH"] = self.fn("truth.txt")
+        return env
+
+    def make(self):
+        """Simulate reads, and align ICE reads against themselves."""
+        done_fn = self.fn("done")
+        if op.exists(done_fn):
+            return
+        print >> sys.stderr, "Simulating {0} data to {1}".format(
+            self.scale, self.dir)
+        simulate(self.dir, n_reads=self.params["n_reads"],
+                 n_genes=self.params["n_genes"], seed=self.seed)
+
+        # first ice_reads flnc reads are clustered by ICE benchmarks
+        n = self.params["ice_reads"]
+        for suffix, lines_per_read in (("fasta", None), ("fastq", 4)):
+            with open(self.fn("flnc." + suffix)) as f, \
+                    open(self.fn("ice." + suffix), 'w') as out:
+                count = 0
+                for i, line in enumerate(f):
+                    if (line[0] == '>' if lines_per_read is None else
+                            i % lines_per_read == 0):
+                        count += 1
+                    if count > n:
+                        break
+                    out.write(line)
+        subprocess.check_call(
+            ["blasr", self.fn("ice.fasta"), self.fn("ice.fasta"), "-m", "5",
+             "-bestn", "24", "-out", self.fn("ice.self.m5")], env=self.env)
+        with open(done_fn, 'w') as f:
+            f.write(json.dumps({"scale": self.scale, "seed": self.seed}))
+
+    def run_dir(self, name):
+        """Return an empty directory for a run of benchmark name."""
+        d = self.fn("run_" + name)
+        if op.exists(d):
+            shutil.rmtree(d)
+        os.makedirs(d)
+        return d
+
+    def probqv(self):
+        """Return ProbFromFastq of ICE reads."""
+        from pbtools.pbtranscript.ice.ProbModel import ProbFromFastq
+        return ProbFromFastq(self.fn("ice.fastq"))
+
+
+#
+# Each benchmark takes BenchData, does the untimed setup, and returns the
+# function to time.
+#
+def bench_eval_blasr_alignment(data):
+    """eval_blasr_alignment of all-vs-all hits of ICE reads."""
+    from pbtools.pbtranscript.io.BLASRRecord import BLASRM5Reader
+    from pbtools.pbtranscript.ice.IceUtils import eval_blasr_alignment
+    probqv = data.probqv()
+    records = list(BLASRM5Reader(data.fn("ice.self.m5")))
+
+    def run():
+        for r in records:
+            eval_blasr_alignment(record=r, qver_get_func=probqv.get_smoothed,
+                                 qvmean_get_func=probqv.get_mean,
+                                 sID_starts_with_c=False,
+                                 qv_prob_threshold=.03)
+    return run
+
+
+def bench_calc_prob_from_aln(data):
+    """ProbFromFastq.calc_prob_from_aln of all-vs-all hits of ICE reads."""
+    from pbtools.pbtranscript.io.BLASRRecord import BLASRM5Reader
+    from pbtools.pbtranscript.ice.IceUtils import eval_blasr_alignment
+    probqv = data.probqv()
+    alns = []
+    for r in BLASRM5Reader(data.fn("ice.self.m5")):
+        cigar, _ece = eval_blasr_alignment(
+            record=r, qver_get_func=probqv.get_smoothed,
+            qvmean_get_func=probqv.get_mean, sID_starts_with_c=False,
+            qv_prob_threshold=.03)
+        alns.append((r.qID, r.qStart, r.qEnd, cigar))
+
+    def run():
+        for qID, qStart, qEnd, cigar in alns:
+            probqv.calc_prob_from_aln(qID, qStart, qEnd, cigar)
+    return run
+
+
+def bench_pClique_grasp(data):
+    """pClique.grasp on the hit graph of ICE reads (IceInit._findCliques)."""
+    from pbtools.pbtranscript.io.BLASRRecord import BLASRM5Reader
+    from pbtools.pbtranscript.ice.IceInit import IceInit, ReadEdgeStore
+    graph = ReadEdgeStore(data.fn("ice.fasta"))
+    for r in BLASRM5Reader(data.fn("ice.self.m5")):
+        graph.add(r.qID, r.sID)
+    # only _findCliques is timed, no alignment is needed
+    ice_init = IceInit.__new__(IceInit)
+
+    def run():
+        ice_init._findCliques(alignGraph=graph, readsFa=data.fn("ice.fasta"))
+    return run
+
+
+def bench_BranchSimple_process_records(data):
+    """BranchSimple.process_records of sorted GMAP SAM of flnc reads."""
+    from pbtools.pbtranscript.branch.branch_simple2 import BranchSimple
+    out_dir = data.run_dir("process_records")
+    b = BranchSimple(data.fn("flnc.fastq"), cov_threshold=1,
+                     min_aln_coverage=.99, min_aln_identity=.85, is_fq=True)
+    with open(op.join(out_dir, "ignored.txt"), 'w') as ignored_fout:
+        groups = list(b.iter_gmap_sam(data.fn("flnc.sam"), ignored_fout))
+
+    def run():
+        with open(op.join(out_dir, "out.gff"), 'w') as f_good, \
+                open(op.join(out_dir, "out.group.txt"), 'w') as f_txt:
+            for recs in groups:
+                for v in recs.itervalues():
+                    if len(v) > 0:
+                        b.process_records(v, True, False, f_good, f_good,
+                                          f_txt)
+    return run
+
+
+def bench_GMAPSAMReader(data):
+    """Read all records of GMAP SAM of flnc reads."""
+    from pbcore.io.FastqIO import FastqReader
+    from pbtools.pbtranscript.BioReaders import GMAPSAMReader
+    query_len_dict = dict((r.name.split()[0], len(r.sequence))
+                          for r in FastqReader(data.fn("flnc.fastq")))
+
+    def run():
+        for r in GMAPSAMReader(data.fn("flnc.sam"), True,
+                               query_len_dict=query_len_dict):
+            r.segments, r.qCoverage, r.identity
+    return run
+
+
+def bench_BLASRM5Reader(data):
+    """Read all-vs-all hits of ICE reads."""
+    from pbtools.pbtranscript.io.BLASRRecord import BLASRM5Reader
+
+    def run():
+        for _r in BLASRM5Reader(data.fn("ice.self.m5")):
+            pass
+    return run
+
+
+def bench_gmapGFFReader(data):
+    """Read GMAP GFF3 of flnc reads."""
+    from pbtools.pbtranscript.io.GFF import gmapGFFReader
+
+    def run():
+        for _r in gmapGFFReader(data.fn("flnc.gff")):
+            pass
+    return run
+
+
+def bench_collapseGFFReader(data):
+    """Read collapsed GFF of isoform models."""
+    from pbtools.pbtranscript.io.GFF import collapseGFFReader
+
+    def run():
+        for _r in collapseGFFReader(data.fn("isoforms.gff")):
+            pass
+    return run
+
+
+def bench_classify(data):
+    """pbtranscript.py classify of reads of insert."""
+    out_dir = data.run_dir("classify")
+    cmd = [sys.executable, op.join(SCRIPT_DIR, "pbtranscript.py"),
+           "classify", data.fn("reads_of_insert.fasta"),
+           op.join(out_dir, "isoseq_draft.fasta"),
+           "--primer", data.fn("primers.fa"), "-d", op.join(out_dir, "tmp"),
+           "--flnc", op.join(out_dir, "isoseq_flnc.fasta"),
+           "--nfl", op.join(out_dir, "isoseq_nfl.fasta"),
+           "--report", op.join(out_dir, "primer_info.csv"),
+           "--summary", op.join(out_dir, "classify_summary.txt")]
+    return lambda: subprocess.check_call(cmd, env=data.env)
+
+
+def bench_ice_init(data):
+    """IceInit of ICE reads, hits from the stand-in blasr."""
+    from pbtools.pbtranscript.ClusterOptions import IceOptions, SgeOptions
+    from pbtools.pbtranscript.ice.IceInit import IceInit
+    out_dir = data.run_dir("ice_init")
+    reads_fa = op.join(out_dir, "input.split_00.fasta")
+    shutil.copy(data.fn("ice.fasta"), reads_fa)
+    # IceInit does not re-align reads if <reads_fa>.self.blasr exists
+    shutil.copy(data.fn("ice.self.m5"), reads_fa + ".self.blasr")
+    probqv = data.probqv()
+    os.environ.update(data.env)
+
+    def run():
+        IceInit(readsFa=reads_fa, qver_get_func=probqv.get_smoothed,
+                qvmean_get_func=probqv.get_mean, ice_opts=IceOptions(),
+                sge_opts=SgeOptions(unique_id=1, blasr_nproc=1),
+                calc_prob_func=probqv.calc_prob_from_aln)
+    return run
+
+
+def bench_collapse(data):
+    """collapse_isoforms_by_sam.py of GMAP SAM of flnc reads."""
+    out_dir = data.run_dir("collapse")
+    cmd = [sys.executable, op.join(SCRIPT_DIR, "collapse_isoforms_by_sam.py"),
+           "--input", data.fn("flnc.fastq"), "--fq", "-s", data.fn("flnc.sam"),
+           "--sort_sam", "-o", op.join(out_dir, "flnc")]
+    return lambda: subprocess.check_call(cmd, env=data.env)
+
+
+BENCHMARKS = [("eval_blasr_alignment", "micro", bench_eval_blasr_alignment),
+              ("calc_prob_from_aln", "micro", bench_calc_prob_from_aln),
+              ("pClique_grasp", "micro", bench_pClique_grasp),
+              ("BranchSimple_process_records", "micro",
+               bench_BranchSimple_process_records),
+              ("GMAPSAMReader", "micro", bench_GMAPSAMReader),
+              ("BLASRM5Reader", "micro", bench_BLASRM5Reader),
+              ("gmapGFFReader", "micro", bench_gmapGFFReader),
+              ("collapseGFFReader", "micro", bench_collapseGFFReader),
+              ("classify", "e2e", bench_classify),
+              ("ice_init", "e2e", bench_ice_init),
+              ("collapse", "e2e", bench_collapse)]
+
+
+def ru_maxrss_mb(who):
+    """Return ru_maxrss (MB) of who (resource.RUSAGE_SELF|CHILDREN)."""
+    rss = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is in bytes on Mac OS X, in KB on Linux
+    return rss / (1024. * 1024.) if sys.platform == "darwin" else rss / 1024.
+
+
+def proc_status_mb(field):
+    """Return field (e.g., VmRSS, VmHWM) of /proc/self/status in MB, or
+    None if it can not be read."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024.
+    except (IOError, ValueError, IndexError):
+        pass
+    return None
+
+
+def reset_peak_rss():
+    """Reset peak RSS (VmHWM) of this process to its current RSS, return
+    False if the kernel does not support it."""
+    try:
+        with open("/proc/self/clear_refs", 'w') as f:
+            f.write("5")
+        return proc_status_mb("VmHWM") is not None
+    except IOError:
+        return False
+
+
+def cpu_seconds():
+    """Return user + sys time of this process and of its children."""
+    t = os.times()
+    return t[0] + t[1] + t[2] + t[3]
+
+
+def _measure(bench_func, data, conn):
+    """Set up and time bench_func in a forked process, send the result."""
+    try:
+        run = bench_func(data)
+        is_reset = reset_peak_rss()
+        start_rss = proc_status_mb("VmRSS") if is_reset else \
+            ru_maxrss_mb(resource.RUSAGE_SELF)
+        start_children_rss = ru_maxrss_mb(resource.RUSAGE_CHILDREN)
+        start_cpu, start_t = cpu_seconds(), time.time()
+        run()
+        seconds = time.time() - start_t
+        # without a reset, the peak of run() is only known if it exceeds
+        # the peak of setup
+        peak_rss = proc_status_mb("VmHWM") if is_reset else \
+            ru_maxrss_mb(resource.RUSAGE_SELF)
+        children_rss = ru_maxrss_mb(resource.RUSAGE_CHILDREN)
+        conn.send((True, {"seconds": seconds,
+                          "cpu_seconds": cpu_seconds() - start_cpu,
+                          "peak_rss_mb": peak_rss,
+                          "rss_delta_mb": max(0., peak_rss - start_rss),
+                          "children_peak_rss_mb":
+                          children_rss if children_rss > start_children_rss
+                          else 0.}))
+    except Exception:
+        conn.send((False, traceback.format_exc()))
+    finally:
+        conn.close()
+
+
+def measure(bench_func, data):
+    """Return measurements of bench_func, or raise RuntimeError."""
+    receiver, sender = Pipe(duplex=False)
+    p = Process(target=_measure, args=(bench_func, data, sender))
+    p.start()
+    sender.close()
+    try:
+        ok, result = receiver.recv()
+    except EOFError:
+        ok, result = False, "exited with code {0}".format(p.exitcode)
+    p.join()
+    if not ok:
+        raise RuntimeError(result)
+    return result
+
+
+def git_commit():
+    """Return (commit, dirty) of the source tree, or (None, None)."""
+    try:
+        commit = subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR).strip()
+        status = subprocess.check_output(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=ROOT_DIR)
+        return commit, len(status.strip()) > 0
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+
+def read_history(history_fn):
+    """Return entries of history_fn, oldest first."""
+    if not op.exists(history_fn):
+        return []
+    with open(history_fn) as f:
+        return [json.loads(line) for line in f if len(line.strip()) > 0]
+
+
+def run_benchmarks(names, data, repeat, history_fn):
+    """Run benchmarks names, append results to history_fn, and print
+    them next to the last recorded result of each benchmark."""
+    history = read_history(history_fn)
+    commit, dirty = git_commit()
+    print "{0:<30} {1:>10} {2:>10} {3:>10} {4:>10} {5:>10} {6:>8}".format(
+        "benchmark", "min sec", "median sec", "cpu sec", "peak MB",
+        "delta MB", "vs last")
+    failed = []
+    for name, kind, func in BENCHMARKS:
+        if name not in names:
+            continue
+        try:
+            results = [measure(func, data) for _i in xrange(repeat)]
+        except RuntimeError as e:
+            print >> sys.stderr, "Benchmark {0} failed:\n{1}".format(name, e)
+            failed.append(name)
+            continue
+        seconds = sorted(r["seconds"] for r in results)
+        entry = {"benchmark": name, "kind": kind, "scale": data.scale,
+                 "seed": data.seed, "repeat": repeat, "seconds": seconds,
+                 "min_seconds": seconds[0],
+                 "median_seconds": seconds[len(seconds) / 2],
+                 "cpu_seconds": min(r["cpu_seconds"] for r in results),
+                 "peak_rss_mb": max(r["peak_rss_mb"] for r in results),
+                 "rss_delta_mb": max(r["rss_delta_mb"] for r in results),
+                 "children_peak_rss_mb": max(r["children_peak_rss_mb"]
+                                             for r in results),
+                 "commit": commit, "dirty": dirty,
+                 "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                 "host": socket.gethostname(),
+                 "python": sys.version.split()[0]}
+        last = [e for e in history if e["benchmark"] == name and
+                e["scale"] == data.scale and e["seed"] == data.seed]
+        change = "{0:+.1%}".format(entry["min_seconds"] /
+                                   last[-1]["min_seconds"] - 1) \
+            if len(last) > 0 and last[-1]["min_seconds"] > 0 else "-"
+        print "{0:<30} {1:>10.3f} {2:>10.3f} {3:>10.3f} {4:>10.1f} {5:>10.1f} {6:>8}".\
+            format(name, entry["min_seconds"], entry["median_seconds"],
+                   entry["cpu_seconds"], entry["peak_rss_mb"],
+                   entry["rss_delta_mb"], change)
+        sys.stdout.flush()
+        with open(history_fn, 'a') as f:
+            f.write(json.dumps(entry, sort_keys=True) + "\n")
+    return failed
+
+
+def main():
+    """Main function of bench_pbtranscript.py."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0],
+                                     prog="bench_pbtranscript.py")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small",
+                        help="Scale of simulated data (default: small)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Seed of simulated data (default: 0)")
+    parser.add_argument("--only", default=None,
+                        help="Comma-separated benchmarks to run " +
+                        "(default: all)")
+    parser.add_argument("--kind", choices=["micro", "e2e"], default=None,
+                        help="Only run micro or end-to-end benchmarks")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Number of runs of each benchmark (default: 3)")
+    parser.add_argument("--data_dir",
+                        default=op.join(ROOT_DIR, "tests", "out", "bench"),
+                        help="Directory of simulated data (default: " +
+                        "tests/out/bench)")
+    parser.add_argument("--history",
+                        default=op.join(BENCH_DIR, "history.jsonl"),
+                        help="Json lines file results are appended to " +
+                        "(default: tests/bench/history.jsonl)")
+    parser.add_argument("--list", action="store_true", default=False,
+                        help="List benchmarks and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, kind, func in BENCHMARKS:
+            print "{0:<30} {1:<6} {2}".format(name, kind, func.__doc__)
+        return 0
+    names = [name for name, kind, _f in BENCHMARKS
+             if args.kind is None or kind == args.kind]
+    if args.only is not None:
+        unknown = set(args.only.split(',')) - set(names)
+        if len(unknown) > 0:
+            parser.error("Unknown benchmarks: " + ",".join(sorted(unknown)))
+        names = args.only.split(',')
+
+    data = BenchData(args.data_dir, args.scale, args.seed)
+    data.make()
+    failed = run_benchmarks(names, data, args.repeat, args.history)
+    return 1 if len(failed) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,560 @@
+#!/usr/bin/env python
+"""
+Simulate a reproducible Iso-Seq data set from synthetic isoform models.
+
+A random genome with multi-exon genes is generated, each gene has one or
+more isoforms (exon skipping, alternative first or last exons). CCS-like reads of
+insert are sampled from isoforms by expression, with substitution,
+insertion and deletion errors and matching QVs, 5' and 3' primers and a
+polyA tail, in random orientation. Reads are full-length (FL), or
+non-full-length (nFL) fragments missing one or both ends, or chimeras of
+two FL reads.
+
+Output files in out_dir:
+    genome.fasta           --- reference genome
+    isoforms.gff           --- isoform models (collapsed GFF format)
+    primers.fa             --- primers (F0, R0) used in reads
+    reads_of_insert.fasta  --- CCS reads of insert, input of classify
+    reads_of_insert.fastq  --- the same reads with QVs
+    flnc.fastq, flnc.fasta --- trimmed, oriented FL non-chimeric reads
+    flnc.sam               --- GMAP-style SAM of flnc reads on genome,
+                               sorted by position (NM:i:, XS:A: tags)
+    flnc.gff               --- GMAP-style GFF3 of flnc reads
+    truth.txt              --- read id, isoform, transcript start and
+                               alignment ops of flnc reads to isoforms
+
+Only the standard library is used, so that data can be made anywhere,
+e.g., the stand-in aligners in bench/bin read truth.txt to write exact
+alignments between reads of the same isoform.
+"""
+
+import os
+import os.path as op
+import sys
+import random
+import argparse
+
+BASES = "ACGT"
+COMPLEMENT = dict(zip("ACGTN-", "TGCAN-"))
+
+# Clontech SMARTer primers, 3' primer as seen at the 3' end of the read
+PRIMER_F = "AAGCAGTGGTATCAACGCAGAGTACATGGGG"
+PRIMER_R = "GTACTCTGCGTTGATACCACTGCTT"
+MOVIE = "m141201_000000_42000_c100000000000000001823000000000000_s1_p0"
+
+
+def revcmp(seq):
+    """Return reverse complement of seq."""
+    return "".join(COMPLEMENT[b] for b in reversed(seq))
+
+
+def encode_ops(ops):
+    """Run-length encode ops, e.g., '===X=' --> '3=1X1='."""
+    out, i = [], 0
+    while i < len(ops):
+        j = i
+        while j < len(ops) and ops[j] == ops[i]:
+            j += 1
+        out.append("{0}{1}".format(j - i, ops[i]))
+        i = j
+    return "".join(out)
+
+
+def decode_ops(s):
+    """Decode run-length encoded ops, e.g., '3=1X1=' --> '===X='."""
+    out, n = [], 0
+    for c in s:
+        if c.isdigit():
+            n = n * 10 + int(c)
+        else:
+            out.append(c * n)
+            n = 0
+    return "".join(out)
+
+
+class Isoform(object):
+
+    """An isoform model: exons are 0-based [start, end) on chrom,
+    ascending."""
+
+    def __init__(self, gene_id, isoform_id, chrom, strand, exons):
+        self.gene_id = gene_id
+        self.isoform_id = isoform_id
+        self.chrom = chrom
+        self.strand = strand
+        self.exons = exons
+        self.seq = None
+        self.weight = 1.
+
+    def set_seq(self, genome):
+        """Set transcript sequence from genome."""
+        s = "".join(genome[self.chrom][a:b] for a, b in self.exons)
+        self.seq = s if self.strand == '+' else revcmp(s)
+
+    def genome_positions(self):
+        """Return genome position of each transcript position."""
+        pos = [p for a, b in self.exons for p in xrange(a, b)]
+        return pos if self.strand == '+' else pos[::-1]
+
+    def exon_index(self):
+        """Return transcript-ordered exon index of each transcript position."""
+        exons = self.exons if self.strand == '+' else self.exons[::-1]
+        return [i for i, (a, b) in enumerate(exons) for _p in xrange(a, b)]
+
+    def gff_lines(self):
+        """Return the isoform in collapsed GFF format."""
+        fmt = "{c}\tPacBio\t{t}\t{s}\t{e}\t.\t{strand}\t.\t" + \
+              "gene_id \"{g}\"; transcript_id \"{i}\";\n"
+        lines = [fmt.format(c=self.chrom, t="transcript",
+                            s=self.exons[0][0] + 1, e=self.exons[-1][1],
+                            strand=self.strand, g=self.gene_id,
+                            i=self.isoform_id)]
+        for a, b in self.exons:
+            lines.append(fmt.format(c=self.chrom, t="exon", s=a + 1, e=b,
+                                    strand=self.strand, g=self.gene_id,
+                                    i=self.isoform_id))
+        return lines
+
+
+class SimRead(object):
+
+    """A simulated read of insert, aligned to an isoform by ops over
+    transcript positions [tstart, tend): '=' match, 'X' substitution,
+    'I' insertion, 'D' deletion."""
+
+    def __init__(self, isoform, tstart, tend, seq, qvs, ops,
+                 full_length=True):
+        self.isoform = isoform
+        self.full_length = full_length
+        self.tstart = tstart
+        self.tend = tend
+        self.seq = seq
+        self.qvs = qvs
+        self.ops = ops
+
+
+class IsoSeqSimulator(object):
+
+    """Simulate genome, isoforms and reads, seeded for reproducibility."""
+
+    def __init__(self, seed=0, n_genes=50, n_chroms=2,
+                 sub_rate=.005, ins_rate=.01, del_rate=.01):
+        self.rng = random.Random(seed)
+        self.n_genes = n_genes
+        self.n_chroms = n_chroms
+        self.sub_rate = sub_rate
+        self.ins_rate = ins_rate
+        self.del_rate = del_rate
+        self.genome = {}
+        self.chroms = []
+        self.isoforms = []
+
+    def _random_seq(self, n):
+        """Return a random sequence of length n."""
+        return "".join(self.rng.choice(BASES) for _i in xrange(n))
+
+    def _gene_exons(self, start, strand):
+        """Return exons of a gene starting at start and its sequence."""
+        rng = self.rng
+        seq, exons = [], []
+        for i in xrange(rng.randint(2, 8)):
+            if i > 0:
+                intron = "GT" + self._random_seq(rng.randint(150, 1500)) + "AG"
+                seq.append(intron if strand == '+' else revcmp(intron))
+            a = start + sum(len(s) for s in seq)
+            seq.append(self._random_seq(rng.randint(60, 400)))
+            exons.append((a, a + len(seq[-1])))
+        return exons, "".join(seq)
+
+    def _isoforms_of_gene(self, exons):
+        """Return distinct exon subsets of a gene: all exons, skipped
+        internal exons, alternative first or last exons."""
+        rng = self.rng
+        result = [list(exons)]
+        for _i in xrange(rng.randint(0, 3)):
+            e = list(exons)
+            if len(e) > 2 and rng.random() < .7:
+                e.pop(rng.randint(1, len(e) - 2))
+            elif len(e) > 2:
+                e = e[1:] if rng.random() < .5 else e[:-1]
+            if e not in result:
+                result.append(e)
+        return result
+
+    def make_genome(self):
+        """Make chromosomes, genes and isoforms."""
+        rng = self.rng
+        genes_per_chrom = [self.n_genes / self.n_chroms] * self.n_chroms
+        genes_per_chrom[0] += self.n_genes % self.n_chroms
+        gene_index = 0
+        for c, n in enumerate(genes_per_chrom):
+            chrom = "chr{0}".format(c + 1)
+            seq = [self._random_seq(rng.randint(1000, 5000))]
+            start = len(seq[0])
+            for _i in xrange(n):
+                gene_index += 1
+                strand = rng.choice("+-")
+                exons, gene_seq = self._gene_exons(start, strand)
+                seq.append(gene_seq)
+                seq.append(self._random_seq(rng.randint(1000, 5000)))
+                start += len(gene_seq) + len(seq[-1])
+                gene_id = "PB.{0}".format(gene_index)
+                for j, e in enumerate(self._isoforms_of_gene(exons)):
+                    iso = Isoform(gene_id, "{0}.{1}".format(gene_id, j + 1),
+                                  chrom, strand, e)
+                    iso.weight = rng.lognormvariate(0, 1.)
+                    self.isoforms.append(iso)
+            self.genome[chrom] = "".join(seq)
+            self.chroms.append(chrom)
+        for iso in self.isoforms:
+            iso.set_seq(self.genome)
+
+    def _mutate(self, seq):
+        """Return (read sequence, phred QVs, ops) of seq with errors."""
+        rng = self.rng
+        out, qvs, ops = [], [], []
+        for b in seq:
+            x = rng.random()
+            if x < self.del_rate:
+                ops.append('D')
+            elif x < self.del_rate + self.sub_rate:
+                out.append(rng.choice([c for c in BASES if c != b]))
+                qvs.append(rng.randint(3, 12))
+                ops.append('X')
+            else:
+                out.append(b)
+                qvs.append(rng.randint(20, 40))
+                ops.append('=')
+            if rng.random() < self.ins_rate:
+                out.append(rng.choice(BASES))
+                qvs.append(rng.randint(3, 12))
+                ops.append('I')
+        return "".join(out), qvs, "".join(ops)
+
+    def sample_isoform(self):
+        """Return an isoform picked by expression weight."""
+        total = sum(iso.weight for iso in self.isoforms)
+        x = self.rng.random() * total
+        for iso in self.isoforms:
+            x -= iso.weight
+            if x <= 0:
+                return iso
+        return self.isoforms[-1]
+
+    def sample_read(self, full_length=True):
+        """Return a SimRead from a random isoform; FL reads may miss up
+        to 30 bp of 5' end, nFL reads miss the 5' end, 3' end or both."""
+        rng = self.rng
+        iso = self.sample_isoform()
+        n = len(iso.seq)
+        if full_length:
+            tstart = 0 if rng.random() < .7 else rng.randint(1, 30)
+            tend = n
+        else:
+            case = rng.choice(("no5", "no3", "none"))
+            tstart = rng.randint(1, n / 2) if case != "no3" else 0
+            tend = rng.randint(n / 2 + 1, n - 1) if case != "no5" else n
+        seq, qvs, ops = self._mutate(iso.seq[tstart:tend])
+        return SimRead(iso, tstart, tend, seq, qvs, ops, full_length)
+
+    def polya(self):
+        """Return a polyA tail."""
+        return "A" * self.rng.randint(15, 40)
+
+
+def _fastq(name, seq, qvs):
+    """Return a FASTQ record."""
+    return "@{0}\n{1}\n+\n{2}\n".format(
+        name, seq, "".join(chr(33 + q) for q in qvs))
+
+
+def _fasta(name, seq, width=60):
+    """Return a FASTA record."""
+    return ">{0}\n{1}\n".format(name, "\n".join(
+        seq[i:i + width] for i in xrange(0, len(seq), width)))
+
+
+def _blocks(read):
+    """
+    Return alignment blocks of read on its isoform's exons, in transcript
+    order: [exon index, genome start, genome end, read start, read end,
+    ops].
+    """
+    iso = read.isoform
+    gpos, eidx = iso.genome_positions(), iso.exon_index()
+    blocks = []
+    j, q, lead = read.tstart, 0, 0
+    for op in read.ops:
+        if op == 'I':
+            q += 1
+            if len(blocks) == 0:  # leading insertion, added to 1st block
+                lead += 1
+            else:
+                blocks[-1][4] = q
+                blocks[-1][5].append(op)
+            continue
+        if len(blocks) == 0:
+            blocks.append([eidx[j], gpos[j], gpos[j], 0, q, ['I'] * lead])
+        elif blocks[-1][0] != eidx[j]:
+            blocks.append([eidx[j], gpos[j], gpos[j], q, q, []])
+        b = blocks[-1]
+        b[1], b[2] = min(b[1], gpos[j]), max(b[2], gpos[j])
+        b[5].append(op)
+        if op != 'D':
+            q += 1
+            b[4] = q
+        j += 1
+    for b in blocks:
+        b[2] += 1
+    return blocks
+
+
+def sam_line(read_id, read):
+    """Return a GMAP-style SAM line of a flnc read on genome."""
+    iso = read.isoform
+    blocks = _blocks(read)
+    if iso.strand == '-':
+        blocks = blocks[::-1]
+        seq, qvs = revcmp(read.seq), read.qvs[::-1]
+    else:
+        seq, qvs = read.seq, read.qvs
+    cigar = []  # [length, op], in genome order
+
+    def push(n, c):
+        if len(cigar) > 0 and cigar[-1][1] == c:
+            cigar[-1][0] += n
+        else:
+            cigar.append([n, c])
+    for k, b in enumerate(blocks):
+        if k > 0:
+            push(b[1] - blocks[k - 1][2], 'N')
+        for op in (b[5] if iso.strand == '+' else reversed(b[5])):
+            push(1, 'M' if op in "=X" else op)
+    nm = len(read.ops) - read.ops.count('=')
+    for k in (0, -1):  # GMAP soft clips unaligned read ends
+        if cigar[k][1] == 'I':
+            cigar[k][1] = 'S'
+            nm -= cigar[k][0]
+    cigar_str = "".join("{0}{1}".format(n, c) for n, c in cigar)
+    flag = 0 if iso.strand == '+' else 16
+    return "\t".join([read_id, str(flag), iso.chrom, str(blocks[0][1] + 1),
+                      "40", cigar_str, "*", "0", "0", seq,
+                      "".join(chr(33 + q) for q in qvs),
+                      "NM:i:{0}".format(nm), "XS:A:{0}".format(iso.strand)])
+
+
+def gff3_lines(read_id, read, path=1):
+    """Return GMAP-style GFF3 lines of a flnc read on genome, exons are
+    in read order."""
+    iso = read.isoform
+    blocks = _blocks(read)
+    ops = read.ops
+    n_mat, n_mis = ops.count('='), ops.count('X')
+    n_indel = ops.count('I') + ops.count('D')
+    idt = 100. * n_mat / len(ops)
+    start = min(b[1] for b in blocks) + 1
+    end = max(b[2] for b in blocks)
+    pid = "{0}.path{1}".format(read_id, path)
+    mid = "{0}.mrna{1}".format(read_id, path)
+    lines = ["{c}\tsim\tgene\t{s}\t{e}\t.\t{st}\t.\tID={p};Name={n}\n".format(
+        c=iso.chrom, s=start, e=end, st=iso.strand, p=pid, n=read_id)]
+    lines.append("{c}\tsim\tmRNA\t{s}\t{e}\t.\t{st}\t.\tID={m};Name={n};"
+                 "Parent={p};coverage=100.0;identity={idt:.1f};"
+                 "matches={ma};mismatches={mi};indels={ind};unknowns=0\n".
+                 format(c=iso.chrom, s=start, e=end, st=iso.strand, m=mid,
+                        n=read_id, p=pid, idt=idt, ma=n_mat,
+                        mi=n_mis, ind=n_indel))
+    for k, b in enumerate(blocks):
+        score = 100. * b[5].count('=') / max(1, len(b[5]))
+        lines.append("{c}\tsim\texon\t{s}\t{e}\t{sc:.0f}\t{st}\t.\t"
+                     "ID={m}.exon{k};Name={n};Parent={m};"
+                     "Target={n} {qs} {qe} +\n".format(
+                         c=iso.chrom, s=b[1] + 1, e=b[2], sc=score,
+                         st=iso.strand, m=mid, k=k + 1, n=read_id,
+                         qs=b[3] + 1, qe=b[4]))
+    lines.append("###\n")
+    return lines
+
+
+def simulate(out_dir, n_reads=2000, n_genes=50, fl_fraction=.6,
+             chimera_rate=.02, seed=0):
+    """Simulate n_reads reads of insert from n_genes genes to out_dir."""
+    if not op.exists(out_dir):
+        os.makedirs(out_dir)
+    sim = IsoSeqSimulator(seed=seed, n_genes=n_genes)
+    sim.make_genome()
+    rng = sim.rng
+
+    with open(op.join(out_dir, "genome.fasta"), 'w') as f:
+        for chrom in sim.chroms:
+            f.write(_fasta(chrom, sim.genome[chrom]))
+    with open(op.join(out_dir, "isoforms.gff"), 'w') as f:
+        for iso in sorted(sim.isoforms, key=lambda x: (x.chrom, x.exons[0])):
+            f.writelines(iso.gff_lines())
+    with open(op.join(out_dir, "primers.fa"), 'w') as f:
+        f.write(">F0\n{0}\n>R0\n{1}\n".format(PRIMER_F, PRIMER_R))
+
+    flnc = []  # (read id, SimRead)
+    fa = open(op.join(out_dir, "reads_of_insert.fasta"), 'w')
+    fq = open(op.join(out_dir, "reads_of_insert.fastq"), 'w')
+    for zmw in xrange(n_reads):
+        name = "{0}/{1}/ccs".format(MOVIE, zmw)
+        x = rng.random()
+        if x < chimera_rate:
+            parts = [sim.sample_read(True), sim.sample_read(True)]
+        else:
+            parts = [sim.sample_read(x < chimera_rate + fl_fraction)]
+        seq, qvs = "", []
+        for r in parts:
+            five = PRIMER_F if r.full_length or r.tstart == 0 else ""
+            three = sim.polya() + PRIMER_R \
+                if r.full_length or r.tend == len(r.isoform.seq) else ""
+            if len(parts) == 1 and r.full_length:
+                flnc.append(("{0}/{1}/{2}_{3}_CCS".format(
+                    MOVIE, zmw, len(seq) + len(five),
+                    len(seq) + len(five) + len(r.seq)), r))
+            seq += five + r.seq + three
+            qvs += [30] * len(five) + r.qvs + [30] * len(three)
+        if rng.random() < .5:
+            seq, qvs = revcmp(seq), qvs[::-1]
+        fa.write(_fasta(name, seq))
+        fq.write(_fastq(name, seq, qvs))
+    fa.close()
+    fq.close()
+
+    with open(op.join(out_dir, "flnc.fastq"), 'w') as f:
+        for rid, r in flnc:
+            f.write(_fastq(rid, r.seq, r.qvs))
+    with open(op.join(out_dir, "flnc.fasta"), 'w') as f:
+        for rid, r in flnc:
+            f.write(_fasta(rid, r.seq))
+    with open(op.join(out_dir, "truth.txt"), 'w') as f:
+        for rid, r in flnc:
+            f.write("{0}\t{1}\t{2}\t{3}\n".format(
+                rid, r.isoform.isoform_id, r.tstart, encode_ops(r.ops)))
+
+    chrom_index = dict((c, i) for i, c in enumerate(sim.chroms))
+    records = []
+    for rid, r in flnc:
+        line = sam_line(rid, r)
+        fields = line.split('\t', 4)
+        records.append((chrom_index[fields[2]], int(fields[3]), line))
+    records.sort()
+    with open(op.join(out_dir, "flnc.sam"), 'w') as f:
+        f.write("@HD\tVN:1.0\tSO:coordinate\n")
+        for chrom in sim.chroms:
+            f.write("@SQ\tSN:{0}\tLN:{1}\n".format(
+                chrom, len(sim.genome[chrom])))
+        f.write("@PG\tID:GMAP\tPN:simulate_isoseq\n")
+        for _c, _p, line in records:
+            f.write(line + "\n")
+    with open(op.join(out_dir, "flnc.gff"), 'w') as f:
+        f.write("##gff-version   3\n")
+        for rid, r in flnc:
+            f.writelines(gff3_lines(rid, r))
+    return len(flnc)
+
+
+def read_truth(truth_fn):
+    """Return read id --> (isoform id, transcript start, ops)."""
+    d = {}
+    with open(truth_fn) as f:
+        for line in f:
+            rid, iso, tstart, ops = line.rstrip('\n').split('\t')
+            d[rid] = (iso, int(tstart), decode_ops(ops))
+    return d
+
+
+def _columns(seq, tstart, ops):
+    """
+    Return (ins, col, qidx) of a read aligned to transcript from tstart:
+    ins[k] --- read bases inserted before transcript position tstart+k
+    col[k] --- read base or '-' at transcript position tstart+k
+    qidx[k] --- read index of the first read base of ins[k] or col[k]
+    """
+    ins, col, qidx = [""], [], [0]
+    q = 0
+    for op in ops:
+        if op == 'I':
+            ins[-1] += seq[q]
+            q += 1
+            continue
+        if op == 'D':
+            col.append('-')
+        else:
+            col.append(seq[q])
+            q += 1
+        ins.append("")
+        qidx.append(q)
+    return ins, col, qidx
+
+
+def compose_alignment(q_seq, q_truth, t_seq, t_truth):
+    """
+    Return (qStart, qEnd, tStart, tEnd, qAln, tAln) of read q against
+    read t of the same isoform, by composing their alignments to the
+    isoform over the transcript positions both reads cover.
+    """
+    qi, qc, qx = _columns(q_seq, q_truth[1], q_truth[2])
+    ti, tc, tx = _columns(t_seq, t_truth[1], t_truth[2])
+    qs, ts = q_truth[1], t_truth[1]
+    lo, hi = max(qs, ts), min(qs + len(qc), ts + len(tc))
+    q_aln, t_aln = [], []
+    for j in xrange(lo, hi):
+        a, b = qi[j - qs], ti[j - ts]
+        if j > lo and (len(a) > 0 or len(b) > 0):
+            n = max(len(a), len(b))
+            q_aln.append(a.ljust(n, '-'))
+            t_aln.append(b.ljust(n, '-'))
+        a, b = qc[j - qs], tc[j - ts]
+        if a != '-' or b != '-':
+            q_aln.append(a)
+            t_aln.append(b)
+    q_start = qx[lo - qs] + len(qi[lo - qs])
+    t_start = tx[lo - ts] + len(ti[lo - ts])
+    return (q_start, qx[hi - qs], t_start, tx[hi - ts],
+            "".join(q_aln), "".join(t_aln))
+
+
+def m5_line(q_id, q_seq, q_truth, t_id, t_seq, t_truth):
+    """Return a BLASR -m 5 line of read q against read t."""
+    q_start, q_end, t_start, t_end, q_aln, t_aln = \
+        compose_alignment(q_seq, q_truth, t_seq, t_truth)
+    n_mat = sum(1 for a, b in zip(q_aln, t_aln) if a == b)
+    n_ins = t_aln.count('-')
+    n_del = q_aln.count('-')
+    n_mis = len(q_aln) - n_mat - n_ins - n_del
+    pattern = "".join('|' if a == b else '*' for a, b in zip(q_aln, t_aln))
+    score = -5 * n_mat + 6 * n_mis + 5 * (n_ins + n_del)
+    # blasr appends /<start>_<end> to query names
+    return " ".join(str(x) for x in [
+        "{0}/0_{1}".format(q_id, len(q_seq)), len(q_seq), q_start, q_end,
+        '+', t_id, len(t_seq), t_start, t_end, '+', score, n_mat, n_mis,
+        n_ins, n_del, 254, q_aln, pattern, t_aln])
+
+
+def main():
+    """Main function of simulate_isoseq.py."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0],
+                                     prog="simulate_isoseq.py")
+    parser.add_argument("out_dir", help="Output directory")
+    parser.add_argument("--n_reads", type=int, default=2000,
+                        help="Number of reads of insert (default: 2000)")
+    parser.add_argument("--n_genes", type=int, default=50,
+                        help="Number of genes (default: 50)")
+    parser.add_argument("--fl_fraction", type=float, default=.6,
+                        help="Fraction of full-length reads (default: 0.6)")
+    parser.add_argument("--chimera_rate", type=float, default=.02,
+                        help="Fraction of chimeric reads (default: 0.02)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Random seed (default: 0)")
+    args = parser.parse_args()
+    n = simulate(args.out_dir, n_reads=args.n_reads, n_genes=args.n_genes,
+                 fl_fraction=args.fl_fraction,
+                 chimera_rate=args.chimera_rate, seed=args.seed)
+    print >> sys.stderr, "{0} reads, {1} flnc reads written to {2}".format(
+        args.n_reads, n, args.out_dir)
+
+
+if __name__ == "__main__":
+    main()
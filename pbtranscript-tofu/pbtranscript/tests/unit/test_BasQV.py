@@ -0,0 +1,99 @@
+"""Test batched QV reading of pbtools.pbtranscript.io.BasQV."""
+import unittest
+import os.path as op
+import numpy as np
+import h5py
+from pbtools.pbtranscript.Utils import mkdir
+from pbtools.pbtranscript.io.BasQV import parse_seqid, read_qvs, \
+    read_qvs_of_files, basQVcacher
+
+MOVIE = "m000_s1_p0"
+
+
+def write_group(h5, group, holes, lens, qv_base):
+    """Write a base calls group, QVs of ZMW i are qv_base + i (mod 100)."""
+    h5[group + "/ZMW/HoleNumber"] = np.array(holes, dtype=np.uint32)
+    h5[group + "/ZMW/NumEvent"] = np.array(lens, dtype=np.int32)
+    qvs = np.concatenate([np.arange(n) % 100 + qv_base + i
+                          for i, n in enumerate(lens)]).astype(np.uint8)
+    for qv_name in ("QualityValue", "InsertionQV", "DeletionQV",
+                    "SubstitutionQV"):
+        h5[group + "/" + qv_name] = qvs
+
+
+class Test_BasQV(unittest.TestCase):
+    """Test parse_seqid, read_qvs and basQVcacher.precache."""
+    def setUp(self):
+        """Write two parts of a movie with raw and CCS base calls."""
+        outDir = op.join(op.dirname(op.dirname(op.abspath(__file__))), "out")
+        mkdir(outDir)
+        self.parts = [op.join(outDir, MOVIE + ".{0}.bax.h5".format(i))
+                      for i in (1, 2)]
+        with h5py.File(self.parts[0], 'w') as h5:
+            write_group(h5, "PulseData/BaseCalls", [0, 5, 9], [300, 200, 0], 0)
+            write_group(h5, "PulseData/ConsensusBaseCalls", [0, 5, 9],
+                        [0, 50, 0], 100)
+        with h5py.File(self.parts[1], 'w') as h5:
+            write_group(h5, "PulseData/BaseCalls", [20, 21], [100, 400], 0)
+            write_group(h5, "PulseData/ConsensusBaseCalls", [20, 21],
+                        [80, 0], 100)
+
+    def test_parse_seqid(self):
+        """Test parse_seqid."""
+        self.assertEqual(parse_seqid(MOVIE + "/5/10_20"),
+                         (MOVIE, 5, 10, 20, '+', False, False))
+        self.assertEqual(parse_seqid(MOVIE + "/5/20_10_CCS fiveseen=1"),
+                         (MOVIE, 5, 10, 20, '-', True, False))
+        self.assertEqual(parse_seqid(MOVIE + "/5/ccs"),
+                         (MOVIE, 5, 0, 0, '+', True, True))
+        with self.assertRaises(ValueError):
+            parse_seqid(MOVIE + "/5")
+
+    def test_read_qvs(self):
+        """Reads are located in parts and sliced from slabs."""
+        seqids = [MOVIE + "/21/350_300", MOVIE + "/0/10_20",
+                  MOVIE + "/5/0_50_CCS", MOVIE + "/20/ccs",
+                  MOVIE + "/21/0_5_CCS"]
+        self.assertEqual(read_qvs({MOVIE: self.parts}, [], ["DeletionQV"]), {})
+        qvs = read_qvs({MOVIE: self.parts}, seqids,
+                       ["QualityValue", "DeletionQV"], cpus=2)
+        self.assertEqual(sorted(qvs.keys()), sorted(seqids))
+        self.assertEqual(list(qvs[seqids[0]]["QualityValue"]),
+                         [p % 100 + 1 for p in range(349, 299, -1)])
+        self.assertEqual(list(qvs[seqids[1]]["DeletionQV"]),
+                         list(range(10, 20)))
+        self.assertEqual(list(qvs[seqids[2]]["QualityValue"]),
+                         list(range(101, 151)))
+        self.assertEqual(len(qvs[seqids[3]]["QualityValue"]), 80)
+        # no CCS base calls, read from raw base calls
+        self.assertEqual(list(qvs[seqids[4]]["QualityValue"]),
+                         list(range(1, 6)))
+
+        # one hyperslab per read
+        reads = [(seqid, ) + parse_seqid(seqid)[1:] for seqid in seqids]
+        reads.sort(key=lambda x: x[1])
+        qvs2 = read_qvs_of_files(self.parts, reads, ["QualityValue"],
+                                 max_slab_size=10)
+        for seqid in seqids:
+            self.assertEqual(list(qvs2[seqid]["QualityValue"]),
+                             list(qvs[seqid]["QualityValue"]))
+
+        with self.assertRaises(IOError):
+            read_qvs({MOVIE: self.parts}, [MOVIE + "/7/0_10"], ["DeletionQV"])
+        with self.assertRaises(IOError):
+            read_qvs({MOVIE: self.parts}, ["m1/0/0_10"], ["DeletionQV"])
+
+    def test_precache(self):
+        """All parts of a movie are added from one bax.h5."""
+        qver = basQVcacher()
+        qver.add_bash5(self.parts[1])
+        self.assertEqual(qver.bas_files, {MOVIE: self.parts})
+        seqid = MOVIE + "/5/0_2"
+        qver.precache([seqid])
+        self.assertAlmostEqual(qver.get(seqid, "InsertionQV", 1), 10 ** -0.2)
+        self.assertAlmostEqual(qver.get_mean(seqid, "DeletionQV"),
+                               (10 ** -0.1 + 10 ** -0.2) / 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
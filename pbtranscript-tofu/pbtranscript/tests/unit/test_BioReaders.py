@@ -0,0 +1,61 @@
+"""Test GMAPSAMReader and GMAPSAMRecord."""
+import unittest
+import os.path as op
+from pbtools.pbtranscript.Utils import mkdir
+from pbtools.pbtranscript.BioReaders import GMAPSAMReader, GMAPSAMRecord, \
+    gmap_line_passes
+
+
+class Test_BioReaders(unittest.TestCase):
+    """Test GMAPSAMReader and GMAPSAMRecord."""
+    def setUp(self):
+        """Write a GMAP SAM."""
+        outDir = op.join(op.dirname(op.dirname(op.abspath(__file__))), "out")
+        mkdir(outDir)
+        self.sam = op.join(outDir, "test_BioReaders.sam")
+        self.lines = [
+            "q1\t4\t*\t0\t0\t*\t*\t0\t0\tACGT\t*",
+            "q2\t0\tchr1\t101\t40\t5S50M2I48M100N30M2D20M\t*\t0\t0\t*\t*\tNM:i:4\tXS:A:-",
+            "q3/0_100\t16\tchr1\t201\t40\t100M\t*\t0\t0\t*\t*\tNM:i:20"]
+        with open(self.sam, 'w') as f:
+            f.write("@SQ\tSN:chr1\tLN:100000\n")
+            f.write("\n".join(self.lines) + "\n")
+        self.qlen = {'q1': 200, 'q2': 160, 'q3': 100}
+
+    def test_record(self):
+        """Test attributes of a spliced record."""
+        r = GMAPSAMRecord(self.lines[1], {'chr1': 100000}, self.qlen)
+        self.assertEqual(r.qID, 'q2')
+        self.assertEqual((r.sStart, r.sEnd), (100, 350))
+        self.assertEqual([(e.start, e.end) for e in r.segments],
+                         [(100, 198), (298, 350)])
+        self.assertEqual(list(r.exon_starts), [100, 298])
+        self.assertEqual((r.qStart, r.qEnd, r.qLen), (5, 155, 160))
+        self.assertEqual((r.num_ins, r.num_del, r.num_mat_or_sub), (2, 2, 148))
+        self.assertAlmostEqual(r.identity, 1. - 4. / 152)
+        self.assertAlmostEqual(r.qCoverage, 150. / 160)
+        self.assertEqual(r.flag.strand, '-')  # from XS:A
+        self.assertEqual(r._flag_strand, '+')
+
+        r = GMAPSAMRecord(self.lines[0])
+        self.assertEqual(r.sID, '*')
+        self.assertEqual((r.sStart, r.segments, r.flag), (None, None, None))
+
+    def test_prefilter(self):
+        """Test the reader pre-filter."""
+        reader = GMAPSAMReader(self.sam, True)
+        self.assertEqual([r.qID for r in reader], ['q1', 'q2', 'q3/0_100'])
+        reader = GMAPSAMReader(self.sam, True, mapped_only=True)
+        self.assertEqual([r.qID for r in reader], ['q2', 'q3/0_100'])
+        self.assertEqual(reader.num_filtered, 1)
+        reader = GMAPSAMReader(self.sam, True, query_len_dict=self.qlen,
+                               min_coverage=.9, min_identity=.95)
+        self.assertEqual([r.qID for r in reader], ['q2'])
+        self.assertFalse(gmap_line_passes(self.lines[2], self.qlen,
+                                          min_identity=.95))
+        self.assertTrue(gmap_line_passes(self.lines[2], self.qlen,
+                                         min_coverage=.99))
+
+
+if __name__ == "__main__":
+    unittest.main()
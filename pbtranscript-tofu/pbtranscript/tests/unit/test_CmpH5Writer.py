@@ -0,0 +1,137 @@
+"""Test pbtools.pbtranscript.io.CmpH5Writer."""
+import unittest
+import random
+import os.path as op
+import numpy as np
+import h5py
+from pbtools.pbtranscript.Utils import mkdir
+from pbtools.pbtranscript.io.CmpH5Writer import write_cmph5, \
+    read_locator_indices, ALN_INDEX_COLUMNS
+
+MOVIE = "m000_s1_p0"
+QVS = ("QualityValue", "InsertionQV", "DeletionQV", "SubstitutionQV")
+TAGS = "ACGTN"
+
+SAM = "\n".join([
+    "@HD\tVN:1.3.1",
+    "@SQ\tSN:c0\tLN:16",
+    "@SQ\tSN:c1\tLN:7",
+    "\t".join([MOVIE + "/3/10_17", "0", "c1", "1", "254", "7M", "*", "0",
+               "0", "GATTACA", "*"]),
+    "\t".join([MOVIE + "/7/100_120", "0", "c0", "3", "254",
+               "2S5M1I3M2D4M5S", "*", "0", "0",
+               "GG" + "CCGGT" + "A" + "TCA" + "GGTT" + "CCCCC", "*"]),
+    "\t".join([MOVIE + "/3/0_10", "4", "*", "0", "0", "*", "*", "0", "0",
+               "ACGTACGTAC", "*"]),
+    "\t".join([MOVIE + "/7/130_140", "16", "c0", "1", "254", "3S7M", "*",
+               "0", "0", "TTT" + "AACCGGT", "*"])]) + "\n"
+
+
+class Test_CmpH5Writer(unittest.TestCase):
+    """Test write_cmph5 and read_locator_indices."""
+    def setUp(self):
+        """Write a bax.h5 file without MergeQV, a reference and a sam."""
+        outDir = op.join(op.dirname(op.dirname(op.abspath(__file__))), "out")
+        mkdir(outDir)
+        self.bax_fn = op.join(outDir, MOVIE + ".1.bax.h5")
+        with h5py.File(self.bax_fn, 'w') as h5:
+            g = "PulseData/BaseCalls"
+            h5[g + "/ZMW/HoleNumber"] = np.array([3, 7], dtype=np.uint32)
+            h5[g + "/ZMW/NumEvent"] = np.array([50, 200], dtype=np.int32)
+            # QVs of a base are its position in the ZMW read
+            qvs = np.concatenate([np.arange(50), np.arange(200)])
+            for qv_name in QVS:
+                h5[g + "/" + qv_name] = qvs.astype(np.uint8)
+            # tags of a base are TAGS[its position in the ZMW read % 5]
+            tags = np.array([ord(TAGS[i % 5]) for i in qvs], dtype=np.uint8)
+            for tag in ("DeletionTag", "SubstitutionTag"):
+                h5[g + "/" + tag] = tags
+            h5[g].attrs["ChangeListID"] = "2.1.0.0.127824"
+            h5.create_group("ScanData/RunInfo")
+            h5["ScanData/RunInfo"].attrs["BindingKit"] = "100356300"
+            h5["ScanData/RunInfo"].attrs["SequencingKit"] = "100356200"
+        self.ref_fn = op.join(outDir, "test_CmpH5Writer.ref.fa")
+        with open(self.ref_fn, 'w') as f:
+            f.write(">c0 isoform=c0\nAACCGGTTAACCGGTT\n>c1 isoform=c1\nGATTACA\n")
+        self.sam_fn = op.join(outDir, "test_CmpH5Writer.sam")
+        with open(self.sam_fn, 'w') as f:
+            f.write(SAM)
+        self.cmph5_fn = op.join(outDir, "test_CmpH5Writer.cmp.h5")
+
+    def test_read_locator_indices(self):
+        """Test read_locator_indices."""
+        n_back, n_overlap = read_locator_indices([0, 2, 5, 10], [8, 4, 6, 12])
+        self.assertEqual(list(n_back), [0, 1, 2, 0])
+        self.assertEqual(list(n_overlap), [0, 1, 1, 0])
+
+        # same as the definition, on random alignments
+        random.seed(0)
+        t_start = sorted(random.randint(0, 500) for _i in range(300))
+        t_end = [s + random.randint(1, 100) for s in t_start]
+        n_back, n_overlap = read_locator_indices(t_start, t_end)
+        for j in range(len(t_start)):
+            overlaps = [i for i in range(j) if t_end[i] > t_start[j]]
+            self.assertEqual(n_back[j], j - overlaps[0] if overlaps else 0)
+            self.assertEqual(n_overlap[j], len(overlaps))
+
+    def test_write_cmph5(self):
+        """Alignments are sorted by reference and tStart, with pulses."""
+        n = write_cmph5(self.sam_fn, self.ref_fn, {MOVIE: [self.bax_fn]},
+                        self.cmph5_fn)
+        self.assertEqual(n, 3)
+        with h5py.File(self.cmph5_fn, 'r') as h5:
+            index = h5["AlnInfo/AlnIndex"][:]
+            col = dict((name, i) for i, name in enumerate(ALN_INDEX_COLUMNS))
+            self.assertEqual(list(index[:, col["RefGroupID"]]), [1, 1, 2])
+            self.assertEqual(list(h5["RefGroup/RefInfoID"][:]), [1, 2])
+            self.assertEqual(h5["RefGroup/OffsetTable"][:].tolist(),
+                             [[1, 0, 2], [2, 2, 3]])
+            self.assertEqual(list(h5["RefInfo/Length"][:]), [16, 7])
+            self.assertEqual(list(h5["MovieInfo/Name"][:]), [MOVIE])
+            self.assertEqual(list(h5["MovieInfo/BindingKit"][:]),
+                             ["100356300"])
+
+            # reverse strand alignment to c0 first
+            rev, fwd = index[0], index[1]
+            self.assertEqual([rev[col[c]] for c in
+                              ("tStart", "tEnd", "RCRefStrand", "HoleNumber",
+                               "rStart", "rEnd", "nM", "nBackRead")],
+                             [0, 7, 1, 7, 130, 137, 7, 0])
+            self.assertEqual([fwd[col[c]] for c in
+                              ("tStart", "tEnd", "RCRefStrand", "rStart",
+                               "rEnd", "nM", "nMM", "nIns", "nDel",
+                               "nBackRead", "nReadOverlap")],
+                             [2, 16, 0, 102, 115, 11, 1, 1, 2, 1, 1])
+            self.assertEqual(index[2, col["MoleculeID"]] !=
+                             fwd[col["MoleculeID"]], True)
+            self.assertEqual(rev[col["MoleculeID"]], fwd[col["MoleculeID"]])
+
+            group = h5["ref000001/rg1-0"]
+            self.assertTrue("MergeQV" not in group)
+            b, e = fwd[col["Offset_begin"]], fwd[col["Offset_end"]]
+            self.assertEqual(e - b, 15)
+            aln = group["AlnArray"][b:e]
+            # A (1) inserted in read, C (2) deleted from read
+            self.assertEqual(aln[5], 1 << 4)
+            self.assertEqual(list(aln[9:11]), [2, 2])
+            qvs = group["QualityValue"][b:e]
+            self.assertEqual(list(qvs[aln >> 4 != 0]), list(range(102, 115)))
+            self.assertEqual(list(qvs[9:11]), [255, 255])
+
+            b, e = rev[col["Offset_begin"]], rev[col["Offset_end"]]
+            self.assertEqual(list(group["DeletionQV"][b:e]),
+                             list(range(136, 129, -1)))
+            # tags of '-' reads are reversed and complemented
+            comp = dict(zip("ACGTN", "TGCAN"))
+            for tag in ("DeletionTag", "SubstitutionTag"):
+                self.assertEqual("".join(chr(x) for x in group[tag][b:e]),
+                                 "".join(comp[TAGS[i % 5]]
+                                         for i in range(136, 129, -1)))
+            b, e = fwd[col["Offset_begin"]], fwd[col["Offset_end"]]
+            tags = group["SubstitutionTag"][b:e]
+            self.assertEqual("".join(chr(x) for x in tags[aln >> 4 != 0]),
+                             "".join(TAGS[i % 5] for i in range(102, 115)))
+
+
+if __name__ == "__main__":
+    unittest.main()
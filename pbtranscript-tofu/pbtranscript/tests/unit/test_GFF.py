@@ -0,0 +1,181 @@
+"""Test GFF readers, which parse with the compiled c_GFF."""
+import unittest
+import random
+import os.path as op
+from pbtools.pbtranscript.Utils import mkdir
+from pbtools.pbtranscript.io.GFF import collapseGFFReader, gmapRecord, \
+    write_collapseGFF_format, load_collapse_gff, gmapGFFReader, GTF
+
+GMAP_GFF = """##gff-version   3
+# Generated by GMAP
+chr1\tmm10\tgene\t1001\t2000\t.\t+\t.\tID=r1.path1;Name=r1
+chr1\tmm10\tmRNA\t1001\t2000\t.\t+\t.\tID=r1.mrna1;Name=r1;Parent=r1.path1;coverage=99.5;identity=98.0
+chr1\tmm10\texon\t1001\t1100\t97\t+\t.\tID=r1.mrna1.exon1;Name=r1;Parent=r1.mrna1;Target=r1 1 100 +
+chr1\tmm10\texon\t1901\t2000\t100\t+\t.\tID=r1.mrna1.exon2;Name=r1;Parent=r1.mrna1;Target=r1 101 200 +
+chr1\tmm10\tCDS\t1051\t1100\t97\t+\t0\tID=r1.mrna1.cds1;Name=r1;Parent=r1.mrna1;Target=r1 51 100 +
+chr1\tmm10\tCDS\t1901\t1950\t100\t+\t1\tID=r1.mrna1.cds2;Name=r1;Parent=r1.mrna1;Target=r1 101 150 +
+###
+chr2\tmm10\tgene\t2001\t3000\t.\t-\t.\tID=r2.path1;Name=r2
+chr2\tmm10\tmRNA\t2001\t3000\t.\t-\t.\tID=r2.mrna1;Name=r2;Parent=r2.path1;coverage=100.0;identity=99.0
+chr2\tmm10\texon\t2901\t3000\t99\t-\t.\tID=r2.mrna1.exon1;Name=r2;Parent=r2.mrna1;Target=r2 1 100 +
+chr2\tmm10\texon\t2001\t2100\t98\t-\t.\tID=r2.mrna1.exon2;Name=r2;Parent=r2.mrna1;Target=r2 101 200 +
+###
+chr2\tmm10\tgene\t2001\t3000\t.\t+\t.\tID=r3.path1;Name=r3
+chr2\tmm10\tmRNA\t2001\t3000\t.\t+\t.\tID=r3.mrna1;Name=r3;Parent=r3.path1;coverage=50.0;identity=90.0
+chr2\tmm10\texon\t2901\t3000\t99\t+\t.\tID=r3.mrna1.exon1;Name=r3;Parent=r3.mrna1;Target=r3 1 100 +
+chr2\tmm10\texon\t2001\t2100\t98\t+\t.\tID=r3.mrna1.exon2;Name=r3;Parent=r3.mrna1;Target=r3 101 200 +
+###
+"""
+
+GTF_LINES = """#!genome-build GRCm38
+
+chr1\tHAVANA\tgene\t101\t500\t.\t+\t.\tgene_id "G1"; gene_type "protein_coding"; gene_status "KNOWN"; gene_name "Abc"
+chr1\tHAVANA\ttranscript\t101\t500\t.\t+\t.\tgene_id "G1"; transcript_id "T1"; gene_type "protein_coding"; gene_status "KNOWN"; gene_name "Abc"; tag "basic"; tag "CCDS"
+chr1\tHAVANA\texon\t101\t200\t.\t+\t.\tgene_id "G1"; transcript_id "T1"; gene_name "Abc"
+chr1\tHAVANA\texon\t401\t500\t.\t+\t.\tgene_id "G1"; transcript_id "T1"; gene_name "Abc"
+chr1\tHAVANA\ttranscript\t151\t500\t.\t+\t.\tgene_id "G1"; transcript_id "T2"
+chr1\tHAVANA\texon\t151\t200\t.\t+\t.\tgene_id "G1"; transcript_id "T2"
+chr1\tHAVANA\texon\t401\t500\t.\t+\t.\tgene_id "G1"; transcript_id "T2"
+"""
+
+
+class Test_collapseGFFReader(unittest.TestCase):
+    """Test collapseGFFReader against pure Python gmapRecords."""
+    def setUp(self):
+        """Write random gmapRecords to a collapsed GFF."""
+        outDir = op.join(op.dirname(op.dirname(op.abspath(__file__))), "out")
+        mkdir(outDir)
+        self.gff = op.join(outDir, "test_GFF.collapsed.gff")
+        random.seed(0)
+        self.records = []
+        for i in range(50):
+            r = gmapRecord(chr="chr{0}".format(i % 3), coverage=None,
+                           identity=None, strand=random.choice("+-"),
+                           seqid="PB.{0}.{1}".format(i / 4 + 1, i % 4 + 1))
+            start = random.randint(0, 100000)
+            for _j in range(random.randint(1, 6)):
+                end = start + random.randint(1, 500)
+                # exons of collapsed GFF are added on '+', like GFF.py did
+                r.add_exon(start, end, start, end, rstrand='+', score=None)
+                start = end + random.randint(0, 2000)
+            self.records.append(r)
+        with open(self.gff, 'w') as f:
+            for r in self.records:
+                write_collapseGFF_format(f, r)
+            f.write("\n")
+
+    def test_read(self):
+        """Records have the fields of the gmapRecords written."""
+        recs = [r for r in collapseGFFReader(self.gff)]
+        self.assertEqual(len(recs), len(self.records))
+        for r, expected in zip(recs, self.records):
+            self.assertEqual((r.chr, r.strand, r.seqid),
+                             (expected.chr, expected.strand, expected.seqid))
+            self.assertEqual((r.start, r.end, r.get_start(), r.get_end()),
+                             (expected.start, expected.end,
+                              expected.start, expected.end))
+            self.assertEqual([(e.start, e.end) for e in r.ref_exons],
+                             [(e.start, e.end) for e in expected.ref_exons])
+            self.assertEqual([(e.start, e.end) for e in r.seq_exons],
+                             [(e.start, e.end) for e in expected.seq_exons])
+            self.assertEqual(r.scores, expected.scores)
+            self.assertEqual((r.coverage, r.identity), (None, None))
+
+        reader = collapseGFFReader(self.gff)
+        self.assertEqual(reader.read().seqid, "PB.1.1")
+        self.assertEqual(reader.read().seqid, "PB.1.2")
+
+    def test_unexpected_feature(self):
+        """A feature other than transcript or exon is an error."""
+        with open(self.gff, 'w') as f:
+            f.write("chr1\tPacBio\tgene\t1\t10\t.\t+\t.\tgene_id \"PB.1\";\n")
+        self.assertRaises(ValueError, list, collapseGFFReader(self.gff))
+
+    def test_load_collapse_gff(self):
+        """Columns have the fields of the records of collapseGFFReader."""
+        recs = [r for r in collapseGFFReader(self.gff)]
+        cols = load_collapse_gff(self.gff)
+        self.assertEqual(list(cols['seqid']), [r.seqid for r in recs])
+        self.assertEqual(list(cols['chr']), [r.chr for r in recs])
+        self.assertEqual(list(cols['strand']), [r.strand for r in recs])
+        self.assertEqual(list(cols['start']), [r.start for r in recs])
+        self.assertEqual(list(cols['end']), [r.end for r in recs])
+        offsets = cols['exon_offsets']
+        self.assertEqual(len(offsets), len(recs) + 1)
+        for i, r in enumerate(recs):
+            self.assertEqual(zip(cols['exon_start'][offsets[i]:offsets[i+1]],
+                                 cols['exon_end'][offsets[i]:offsets[i+1]]),
+                             [(e.start, e.end) for e in r.ref_exons])
+
+
+class Test_gmapGFFReader(unittest.TestCase):
+    """Test gmapGFFReader."""
+    def setUp(self):
+        """Write a GMAP GFF."""
+        outDir = op.join(op.dirname(op.dirname(op.abspath(__file__))), "out")
+        mkdir(outDir)
+        self.gff = op.join(outDir, "test_GFF.gmap.gff")
+        with open(self.gff, 'w') as f:
+            f.write(GMAP_GFF)
+
+    def test_read(self):
+        """Exons are sorted by reference position, CDS are kept."""
+        recs = [r for r in gmapGFFReader(self.gff)]
+        self.assertEqual([r.seqid for r in recs], ["r1", "r2", "r3"])
+        r1, r2, r3 = recs
+        self.assertEqual((r1.chr, r1.strand, r1.sstrand, r1.coverage,
+                          r1.identity), ("chr1", "+", "+", 99.5, 98.0))
+        self.assertEqual([(e.start, e.end) for e in r1.ref_exons],
+                         [(1000, 1100), (1900, 2000)])
+        self.assertEqual([(e.start, e.end) for e in r1.seq_exons],
+                         [(0, 100), (100, 200)])
+        self.assertEqual(r1.scores, [97.0, 100.0])
+        self.assertEqual((r1.start, r1.end), (1000, 2000))
+        self.assertEqual([(e.start, e.end) for e in r1.cds_exons],
+                         [(1050, 1100), (1900, 1950)])
+        self.assertEqual((r1.cds_seq_start, r1.cds_seq_end), (50, 150))
+
+        self.assertEqual((r2.chr, r2.strand), ("chr2", "-"))
+        self.assertEqual([(e.start, e.end) for e in r2.ref_exons],
+                         [(2000, 2100), (2900, 3000)])
+        self.assertEqual([(e.start, e.end) for e in r2.seq_exons],
+                         [(100, 200), (0, 100)])
+        self.assertEqual((r2.cds_exons, r2.cds_seq_start), ([], None))
+
+        # non-colinear exons on '+', the record is returned without CDS
+        self.assertEqual([(e.start, e.end) for e in r3.ref_exons],
+                         [(2900, 3000)])
+        self.assertFalse(hasattr(r3, 'cds_exons'))
+
+        reader = gmapGFFReader(self.gff)
+        self.assertEqual(reader.read().seqid, "r1")
+        self.assertEqual(reader.f.tell(), GMAP_GFF.index("chr2"))
+
+
+class Test_GTF(unittest.TestCase):
+    """Test GTF."""
+    def test_readGTF(self):
+        """Transcripts, exons and gene info."""
+        outDir = op.join(op.dirname(op.dirname(op.abspath(__file__))), "out")
+        mkdir(outDir)
+        gtf_fn = op.join(outDir, "test_GFF.gtf")
+        with open(gtf_fn, 'w') as f:
+            f.write(GTF_LINES)
+        gtf = GTF(gtf_fn)
+        self.assertEqual(sorted(gtf.find("chr1", 0, 1000)), ["T1", "T2"])
+        self.assertEqual(gtf.find("chr1", 0, 120), ["T1"])
+        self.assertEqual(gtf.transcript_info["T1"],
+                         {'chr': "chr1", 'gname': "Abc", 'gid': "G1",
+                          'type': "protein_coding", 'status': "KNOWN",
+                          'strand': "+", 'tags': ["basic", "CCDS"]})
+        self.assertEqual(gtf.transcript_info["T2"]['gname'], "NA")
+        self.assertEqual(gtf.transcript["T1"].find(150, 450),
+                         [{'ith': 0, 'chr': "chr1"}, {'ith': 1, 'chr': "chr1"}])
+        self.assertEqual(dict(gtf.exon),
+                         {(100, 200): [("T1", 0, "chr1")],
+                          (400, 500): [("T1", 1, "chr1"), ("T2", 1, "chr1")],
+                          (150, 200): [("T2", 0, "chr1")]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+"""Test ClusterStore."""
+import unittest
+import shutil
+import os.path as op
+from pbtools.pbtranscript.ice.IceClusterStore import ClusterStore
+
+
+class Test_ClusterStore(unittest.TestCase):
+    """Test ClusterStore."""
+    def setUp(self):
+        """Initialize."""
+        self.outDir = op.join(op.dirname(op.dirname(op.abspath(__file__))),
+                              "out")
+        self.storeDir = op.join(self.outDir, "test_ClusterStore")
+        if op.exists(self.storeDir):
+            shutil.rmtree(self.storeDir)
+
+    def test_put_get_delete(self):
+        """Test put, get, delete, reopen, compact and export."""
+        s = ClusterStore(self.storeDir)
+        s.put(0, "in.fa", ">a\nAAAA\n")
+        s.put(1, "in.fa", ">b\nCCCC\n")
+        s.put(0, "in.fa", ">a\nAAAA\n>c\nGGGG\n")
+        s.put(1, "in.fa.1stseq.fasta", ">c1\nCCCC\n")
+        s.delete(1)
+        self.assertEqual(s.get(0, "in.fa"), ">a\nAAAA\n>c\nGGGG\n")
+        self.assertFalse(s.has(1, "in.fa"))
+        s.close()
+
+        s = ClusterStore(self.storeDir)
+        self.assertEqual(s.names(0), ["in.fa"])
+        self.assertEqual(s.names(1), [])
+        s.compact()
+        self.assertEqual(s.get(0, "in.fa"), ">a\nAAAA\n>c\nGGGG\n")
+        out_fns = s.export(0, op.join(self.storeDir, "c0"))
+        self.assertEqual(open(out_fns[0]).read(), ">a\nAAAA\n>c\nGGGG\n")
+        s.close()
+
+        s = ClusterStore(self.storeDir, reset=True)
+        self.assertFalse(s.has(0, "in.fa"))
+        s.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""Test pbtools.pbtranscript.ice.IceIterative."""
+import unittest
+import os.path as op
+import multiprocessing
+import numpy as np
+from pbtools.pbtranscript.Utils import mkdir
+from pbtools.pbtranscript.ice import IceIterative
+
+
+class _Hit(object):
+    """A hit with the fields _score_las_out uses."""
+    def __init__(self, qID, cID, qStart, qEnd, fakecigar):
+        self.qID, self.cID = qID, cID
+        self.qStart, self.qEnd, self.fakecigar = qStart, qEnd, fakecigar
+
+
+def _dalign_against_ref(query_obj, ref_obj, las_out_filename, **kwargs):
+    """Yield hits of a fake LA4Ice output with a hit per line:
+    qID cID qStart qEnd fakecigar ('*' if the hit failed checks)."""
+    for line in open(las_out_filename):
+        qid, cid, qstart, qend, cigar = line.split()
+        yield _Hit(qid, int(cid), int(qstart), int(qend),
+                   None if cigar == '*' else cigar)
+
+
+class _ProbQV(object):
+    """A prob model whose logprob depends on the alignment."""
+    def calc_prob_from_aln(self, qID, qStart, qEnd, fakecigar):
+        return -0.1 * fakecigar.count('X') - 0.01 * (qEnd - qStart)
+
+
+class Test_score_las_outs(unittest.TestCase):
+    """Test score_las_outs."""
+    def setUp(self):
+        """Write fake LA4Ice outputs, use a fake dalign_against_ref."""
+        self.outDir = op.join(op.dirname(op.dirname(op.abspath(__file__))),
+                              "out", "test_IceIterative")
+        mkdir(self.outDir)
+        self.las_outs = []
+        for i in range(5):
+            fn = op.join(self.outDir, "block{0}.las.out".format(i))
+            with open(fn, 'w') as f:
+                for j in range(20):
+                    f.write("q{0}_{1} {2} {3} {4} {5}\n".format(
+                        i, j, (i * j) % 7, j, 100 + i * j,
+                        '*' if j % 5 == 0 else "M" * j + "X" * i))
+            self.las_outs.append(fn)
+        self.dalign_against_ref = IceIterative.dalign_against_ref
+        IceIterative.dalign_against_ref = _dalign_against_ref
+
+    def tearDown(self):
+        """Restore dalign_against_ref."""
+        IceIterative.dalign_against_ref = self.dalign_against_ref
+
+    def test_pool(self):
+        """Pooled results are those of the serial path, in order."""
+        serial = IceIterative.score_las_outs(self.las_outs, None, None,
+                                             _ProbQV(), {}, 1)
+        pooled = IceIterative.score_las_outs(self.las_outs, None, None,
+                                             _ProbQV(), {}, 3)
+        self.assertEqual(len(serial), 5)
+        self.assertEqual(len(pooled), 5)
+        for (qids, cids, probs), (qids2, cids2, probs2) in zip(serial, pooled):
+            self.assertEqual(qids, qids2)
+            np.testing.assert_array_equal(cids, cids2)
+            # hits which failed checks have NaN probs in both
+            np.testing.assert_array_equal(probs, probs2)
+        self.assertTrue(np.isnan(serial[1][2][0]))
+        self.assertEqual(IceIterative._g2_shared_args, None)
+
+    def test_failure(self):
+        """A failed worker raises, and no workers are left behind."""
+        las_outs = self.las_outs + [op.join(self.outDir, "missing.las.out")]
+        self.assertRaises(IOError, IceIterative.score_las_outs, las_outs,
+                          None, None, _ProbQV(), {}, 3)
+        self.assertEqual(multiprocessing.active_children(), [])
+        self.assertEqual(IceIterative._g2_shared_args, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Test IceJournal."""
+import unittest
+import shutil
+import os.path as op
+from pbtools.pbtranscript.ice.IceJournal import IceJournal
+
+
+class Test_IceJournal(unittest.TestCase):
+    """Test IceJournal."""
+    def setUp(self):
+        """Initialize."""
+        self.outDir = op.join(op.dirname(op.dirname(op.abspath(__file__))),
+                              "out")
+        self.journalDir = op.join(self.outDir, "test_IceJournal")
+        if op.exists(self.journalDir):
+            shutil.rmtree(self.journalDir)
+
+    def test_replay(self):
+        """Replay snapshot + journal up to the last commit."""
+        state = {'uc': {0: ['a', 'b'], 1: ['c']},
+                 'refs': {0: 'c0.fasta', 1: 'c1.fasta'},
+                 'd': {'a': {0: -1.0}, 'b': {0: -2.0, 1: -3.0}, 'c': {1: -1.0}},
+                 'newids': set(['a', 'b', 'c'])}
+        j = IceJournal(self.journalDir)
+        j.start(state)
+        j.record('rm', 0, 'b')
+        j.record('add', 1, 'b')
+        j.record('set', 2, ['d'])
+        j.record('ref', 1, 'c1.new.fasta')
+        j.touch([1])
+        j.commit('first', {'newids': set(['b', 'd'])})
+        # uncommitted records are ignored, touched clusters are dirty
+        j.touch([0, 3])
+        j.record('del', 0)
+        j.close()
+
+        state, touched, dirty, offset = IceJournal(self.journalDir).replay()
+        self.assertEqual(state['uc'], {0: ['a'], 1: ['c', 'b'], 2: ['d']})
+        self.assertEqual(state['refs'][1], 'c1.new.fasta')
+        self.assertEqual(state['newids'], set(['b', 'd']))
+        self.assertEqual(touched, set([0, 1, 2]))
+        self.assertEqual(dirty, set([0, 3]))
+        self.assertTrue(offset > 0)
+
+        # resuming drops the uncommitted tail
+        j = IceJournal(self.journalDir)
+        j.resume(offset)
+        j.record('del', 0)
+        j.commit('second', {})
+        j.close()
+        state, touched, dirty, _offset = IceJournal(self.journalDir).replay()
+        self.assertEqual(sorted(state['uc'].keys()), [1, 2])
+        self.assertTrue(0 not in state['refs'])
+        self.assertEqual(state['d']['b'], {1: -3.0})
+        self.assertEqual(touched, set([1, 2]))
+        self.assertEqual(dirty, set())
+
+    def test_replay_d(self):
+        """Committed rows of d replace old rows after deleted clusters are dropped."""
+        state = {'uc': {0: ['a'], 1: ['b'], 2: ['c']},
+                 'refs': {0: 'c0.fasta', 1: 'c1.fasta', 2: 'c2.fasta'},
+                 'd': {'a': {0: -1.0, 1: -5.0}, 'b': {1: -1.0, 2: -4.0},
+                       'c': {2: -1.0, 1: -6.0}}}
+        j = IceJournal(self.journalDir)
+        j.start(state)
+        j.record('rm', 0, 'a')
+        j.record('add', 1, 'a')
+        j.record('del', 0)
+        j.record('d', {'a': {1: -2.0}})
+        j.commit('first', {})
+        # cluster 2 is deleted and then created again
+        j.record('del', 2)
+        j.record('set', 2, ['c'])
+        j.record('d', {'c': {2: -3.0}, 'x': None})
+        j.commit('second', {})
+        # rows of d which are not committed are ignored
+        j.record('d', {'b': {}})
+        j.close()
+
+        state, _touched, _dirty, _offset = IceJournal(self.journalDir).replay()
+        self.assertEqual(state['uc'], {1: ['b', 'a'], 2: ['c']})
+        self.assertEqual(state['d'], {'a': {1: -2.0}, 'b': {1: -1.0},
+                                      'c': {2: -3.0}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""Test IceSketch."""
+import unittest
+import random
+from pbtools.pbtranscript.ice.IceSketch import minimizer_sketch, \
+    sketch_candidate_pairs, candidate_groups
+
+
+def mutate(seq, rate, rng):
+    """Return seq with substitutions at the given rate."""
+    return "".join(rng.choice("ACGT".replace(c, "")) if rng.random() < rate
+                   else c for c in seq)
+
+
+class Test_IceSketch(unittest.TestCase):
+    """Test IceSketch."""
+    def setUp(self):
+        """Initialize."""
+        rng = random.Random(0)
+        a = "".join(rng.choice("ACGT") for _i in range(1500))
+        b = "".join(rng.choice("ACGT") for _i in range(1500))
+        self.seqs = {0: a,
+                     1: mutate(a, 0.01, rng),          # similar to 0
+                     2: b,
+                     3: mutate(b, 0.01, rng)[:1000],   # too short for 2
+                     4: mutate(a, 0.02, rng) + "N" * 50}
+
+    def test_minimizer_sketch(self):
+        """Minimizers are shared by similar sequences only."""
+        s0 = set(minimizer_sketch(self.seqs[0]).tolist())
+        s1 = set(minimizer_sketch(self.seqs[1]).tolist())
+        s2 = set(minimizer_sketch(self.seqs[2]).tolist())
+        self.assertTrue(len(s0) > 200)
+        self.assertTrue(len(s0 & s1) > len(s0) / 2)
+        self.assertTrue(len(s0 & s2) < 3)
+        self.assertEqual(len(minimizer_sketch("ACGT")), 0)
+        self.assertEqual(len(minimizer_sketch("N" * 100)), 0)
+
+    def test_sketch_candidate_pairs(self):
+        """Only similar sequences of compatible lengths are paired."""
+        sketches = dict((k, minimizer_sketch(v))
+                        for k, v in self.seqs.items())
+        lengths = dict((k, len(v)) for k, v in self.seqs.items())
+        pairs, families = sketch_candidate_pairs(sketches, lengths,
+                                                 max_missed_start=200,
+                                                 max_missed_end=50)
+        self.assertEqual(pairs, set([(0, 1), (0, 4), (1, 4)]))
+        self.assertEqual(families, [])
+
+    def test_sketch_candidate_families(self):
+        """Pairs of a family of more than max_occ similar sequences are
+        candidates, sequences sharing a poly-A tail are not."""
+        rng = random.Random(1)
+        a = "".join(rng.choice("ACGT") for _i in range(1500))
+        seqs = {}
+        for i in range(50):
+            # drop up to 100 bases on 5' and up to 30 bases on 3'
+            seqs[i] = mutate(a, 0.01, rng)[rng.randint(0, 100):
+                                           1500 - rng.randint(0, 30)]
+        for i in range(50, 90):
+            seqs[i] = "".join(rng.choice("ACGT") for _j in range(1400)) + \
+                "A" * 60
+        sketches = dict((k, minimizer_sketch(v)) for k, v in seqs.items())
+        lengths = dict((k, len(v)) for k, v in seqs.items())
+        pairs, families = sketch_candidate_pairs(sketches, lengths,
+                                                 max_missed_start=200,
+                                                 max_missed_end=50,
+                                                 max_occ=30)
+        family_of = dict((sid, n) for n, fam in enumerate(families)
+                         for sid in fam)
+        # all-vs-all alignment merged every pair of the family
+        for i in range(50):
+            for j in range(i + 1, 50):
+                self.assertTrue((i, j) in pairs or
+                                family_of.get(i, -1) == family_of.get(j, -2))
+        for i in range(50, 90):
+            self.assertTrue(i not in family_of)
+            self.assertEqual([pair for pair in pairs if i in pair], [])
+        groups = candidate_groups(pairs, families=families)
+        self.assertEqual(groups, [range(50)])
+
+    def test_candidate_groups(self):
+        """Connected components are packed into groups."""
+        pairs = set([(0, 1), (1, 4), (5, 6), (7, 8)])
+        self.assertEqual(candidate_groups(pairs),
+                         [[0, 1, 4, 5, 6, 7, 8]])
+        self.assertEqual(candidate_groups(pairs, max_group_size=4),
+                         [[0, 1, 4], [5, 6, 7, 8]])
+        self.assertEqual(candidate_groups(pairs, max_group_size=2),
+                         [[0, 1, 4], [5, 6], [7, 8]])
+        self.assertEqual(candidate_groups(pairs, max_group_size=2,
+                                          families=[[2, 3, 8]]),
+                         [[0, 1, 4], [2, 3, 7, 8], [5, 6]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 import os.path as op
 from pbtools.pbtranscript.ice import IceUtils
+from pbtools.pbtranscript.ice.IceInit import ReadEdgeStore
 
 class Test_ICEUtils(unittest.TestCase):
     """Test IceUtils."""
@@ -14,6 +15,83 @@ class Test_ICEUtils(unittest.TestCase):
         self.assertTrue(IceUtils.gcon_py == "ice_gcontools.py")
         self.assertTrue(IceUtils.sanity_check_gcon() == IceUtils.gcon_py)
 
+    def test_quivered_fastq(self):
+        """iter_quivered_fastq and quality_stats."""
+        fq = op.join(self.outDir, "test_quivered.fastq")
+        with open(fq, 'w') as f:
+            f.write("@c0/0_10|quiver\nACGTACGTAC\n+\n" + "+" * 10 + "\n")
+            f.write("@c12_ref|quiver\nACGT\n+\n5?I!\n")
+        res = list(IceUtils.iter_quivered_fastq([fq]))
+        self.assertEqual([(cid, name) for cid, name, _s, _q in res],
+                         [(0, "c0/0_10|quiver"), (12, "c12_ref|quiver")])
+        self.assertEqual(res[1][2:], ("ACGT", "5?I!"))
+
+        # QV 10 everywhere, 0.1 errors per base
+        qv_len, err, low = IceUtils.quality_stats(res[0][3], 2, 3)
+        self.assertEqual((qv_len, low), (5, 5))
+        self.assertAlmostEqual(err, 0.5)
+        # QVs 20, 30, 40, 0
+        qv_len, err, low = IceUtils.quality_stats(res[1][3], 0, 0)
+        self.assertEqual((qv_len, low), (4, 1))
+        self.assertAlmostEqual(err, 1.0111)
+        self.assertEqual(IceUtils.quality_stats(res[1][3], 3, 2)[:2], (0, 0))
+
+    def test_subsample_reads(self):
+        """subsample_reads is reproducible and prefers FL reads."""
+        fl = ["m/{0}/ccs".format(i) for i in xrange(150)]
+        nfl = ["m/{0}/0_100".format(i) for i in xrange(1000, 1200)]
+        a = IceUtils.subsample_reads(3, fl, nfl)
+        self.assertEqual(len(a), 100)
+        self.assertTrue(set(a) <= set(fl))
+        self.assertEqual(a, IceUtils.subsample_reads(3, fl, nfl))
+        self.assertNotEqual(a, IceUtils.subsample_reads(4, fl, nfl))
+
+        b = IceUtils.subsample_reads(3, fl[:30], nfl)
+        self.assertEqual(b[:30], fl[:30])
+        self.assertEqual(len(b), 100)
+        self.assertEqual(len(set(b[30:]) & set(nfl)), 70)
+        self.assertEqual(IceUtils.subsample_reads(3, fl[:3], nfl[:5]),
+                         fl[:3] + nfl[:5])
+
+    def test_balanced_partition(self):
+        """balanced_partition and quiver_cost."""
+        costs = {0: 10, 1: 7, 2: 5, 3: 4, 4: 3, 5: 1}
+        parts = IceUtils.balanced_partition(costs, 2)
+        self.assertEqual(parts, [(15, [0, 3, 5]), (15, [1, 2, 4])])
+        parts = IceUtils.balanced_partition(costs, 8)
+        self.assertEqual([c for c, _keys in parts], [10, 7, 5, 4, 3, 1, 0, 0])
+        self.assertEqual(IceUtils.balanced_partition({}, 2), [(0, []), (0, [])])
+
+        zmw_bases = {"m/1": 3000, "m/2": 500}
+        self.assertEqual(IceUtils.quiver_cost(
+            ["m/1/ccs", "m/1/0_100", "m/2/0_50", "m/3/0_10"], 100, zmw_bases),
+            (3000 + 500 + 100) * 100)
+
+    def test_cids_missing_own_prob(self):
+        """cids_missing_own_prob on probs seeded from a quasi-clique."""
+        fa = op.join(self.outDir, "test_cids_missing_own_prob.fasta")
+        with open(fa, 'w') as f:
+            for rid in "abcde":
+                f.write(">{0}\nACGTACGTAC\n".format(rid))
+        edges = ReadEdgeStore(fa)
+        # quasi-clique a, b, c without a scored hit of c to a or b;
+        # a hit only gives a prob of its query
+        edges.add("a", "b", -1.0)
+        edges.add("b", "a", -1.5)
+        edges.add("c", "a")
+        edges.add("b", "d", -5.0)
+        uc = {0: ["a", "b", "c"], 1: ["d"], 2: ["e"]}
+        d = edges.seed_probs(uc, lambda rid, l: -0.5)
+        self.assertEqual(d, {"a": {0: -1.0}, "b": {0: -1.5, 1: -5.0},
+                             "c": {}, "d": {1: -0.5},
+                             "e": {2: -0.5}})
+        self.assertEqual(IceUtils.cids_missing_own_prob(uc, d), set([0]))
+
+        d["c"][0] = -2.0
+        self.assertEqual(IceUtils.cids_missing_own_prob(uc, d), set())
+        del d["e"]
+        self.assertEqual(IceUtils.cids_missing_own_prob(uc, d), set([2]))
+
     #def test_sanity_check_sge(self):
     #    """sanity_check_sge."""
     #    self.assertTrue(IceUtils.sanity_check_sge(self.outDir))
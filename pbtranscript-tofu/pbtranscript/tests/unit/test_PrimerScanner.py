@@ -0,0 +1,115 @@
+"""Test pbtools.pbtranscript.PrimerScanner."""
+import unittest
+import random
+import os.path as op
+from pbcore.io.FastaIO import FastaReader
+from pbtools.pbtranscript.Classifier import Classifier
+from pbtools.pbtranscript.Utils import mkdir, revcmp
+from pbtools.pbtranscript.PrimerScanner import PrimerScanner
+from pbtools.pbtranscript.c_PrimerScanner import encode_seqs, scan_windows
+
+
+class Test_PrimerScanner(unittest.TestCase):
+    """Test PrimerScanner."""
+    def setUp(self):
+        """Set up test data."""
+        self.testDir = op.dirname(op.dirname(op.abspath(__file__)))
+        mkdir(op.join(self.testDir, "out"))
+        # F1 and reverse complemented R1, which test_parseHmmDom.dom
+        # was created with
+        self.primerFN = op.join(self.testDir, "out/test_PrimerScanner.fa")
+        with open(self.primerFN, 'w') as f:
+            f.write(">F1\nAAGCAGTGGTATCAACGCAGAGTACATGGGG\n>R1\n{s}\n".
+                    format(s=revcmp("GTACTCTGCGTTGATACCACTGCTT")))
+        self.readsFN = op.join(self.testDir, "data/reads_of_insert.fasta")
+
+    def test_scan_reads(self):
+        """Builtin primer search finds the hits of phmmer."""
+        scanner = PrimerScanner(self.primerFN, window_size=100)
+        with FastaReader(self.readsFN) as reader:
+            hits = list(scanner.scan_reads(reader, cpus=1, batch_size=5))
+        self.assertEqual(len(hits), 22)
+        with FastaReader(self.readsFN) as reader:
+            self.assertEqual(
+                [(r.name, str(f), str(b)) for (r, f, b) in hits],
+                [(r.name, str(f), str(b)) for (r, f, b) in
+                 scanner.scan_reads(reader, cpus=2, batch_size=3)])
+
+        front = dict((r.name, f) for (r, f, b) in hits)
+        back = dict((r.name, b) for (r, f, b) in hits)
+        obj = Classifier()
+        domFN = op.join(self.testDir, "data/test_parseHmmDom.dom")
+        phmmer_front, phmmer_back = obj._getBestFrontBackRecord(domFN)
+        for phmmer_hits, scanner_hits in ((phmmer_front, front),
+                                          (phmmer_back, back)):
+            for rid, d in phmmer_hits.iteritems():
+                for pid, r in d.iteritems():
+                    h = scanner_hits[rid][pid]
+                    self.assertEqual(h.sStart, r.sStart)
+                    self.assertTrue(abs(h.sEnd - r.sEnd) <= 2)
+                    self.assertTrue(abs(h.score - r.score) <= 3)
+
+        rid = "m131018_081703_42161_c100585152550000001823088404281404_s1_p0/45/ccs"
+        self.assertEqual((front[rid]['F1'].score, front[rid]['F1'].sEnd),
+                         (33.0, 30))
+        self.assertEqual(front["m131018_081703_42161_c100585152550000001823088404281404_s1_p0/43/ccs"], None)
+
+
+    def test_interior_hits(self):
+        """Primer hits in the middle of reads are found, with or without
+        seeds."""
+        scanner = PrimerScanner(self.primerFN, window_size=100)
+        with FastaReader(self.readsFN) as reader:
+            seqs = [r.sequence[100:-100] for r in reader]
+        def hits(seq, **kwargs):
+            return [str(h) for h in scanner.interior_hits("r", seq, 100, 10,
+                                                          **kwargs)]
+        for seq in seqs:
+            self.assertEqual(hits(seq), hits(seq, full_search=True))
+        # some of the reads have a primer in the middle
+        seqs = [seq for seq in seqs if len(hits(seq)) == 0]
+        self.assertTrue(len(seqs) >= 2)
+
+        chimera = seqs[0] + "AAGCAGTGGTATCAACGCAGAGTACATGGGG" + seqs[1]
+        for full_search in (False, True):
+            hits = scanner.interior_hits("r", chimera, 100, 10,
+                                         full_search=full_search)
+            self.assertEqual([(h.pid, h.sStart, h.sEnd, h.sLen)
+                              for h in hits if h.pid == "F1"],
+                             [("F1", len(seqs[0]), len(seqs[0]) + 31,
+                               len(chimera))])
+
+    def test_scan_windows_band(self):
+        """Alignments with at most max_gaps gaps are the same as in the
+        full matrix."""
+        random.seed(0)
+        primer = "AAGCAGTGGTATCAACGCAGAGTACATGGGG"
+        seqs = []
+        for _i in range(2000):
+            seq = "".join(random.choice("ACGT") for _j in range(100))
+            p = []
+            for c in primer:  # 5% mismatch, insertion and deletion each
+                x = random.random()
+                if x < 0.05:
+                    continue
+                p.append(random.choice("ACGT") + c if x < 0.1 else
+                         random.choice("ACGT") if x < 0.15 else c)
+            offset = random.randint(0, 60)
+            seqs.append((seq[:offset] + "".join(p) + seq[offset:])[:100])
+        codes, lens = encode_seqs(seqs, 100)
+        pcodes = encode_seqs([primer], len(primer))[0][0]
+        full = scan_windows(codes, lens, pcodes, 1.1, -1.5, 2.5, 48)
+        # alignments scoring at least 10 have at most 9 gaps
+        banded = scan_windows(codes, lens, pcodes, 1.1, -1.5, 2.5, 48, 9)
+        ks = (full[0] >= 10).nonzero()[0]
+        self.assertTrue(len(ks) > 1500)
+        self.assertEqual((banded[0] >= 10).nonzero()[0].tolist(), ks.tolist())
+        for x, y in zip(full, banded):
+            self.assertEqual(x[ks].tolist(), y[ks].tolist())
+        # a band without gaps misses alignments with gaps
+        self.assertTrue((scan_windows(codes, lens, pcodes, 1.1, -1.5, 2.5,
+                                      48, 0)[0] < full[0]).any())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Test SortedSAMStream."""
+import unittest
+import random
+import os
+import os.path as op
+from pbtools.pbtranscript.Utils import mkdir
+from pbtools.pbtranscript.io.SAMSorter import SortedSAMStream, sam_sort_key
+
+
+class Test_SAMSorter(unittest.TestCase):
+    """Test SortedSAMStream."""
+    def setUp(self):
+        """Write an unsorted SAM with headers at both ends."""
+        self.outDir = op.join(op.dirname(op.dirname(op.abspath(__file__))),
+                              "out")
+        mkdir(self.outDir)
+        self.sam = op.join(self.outDir, "test_SAMSorter.sam")
+        rng = random.Random(0)
+        self.records = ["q{0}\t0\tchr{1}\t{2}\t40\t10M\t*\t0\t0\tACGTACGTAC\t*\n".
+                        format(i, rng.randint(1, 3), rng.randint(1, 1000))
+                        for i in range(500)]
+        self.headers = ["@SQ\tSN:chr1\tLN:1000\n", "@PG\tID:gmap\n"]
+        with open(self.sam, 'w') as f:
+            f.write(self.headers[0])
+            f.writelines(self.records)
+            f.write(self.headers[1])
+
+    def tearDown(self):
+        """Remove the SAM."""
+        os.remove(self.sam)
+
+    def _check(self, stream):
+        """Records come out sorted by (reference, position), stably."""
+        self.assertEqual(stream.header, "".join(self.headers))
+        lines = []
+        while True:
+            line = stream.readline()
+            if line == '':
+                break
+            lines.append(line)
+        self.assertEqual(lines, sorted(self.records, key=sam_sort_key))
+
+    def test_in_memory(self):
+        """Test sorting a SAM that fits in the buffer."""
+        self._check(SortedSAMStream(self.sam))
+
+    def test_merge_runs(self):
+        """Test sorting runs in parallel and merging them."""
+        stream = SortedSAMStream(self.sam, cpus=2, buffer_size=1000)
+        run_dir = stream.run_dir
+        self.assertTrue(op.isdir(run_dir))
+        self._check(stream)
+        self.assertFalse(op.exists(run_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
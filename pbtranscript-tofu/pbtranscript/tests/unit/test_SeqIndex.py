@@ -0,0 +1,58 @@
+"""Test pbtools.pbtranscript.io.SeqIndex."""
+import unittest
+import os.path as op
+from pbcore.io import FastaReader
+from pbtools.pbtranscript.Utils import mkdir
+from pbtools.pbtranscript.io.SeqIndex import SeqFileIndex, count_records
+
+
+class Test_SeqIndex(unittest.TestCase):
+    """Test SeqFileIndex and count_records."""
+    def setUp(self):
+        """Set up test data."""
+        self.testDir = op.dirname(op.dirname(op.abspath(__file__)))
+        self.outDir = op.join(self.testDir, "out")
+        mkdir(self.outDir)
+        self.input_fasta = op.join(self.testDir, "data/reads_of_insert.fasta")
+        with FastaReader(self.input_fasta) as reader:
+            self.reads = [(r.name, r.sequence) for r in reader]
+        self.input_fastq = op.join(self.outDir, "test_SeqIndex.fastq")
+        with open(self.input_fastq, 'w') as f:
+            for name, seq in self.reads:
+                # quality lines may start with '@'
+                f.write("@{n}\n{s}\n+\n{q}\n".format(n=name, s=seq,
+                                                     q="@" * len(seq)))
+
+    def test_index(self):
+        """Test record lengths with blocks smaller than records."""
+        for fn, is_fq in ((self.input_fasta, False),
+                          (self.input_fastq, True)):
+            for block_size in (100, 1024 * 1024):
+                index = SeqFileIndex(fn, is_fq=is_fq, block_size=block_size)
+                self.assertEqual(len(index), 22)
+                self.assertEqual(list(index.bases),
+                                 [len(seq) for (_name, seq) in self.reads])
+                self.assertEqual(index.offsets[-1], op.getsize(fn))
+                self.assertEqual(count_records(fn, is_fq=is_fq,
+                                               block_size=block_size), 22)
+
+    def test_split(self):
+        """Test splitting by count and by bases, and copying splits."""
+        index = SeqFileIndex(self.input_fasta)
+        self.assertEqual(index.split_by_count(10, first_split=3),
+                         [(0, 3), (3, 10), (10, 20), (20, 22)])
+        chunks = index.split_by_bases(4)
+        self.assertEqual([(s, e) for (_i, s, e) in chunks][0][0], 0)
+        self.assertEqual(chunks[-1][2], 22)
+
+        reads = []
+        out_fn = op.join(self.outDir, "test_SeqIndex.split.fasta")
+        for (_i, start, end) in chunks:
+            index.copy(start, end, out_fn)
+            with FastaReader(out_fn) as reader:
+                reads.extend([(r.name, r.sequence) for r in reader])
+        self.assertEqual(reads, self.reads)
+
+
+if __name__ == "__main__":
+    unittest.main()
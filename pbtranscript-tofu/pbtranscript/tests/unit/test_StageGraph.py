@@ -0,0 +1,152 @@
+"""Test pbtools.pbtranscript.StageGraph."""
+import unittest
+import os.path as op
+import shutil
+import threading
+import time
+from pbtools.pbtranscript.Utils import mkdir
+from pbtools.pbtranscript.StageGraph import StageGraph, Stage, \
+    StageGraphException, canonical
+
+
+class Test_StageGraph(unittest.TestCase):
+    """Test StageGraph."""
+    def setUp(self):
+        """Make an empty directory with an input file."""
+        outDir = op.join(op.dirname(op.dirname(op.abspath(__file__))), "out")
+        self.root_dir = op.join(outDir, "test_StageGraph")
+        if op.exists(self.root_dir):
+            shutil.rmtree(self.root_dir)
+        mkdir(self.root_dir)
+        self.input_fn = op.join(self.root_dir, "input.txt")
+        with open(self.input_fn, 'w') as f:
+            f.write("ACGT\n")
+        self.calls = []
+
+    def _fn(self, name):
+        """Return path of name in root_dir."""
+        return op.join(self.root_dir, name)
+
+    def _writer(self, name, src, suffix):
+        """Return a func which writes src + suffix to name."""
+        def func():
+            self.calls.append(name)
+            with open(self._fn(name), 'w') as f:
+                f.write(open(src).read() + suffix)
+        return func
+
+    def _graph(self, a_param="a", b_suffix="b"):
+        """Return a graph of input --> a --> b."""
+        g = StageGraph(cache_dir=self._fn("stages"))
+        g.add(Stage("a", self._writer("a.txt", self.input_fn, "a"),
+                    inputs=[self.input_fn], outputs=[self._fn("a.txt")],
+                    params={'p': a_param}))
+        g.add(Stage("b", self._writer("b.txt", self._fn("a.txt"), b_suffix),
+                    deps=["a"], outputs=[self._fn("b.txt")],
+                    params={'suffix': b_suffix}))
+        return g
+
+    def test_canonical(self):
+        """Dicts are sorted, objects are represented by their attributes."""
+        class Opts(object):
+            def __init__(self):
+                self.x, self.y = 1, u"y"
+        self.assertEqual(canonical({'b': 1, 'a': [Opts(), 2]}),
+                         canonical({'a': [Opts(), 2], 'b': 1}))
+        self.assertEqual(canonical(Opts()), "Opts{'x':1,'y':'y'}")
+
+    def test_rerun(self):
+        """A re-run skips done stages, and re-runs changed stages."""
+        self.assertEqual(self._graph().run(), ["a", "b"])
+        self.assertEqual(self._graph().run(), [])
+        self.assertEqual(self.calls, ["a.txt", "b.txt"])
+
+        # changing params of b only re-runs b
+        self.assertEqual(self._graph(b_suffix="B").run(), ["b"])
+        self.assertEqual(open(self._fn("b.txt")).read(), "ACGT\naB")
+
+        # a re-run of a with the same output does not re-run b
+        with open(self._fn("a.txt"), 'w') as f:
+            f.write("ACGT\na")
+        self.assertEqual(self._graph(b_suffix="B").run(), ["a"])
+
+        # changing the input re-runs a and b
+        with open(self.input_fn, 'w') as f:
+            f.write("TTTT\n")
+        self.assertEqual(self._graph(b_suffix="B").run(), ["a", "b"])
+        self.assertEqual(open(self._fn("b.txt")).read(), "TTTT\naB")
+
+    def test_returned_outputs(self):
+        """Files returned by a stage are outputs of the stage."""
+        g = StageGraph(cache_dir=self._fn("stages"))
+        g.add(Stage("a", lambda: [self._writer("a.txt", self.input_fn, "")()
+                                  or self._fn("a.txt")]))
+        g.run()
+        self.assertEqual(g.outputs("a"), [self._fn("a.txt")])
+
+    def test_lazy_digests(self):
+        """Only outputs which a stage reads are hashed."""
+        g = self._graph()
+        g.run()
+        self.assertTrue(self._fn("a.txt") in g._digests)
+        self.assertFalse(self._fn("b.txt") in g._digests)
+        done = g.is_fresh(g.stage_by_name["b"], g.done["b"]["key"])
+        self.assertEqual(len(done["outputs"][self._fn("b.txt")]), 2)
+
+    def test_fork(self):
+        """Stages with fork=True are forked by the thread of run()."""
+        def func():
+            with open(self._fn("thread.txt"), 'w') as f:
+                f.write(threading.current_thread().name)
+            return [self._fn("thread.txt")]
+        g = StageGraph(cache_dir=self._fn("stages"), max_cpus=2)
+        g.add(Stage("a", self._writer("a.txt", self.input_fn, "")))
+        g.add(Stage("b", func, fork=True))
+        self.assertEqual(sorted(g.run()), ["a", "b"])
+        self.assertEqual(open(self._fn("thread.txt")).read(),
+                         threading.current_thread().name)
+        self.assertEqual(g.outputs("b"), [self._fn("thread.txt")])
+
+    def test_budget(self):
+        """Stages run concurrently within max_cpus."""
+        lock = threading.Lock()
+        state = {'running': 0, 'max': 0}
+
+        def func():
+            with lock:
+                state['running'] += 1
+                state['max'] = max(state['max'], state['running'])
+            time.sleep(0.2)
+            with lock:
+                state['running'] -= 1
+
+        for max_cpus, expected in ((4, 2), (3, 1)):
+            g = StageGraph(cache_dir=self._fn("stages%d" % max_cpus),
+                           max_cpus=max_cpus)
+            for i in range(4):
+                g.add(Stage("s%d" % i, func, cpus=2, params=max_cpus))
+            state['max'] = 0
+            self.assertEqual(sorted(g.run()), ["s0", "s1", "s2", "s3"])
+            self.assertEqual(state['max'], expected)
+
+    def test_failure(self):
+        """A failed stage raises its error and is not done."""
+        def fail():
+            raise ValueError("failed")
+        g = StageGraph(cache_dir=self._fn("stages"))
+        g.add(Stage("a", fail))
+        g.add(Stage("b", self._writer("b.txt", self.input_fn, ""),
+                    deps=["a"]))
+        self.assertRaises(ValueError, g.run)
+        self.assertFalse(op.exists(g.done_fn("a")))
+        self.assertEqual(self.calls, [])
+
+        g = StageGraph(cache_dir=self._fn("stages"))
+        g.add(Stage("a", fail, fork=True))
+        self.assertRaises(StageGraphException, g.run)
+        self.assertRaises(StageGraphException, g.add, Stage("c", fail,
+                                                            deps=["x"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
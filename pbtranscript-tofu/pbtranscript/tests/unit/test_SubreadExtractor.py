@@ -0,0 +1,39 @@
+"""Test pbtools.pbtranscript.io.SubreadExtractor."""
+import unittest
+from collections import namedtuple
+from pbtools.pbtranscript.io.SubreadExtractor import zmw_subreads
+
+# Stand-ins of pbcore Zmw and ZmwRead, subreads already clipped to HQ region
+Read = namedtuple('Read', ['readStart', 'readEnd', 'seq'])
+Read.basecalls = lambda self: self.seq
+Zmw = namedtuple('Zmw', ['zmwName', 'readScore', 'subreads'])
+
+
+def make_read(start, end):
+    """Return a subread of bases start..end, 'A' at ends and 'C' within."""
+    return Read(start, end, "A" * 100 + "C" * (end - start - 200) + "A" * 100)
+
+
+class Test_SubreadExtractor(unittest.TestCase):
+    """Test zmw_subreads."""
+    def test_zmw_subreads(self):
+        """Subreads are filtered like pls2fasta and flank-trimmed."""
+        zmw = Zmw("m1_s1_p0/7", 0.85,
+                  [make_read(0, 250), make_read(300, 1000), make_read(1050, 1350)])
+        res = list(zmw_subreads(zmw))
+        self.assertEqual([name for name, _seq in res],
+                         ["m1_s1_p0/7/400_900", "m1_s1_p0/7/1150_1250"])
+        self.assertEqual([seq for _name, seq in res], ["C" * 500, "C" * 100])
+
+        # min_len applies after trimming, min_subread_length before
+        res = list(zmw_subreads(zmw, min_subread_length=200, min_len=101))
+        self.assertEqual([name for name, _seq in res], ["m1_s1_p0/7/400_900"])
+        res = list(zmw_subreads(zmw, trim_len=0, min_subread_length=200))
+        self.assertEqual([len(seq) for _name, seq in res], [250, 700, 300])
+
+        # low quality ZMW
+        self.assertEqual(list(zmw_subreads(zmw._replace(readScore=0.7))), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
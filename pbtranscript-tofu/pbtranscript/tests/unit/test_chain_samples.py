@@ -0,0 +1,109 @@
+"""Test pbtools.pbtranscript.counting.chain_samples."""
+import unittest
+import os.path as op
+from csv import DictReader
+from pbtools.pbtranscript.Utils import mkdir
+from pbtools.pbtranscript.io.GFF import collapseGFFReader, gmapRecord, \
+    write_collapseGFF_format
+from pbtools.pbtranscript.counting.chain_samples import read_count_info, \
+    iter_sorted_records, sweep_chain, write_chained
+
+# sample --> [(seqid, chr, strand, exons)]
+SAMPLES = {
+    "A": [("PB.1.1", "chr1", "+", [(100, 200), (300, 400)]),
+          ("PB.2.1", "chr1", "+", [(1000, 1100)]),
+          ("PB.3.1", "chr2", "-", [(10, 50), (80, 100)])],
+    "B": [("PB.1.1", "chr1", "+", [(90, 200), (300, 420)]),
+          ("PB.1.2", "chr1", "+", [(95, 200), (300, 410)]),
+          ("PB.1.3", "chr1", "+", [(100, 200), (350, 400)]),
+          ("PB.2.1", "chr1", "+", [(1050, 1200)])],
+    "C": [("PB.1.1", "chr1", "+", [(100, 202), (303, 400)]),
+          ("PB.2.1", "chr2", "-", [(12, 50), (80, 120)])]}
+NAMES = ["A", "B", "C"]
+
+
+class Test_chain_samples(unittest.TestCase):
+    """Test chaining samples in one sweep."""
+    def setUp(self):
+        """Write a collapsed GFF and a count file of each sample."""
+        self.outDir = op.join(op.dirname(op.dirname(op.abspath(__file__))),
+                              "out", "test_chain_samples")
+        self.dirs = {}
+        for name in NAMES:
+            d = op.join(self.outDir, name)
+            mkdir(d)
+            self.dirs[name] = d
+            with open(op.join(d, "test.collapsed.gff"), 'w') as f:
+                for seqid, chr, strand, exons in SAMPLES[name]:
+                    r = gmapRecord(chr=chr, coverage=None, identity=None,
+                                   strand=strand, seqid=seqid)
+                    for start, end in exons:
+                        r.add_exon(start, end, start, end, rstrand='+',
+                                   score=None)
+                    write_collapseGFF_format(f, r)
+            with open(op.join(d, "test.abundance.txt"), 'w') as f:
+                f.write("# comment\npbid\tcount_fl\tnorm_nfl\n")
+                for i, (seqid, _chr, _strand, _exons) in enumerate(SAMPLES[name]):
+                    f.write("{0}\t{1}\t{2}{1}\n".format(seqid, i + 1, name))
+
+    def test_sweep_chain(self):
+        """Records join the first matching transcript without their sample."""
+        chained = sweep_chain(iter_sorted_records(
+            self.dirs, NAMES, "test.collapsed.gff"), fuzzy_junction=5)
+        self.assertEqual(sorted(chained.keys()),
+                         [("chr1", "+"), ("chr2", "-")])
+        res = dict((k, [(r.seqid, dict((NAMES[i], x.seqid) for i, x in
+                                       members.iteritems()))
+                        for r, members in v])
+                   for k, v in chained.iteritems())
+        # B's PB.1.2 can not join B's PB.1.1; PB.1.3 has another junction
+        self.assertEqual(res[("chr1", "+")],
+                         [("PB.1.1", {"A": "PB.1.1", "B": "PB.1.1",
+                                      "C": "PB.1.1"}),
+                          ("PB.1.2", {"B": "PB.1.2"}),
+                          ("PB.1.3", {"B": "PB.1.3"}),
+                          ("PB.2.1", {"A": "PB.2.1", "B": "PB.2.1"})])
+        # the representative is the longest record
+        self.assertEqual(chained[("chr1", "+")][0][0].end, 420)
+        self.assertEqual(chained[("chr1", "+")][3][0].end, 1200)
+        self.assertEqual(res[("chr2", "-")],
+                         [("PB.2.1", {"A": "PB.3.1", "C": "PB.2.1"})])
+
+        # fuzzy_junction=0, C's PB.1.1 no longer matches
+        chained = sweep_chain(iter_sorted_records(
+            self.dirs, NAMES, "test.collapsed.gff"), fuzzy_junction=0)
+        self.assertEqual([sorted(members) for _r, members in
+                          chained[("chr1", "+")]], [[0, 1], [1], [1], [2], [0, 1]])
+
+    def test_write_chained(self):
+        """Chained GFF, ids and counts of all samples."""
+        count_info = read_count_info(self.dirs, "test.abundance.txt", "norm_nfl")
+        self.assertEqual(count_info["B", "PB.1.3"], "B3")
+        chained = sweep_chain(iter_sorted_records(
+            self.dirs, NAMES, "test.collapsed.gff"), fuzzy_junction=5)
+        prefix = op.join(self.outDir, "all_samples")
+        gff_fn, ids_fn, count_fn = write_chained(chained, NAMES, count_info,
+                                                 output_prefix=prefix)
+        self.assertEqual(gff_fn, prefix + ".chained.gff")
+
+        ids = [r for r in DictReader(open(ids_fn), delimiter='\t')]
+        counts = [r for r in DictReader(open(count_fn), delimiter='\t')]
+        self.assertEqual(sorted(tuple(r[name] for name in NAMES) for r in ids),
+                         [("NA", "PB.1.2", "NA"), ("NA", "PB.1.3", "NA"),
+                          ("PB.1.1", "PB.1.1", "PB.1.1"),
+                          ("PB.2.1", "PB.2.1", "NA"),
+                          ("PB.3.1", "NA", "PB.2.1")])
+        for r, c in zip(ids, counts):
+            self.assertEqual(r["superPBID"], c["superPBID"])
+            for name in NAMES:
+                self.assertEqual(c[name], count_info.get((name, r[name]), "NA"))
+
+        recs = [r for r in collapseGFFReader(gff_fn)]
+        self.assertEqual([r.seqid for r in recs], [r["superPBID"] for r in ids])
+        self.assertEqual(len(set(r.seqid.split('.')[1] for r in recs)), 3)
+        self.assertEqual([(e.start, e.end) for e in recs[-1].ref_exons],
+                         [(12, 50), (80, 120)])
+
+
+if __name__ == "__main__":
+    unittest.main()
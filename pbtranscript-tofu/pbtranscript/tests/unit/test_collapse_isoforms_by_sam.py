@@ -0,0 +1,102 @@
+"""Test pbtools.pbtranscript.collapse_isoforms_by_sam."""
+import unittest
+import random
+import os.path as op
+from pbtools.pbtranscript.Utils import mkdir
+from pbtools.pbtranscript.io.GFF import gmapRecord, write_collapseGFF_format
+from pbtools.pbtranscript.counting import compare_junctions
+from pbtools.pbtranscript.collapse_isoforms_by_sam import \
+    collapse_fuzzy_junctions, three_prime_site, can_merge
+
+
+def _record(seqid, strand, exons, chr="chr1"):
+    """Return a gmapRecord with exons [(start, end)]."""
+    r = gmapRecord(chr=chr, coverage=None, identity=None, strand=strand,
+                   seqid=seqid)
+    for start, end in exons:
+        r.add_exon(start, end, start, end, rstrand='+', score=None)
+    return r
+
+
+def _naive_fuzzy_match(recs, allow_extra_5exon, max_dist):
+    """
+    Return fuzzy groups found by comparing each record to all overlapping
+    group representatives, by start and then group creation order.
+    """
+    reps = []  # (chr, strand, group index, rep)
+    fuzzy_match = {}
+    for r in recs:
+        r.segments = r.ref_exons
+        candidates = sorted([x for x in reps if x[:2] == (r.chr, r.strand) and
+                             x[3].start < r.end and r.start < x[3].end],
+                            key=lambda x: (x[3].start, x[2]))
+        for _chr, _strand, _i, r2 in candidates:
+            m = compare_junctions.compare_junctions(
+                r, r2, internal_fuzzy_max_dist=max_dist)
+            if can_merge(m, r, r2, allow_extra_5exon, max_dist):
+                fuzzy_match[r2.seqid].append(r.seqid)
+                break
+        else:
+            reps.append((r.chr, r.strand, len(reps), r))
+            fuzzy_match[r.seqid] = [r.seqid]
+    return fuzzy_match
+
+
+class Test_collapse_fuzzy_junctions(unittest.TestCase):
+    """Test collapse_fuzzy_junctions."""
+    def setUp(self):
+        """Define outDir."""
+        self.outDir = op.join(op.dirname(op.dirname(op.abspath(__file__))),
+                              "out", "test_collapse_isoforms_by_sam")
+        mkdir(self.outDir)
+
+    def test_three_prime_site(self):
+        """Acceptor of the 3' exon, or the 5' end of single-exon records."""
+        exons = [(100, 200), (300, 400), (500, 600)]
+        self.assertEqual(three_prime_site(_record("PB.1.1", '+', exons)), 500)
+        self.assertEqual(three_prime_site(_record("PB.1.1", '-', exons)), 200)
+        self.assertEqual(three_prime_site(_record("PB.1.1", '+', exons[1:2])), 300)
+        self.assertEqual(three_prime_site(_record("PB.1.1", '-', exons[1:2])), 400)
+
+    def test_collapse_fuzzy_junctions(self):
+        """Fuzzy groups are those of comparing to all overlapping groups."""
+        gff = op.join(self.outDir, "test.collapsed.gff")
+        group = op.join(self.outDir, "test.collapsed.group.txt")
+        random.seed(0)
+        base = [(100, 200), (300, 400), (500, 600), (700, 800), (900, 1000)]
+        for _trial in range(50):
+            recs = []
+            for i in range(40):
+                strand = random.choice("+-")
+                n = random.randint(1, len(base))
+                # share the 3' exon, more exons on the 5' end
+                exons = base[-n:] if strand == '+' else base[:n]
+                if random.random() < 0.2:  # skip an internal exon
+                    exons = exons[:1] + exons[2:] if n > 2 else exons
+                exons = [(s + random.randint(-6, 6), e + random.randint(-6, 6))
+                         for s, e in exons]
+                if random.random() < 0.2:  # move the 3' exon away
+                    offset = random.choice([-50, 50])
+                    if strand == '+':
+                        exons[-1] = (exons[-1][0] + offset, exons[-1][1] + 100)
+                    else:
+                        exons[0] = (exons[0][0] - 100, exons[0][1] + offset)
+                recs.append(_record("PB.1.{0}".format(i + 1), strand, exons,
+                                    chr=random.choice(["chr1", "chr2"])))
+            with open(gff, 'w') as f:
+                for r in recs:
+                    write_collapseGFF_format(f, r)
+            with open(group, 'w') as f:
+                for i, r in enumerate(recs):
+                    f.write("{0}\tc{1}/f{2}p0/100\n".format(r.seqid, i, i % 3 + 1))
+
+            for allow_extra_5exon in (True, False):
+                fuzzy_match = collapse_fuzzy_junctions(gff, group,
+                                                       allow_extra_5exon, 5)
+                self.assertEqual(dict(fuzzy_match),
+                                 _naive_fuzzy_match(recs, allow_extra_5exon, 5))
+                self.assertTrue(op.exists(gff + ".fuzzy"))
+
+
+if __name__ == "__main__":
+    unittest.main()
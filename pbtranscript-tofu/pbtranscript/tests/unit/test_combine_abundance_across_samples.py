@@ -0,0 +1,116 @@
+"""Test pbtools.pbtranscript.counting.combine_abundance_across_samples."""
+import unittest
+import random
+import os.path as op
+from csv import DictReader
+from pbtools.pbtranscript.Utils import mkdir
+from pbtools.pbtranscript.io.GFF import gmapRecord, write_collapseGFF_format
+from pbtools.pbtranscript.counting.combine_abundance_across_samples import \
+    SortedIntervalIndex, MegaPBTree
+
+
+class _Interval(object):
+    """An interval [start, end) with a name."""
+    def __init__(self, name, start, end):
+        self.name, self.start, self.end = name, start, end
+
+
+def _write_sample(prefix, recs):
+    """Write collapsed GFF and group file of recs [(seqid, strand, exons)]."""
+    with open(prefix + ".gff", 'w') as f:
+        for seqid, strand, exons in recs:
+            r = gmapRecord(chr="chr1", coverage=None, identity=None,
+                           strand=strand, seqid=seqid)
+            for start, end in exons:
+                r.add_exon(start, end, start, end, rstrand='+', score=None)
+            write_collapseGFF_format(f, r)
+    with open(prefix + ".group.txt", 'w') as f:
+        for seqid, _strand, _exons in recs:
+            f.write("{0}\ti_{0}\n".format(seqid))
+    return prefix + ".gff", prefix + ".group.txt"
+
+
+class Test_SortedIntervalIndex(unittest.TestCase):
+    """Test SortedIntervalIndex."""
+    def test_find(self):
+        """Overlapping records, by start, ties in given order."""
+        self.assertEqual(SortedIntervalIndex([]).find(0, 100), [])
+
+        random.seed(0)
+        recs = []
+        for i in range(500):
+            start = random.randint(0, 10000)
+            recs.append(_Interval(i, start, start + random.randint(1, 800)))
+        index = SortedIntervalIndex(recs)
+        by_start = sorted(recs, key=lambda r: r.start)
+        for _i in range(200):
+            start = random.randint(-100, 10500)
+            end = start + random.randint(1, 300)
+            self.assertEqual([r.name for r in index.find(start, end)],
+                             [r.name for r in by_start
+                              if r.start < end and r.end > start])
+        # end points are not overlaps
+        index = SortedIntervalIndex([_Interval(0, 10, 20), _Interval(1, 10, 15)])
+        self.assertEqual([r.name for r in index.find(14, 15)], [0, 1])
+        self.assertEqual([r.name for r in index.find(20, 30)], [])
+        self.assertEqual([r.name for r in index.find(0, 10)], [])
+
+
+class Test_MegaPBTree(unittest.TestCase):
+    """Test MegaPBTree."""
+    def setUp(self):
+        """Write two samples."""
+        self.outDir = op.join(op.dirname(op.dirname(op.abspath(__file__))),
+                              "out", "test_combine_abundance_across_samples")
+        mkdir(self.outDir)
+        self.gff1, self.group1 = _write_sample(op.join(self.outDir, "s1"), [
+            ("PB.1.1", "+", [(100, 200), (300, 400)]),
+            ("PB.1.2", "+", [(100, 200), (300, 400), (500, 600)]),
+            ("PB.1.3", "-", [(100, 200), (300, 400)]),
+            ("PB.2.1", "+", [(1000, 1100)])])
+        self.gff2, self.group2 = _write_sample(op.join(self.outDir, "s2"), [
+            ("PB.1.1", "+", [(150, 203), (298, 450)]),
+            ("PB.1.2", "+", [(300, 400), (500, 600)]),
+            ("PB.2.1", "+", [(1050, 1300)]),
+            ("PB.3.1", "+", [(5000, 5100)])])
+
+    def test_match_record_to_tree(self):
+        """Only records with the same junctions match."""
+        tree = MegaPBTree(self.gff1, self.group1, internal_fuzzy_max_dist=5,
+                          self_prefix="s1")
+        self.assertEqual(sorted(tree.tree.keys()),
+                         [("chr1", "+", 1), ("chr1", "+", 2),
+                          ("chr1", "+", 3), ("chr1", "-", 2)])
+        tree2 = MegaPBTree(self.gff2, self.group2, self_prefix="s2")
+        matches = [tree.match_record_to_tree(r) for r in tree2.records]
+        self.assertEqual([r.seqid if r is not None else None for r in matches],
+                         ["PB.1.1", None, "PB.2.1", None])
+        self.assertEqual(tree.group_info["PB.1.1"], ["s1|i_PB.1.1"])
+
+        tree = MegaPBTree(self.gff1, self.group1, internal_fuzzy_max_dist=0)
+        self.assertEqual(tree.match_record_to_tree(tree2.records[0]), None)
+
+    def test_add_sample(self):
+        """Matched, unmatched records of both samples are written."""
+        tree = MegaPBTree(self.gff1, self.group1, internal_fuzzy_max_dist=5,
+                          self_prefix="s1")
+        prefix = op.join(self.outDir, "tmp_s2")
+        tree.add_sample(self.gff2, self.group2, sample_prefix="s2",
+                        output_prefix=prefix)
+        rows = [(r["s1"], r["s2"]) for r in
+                DictReader(open(prefix + ".mega_info.txt"), delimiter='\t')]
+        self.assertEqual(sorted(rows),
+                         [("NA", "PB.1.2"), ("NA", "PB.3.1"),
+                          ("PB.1.1", "PB.1.1"), ("PB.1.2", "NA"),
+                          ("PB.1.3", "NA"), ("PB.2.1", "PB.2.1")])
+        tree3 = MegaPBTree(prefix + ".gff", prefix + ".group.txt")
+        self.assertEqual(len(tree3.records), 6)
+        # the longer of matched records is kept
+        self.assertEqual(sorted((r.start, r.end) for r in tree3.records
+                                if r.strand == '+' and len(r.ref_exons) == 2),
+                         [(150, 450), (300, 600)])
+        self.assertTrue(["s1|i_PB.1.1", "s2|i_PB.1.1"] in tree3.group_info.values())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""Test pbtools.pbtranscript.fusion_finder."""
+import unittest
+import os.path as op
+from pbtools.pbtranscript.Utils import mkdir
+from pbtools.pbtranscript.BioReaders import GMAPSAMReader, Interval, SAMRecord
+from pbtools.pbtranscript.fusion_finder import find_fusion_candidates, \
+    merge_fusion_exons
+
+
+def _sam_line(qid, flag, pos, cigar, seq_len=200):
+    """Return a GMAP SAM line of a perfect alignment."""
+    return "\t".join([qid, str(flag), "chr1", str(pos), "40", cigar, "*", "0",
+                      "0", "A" * seq_len, "*", "NM:i:0"])
+
+
+class _Rec(object):
+    """A record with the fields merge_fusion_exons uses."""
+    def __init__(self, qid, strand, q_start, segments, q_len=200):
+        self.qID, self.qStart, self.qLen = qid, q_start, q_len
+        self.flag = SAMRecord.SAMflag(False, strand, 0)
+        self.segments = [Interval(s, e) for s, e in segments]
+        self.sStart, self.sEnd = segments[0][0], segments[-1][1]
+
+
+class Test_fusion_finder(unittest.TestCase):
+    """Test fusion_finder."""
+    def setUp(self):
+        """Write a sorted GMAP SAM."""
+        outDir = op.join(op.dirname(op.dirname(op.abspath(__file__))), "out")
+        mkdir(outDir)
+        self.sam = op.join(outDir, "test_fusion_finder.sam")
+        with open(self.sam, 'w') as f:
+            f.write("@SQ\tSN:chr1\tLN:100000\n")
+            # f1 and f2 are fusions, t1 maps to one locus, t2 to two loci
+            # which are too close, u1 is not mapped
+            f.write("\n".join([
+                _sam_line("f1", 0, 1001, "100M100S"),
+                _sam_line("t1", 0, 2001, "200M"),
+                _sam_line("f2", 0, 2501, "120M80S"),
+                _sam_line("t2", 0, 3001, "100M100S"),
+                _sam_line("t2", 0, 5001, "100S100M"),
+                _sam_line("f1", 0, 50001, "100S100M"),
+                _sam_line("f2", 0, 60001, "120S80M"),
+                "u1\t4\t*\t0\t0\t*\t*\t0\t0\t" + "A" * 200 + "\t*"]) + "\n")
+        self.query_len_dict = {"f1": 200, "f2": 200, "t1": 200, "t2": 200,
+                               "u1": 200}
+
+    def test_find_fusion_candidates(self):
+        """Records of candidates are re-read by offset, in SAM order."""
+        recs = find_fusion_candidates(self.sam, self.query_len_dict)
+        self.assertEqual([(r.qID, r.sStart) for r in recs],
+                         [("f1", 1000), ("f2", 2500), ("f1", 50000),
+                          ("f2", 60000)])
+        expected = [r for r in GMAPSAMReader(self.sam, True,
+                                             query_len_dict=self.query_len_dict)
+                    if r.qID in ("f1", "f2")]
+        self.assertEqual([r.record_line for r in recs],
+                         [r.record_line for r in expected])
+        self.assertEqual([(r.qStart, r.qEnd, r.segments) for r in recs],
+                         [(r.qStart, r.qEnd, r.segments) for r in expected])
+
+        self.assertEqual(find_fusion_candidates(self.sam, self.query_len_dict,
+                                                min_dist_between_loci=100000), [])
+
+    def test_merge_fusion_exons(self):
+        """Records in the 5' and 3' portion of reads are never merged."""
+        a = _Rec("a", '+', 0, [(1000, 1100)])
+        b = _Rec("b", '+', 10, [(1010, 1100)])
+        c = _Rec("c", '+', 120, [(1000, 1100)])
+        d = _Rec("d", '+', 150, [(1005, 1100)])
+        e = _Rec("e", '+', 0, [(1300, 1400)])
+        groups = merge_fusion_exons([a, c, b, e, d], max_fusion_point_dist=100,
+                                    max_exon_end_dist=0, allow_extra_5_exons=True)
+        self.assertEqual([[r.qID for r in g] for g in groups],
+                         [["a", "b"], ["e"], ["c", "d"]])
+
+        # on the 3' portion, the fusion point is the alignment end
+        d2 = _Rec("d2", '+', 150, [(1000, 1300)])
+        groups = merge_fusion_exons([c, d2], max_fusion_point_dist=100,
+                                    max_exon_end_dist=0, allow_extra_5_exons=True)
+        self.assertEqual([[r.qID for r in g] for g in groups], [["c"], ["d2"]])
+
+        # an extra 5' exon
+        f = _Rec("f", '+', 0, [(500, 600), (1000, 1100)])
+        g = _Rec("g", '+', 0, [(700, 800), (1000, 1100)])
+        groups = merge_fusion_exons([f, a, g], max_fusion_point_dist=100,
+                                    max_exon_end_dist=0, allow_extra_5_exons=True)
+        self.assertEqual([[r.qID for r in g] for g in groups], [["f", "a"], ["g"]])
+        groups = merge_fusion_exons([f, a], max_fusion_point_dist=100,
+                                    max_exon_end_dist=0, allow_extra_5_exons=False)
+        self.assertEqual([[r.qID for r in g] for g in groups], [["f"], ["a"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
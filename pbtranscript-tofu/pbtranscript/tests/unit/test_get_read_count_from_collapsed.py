@@ -0,0 +1,153 @@
+"""Test pbtools.pbtranscript.counting.get_read_count_from_collapsed."""
+import unittest
+import os
+import os.path as op
+from cPickle import dump
+from pbtools.pbtranscript.Utils import mkdir
+from pbtools.pbtranscript.counting.get_read_count_from_collapsed import \
+    read_group_filename, output_read_count_FL, output_read_count_nFL, \
+    make_abundance_file, AbundanceCounter
+
+
+def _rid(movie, zmw):
+    """Return a read id <movie>/<zmw>/0_100_CCS."""
+    return "{0}/{1}/0_100_CCS".format(movie, zmw)
+
+
+def _read_abundance(filename):
+    """Return {pbid: (count_fl, count_nfl, count_nfl_amb)} and totals."""
+    counts, totals = {}, []
+    for line in open(filename):
+        if line.startswith('# Total'):
+            totals.append(int(line.split(':')[1]))
+        elif not line.startswith('#') and not line.startswith('pbid'):
+            raw = line.strip().split('\t')
+            counts[raw[0]] = (int(raw[1]), int(raw[2]), float(raw[3]))
+    return counts, totals
+
+
+class Test_get_read_count_from_collapsed(unittest.TestCase):
+    """Test read stats and abundance counting."""
+    def assertCounts(self, counts, expected):
+        """Assert (count_fl, count_nfl, count_nfl_amb) are expected."""
+        self.assertEqual(counts[:2], expected[:2])
+        self.assertAlmostEqual(counts[2], expected[2])
+
+    def setUp(self):
+        """Write a group file, an FL and an nFL pickle."""
+        self.outDir = op.join(op.dirname(op.dirname(op.abspath(__file__))),
+                              "out", "test_get_read_count_from_collapsed")
+        mkdir(self.outDir)
+        self.group_fn = op.join(self.outDir, "collapsed.group.txt")
+        with open(self.group_fn, 'w') as f:
+            f.write("PB.1.1\tc1/f2p0/100,c2/f1p0/100\n")
+            f.write("PB.2.1\tc3/f1p0/100\n")
+            f.write("PB.10.1\tc4/f1p0/100\n")
+        self.fl_pickle = op.join(self.outDir, "fl.pickle")
+        with open(self.fl_pickle, 'w') as f:
+            dump({'uc': {1: [_rid('m1', 1), _rid('m1', 2)],
+                         2: [_rid('m2', 3)], 3: [_rid('m1', 4)],
+                         5: [_rid('m1', 5)]}}, f)
+        self.nfl_pickle = op.join(self.outDir, "nfl.pickle")
+        with open(self.nfl_pickle, 'w') as f:
+            dump({'nohit': set([_rid('m1', 20)]),
+                  'partial_uc': {1: [_rid('m1', 10), _rid('m1', 11)],
+                                 3: [_rid('m1', 11), _rid('m1', 12)],
+                                 4: [_rid('m1', 12), _rid('m1', 13)],
+                                 5: [_rid('m1', 14)]}}, f)
+
+    def test_make_abundance_file(self):
+        """Ambiguous nFL lines of a read need not be consecutive."""
+        stat_fn = op.join(self.outDir, "read_stat.txt")
+        with open(stat_fn, 'w') as f:
+            f.write("id\tlength\tis_fl\tstat\tpbid\n")
+            for x, is_fl, stat, pbid in [
+                    (_rid('m1', 1), 'Y', 'unique', 'PB.1.1'),
+                    (_rid('m1', 10), 'N', 'ambiguous', 'PB.1.1'),
+                    (_rid('m1', 2), 'Y', 'unmapped', 'NA'),
+                    (_rid('m1', 11), 'N', 'ambiguous', 'PB.2.1'),
+                    (_rid('m1', 10), 'N', 'ambiguous', 'PB.2.1'),
+                    (_rid('m1', 11), 'N', 'ambiguous', 'PB.1.1'),
+                    (_rid('m1', 10), 'N', 'ambiguous', 'PB.10.1'),
+                    (_rid('m1', 12), 'N', 'unique', 'PB.10.1'),
+                    (_rid('m2', 13), 'N', 'unique', 'PB.10.1')]:
+                f.write("{0}\t100\t{1}\t{2}\t{3}\n".format(x, is_fl, stat, pbid))
+        out_fn = op.join(self.outDir, "abundance.txt")
+        make_abundance_file(stat_fn, out_fn)
+        counts, totals = _read_abundance(out_fn)
+        self.assertEqual(totals, [2, 4, 6])
+        self.assertCounts(counts['PB.1.1'], (1, 1, 1 + 1. / 3 + 1. / 2))
+        self.assertCounts(counts['PB.2.1'], (0, 0, 1. / 3 + 1. / 2))
+        self.assertCounts(counts['PB.10.1'], (0, 2, 2 + 1. / 3))
+        # sorted by PB.1, PB.2, PB.10
+        self.assertEqual([line.split('\t')[0] for line in open(out_fn)
+                          if line.startswith('PB.')],
+                         ['PB.1.1', 'PB.2.1', 'PB.10.1'])
+
+        make_abundance_file(stat_fn, out_fn, restricted_movies=['m1'])
+        counts, totals = _read_abundance(out_fn)
+        self.assertEqual(totals, [2, 3, 5])
+        self.assertCounts(counts['PB.10.1'], (0, 1, 1 + 1. / 3))
+
+    def test_counter(self):
+        """Counts made while writing read stats are those of the file."""
+        cid_info = read_group_filename(self.group_fn, is_cid=True)
+        stat_fn = op.join(self.outDir, "read_stat.txt")
+        counter = AbundanceCounter()
+        output_read_count_FL(cid_info, [(None, self.fl_pickle)], stat_fn,
+                             'w', counter=counter)
+        output_read_count_nFL(cid_info, [(None, self.nfl_pickle)], stat_fn,
+                              'a', counter=counter)
+        counter_fn = op.join(self.outDir, "abundance.counter.txt")
+        counter.write(counter_fn)
+        file_fn = op.join(self.outDir, "abundance.file.txt")
+        make_abundance_file(stat_fn, file_fn)
+        self.assertEqual(open(counter_fn).read(), open(file_fn).read())
+
+        counts, totals = _read_abundance(file_fn)
+        # FL: 4 mapped, 1 unmapped; nFL: 10, 13 unique, 14, 20 unmapped,
+        # 11, 12 ambiguous
+        self.assertEqual(totals, [5, 9, 11])
+        self.assertCounts(counts['PB.1.1'], (3, 4, 4 + 1. / 2))
+        self.assertCounts(counts['PB.2.1'], (1, 1, 1 + 1. / 2 + 1. / 2))
+        self.assertCounts(counts['PB.10.1'], (0, 1, 1 + 1. / 2))
+
+    def test_multiple_pickles(self):
+        """Reads are merged across pickles, no temporary runs are left."""
+        cid_info = read_group_filename(self.group_fn, is_cid=True)
+        nfl_pickle2 = op.join(self.outDir, "nfl2.pickle")
+        with open(nfl_pickle2, 'w') as f:
+            dump({'nohit': set([_rid('m1', 13), _rid('m1', 21)]),
+                  'partial_uc': {4: [_rid('m1', 10), _rid('m1', 20)],
+                                 5: [_rid('m1', 14)]}}, f)
+        stat_fn = op.join(self.outDir, "read_stat.txt")
+        counter = AbundanceCounter()
+        output_read_count_FL(cid_info, [(None, self.fl_pickle)], stat_fn,
+                             'w', counter=counter)
+        output_read_count_nFL(cid_info, [(None, self.nfl_pickle),
+                                         (None, nfl_pickle2)], stat_fn,
+                              'a', counter=counter)
+        self.assertEqual([fn for fn in os.listdir(self.outDir)
+                          if fn.startswith("read_runs.")], [])
+        stats = {}
+        for line in list(open(stat_fn))[1:]:
+            x, _len, is_fl, stat, pbid = line.strip().split('\t')
+            stats.setdefault((x, is_fl), []).append((stat, pbid))
+        self.assertEqual(stats[(_rid('m1', 5), 'Y')], [('unmapped', 'NA')])
+        self.assertEqual(stats[(_rid('m1', 10), 'N')],
+                         [('ambiguous', 'PB.1.1'), ('ambiguous', 'PB.10.1')])
+        self.assertEqual(stats[(_rid('m1', 13), 'N')], [('unique', 'PB.10.1')])
+        self.assertEqual(stats[(_rid('m1', 20), 'N')], [('unique', 'PB.10.1')])
+        self.assertEqual(stats[(_rid('m1', 21), 'N')], [('unmapped', 'NA')])
+        # nFL: 13, 20 unique, 14, 21 unmapped, 10, 11, 12 ambiguous
+        self.assertEqual(counter.total.tolist(), [5, 4, 3])
+
+        counter_fn = op.join(self.outDir, "abundance.counter.txt")
+        counter.write(counter_fn)
+        file_fn = op.join(self.outDir, "abundance.file.txt")
+        make_abundance_file(stat_fn, file_fn)
+        self.assertEqual(open(counter_fn).read(), open(file_fn).read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Test parallel_gmap with a stand-in aligner."""
+import unittest
+import shutil
+import sys
+import os
+import os.path as op
+from pbtools.pbtranscript.Utils import mkdir
+from pbtools.pbtranscript.parallel_gmap import run_gmap_chunks
+from pbtools.pbtranscript.io.SAMSorter import SortedSAMStream, sam_sort_key
+
+# Stand-in aligner: "maps" read r<i> to chr<i%3>:<1000-i>, writes samse SAM.
+STAND_IN = """import sys
+print "@SQ\\tSN:chr0\\tLN:1000"
+for line in open(sys.argv[1]):
+    if line.startswith('>'):
+        i = int(line[2:].strip())
+        print "r{0}\\t0\\tchr{1}\\t{2}\\t40\\t10M\\t*\\t0\\t0\\t*\\t*".format(i, i % 3, 1000 - i)
+"""
+
+
+class Test_parallel_gmap(unittest.TestCase):
+    """Test run_gmap_chunks."""
+    def setUp(self):
+        """Write two inputs and the stand-in aligner."""
+        self.outDir = op.join(op.dirname(op.dirname(op.abspath(__file__))),
+                              "out", "test_parallel_gmap")
+        if op.exists(self.outDir):
+            shutil.rmtree(self.outDir)
+        mkdir(self.outDir)
+        self.aligner = op.join(self.outDir, "stand_in.py")
+        with open(self.aligner, 'w') as f:
+            f.write(STAND_IN)
+        self.inputs = []
+        for k, n in enumerate((60, 20)):
+            fn = op.join(self.outDir, "bin{0}.fasta".format(k))
+            with open(fn, 'w') as f:
+                for i in xrange(k * 100, k * 100 + n):
+                    f.write(">r{0}\n{1}\n".format(i, "A" * (100 + i)))
+            self.inputs.append(fn)
+
+    def test_run_gmap_chunks(self):
+        """Chunks of all inputs are mapped, and merge in coordinate order."""
+        cmd = sys.executable + " " + self.aligner + " {input} > {output}"
+        sams = run_gmap_chunks(self.inputs, None, None, cpus=4,
+                               threads_per_job=1, chunks_per_job=2,
+                               is_fq=False, aligner_cmd=cmd)
+        self.assertEqual(len(sams), 2)
+        # 8 chunks shared by size: the first input gets most of them
+        self.assertTrue(len(sams[0]) > len(sams[1]) >= 1)
+        for k, (fn, chunk_sams) in enumerate(zip(self.inputs, sams)):
+            stream = SortedSAMStream(chunk_sams, cpus=2, buffer_size=500)
+            self.assertEqual(stream.header, "@SQ\tSN:chr0\tLN:1000\n")
+            lines = list(iter(stream.readline, ''))
+            self.assertEqual(len(lines), 60 if k == 0 else 20)
+            self.assertEqual(lines, sorted(lines, key=sam_sort_key))
+
+    def test_resume(self):
+        """A re-run only maps chunks without a SAM of the same command."""
+        calls_fn = op.join(self.outDir, "calls.txt")
+        cmd = "echo {input} >> " + calls_fn + " && " + sys.executable + \
+              " " + self.aligner + " {input} > {output}"
+
+        def run(cmd=cmd):
+            """Run run_gmap_chunks, return (SAMs, chunks mapped)."""
+            if op.exists(calls_fn):
+                os.remove(calls_fn)
+            sams = run_gmap_chunks(self.inputs, None, None, cpus=4,
+                                   threads_per_job=1, chunks_per_job=2,
+                                   is_fq=False, aligner_cmd=cmd)
+            calls = [] if not op.exists(calls_fn) else \
+                    sorted(line.strip() for line in open(calls_fn))
+            return sams, calls
+
+        sams, calls = run()
+        all_chunks = sorted(fn[:-len('.sam')] for x in sams for fn in x)
+        self.assertEqual(calls, all_chunks)
+        self.assertEqual(run(), (sams, []))
+
+        # a missing SAM (ex: killed while mapping) is remapped
+        os.remove(sams[0][1])
+        self.assertEqual(run(), (sams, [sams[0][1][:-len('.sam')]]))
+
+        # chunks of a changed input are remapped, other chunks are not
+        with open(self.inputs[1], 'w') as f:
+            for i in xrange(100, 120):
+                f.write(">r{0}\n{1}\n".format(i, "C" * (100 + i)))
+        self.assertEqual(run(), (sams, sorted(fn[:-len('.sam')]
+                                              for fn in sams[1])))
+
+        # so are all chunks of a different command
+        self.assertEqual(run(cmd + " ")[1], all_chunks)
+        for chunk_sams in sams:
+            chunk_dir = op.dirname(chunk_sams[0])
+            self.assertEqual([fn for fn in os.listdir(chunk_dir)
+                              if fn.endswith('.tmp')], [])
+
+
+if __name__ == "__main__":
+    unittest.main()